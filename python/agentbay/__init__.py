@@ -19,6 +19,8 @@ from ._common.exceptions import (
     SessionError,
     AgentError,
     ClearanceTimeoutError,
+    DeadlineExceededError,
+    CircuitOpenError,
     GitError,
     GitAuthError,
     GitNotFoundError,
@@ -68,11 +70,24 @@ from ._common.models.response import (
     GetSessionData,
     extract_request_id,
 )
+from ._common.models.metrics import SessionMetricsHistory, SessionMetricsSummary
+from ._common.instrumentation import (
+    HistogramCollector,
+    Instrumentation,
+    OpenTelemetryHook,
+    RequestCall,
+    RequestHook,
+)
+from ._common.retry import RetryPolicy, deadline
+from ._common.circuit_breaker import CircuitBreakerPolicy
 from .api.models import ExtraConfigs, MobileExtraConfig, AppManagerRule, MobileSimulateMode, MobileSimulateConfig
 
 # Sync API (Default)
 from ._sync.agentbay import AgentBay
 from ._sync.session import Session, SessionInfo
+from ._sync.keep_alive import KeepAliveScheduler
+from ._sync.metrics_sampler import MetricsSampler
+from ._sync._internal.ws_client import set_ws_loop_threads
 from ._sync.fingerprint import BrowserFingerprintGenerator
 from ._sync.browser import (
     Browser,
@@ -111,11 +126,18 @@ from ._sync.mobile_simulate import MobileSimulateService
 from ._sync.agent import Agent
 from ._common.models.agent import AgentEvent, ExecutionResult
 from ._sync.agent import TaskExecution
-from ._sync.command import Command, CommandResult
+from ._sync.command import Command, CommandExecution, CommandResult, ProcessHandle
+from ._common.models.command import (
+    BackgroundProcessListResult,
+    BatchCommandResult,
+    CommandOutputChunk,
+    ProcessInfo,
+)
 from ._sync.filesystem import (
     FileSystem,
     FileChangeEvent,
     FileChangeResult,
+    FileWatch,
     DirectoryListResult,
     FileContentResult,
     BinaryFileContentResult,
@@ -131,7 +153,9 @@ from ._sync.context_manager import ContextManager
 from ._common.models.context import (
     ContextBinding,
     ContextBindingsResult,
+    ContextBatchResult,
     ContextBindResult,
+    ContextDirSyncResult,
     ContextInfoResult,
     ContextSyncResult,
 )
@@ -148,8 +172,11 @@ from ._sync.context import (
     ContextService,
 )
 from ._sync.beta_network import SyncBetaNetworkService as BetaNetwork
-from ._sync.code import Code, CodeExecutionResult
+from ._sync.code import Code, CodeContext, CodeExecutionResult
 from ._common.models.code import (
+    CodeContextInfo,
+    CodeContextListResult,
+    CodeContextResult,
     EnhancedCodeExecutionResult,
     ExecutionResult as CodeExecutionResult,
     ExecutionLogs,
@@ -160,6 +187,8 @@ from ._common.models import MobileSimulateUploadResult
 # Async API (Explicitly marked)
 from ._async.agentbay import AsyncAgentBay
 from ._async.session import AsyncSession
+from ._async.keep_alive import AsyncKeepAliveScheduler
+from ._async.metrics_sampler import AsyncMetricsSampler
 from ._async.browser import AsyncBrowser
 from ._async.browser_operator import AsyncBrowserOperator
 from ._async.fingerprint import AsyncBrowserFingerprintGenerator
@@ -185,6 +214,19 @@ __all__ = [
     "Session",
     "SessionInfo",
     "AsyncSession",
+    "KeepAliveScheduler",
+    "AsyncKeepAliveScheduler",
+    "set_ws_loop_threads",
+    # Instrumentation
+    "RequestHook",
+    "RequestCall",
+    "Instrumentation",
+    "HistogramCollector",
+    "OpenTelemetryHook",
+    # Retries
+    "RetryPolicy",
+    "deadline",
+    "CircuitBreakerPolicy",
     # Enums
     "SessionStatus",
     "BrowserSyncMode",
@@ -224,6 +266,8 @@ __all__ = [
     "SessionError",
     "AgentError",
     "ClearanceTimeoutError",
+    "DeadlineExceededError",
+    "CircuitOpenError",
     "AgentBayLogger",
     "get_logger",
     "log",
@@ -267,6 +311,8 @@ __all__ = [
     "ContextBindResult",
     "ContextInfoResult",
     "ContextSyncResult",
+    "ContextDirSyncResult",
+    "ContextBatchResult",
     "ContextService",
     "AsyncContextService",
     "Context",
@@ -294,6 +340,10 @@ __all__ = [
     "McpToolResult",
     "SessionMetrics",
     "SessionMetricsResult",
+    "SessionMetricsHistory",
+    "SessionMetricsSummary",
+    "MetricsSampler",
+    "AsyncMetricsSampler",
     "AdbUrlResult",
     "McpToolsResult",
     "SessionPauseResult",
@@ -305,7 +355,17 @@ __all__ = [
     "ExecutionResult",
     "TaskExecution",
     "CommandResult",
+    "CommandExecution",
+    "CommandOutputChunk",
+    "BatchCommandResult",
+    "ProcessHandle",
+    "ProcessInfo",
+    "BackgroundProcessListResult",
     "CodeExecutionResult",
+    "CodeContext",
+    "CodeContextInfo",
+    "CodeContextResult",
+    "CodeContextListResult",
     "EnhancedCodeExecutionResult",
     "ExecutionLogs",
     "ExecutionError",
@@ -332,6 +392,7 @@ __all__ = [
     # Filesystem related
     "FileChangeEvent",
     "FileChangeResult",
+    "FileWatch",
     "AsyncFileTransfer",
     "FileTransfer",
     "DirectoryListResult",
@@ -0,0 +1,552 @@
+import asyncio
+import posixpath
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set
+
+from ..._common.logger import get_logger
+from ..._common.models.filesystem import FileChangeEvent
+
+_logger = get_logger("filesystem")
+
+_FILE_CHANGE_TOOL = "get_file_change"
+
+# How long an idle push-mode watch sleeps before re-checking the connection.
+_PUSH_IDLE_CHECK_S = 1.0
+
+# How long to wait for the server to acknowledge subscribe_file_change.
+_SUBSCRIBE_TIMEOUT_S = 15
+
+
+def _merge_event(
+    previous: Optional[FileChangeEvent], event: FileChangeEvent
+) -> Optional[FileChangeEvent]:
+    """Fold two events for the same path into one, or None when they cancel out."""
+    if previous is None:
+        return event
+    if previous.event_type == "create":
+        if event.event_type == "delete":
+            return None
+        if event.event_type == "modify":
+            return previous
+    if previous.event_type == "delete" and event.event_type == "create":
+        return FileChangeEvent("modify", event.path, event.path_type)
+    return event
+
+
+class FileWatch:
+    """
+    Iterator over batches of file change events for one directory.
+
+    Returned by ``session.file_system.watch(path)``. Each batch holds at most
+    one event per path: a create followed by modifies stays a create, a create
+    followed by a delete disappears. Events are buffered per watch up to
+    ``max_pending`` paths; beyond that the oldest are dropped and counted in
+    ``dropped``, which signals that a full rescan is needed.
+
+    Consumers that sample changes on their own schedule instead of iterating
+    call ``poll()``.
+
+    Close the watch (or leave its ``async with`` block) to release the shared
+    subscription.
+    """
+
+    def __init__(
+        self,
+        hub: "FileWatchHub",
+        path: str,
+        interval: float,
+        debounce: float,
+        max_pending: int,
+    ):
+        self.path = path
+        self.interval = interval
+        self.debounce = debounce
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._hub = hub
+        self._pending: "OrderedDict[str, FileChangeEvent]" = OrderedDict()
+        # Guards _pending: in the sync SDK pushes arrive on the WS thread.
+        self._pending_lock = threading.Lock()
+        self._wakeup = asyncio.Event()
+        self._started = False
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _push(self, events: List[FileChangeEvent]) -> None:
+        with self._pending_lock:
+            for event in events:
+                merged = _merge_event(self._pending.pop(event.path, None), event)
+                if merged is not None:
+                    self._pending[event.path] = merged
+            while len(self._pending) > self.max_pending:
+                self._pending.popitem(last=False)
+                self.dropped += 1
+        self._wakeup.set()
+
+    def _take(self) -> List[FileChangeEvent]:
+        with self._pending_lock:
+            events = list(self._pending.values())
+            self._pending.clear()
+        return events
+
+    async def start(self) -> None:
+        """Establish the baseline and join the session's shared feed for this path."""
+        if not self._started:
+            self._started = True
+            await self._hub._attach(self)
+
+    async def poll(self) -> Optional[List[FileChangeEvent]]:
+        """
+        Bring the shared feed up to date now and take the buffered events.
+
+        Returns:
+            Optional[List[FileChangeEvent]]: The coalesced events since the last
+                batch, or None if the feed could not be read, in which case
+                changes may have been missed.
+        """
+        await self.start()
+        if self._closed or not await self._hub._poll_now(self):
+            return None
+        return self._take()
+
+    async def close(self) -> None:
+        """Stop watching. The shared subscription ends with the last watch on the path."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        if self._started:
+            await self._hub._detach(self)
+
+    async def __aenter__(self) -> "FileWatch":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def __aiter__(self) -> "FileWatch":
+        return self
+
+    async def __anext__(self) -> List[FileChangeEvent]:
+        events = await self._next_batch()
+        if events is None:
+            raise StopAsyncIteration
+        return events
+
+    async def _next_batch(self, timeout: Optional[float] = None) -> Optional[List[FileChangeEvent]]:
+        """
+        Wait for the next batch, driving the shared feed meanwhile.
+
+        Returns an empty list once *timeout* seconds pass without changes (an
+        in-flight poll is never interrupted), and None when the watch is closed
+        or the session expired.
+        """
+        await self.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._closed:
+            self._wakeup.clear()
+            if self._pending:
+                if self.debounce > 0 and self._hub._is_pushed(self.path):
+                    await asyncio.sleep(self.debounce)
+                events = self._take()
+                if events:
+                    return events
+                continue
+            if self._hub._session_expired():
+                _logger.warning(f"Session expired, stopping watch for: {self.path}")
+                await self.close()
+                break
+            interval = await self._hub._refresh(self)
+            if self._pending or self._closed:
+                continue
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                interval = min(interval, remaining)
+            stop_event = self._wakeup
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+        return None
+
+
+def _feed_key(path: str) -> str:
+    """Polled directories sharing a top-level directory are served by one feed."""
+    if not path.startswith("/"):
+        return path
+    return "/" + path.strip("/").split("/", 1)[0]
+
+
+class _PathTrie:
+    """Prefix trie of watched directories, used to route events of a shared feed."""
+
+    # Key marking a watched directory; never a path component.
+    _END = ""
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+
+    @staticmethod
+    def _parts(path: str) -> List[str]:
+        return [part for part in path.split("/") if part]
+
+    def add(self, path: str) -> None:
+        node = self._root
+        for part in self._parts(path):
+            node = node.setdefault(part, {})
+        node[self._END] = path
+
+    def remove(self, path: str) -> None:
+        parts = self._parts(path)
+        nodes = [self._root]
+        for part in parts:
+            node = nodes[-1].get(part)
+            if node is None:
+                return
+            nodes.append(node)
+        nodes[-1].pop(self._END, None)
+        for part, node, parent in reversed(list(zip(parts, nodes[1:], nodes[:-1]))):
+            if node:
+                break
+            del parent[part]
+
+    def match(self, path: str) -> List[str]:
+        """Return the watched directories equal to or containing *path*."""
+        node = self._root
+        found = [node[self._END]] if self._END in node else []
+        for part in self._parts(path):
+            node = node.get(part)
+            if node is None:
+                break
+            if self._END in node:
+                found.append(node[self._END])
+        return found
+
+
+class _WatchedPath:
+    """Watches of one directory and how its changes are delivered."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.watches: List[FileWatch] = []
+        self.attached = False
+        self.pushed = False
+
+
+class _Feed:
+    """One get_file_change poll at ``root`` serving several polled directories."""
+
+    def __init__(self):
+        self.root: Optional[str] = None
+        self.paths: Set[str] = set()
+        self.trie = _PathTrie()
+        self.next_poll = 0.0
+        self.lock = asyncio.Lock()
+
+
+class FileWatchHub:
+    """
+    Shares ``get_file_change`` feeds between all watches of one session.
+
+    ``get_file_change`` reports the changes since the previous call for a path,
+    so independent pollers of the same directory would steal each other's
+    events. The hub therefore owns every feed of the session:
+
+    - with push available, one WS ``subscribe_file_change`` subscription per
+      directory, delivered through a single registered callback;
+    - otherwise polled directories are grouped by top-level directory and each
+      group is polled once per tick at the group's common ancestor. Events are
+      routed back to the watched directories with a prefix trie, so N watched
+      directories under ``/home`` cost one call per tick instead of N.
+
+    Polls are driven by the consumers, either by iterating a watch or through
+    ``FileWatch.poll()`` (as the incremental git status does), so a watch
+    nobody reads from costs nothing and unread changes accumulate server-side
+    instead of in memory.
+
+    This is an internal SDK module.
+    """
+
+    def __init__(self, file_system: Any):
+        self._fs = file_system
+        self._paths: Dict[str, _WatchedPath] = {}
+        self._feeds: Dict[str, _Feed] = {}
+        self._lock = asyncio.Lock()
+        self._ws_client: Any = None
+        self._ws_target = ""
+        self._unsubscribe_push: Any = None
+        self._unsubscribe_state: Any = None
+        self._resubscribe = False
+
+    def watch(
+        self, path: str, interval: float, debounce: float, max_pending: int
+    ) -> FileWatch:
+        return FileWatch(self, path, interval, debounce, max_pending)
+
+    def _is_pushed(self, path: str) -> bool:
+        entry = self._paths.get(path)
+        return entry is not None and entry.pushed
+
+    def _session_expired(self) -> bool:
+        is_expired = getattr(self._fs.session, "_is_expired", None)
+        return bool(is_expired()) if callable(is_expired) else False
+
+    def _push_target(self) -> str:
+        session = self._fs.session
+        if not (getattr(session, "ws_url", "") and getattr(session, "token", "")):
+            return ""
+        for tool in getattr(session, "mcpTools", None) or []:
+            if getattr(tool, "name", None) == _FILE_CHANGE_TOOL:
+                return getattr(tool, "server", "") or ""
+        return ""
+
+    def _dispatch(self, entry: _WatchedPath, events: List[FileChangeEvent]) -> None:
+        if events:
+            for watch in list(entry.watches):
+                watch._push(events)
+
+    # -------------------------------------------------------------------------
+    # Attach / detach
+    # -------------------------------------------------------------------------
+
+    async def _attach(self, watch: FileWatch) -> None:
+        entry = self._paths.get(watch.path)
+        if entry is None:
+            entry = _WatchedPath(watch.path)
+            self._paths[watch.path] = entry
+        entry.watches.append(watch)
+        async with self._lock:
+            if entry.attached:
+                return
+            entry.attached = True
+            if self._push_target():
+                # The first call only establishes the server-side baseline.
+                await self._fs._get_file_change(entry.path)
+                await self._subscribe(entry)
+            if not entry.pushed:
+                await self._join_feed(entry.path, watch.interval)
+
+    async def _detach(self, watch: FileWatch) -> None:
+        entry = self._paths.get(watch.path)
+        if entry is None or watch not in entry.watches:
+            return
+        entry.watches.remove(watch)
+        if entry.watches:
+            return
+        async with self._lock:
+            if entry.watches or self._paths.get(entry.path) is not entry:
+                return
+            del self._paths[entry.path]
+            if entry.pushed:
+                await self._unsubscribe(entry)
+            elif entry.attached:
+                await self._leave_feed(entry.path, watch.interval)
+            if not self._paths and self._ws_client is not None:
+                for release in (self._unsubscribe_push, self._unsubscribe_state):
+                    if release is not None:
+                        release()
+                self._ws_client = None
+                self._unsubscribe_push = None
+                self._unsubscribe_state = None
+
+    # -------------------------------------------------------------------------
+    # Polled feeds
+    # -------------------------------------------------------------------------
+
+    async def _poll_feed(self, feed: _Feed) -> bool:
+        result = await self._fs._get_file_change(feed.root)
+        if not result.success:
+            _logger.debug(f"get_file_change failed for {feed.root}: {result.error_message}")
+            return False
+        routed: Dict[str, List[FileChangeEvent]] = {}
+        for event in result.events:
+            for path in feed.trie.match(event.path):
+                routed.setdefault(path, []).append(event)
+        for path, events in routed.items():
+            entry = self._paths.get(path)
+            if entry is not None:
+                self._dispatch(entry, events)
+        return True
+
+    async def _rebase(self, feed: _Feed, interval: float) -> None:
+        """Move the feed to the common ancestor of its directories if that changed."""
+        root = posixpath.commonpath(sorted(feed.paths))
+        if root == feed.root:
+            return
+        feed.root = root
+        # The first call on a new root only establishes the server-side baseline.
+        await self._fs._get_file_change(root)
+        feed.next_poll = time.monotonic() + interval
+
+    async def _join_feed(self, path: str, interval: float) -> None:
+        key = _feed_key(path)
+        feed = self._feeds.get(key)
+        if feed is None:
+            feed = _Feed()
+            self._feeds[key] = feed
+        async with feed.lock:
+            if feed.root is not None:
+                # Deliver what the current root saw before the new directory
+                # joins, so it does not receive changes older than its watch.
+                await self._poll_feed(feed)
+            feed.paths.add(path)
+            feed.trie.add(path)
+            await self._rebase(feed, interval)
+
+    async def _leave_feed(self, path: str, interval: float) -> None:
+        key = _feed_key(path)
+        feed = self._feeds.get(key)
+        if feed is None or path not in feed.paths:
+            return
+        async with feed.lock:
+            feed.paths.discard(path)
+            feed.trie.remove(path)
+            if not feed.paths:
+                del self._feeds[key]
+                return
+            if posixpath.commonpath(sorted(feed.paths)) != feed.root:
+                # Flush the wider root before narrowing to the remaining directories.
+                await self._poll_feed(feed)
+                await self._rebase(feed, interval)
+
+    # -------------------------------------------------------------------------
+    # Push subscriptions
+    # -------------------------------------------------------------------------
+
+    async def _subscribe(self, entry: _WatchedPath) -> None:
+        target = self._push_target()
+        if not target:
+            return
+        try:
+            if self._ws_client is None:
+                self._ws_client = await self._fs.session._get_ws_client()
+                self._ws_target = target
+                self._unsubscribe_push = self._ws_client.register_callback(
+                    target, self._on_push
+                )
+                self._unsubscribe_state = self._ws_client.on_connection_state_change(
+                    self._on_state_change
+                )
+            handle = await self._ws_client.call_stream(
+                target=self._ws_target,
+                data={"method": "subscribe_file_change", "params": {"path": entry.path}},
+                on_event=None,
+                on_end=None,
+                on_error=None,
+            )
+            await handle.wait_end_with_timeout(timeout=_SUBSCRIBE_TIMEOUT_S)
+            entry.pushed = True
+        except Exception as e:
+            _logger.warning(
+                f"WS push subscribe failed for {entry.path}: {e}. Falling back to polling."
+            )
+            entry.pushed = False
+            return
+        # Catch up on changes made between the baseline and the subscription.
+        result = await self._fs._get_file_change(entry.path)
+        if result.success:
+            self._dispatch(entry, result.events)
+
+    async def _unsubscribe(self, entry: _WatchedPath) -> None:
+        if self._ws_client is None:
+            return
+        try:
+            await self._ws_client.send_message(
+                target=self._ws_target,
+                data={"method": "unsubscribe_file_change", "params": {"path": entry.path}},
+            )
+        except Exception as e:
+            _logger.debug(f"unsubscribe_file_change failed for {entry.path}: {e}")
+
+    def _on_push(self, payload: Dict[str, Any]) -> None:
+        data = payload.get("data", {})
+        if data.get("eventType") != "file_change":
+            return
+        entry = self._paths.get(data.get("path"))
+        if entry is None:
+            return
+        events = [
+            FileChangeEvent._from_dict(raw)
+            for raw in data.get("events", [])
+            if isinstance(raw, dict)
+        ]
+        self._dispatch(entry, events)
+
+    def _on_state_change(self, state: Any, _reason: str) -> None:
+        if state != "OPEN":
+            return
+        pushed = [entry for entry in self._paths.values() if entry.pushed]
+        if not pushed:
+            return
+        # Resubscribing needs a round trip, so leave it to the next reader.
+        self._resubscribe = True
+        for entry in pushed:
+            for watch in entry.watches:
+                watch._wakeup.set()
+
+    # -------------------------------------------------------------------------
+    # Refresh
+    # -------------------------------------------------------------------------
+
+    async def _refresh(self, watch: FileWatch) -> float:
+        """
+        Bring the feed of *watch*'s path up to date.
+
+        Returns:
+            float: Seconds the caller may sleep before calling again.
+        """
+        if self._resubscribe:
+            self._resubscribe = False
+            async with self._lock:
+                for entry in [e for e in self._paths.values() if e.pushed]:
+                    entry.pushed = False
+                    await self._subscribe(entry)
+                    if not entry.pushed:
+                        await self._join_feed(entry.path, watch.interval)
+        entry = self._paths.get(watch.path)
+        if entry is None:
+            return watch.interval
+        if entry.pushed:
+            return _PUSH_IDLE_CHECK_S
+        feed = self._feeds.get(_feed_key(watch.path))
+        if feed is None:
+            return watch.interval
+        async with feed.lock:
+            wait_s = feed.next_poll - time.monotonic()
+            if wait_s <= 0:
+                feed.next_poll = time.monotonic() + watch.interval
+                await self._poll_feed(feed)
+                wait_s = watch.interval
+        return wait_s
+
+    async def _poll_now(self, watch: FileWatch) -> bool:
+        """
+        Read the feed of *watch*'s path right away, regardless of the poll schedule.
+
+        Events go to every watch on the routed paths, as with a scheduled poll.
+
+        Returns:
+            bool: False if the feed could not be read.
+        """
+        entry = self._paths.get(watch.path)
+        if entry is None:
+            return False
+        if entry.pushed:
+            # Pushes may trail the change; catch up the same way _subscribe() does.
+            result = await self._fs._get_file_change(entry.path)
+            if result.success:
+                self._dispatch(entry, result.events)
+            return result.success
+        feed = self._feeds.get(_feed_key(watch.path))
+        if feed is None:
+            return False
+        async with feed.lock:
+            return await self._poll_feed(feed)
@@ -0,0 +1,273 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+class TokenBucket:
+    """
+    Client-side token bucket used to keep bulk calls within OpenAPI quotas.
+
+    Tokens refill continuously at `rate` per second up to `burst`. acquire() waits
+    until enough tokens are available. A rate of None or <= 0 disables limiting.
+    The bucket holds no event-loop state, so one client may be used from several
+    loops and threads.
+
+    This is an internal SDK module.
+    """
+
+    def __init__(self, rate: Optional[float], burst: Optional[float] = None):
+        self.rate = rate if rate and rate > 0 else None
+        self.burst = float(burst if burst is not None else max(1.0, rate or 1.0))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        if self.rate is None:
+            return
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait_s = (tokens - self._tokens) / self.rate
+            await asyncio.sleep(wait_s)
+
+
+async def run_bounded(items: Iterable[Any], fn: Callable[[Any], Any], limit: int) -> None:
+    """
+    Await fn(item) for every item with at most `limit` calls in flight.
+
+    Workers pull from a shared queue, so a slow item never holds up a whole batch.
+    """
+    pending = deque(items)
+
+    async def _worker():
+        while pending:
+            item = pending.popleft()
+            await fn(item)
+
+    tasks = [_worker() for _ in range(min(max(1, limit), len(pending)))]
+    await asyncio.gather(*tasks)
+
+
+# Outcomes reported to RequestLimiter.release().
+OUTCOME_OK = "ok"
+OUTCOME_OVERLOADED = "overloaded"  # throttling, 429 or 5xx: shrink the in-flight cap
+OUTCOME_FAILED = "failed"  # any other failure: leave the cap unchanged
+
+# Actions that are not OpenAPI calls but share the limiter.
+LINK_URL_ACTION = "CallMcpTool(LinkUrl)"
+
+
+class _Waiter:
+    """
+    Wake-up of one queued acquire(), bound to the loop it was created on.
+
+    set() may be called from any thread or loop, so limiter state shared across
+    loops never holds a loop-bound primitive.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._future = self._loop.create_future()
+
+    def _wake(self) -> None:
+        if not self._future.done():
+            self._future.set_result(None)
+
+    def set(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._wake)
+        except RuntimeError:
+            # The loop is closed, so nobody is waiting any more.
+            pass
+
+    async def wait(self) -> None:
+        await self._future
+
+
+class _ActionState:
+    """AIMD in-flight cap and queueing counters of one action."""
+
+    __slots__ = (
+        "limit",
+        "in_flight",
+        "queued",
+        "waiters",
+        "last_decrease",
+        "calls",
+        "queued_calls",
+        "max_queued",
+        "total_wait_s",
+        "max_wait_s",
+        "overloaded",
+    )
+
+    def __init__(self, limit: float):
+        self.limit = limit
+        self.in_flight = 0
+        self.queued = 0
+        self.waiters: List[Any] = []
+        self.last_decrease = 0.0
+        self.calls = 0
+        self.queued_calls = 0
+        self.max_queued = 0
+        self.total_wait_s = 0.0
+        self.max_wait_s = 0.0
+        self.overloaded = 0
+
+
+class RequestLimiter:
+    """
+    Per-client limiter applied to every OpenAPI action and LinkUrl tool call.
+
+    Each action gets an optional token bucket (requests per second) and an
+    adaptive cap on calls in flight. The cap starts at `max_concurrency` and
+    follows AIMD: a throttled, 429 or 5xx response halves it (at most once per
+    round trip, so a burst of rejections counts as one signal), and every
+    successful call grows it by 1/cap, i.e. by one per cap's worth of
+    successes. Callers over the cap queue until a call of the same action
+    finishes.
+
+    State is guarded by a plain lock and each queued call waits on its own
+    wake-up, so one limiter can serve several event loops and threads.
+
+    This is an internal SDK module.
+    """
+
+    def __init__(
+        self,
+        rates: Optional[Dict[str, float]] = None,
+        max_concurrency: int = 64,
+        min_concurrency: int = 1,
+        backoff: float = 0.5,
+    ):
+        """
+        Args:
+            rates: Requests per second per action. The "*" key applies to every
+                action without its own entry. Unlisted actions are not rate limited.
+            max_concurrency: Upper bound (and starting value) of the in-flight cap.
+            min_concurrency: Lower bound of the in-flight cap.
+            backoff: Factor the cap is multiplied by on overload.
+        """
+        self.rates = dict(rates or {})
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.backoff = backoff
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._states: Dict[str, _ActionState] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, action: str) -> Optional[TokenBucket]:
+        if action not in self._buckets:
+            rate = self.rates.get(action, self.rates.get("*"))
+            self._buckets[action] = TokenBucket(rate) if rate else None
+        return self._buckets[action]
+
+    def _state(self, action: str) -> _ActionState:
+        state = self._states.get(action)
+        if state is None:
+            state = self._states[action] = _ActionState(float(self.max_concurrency))
+        return state
+
+    async def acquire(self, action: str) -> float:
+        """
+        Wait for a token and an in-flight slot of `action`.
+
+        Returns:
+            float: The monotonic time the call started; pass it to release().
+        """
+        queued_at = time.monotonic()
+        bucket = self._bucket(action)
+        if bucket is not None:
+            await bucket.acquire()
+        waiting = False
+        waiter = None
+        try:
+            while True:
+                with self._lock:
+                    state = self._state(action)
+                    if state.in_flight < int(state.limit):
+                        now = time.monotonic()
+                        wait_s = now - queued_at
+                        state.in_flight += 1
+                        state.calls += 1
+                        state.total_wait_s += wait_s
+                        state.max_wait_s = max(state.max_wait_s, wait_s)
+                        if waiting:
+                            state.queued -= 1
+                        return now
+                    if not waiting:
+                        waiting = True
+                        state.queued += 1
+                        state.queued_calls += 1
+                        state.max_queued = max(state.max_queued, state.queued)
+                    waiter = _Waiter()
+                    state.waiters.append(waiter)
+                await waiter.wait()
+        except BaseException:
+            # A waiter cancelled (or interrupted) in the queue gives up its place.
+            if waiting:
+                with self._lock:
+                    state.queued -= 1
+                    if waiter in state.waiters:
+                        state.waiters.remove(waiter)
+            raise
+
+    async def release(self, action: str, started: float, outcome: str = OUTCOME_OK) -> None:
+        """Free the slot taken by acquire() and adapt the cap to the outcome."""
+        with self._lock:
+            state = self._state(action)
+            if outcome == OUTCOME_OVERLOADED:
+                state.overloaded += 1
+                # Calls sent before the last decrease saw the old cap; don't punish twice.
+                if started >= state.last_decrease:
+                    state.limit = max(float(self.min_concurrency), state.limit * self.backoff)
+                    state.last_decrease = time.monotonic()
+            elif outcome == OUTCOME_OK and state.in_flight * 2 >= state.limit:
+                # Only grow a cap that is actually being used.
+                state.limit = min(float(self.max_concurrency), state.limit + 1.0 / state.limit)
+            state.in_flight -= 1
+            waiters, state.waiters = state.waiters, []
+        # Every waiter re-checks the cap; those that lose the race queue again.
+        for waiter in waiters:
+            waiter.set()
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Queueing statistics per action, sorted by action name.
+
+        Returns:
+            List[Dict[str, Any]]: Rows with action, limit, in_flight, queued,
+                calls, queued_calls, max_queued, mean_wait_s, max_wait_s and
+                overloaded.
+        """
+        return [
+            {
+                "action": action,
+                "limit": int(state.limit),
+                "in_flight": state.in_flight,
+                "queued": state.queued,
+                "calls": state.calls,
+                "queued_calls": state.queued_calls,
+                "max_queued": state.max_queued,
+                "mean_wait_s": state.total_wait_s / state.calls if state.calls else 0.0,
+                "max_wait_s": state.max_wait_s,
+                "overloaded": state.overloaded,
+            }
+            for action, state in sorted(self._states.items())
+        ]
+
+
+def request_limiter_of(agent_bay: Any) -> Optional[RequestLimiter]:
+    """The RequestLimiter of an AgentBay client, or None (e.g. for test doubles)."""
+    limiter = getattr(agent_bay, "request_limiter", None)
+    return limiter if isinstance(limiter, RequestLimiter) else None
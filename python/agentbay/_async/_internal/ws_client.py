@@ -9,6 +9,12 @@ from enum import Enum
 from typing import Any, Callable, Optional
 
 from ..._common.exceptions import AgentBayError, WsCancelledError
+from ..._common.instrumentation import (
+    KIND_WS,
+    NULL_INSTRUMENTATION,
+    Instrumentation,
+    RequestCall,
+)
 from ..._common.logger import _mask_sensitive_data_string, _truncate_string_for_log, get_logger
 
 _logger = get_logger("ws_client")
@@ -118,9 +124,11 @@ class WsClient:
         heartbeat_interval_s: float = 20.0,
         reconnect_initial_delay_s: float = 0.5,
         reconnect_max_delay_s: float = 5.0,
+        instrumentation: Optional[Instrumentation] = None,
     ):
         self._ws_url = ws_url
         self._ws_token = ws_token
+        self._instrumentation = instrumentation or NULL_INSTRUMENTATION
 
         self._heartbeat_interval_s = heartbeat_interval_s
         self._reconnect_initial_delay_s = reconnect_initial_delay_s
@@ -244,6 +252,13 @@ class WsClient:
             end_future=end_future,
         )
         self._pending_by_id[invocation_id] = pending
+        if self._instrumentation.enabled:
+            call = self._instrumentation.start(
+                KIND_WS, target, "WS", request_bytes=len(_json_dumps(data))
+            )
+            end_future.add_done_callback(
+                lambda future: self._finish_call(call, invocation_id, future)
+            )
 
         try:
             await self._write_business(
@@ -261,6 +276,16 @@ class WsClient:
 
         return WsStreamHandle(self, pending)
 
+    def _finish_call(
+        self, call: Optional[RequestCall], invocation_id: str, future: asyncio.Future
+    ) -> None:
+        if future.cancelled():
+            self._instrumentation.fail(call, WsCancelledError("stream cancelled"), invocation_id)
+        elif future.exception() is not None:
+            self._instrumentation.fail(call, future.exception(), invocation_id)
+        else:
+            self._instrumentation.end(call, invocation_id)
+
     async def send_message(
         self,
         *,
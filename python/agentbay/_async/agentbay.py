@@ -40,7 +40,20 @@ from .._common.models import (
 )
 from .._common.version import __is_release__, __version__
 from .._common.enums import SessionStatus
-from ..api.client import Client as mcp_client
+from .._common.instrumentation import Instrumentation, RequestHook
+from .._common.tool_list_cache import (
+    DEFAULT_TOOL_LIST_TTL_S,
+    ToolListCache,
+    tool_list_cache_of,
+)
+from .._common.retry import RetryPolicy
+from .._common.circuit_breaker import (
+    CircuitBreakerPolicy,
+    CircuitBreakerRegistry,
+    discard_circuit_breaker,
+    session_key,
+)
+from ..api.instrumented_client import InstrumentedClient as mcp_client
 from ..api.models import (
     CreateMcpSessionRequest,
     GetSessionRequest,
@@ -51,6 +64,8 @@ from .._common.models.mcp_tool import McpTool
 from .context import AsyncContextService
 from .beta_network import AsyncBetaNetworkService
 from .beta import AsyncBetaNamespace
+from ._internal.rate_limit import RequestLimiter
+from .keep_alive import AsyncKeepAliveScheduler
 from .session import AsyncSession
 from .._common.params.session_params import CreateSessionParams
 
@@ -69,6 +84,13 @@ class AsyncAgentBay:
         api_key: str = "",
         cfg: Optional[Config] = None,
         env_file: Optional[str] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        max_concurrency: int = 64,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+        read_cache_ttls: Optional[Dict[str, float]] = None,
+        tool_list_cache_ttl: float = DEFAULT_TOOL_LIST_TTL_S,
+        tool_list_cache_path: Optional[str] = None,
     ):
         """
         Initialize AsyncAgentBay client.
@@ -77,6 +99,27 @@ class AsyncAgentBay:
             api_key: API key for authentication. If not provided, will read from AGENTBAY_API_KEY environment variable.
             cfg: Configuration object. If not provided, will load from environment variables and .env file.
             env_file: Custom path to .env file. If not provided, will search upward from current directory.
+            rate_limits: Client-side requests per second per OpenAPI action (e.g. {"CreateMcpSession": 5}),
+                with "*" as the default for unlisted actions. LinkUrl tool calls use the
+                "CallMcpTool(LinkUrl)" key. Unlisted actions are not rate limited.
+            max_concurrency: Upper bound of the adaptive per-action cap on calls in flight. The cap
+                halves on throttling, 429 and 5xx responses and grows back on success.
+            retry_policy: How idempotent calls (reads, status queries, read-only tools) are retried
+                on network errors, throttling and 5xx responses. Defaults to RetryPolicy(); pass
+                RetryPolicy(max_attempts=1) to disable retries.
+            circuit_breaker: When a session or endpoint is considered dead. Calls to an open
+                circuit raise CircuitOpenError at once instead of waiting out their timeout;
+                sessions are probed with get_status before they are used again. Defaults to
+                CircuitBreakerPolicy(); pass CircuitBreakerPolicy(failure_threshold=0) to disable.
+            read_cache_ttls: Seconds to keep successful results of session reads that rarely
+                change, by method name: "get_status", "info", "list_mcp_tools",
+                "get_file_info", "get_screen_size" or "get_installed_apps", e.g.
+                {"get_screen_size": 30}. Off by default; identical concurrent reads share
+                one request either way.
+            tool_list_cache_ttl: Seconds to remember the MCP tool list of each image. Sessions
+                created or fetched without a ToolList get their image's cached list, so tool
+                calls can take the LinkUrl route. 0 disables the cache.
+            tool_list_cache_path: JSON file to persist the tool list cache in across runs.
         """
         if not api_key:
             api_key = os.getenv("AGENTBAY_API_KEY") or ""
@@ -93,11 +136,27 @@ class AsyncAgentBay:
         self.region_id = config_data["region_id"]
 
         config = open_api_models.Config()
-        config.endpoint = config_data["endpoint"]
+        endpoint = config_data["endpoint"]
+        if endpoint.startswith("http://"):
+            # Plain-HTTP endpoints such as agentbay.testing.MockAgentBayServer
+            config.protocol = "HTTP"
+        config.endpoint = endpoint.split("://", 1)[-1]
         config.read_timeout = config_data["timeout_ms"]
         config.connect_timeout = config_data["timeout_ms"]
 
-        self.client = mcp_client(config)
+        self.instrumentation = Instrumentation()
+        self.request_limiter = RequestLimiter(rate_limits, max_concurrency=max_concurrency)
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.circuit_breakers = CircuitBreakerRegistry(circuit_breaker)
+        self.read_cache_ttls = dict(read_cache_ttls or {})
+        self.tool_list_cache = ToolListCache(tool_list_cache_ttl, tool_list_cache_path)
+        self.client = mcp_client(
+            config,
+            self.instrumentation,
+            self.request_limiter,
+            self.retry_policy,
+            self.circuit_breakers,
+        )
         self._sessions = {}
         self._lock = Lock()
 
@@ -106,8 +165,41 @@ class AsyncAgentBay:
         self.beta_network = AsyncBetaNetworkService(self)
         self.beta = AsyncBetaNamespace(self)
         self.beta_skills = self.beta.skills
+        self.keep_alive_scheduler = AsyncKeepAliveScheduler()
         self._file_transfer_context: Optional[Any] = None
 
+    def add_request_hook(self, hook: RequestHook) -> RequestHook:
+        """
+        Observe every OpenAPI action, MCP tool call, WS stream and file transfer.
+
+        The hook receives start, end and error events for calls made through
+        this client and its sessions. ``HistogramCollector`` keeps latency
+        percentiles per action/tool; ``OpenTelemetryHook`` exports spans.
+
+        Args:
+            hook: The hook to register.
+
+        Returns:
+            RequestHook: The registered hook.
+
+        Example:
+            ```python
+            collector = agent_bay.add_request_hook(HistogramCollector())
+            ...
+            print(collector.percentile("tool", "shell", 99))
+            ```
+        """
+        return self.instrumentation.add_hook(hook)
+
+    def remove_request_hook(self, hook: RequestHook) -> bool:
+        """
+        Unregister a hook added with add_request_hook().
+
+        Returns:
+            bool: False if the hook was not registered.
+        """
+        return self.instrumentation.remove_hook(hook)
+
     def _safe_serialize(self, obj):
         """
         Helper function to serialize objects to JSON-compatible format.
@@ -266,6 +358,19 @@ class AsyncAgentBay:
             )
         return tools
 
+    def _share_tool_list(self, session: AsyncSession, image_id: Optional[str]) -> None:
+        """
+        Remember the tool list a session came with for its image, or give a
+        session that came without one the image's cached list.
+        """
+        cache = tool_list_cache_of(self)
+        if cache is None:
+            return
+        if session.mcpTools:
+            cache.put(image_id, session.mcpTools)
+        else:
+            session.mcpTools = cache.get(image_id)
+
     async def _build_session_from_response(
         self,
         response_data: dict,
@@ -302,6 +407,7 @@ class AsyncAgentBay:
         # ToolList returned by backend for this session
         tool_list = response_data.get("ToolList")
         session.mcpTools = self._parse_tool_list_to_mcp_tools(tool_list)
+        self._share_tool_list(session, params.image_id)
 
         # Set AppInstanceId and ResourceUrl
         session.app_instance_id = app_instance_id
@@ -325,6 +431,9 @@ class AsyncAgentBay:
         # Store image_id used for this session
         setattr(session, "image_id", params.image_id)
 
+        # Idle timeout requested for this session (used by keep_alive_scheduler)
+        session.idle_release_timeout = params.idle_release_timeout
+
         # Process mobile configuration if provided
         if (
             params.extra_configs
@@ -1088,6 +1197,7 @@ class AsyncAgentBay:
 
             with self._lock:
                 self._sessions.pop(session.session_id, None)
+            discard_circuit_breaker(self, session_key(session.session_id))
 
             # Return the DeleteResult obtained from session.delete()
             return delete_result
@@ -1271,6 +1381,13 @@ class AsyncAgentBay:
             session.resource_url = get_result.data.resource_url
             session.mcpTools = self._parse_tool_list_to_mcp_tools(
                 get_result.data.tool_list)
+            # GetSession does not report the image; it is known for sessions
+            # created by this client.
+            with self._lock:
+                image_id = getattr(self._sessions.get(session_id), "image_id", None)
+            if image_id:
+                setattr(session, "image_id", image_id)
+            self._share_tool_list(session, image_id)
             session.token = str(get_result.data.token or "")
             session.link_url = str(
                 getattr(get_result.data, "link_url", "") or "")
@@ -1,7 +1,6 @@
 import os
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-import asyncio
 from ..api.models import ListSkillMetaDataRequest, GetSkillMetaDataRequest
 from .._common.models.skill_info import SkillInfo, SkillsMetadataResult
 
@@ -57,30 +56,7 @@ class AsyncBetaSkillsService:
             skill_group_ids=skill_names,
         )
 
-        max_attempts = 3
-        delay_s = 0.2
-        last_err: Optional[BaseException] = None
-        resp = None
-        for attempt in range(1, max_attempts + 1):
-            try:
-                resp = await self._agent_bay.client.get_skill_meta_data_async(request)
-                last_err = None
-                break
-            except Exception as e:
-                last_err = e
-                msg = str(e)
-                if attempt < max_attempts and (
-                    "ServiceUnavailable" in msg
-                    or "statusCode': 503" in msg
-                    or "code: 503" in msg
-                ):
-                    await asyncio.sleep(delay_s)
-                    delay_s *= 2
-                    continue
-                raise
-
-        if last_err is not None:
-            raise RuntimeError(f"GetSkillMetaData failed: {last_err}") from last_err
+        resp = await self._agent_bay.client.get_skill_meta_data_async(request)  # retried by the client
 
         body = getattr(resp, "body", None)
         if body is None:
@@ -126,28 +102,7 @@ class AsyncBetaSkillsService:
             authorization=f"Bearer {self._agent_bay.api_key}",
         )
 
-        max_attempts = 3
-        delay_s = 0.2
-        last_err: Optional[BaseException] = None
-        resp: Any = None
-        for attempt in range(1, max_attempts + 1):
-            try:
-                resp = await self._agent_bay.client.list_skill_meta_data_async(request)
-                last_err = None
-                break
-            except Exception as e:
-                last_err = e
-                msg = str(e)
-                if attempt < max_attempts and (
-                    "ServiceUnavailable" in msg or "statusCode': 503" in msg or "code: 503" in msg
-                ):
-                    await asyncio.sleep(delay_s)
-                    delay_s *= 2
-                    continue
-                raise
-
-        if last_err is not None:
-            raise RuntimeError(f"ListSkillMetaData failed: {last_err}") from last_err
+        resp = await self._agent_bay.client.list_skill_meta_data_async(request)  # retried by the client
 
         body = getattr(resp, "body", None)
         if body is None:
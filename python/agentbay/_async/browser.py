@@ -5,6 +5,7 @@ from .._common.exceptions import BrowserError
 from .._common.logger import _log_api_response_with_details, get_logger
 from .._common.models import BrowserNotifyMessage, BrowserCallback
 from ..api.models import InitBrowserRequest
+from ._internal.link_cache import LinkCache
 from .base_service import AsyncBaseService
 from .browser_operator import AsyncBrowserOperator
 
@@ -263,6 +264,9 @@ class AsyncBrowser(AsyncBaseService):
             self._endpoint_router_port = None
             self._endpoint_url = None
             self._option = None
+            link_cache = getattr(self.session, "_link_cache", None)
+            if isinstance(link_cache, LinkCache):
+                link_cache.invalidate("cdp")
         else:
             raise BrowserError("Browser is not initialized. Cannot stop browser.")
 
@@ -515,10 +519,15 @@ class AsyncBrowser(AsyncBaseService):
             return False
 
 
-    async def get_endpoint_url(self) -> str:
+    async def get_endpoint_url(self, force_refresh: bool = False) -> str:
         """
         Returns the endpoint URL if the browser is initialized, otherwise raises an exception.
-        When initialized, always fetches the latest CDP url from session.get_link().
+        The CDP url is cached on the session until it expires; pass `force_refresh=True`
+        (or call `session.invalidate_link_cache("cdp")` after a failed connect) to
+        fetch a new one.
+
+        Args:
+            force_refresh (bool): Bypass the session link cache. Defaults to False.
 
         Returns:
             str: The browser CDP endpoint URL.
@@ -542,25 +551,37 @@ class AsyncBrowser(AsyncBaseService):
                 "Browser is not initialized. Cannot access endpoint URL."
             )
         try:
-            from ..api.models import GetCdpLinkRequest
-
-            request = GetCdpLinkRequest(
-                authorization=f"Bearer {self.session.agent_bay.api_key}",
-                session_id=self.session.session_id,
-            )
-            # Async call
-            response = await self.session.agent_bay.client.get_cdp_link_async(
-                request
-            )
-            if response.body and response.body.success and response.body.data:
-                self._endpoint_url = response.body.data.url
-            else:
-                error_msg = response.body.message if response.body else "Unknown error"
-                raise BrowserError(f"Failed to get CDP link: {error_msg}")
+            link_cache = getattr(self.session, "_link_cache", None)
+            if not isinstance(link_cache, LinkCache):
+                url, _ = await self._fetch_cdp_link()
+                self._endpoint_url = url
+                return self._endpoint_url
+
+            key = ("cdp", self.endpoint_router_port, None, None)
+            if force_refresh:
+                link_cache.invalidate_key(key)
+            entry = await link_cache.get_or_fetch(key, self._fetch_cdp_link)
+            if entry is None:
+                raise BrowserError("Failed to get CDP link: empty URL in response")
+            self._endpoint_url = entry.url
             return self._endpoint_url
         except Exception as e:
             raise BrowserError(f"Failed to get endpoint URL from session: {e}")
 
+    async def _fetch_cdp_link(self):
+        """Internal: call GetCdpLink and return (url, request_id)."""
+        from ..api.models import GetCdpLinkRequest
+
+        request = GetCdpLinkRequest(
+            authorization=f"Bearer {self.session.agent_bay.api_key}",
+            session_id=self.session.session_id,
+        )
+        response = await self.session.agent_bay.client.get_cdp_link_async(request)
+        if response.body and response.body.success and response.body.data:
+            return (response.body.data.url, response.body.request_id or "")
+        error_msg = response.body.message if response.body else "Unknown error"
+        raise BrowserError(f"Failed to get CDP link: {error_msg}")
+
     def get_option(self) -> Optional["BrowserOption"]:
         """
         Returns the current BrowserOption used to initialize the browser, or None if not set.
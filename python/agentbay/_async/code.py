@@ -1,20 +1,241 @@
+import asyncio
 import json
-from typing import Any, Callable, Dict, List, Optional
+import re
+import shlex
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from .._common.exceptions import AgentBayError, CommandError
 from .._common.logger import get_logger
 from .._common.models.code import (
+    CodeContextInfo,
+    CodeContextListResult,
+    CodeContextResult,
     CodeExecutionResult,
     EnhancedCodeExecutionResult,
     ExecutionLogs,
     ExecutionResult,
     ExecutionError,
 )
-from .._common.models.response import ApiResponse
+from .._common.models.response import ApiResponse, OperationResult
+from .._common.utils.code_kernel import KERNEL_CLIENT_SOURCE, KERNEL_SERVER_SOURCE
 from .base_service import AsyncBaseService
+from .command import (
+    _PID_ALIVE_CHECK,
+    _PROCESS_ROOT,
+    ProcessHandle,
+    _process_start_script,
+)
 
 # Initialize _logger for this module
 _logger = get_logger("code")
 
+# Persistent code contexts keep their kernel source, socket and pid here.
+_CONTEXT_ROOT = "/tmp/.agentbay/kernels"
+_CONTEXT_NAME_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+_CONTEXT_MARKER = "__AGENTBAY_CTX__"
+
+# Each kernel round trip waits at most this long server-side, which keeps single
+# requests under the 60 s gateway limit. Longer cells continue with further polls.
+_DEFAULT_CHUNK_TIMEOUT_S = 45
+
+# Extra time given to each shell call on top of the kernel wait (client start-up
+# and socket connect retries).
+_KERNEL_CALL_MARGIN_S = 15
+
+
+class CodeContext:
+    """
+    Handle for a persistent Python interpreter running inside the session.
+
+    Variables, imports and function definitions survive between run() calls on the
+    same context. Different contexts are independent processes, so cells in
+    separate contexts can run concurrently.
+    """
+
+    def __init__(self, code_service: "AsyncCode", name: str, process: Optional[ProcessHandle] = None):
+        self._code = code_service
+        self.name = name
+        self.process = process
+        self.language = "python"
+
+    @property
+    def context_dir(self) -> str:
+        """Directory in the session holding the kernel source, socket and pid."""
+        return f"{_CONTEXT_ROOT}/{self.name}"
+
+    def __repr__(self) -> str:
+        pid = self.process.pid if self.process is not None else None
+        return f"CodeContext(name={self.name!r}, pid={pid})"
+
+    async def _call(self, request: Dict[str, Any], wait_s: float = 0) -> Tuple[Dict[str, Any], str]:
+        script = (
+            f"printf '%s' {shlex.quote(json.dumps(request))} | "
+            f"python3 -c {shlex.quote(KERNEL_CLIENT_SOURCE)} "
+            f"{shlex.quote(self.context_dir + '/kernel.sock')}"
+        )
+        result = await self._code.session.command.execute_command(
+            script, timeout_ms=int((wait_s + _KERNEL_CALL_MARGIN_S) * 1000)
+        )
+        if not result.success:
+            return {"error_message": result.error_message or result.output}, result.request_id
+        lines = (result.stdout or result.output).strip().splitlines()
+        try:
+            reply = json.loads(lines[-1])
+        except (IndexError, ValueError):
+            return {"error_message": f"Invalid kernel reply: {result.output!r}"}, result.request_id
+        if not isinstance(reply, dict):
+            return {"error_message": f"Invalid kernel reply: {result.output!r}"}, result.request_id
+        return reply, result.request_id
+
+    async def run(
+        self,
+        code: str,
+        timeout_s: int = 300,
+        chunk_timeout_s: int = _DEFAULT_CHUNK_TIMEOUT_S,
+        on_stdout: Optional[Callable[[str], None]] = None,
+        on_stderr: Optional[Callable[[str], None]] = None,
+    ) -> EnhancedCodeExecutionResult:
+        """
+        Execute Python code in this context.
+
+        The cell is queued in the kernel and followed with short polls, so it may
+        run longer than one gateway request. If the last statement is an expression
+        its repr() is returned as the main result.
+
+        Args:
+            code: The Python code to execute.
+            timeout_s: Overall time limit. The cell is interrupted when it is exceeded.
+            chunk_timeout_s: Longest wait of a single round trip to the kernel.
+            on_stdout: Callback invoked with stdout text as each round trip returns.
+            on_stderr: Callback invoked with stderr text as each round trip returns.
+
+        Returns:
+            EnhancedCodeExecutionResult: Logs, main result and error of the cell.
+        """
+        deadline = time.monotonic() + timeout_s
+        stdout_chunks: List[str] = []
+        stderr_chunks: List[str] = []
+        timed_out = False
+        wait_s = max(0, min(chunk_timeout_s, timeout_s))
+        reply, request_id = await self._call({"op": "run", "code": code, "wait_s": wait_s}, wait_s)
+        while True:
+            if reply.get("error_message"):
+                return EnhancedCodeExecutionResult(
+                    request_id=request_id,
+                    success=False,
+                    logs=ExecutionLogs(stdout=stdout_chunks, stderr=stderr_chunks),
+                    error_message=reply["error_message"],
+                )
+            for key, chunks, callback in (
+                ("stdout", stdout_chunks, on_stdout),
+                ("stderr", stderr_chunks, on_stderr),
+            ):
+                text = reply.get(key) or ""
+                if text:
+                    chunks.append(text)
+                    if callback is not None:
+                        callback(text)
+            if reply.get("done"):
+                break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 and not timed_out:
+                # Interrupt, then collect the output and traceback of the stopped cell.
+                timed_out = True
+                await self.interrupt()
+                remaining = 5
+            elif remaining <= 0:
+                break
+            wait_s = min(chunk_timeout_s, remaining)
+            reply, request_id = await self._call(
+                {"op": "poll", "id": reply.get("id"), "offsets": reply.get("offsets"), "wait_s": wait_s},
+                wait_s,
+            )
+
+        logs = ExecutionLogs(stdout=stdout_chunks, stderr=stderr_chunks)
+        if timed_out:
+            return EnhancedCodeExecutionResult(
+                request_id=request_id,
+                success=False,
+                execution_count=reply.get("execution_count"),
+                logs=logs,
+                error=ExecutionError(
+                    name="TimeoutError",
+                    value=f"Execution exceeded {timeout_s}s and was interrupted",
+                    traceback="",
+                ),
+                error_message=f"Execution exceeded {timeout_s}s and was interrupted",
+            )
+        results: List[ExecutionResult] = []
+        if reply.get("result") is not None:
+            results.append(ExecutionResult(text=reply["result"], is_main_result=True))
+        error_obj = None
+        error_data = reply.get("error")
+        if error_data:
+            error_obj = ExecutionError(
+                name=error_data.get("name", "UnknownError"),
+                value=error_data.get("value", ""),
+                traceback=error_data.get("traceback", ""),
+            )
+        return EnhancedCodeExecutionResult(
+            request_id=request_id,
+            success=error_obj is None,
+            execution_count=reply.get("execution_count"),
+            logs=logs,
+            results=results,
+            error=error_obj,
+            error_message=f"{error_obj.name}: {error_obj.value}" if error_obj else "",
+        )
+
+    async def interrupt(self) -> OperationResult:
+        """
+        Interrupt the cell currently running in this context.
+
+        Returns:
+            OperationResult: data is True if a running cell was interrupted.
+        """
+        reply, request_id = await self._call({"op": "interrupt"})
+        if reply.get("error_message"):
+            return OperationResult(request_id=request_id, success=False, error_message=reply["error_message"])
+        return OperationResult(request_id=request_id, success=True, data=bool(reply.get("interrupted")))
+
+    async def restart(self) -> OperationResult:
+        """
+        Restart the interpreter, discarding all state of this context.
+
+        Returns:
+            OperationResult: data is the new kernel pid on success.
+        """
+        result = await self._code._start_context(self.name, replace=True)
+        if not result.success:
+            return OperationResult(request_id=result.request_id, success=False, error_message=result.error_message)
+        self.process = result.context.process
+        return OperationResult(request_id=result.request_id, success=True, data=self.process.pid)
+
+    async def destroy(self) -> OperationResult:
+        """
+        Stop the interpreter and remove the context from the session.
+
+        Returns:
+            OperationResult: Success status of the operation.
+        """
+        script = (
+            f"d={shlex.quote(self.context_dir)}; id=$(cat \"$d/process_id\" 2>/dev/null); "
+            f"p={shlex.quote(_PROCESS_ROOT)}/$id; pid=$(cat \"$p/pid\" 2>/dev/null); "
+            "if [ -n \"$id\" ] && [ -n \"$pid\" ]; then "
+            "kill -TERM \"-$pid\" 2>/dev/null || kill -TERM \"$pid\" 2>/dev/null; "
+            "rm -rf \"$p\"; fi; rm -rf \"$d\""
+        )
+        result = await self._code.session.command.execute_command(script)
+        if not result.success:
+            return OperationResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=result.error_message or "Failed to destroy code context",
+            )
+        self.process = None
+        return OperationResult(request_id=result.request_id, success=True, data=True)
+
 
 class AsyncCode(AsyncBaseService):
     """
@@ -599,3 +820,174 @@ class AsyncCode(AsyncBaseService):
             on_stderr=on_stderr,
             on_error=on_error,
         )
+
+    @staticmethod
+    def _validate_context_name(name: str) -> None:
+        if not _CONTEXT_NAME_PATTERN.match(name or ""):
+            raise ValueError(
+                f"Invalid context name {name!r}: use 1-64 letters, digits, '.', '_' or '-'"
+            )
+
+    async def _start_context(self, name: str, replace: bool = False) -> CodeContextResult:
+        """
+        Start the kernel of a context in one shell call, reusing a live kernel
+        unless replace is True.
+        """
+        ctx_dir = f"{_CONTEXT_ROOT}/{name}"
+        process_id = uuid.uuid4().hex[:12]
+        proc_dir = f"{_PROCESS_ROOT}/{process_id}"
+        kernel_command = f"python3 -u {shlex.quote(ctx_dir + '/kernel.py')} {shlex.quote(ctx_dir)}"
+        if replace:
+            on_live = (
+                "kill -TERM \"-$pid\" 2>/dev/null || kill -TERM \"$pid\" 2>/dev/null; "
+                "rm -rf \"$p/$old\""
+            )
+        else:
+            on_live = f"echo \"{_CONTEXT_MARKER} $old $pid\"; exit 0"
+        script = (
+            f"c={shlex.quote(ctx_dir)}; mkdir -p \"$c\" || exit 1\n"
+            "cat > \"$c/kernel.py\" <<'__AGENTBAY_KERNEL_EOF__'\n"
+            f"{KERNEL_SERVER_SOURCE.strip()}\n"
+            "__AGENTBAY_KERNEL_EOF__\n"
+            f"p={shlex.quote(_PROCESS_ROOT)}; old=$(cat \"$c/process_id\" 2>/dev/null); "
+            "pid=$(cat \"$p/$old/pid\" 2>/dev/null)\n"
+            f"if [ -n \"$old\" ] && [ -n \"$pid\" ] && {_PID_ALIVE_CHECK}; then {on_live}; fi\n"
+            f"rm -f \"$c/pid\"; printf '%s' {process_id} > \"$c/process_id\"\n"
+            f"{_process_start_script(proc_dir, kernel_command)}; "
+            f"cp {shlex.quote(proc_dir + '/pid')} \"$c/pid\""
+        )
+        result = await self.session.command.execute_command(script)
+        if not result.success:
+            return CodeContextResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=result.error_message or "Failed to start code context",
+            )
+        lines = (result.stdout or result.output).strip().splitlines()
+        try:
+            fields = lines[-1].split()
+            if fields[0] == _CONTEXT_MARKER:
+                process_id, pid = fields[1], int(fields[2])
+            else:
+                pid = int(fields[0])
+        except (IndexError, ValueError):
+            return CodeContextResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=f"Failed to start code context: unexpected output {result.output!r}",
+            )
+        process = ProcessHandle(self.session.command, process_id, pid, kernel_command)
+        _logger.info(f"Code context {name} running with pid {pid}")
+        return CodeContextResult(
+            request_id=result.request_id,
+            success=True,
+            context=CodeContext(self, name, process),
+        )
+
+    async def create_context(
+        self, name: Optional[str] = None, language: str = "python"
+    ) -> CodeContextResult:
+        """
+        Create a persistent interpreter context, or reuse a running one of the same name.
+
+        State (variables, imports, definitions) persists across runs in the same
+        context. Separate contexts run in separate processes and can execute
+        concurrently, see run_in_contexts().
+
+        Args:
+            name: Context name. A random name is generated when omitted.
+            language: Interpreter language. Only 'python' is supported.
+
+        Returns:
+            CodeContextResult: context is the CodeContext handle on success.
+
+        Raises:
+            ValueError: If the name is invalid.
+
+        Example:
+            ctx = (await session.code.create_context("analysis")).context
+            await ctx.run("import math; x = 21")
+            result = await ctx.run("math.sqrt(x * 2)")
+            print(result.result)
+            await ctx.destroy()
+        """
+        if language.lower() != "python":
+            return CodeContextResult(
+                success=False,
+                error_message=f"Unsupported language for code contexts: {language}. Supported: python",
+            )
+        name = name or f"ctx-{uuid.uuid4().hex[:8]}"
+        self._validate_context_name(name)
+        return await self._start_context(name)
+
+    def get_context(self, name: str) -> CodeContext:
+        """
+        Get a handle for an existing context without contacting the session.
+
+        Args:
+            name: Context name.
+
+        Returns:
+            CodeContext: Handle for the context.
+        """
+        self._validate_context_name(name)
+        return CodeContext(self, name)
+
+    async def list_contexts(self) -> CodeContextListResult:
+        """
+        List the code contexts of this session.
+
+        Returns:
+            CodeContextListResult: One CodeContextInfo per context, running or not.
+        """
+        script = (
+            f"p={shlex.quote(_PROCESS_ROOT)}; "
+            f"for c in {shlex.quote(_CONTEXT_ROOT)}/*/; do [ -f \"$c/process_id\" ] || continue; "
+            "id=$(cat \"$c/process_id\"); pid=$(cat \"$p/$id/pid\" 2>/dev/null); "
+            f"if [ -n \"$pid\" ] && {_PID_ALIVE_CHECK}; then st=running; else st=stopped; fi; "
+            "printf '%s\\t%s\\t%s\\t%s\\n' \"$(basename \"$c\")\" \"$id\" \"$pid\" \"$st\"; done"
+        )
+        result = await self.session.command.execute_command(script)
+        if not result.success:
+            return CodeContextListResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=result.error_message or "Failed to list code contexts",
+            )
+        contexts: List[CodeContextInfo] = []
+        for line in (result.stdout or result.output).splitlines():
+            fields = line.split("\t")
+            if len(fields) != 4:
+                continue
+            try:
+                pid = int(fields[2]) if fields[2] else 0
+            except ValueError:
+                pid = 0
+            contexts.append(
+                CodeContextInfo(
+                    name=fields[0],
+                    process_id=fields[1],
+                    pid=pid,
+                    running=fields[3] == "running",
+                )
+            )
+        return CodeContextListResult(request_id=result.request_id, success=True, contexts=contexts)
+
+    async def run_in_contexts(
+        self, jobs: Dict[str, str], timeout_s: int = 300
+    ) -> Dict[str, EnhancedCodeExecutionResult]:
+        """
+        Run code in several contexts concurrently.
+
+        Args:
+            jobs: Mapping of context name to the code to run in it. The contexts
+                must already exist.
+            timeout_s: Time limit applied to each cell.
+
+        Returns:
+            Dict[str, EnhancedCodeExecutionResult]: Result per context name.
+        """
+        names = list(jobs)
+        tasks = [self.get_context(name).run(jobs[name], timeout_s=timeout_s) for name in names]
+        results = await asyncio.gather(*tasks)
+        return dict(zip(names, results))
@@ -1,15 +1,557 @@
+import asyncio
 import json
-from typing import Any, Dict, Optional
+import shlex
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from .._common.exceptions import AgentBayError, CommandError
 from .._common.logger import get_logger
-from .._common.models.command import CommandResult
-from .._common.models.response import ApiResponse
+from .._common.models.command import (
+    BackgroundProcessListResult,
+    BatchCommandResult,
+    CommandOutputChunk,
+    CommandResult,
+    ProcessInfo,
+)
+from .._common.models.response import ApiResponse, OperationResult
 from .base_service import AsyncBaseService
 
 # Initialize _logger for this module
 _logger = get_logger("command")
 
+# MCP server that hosts the shell tool when the session tool list does not say otherwise.
+_DEFAULT_SHELL_SERVER = "wuying_shell"
+
+# Background processes keep their pid, command line, output and exit code here.
+_PROCESS_ROOT = "/tmp/.agentbay/processes"
+
+# Markers separating the sections of a process status script's output.
+_STATUS_MARKER = "__AGENTBAY_PROC_STATUS__"
+_STDOUT_MARKER = "__AGENTBAY_PROC_STDOUT__"
+_STDERR_MARKER = "__AGENTBAY_PROC_STDERR__"
+
+# Extra time given to the shell call on top of the server-side wait in ProcessHandle.wait().
+_PROCESS_WAIT_MARGIN_MS = 5000
+
+# Shell test for "$pid is alive"; zombies count as exited since nothing may reap them.
+_PID_ALIVE_CHECK = 'kill -0 "$pid" 2>/dev/null && [ "$(cut -d" " -f3 /proc/$pid/stat 2>/dev/null)" != Z ]'
+
+
+class CommandExecution:
+    """
+    Handle for a shell command whose output is streamed over WebSocket.
+
+    Iterate over the handle to receive CommandOutputChunk objects as the command
+    writes them, call wait() to get the final CommandResult, or cancel() to stop
+    waiting early (for example when a build step reports a failure).
+    """
+
+    def __init__(
+        self,
+        buffer_output: bool = True,
+        on_stdout: Optional[Callable[[str], None]] = None,
+        on_stderr: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[Any], None]] = None,
+        iterable: bool = True,
+    ):
+        self._buffer_output = buffer_output
+        self._on_stdout = on_stdout
+        self._on_stderr = on_stderr
+        self._on_error = on_error
+        self._queue = asyncio.Queue() if iterable else None
+        self._exhausted = False
+        self._handle: Any = None
+        self._result: Optional[CommandResult] = None
+        self._stdout_chunks: List[str] = []
+        self._stderr_chunks: List[str] = []
+        self._error: Any = None
+        self._error_reported = False
+
+    @property
+    def invocation_id(self) -> str:
+        """The WS invocation id of the command, empty if the stream never started."""
+        return self._handle.invocation_id if self._handle is not None else ""
+
+    def _emit(self, item: Optional[CommandOutputChunk]) -> None:
+        if self._queue is not None:
+            self._queue.put_nowait(item)
+
+    def _record_error(self, err: Any) -> None:
+        if self._error is None:
+            self._error = err
+        if not self._error_reported:
+            self._error_reported = True
+            if self._on_error is not None:
+                self._on_error(err)
+
+    def _handle_event(self, invocation_id: str, data: Dict[str, Any]) -> None:
+        event_type = data.get("eventType")
+        if event_type in ("stdout", "stderr"):
+            chunk = data.get("chunk")
+            if not isinstance(chunk, str):
+                return
+            if event_type == "stdout":
+                if self._buffer_output:
+                    self._stdout_chunks.append(chunk)
+                if self._on_stdout is not None:
+                    self._on_stdout(chunk)
+            else:
+                if self._buffer_output:
+                    self._stderr_chunks.append(chunk)
+                if self._on_stderr is not None:
+                    self._on_stderr(chunk)
+            self._emit(CommandOutputChunk(stream=event_type, data=chunk))
+            return
+        if event_type == "error":
+            self._record_error(data.get("error") or data)
+
+    def _handle_end(self, invocation_id: str, data: Dict[str, Any]) -> None:
+        self._emit(None)
+
+    def _handle_error(self, invocation_id: str, err: Exception) -> None:
+        self._record_error(err)
+        self._emit(None)
+
+    def __aiter__(self) -> "CommandExecution":
+        return self
+
+    async def __anext__(self) -> CommandOutputChunk:
+        if self._queue is None or self._exhausted:
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is None:
+            self._exhausted = True
+            raise StopAsyncIteration
+        return item
+
+    def _error_text(self) -> str:
+        err = self._error
+        if isinstance(err, dict):
+            return str(err.get("message") or err.get("error") or err.get("code") or err)
+        return str(err) if err is not None else ""
+
+    def _build_result(self, end_data: Dict[str, Any]) -> CommandResult:
+        stdout = "".join(self._stdout_chunks)
+        stderr = "".join(self._stderr_chunks)
+        exit_code = end_data.get("exitCode", end_data.get("exit_code", 0))
+        if not isinstance(exit_code, int):
+            try:
+                exit_code = int(exit_code)
+            except (TypeError, ValueError):
+                exit_code = -1
+        trace_id = str(end_data.get("traceId") or "")
+        if not trace_id and isinstance(self._error, dict):
+            trace_id = str(self._error.get("traceId") or "")
+        success = (
+            self._error is None
+            and exit_code == 0
+            and end_data.get("status") != "failed"
+        )
+        error_message = ""
+        if not success:
+            error_message = self._error_text() or stderr or str(
+                end_data.get("errorMessage") or "Failed to execute command"
+            )
+        return CommandResult(
+            request_id=self.invocation_id,
+            success=success,
+            output=stdout + stderr,
+            exit_code=exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            trace_id=trace_id,
+            error_message=error_message,
+        )
+
+    async def wait(self) -> CommandResult:
+        """
+        Wait for the command to exit.
+
+        Returns:
+            CommandResult: The final result. stdout/stderr are only populated when
+                the handle buffers output.
+        """
+        if self._result is not None:
+            return self._result
+        if self._handle is None:
+            self._result = CommandResult(
+                request_id="",
+                success=False,
+                error_message=f"Failed to execute command: {self._error_text()}",
+            )
+            return self._result
+        try:
+            end_data = await self._handle.wait_end()
+            self._result = self._build_result(end_data if isinstance(end_data, dict) else {})
+        except Exception as e:
+            self._record_error(e)
+            stdout = "".join(self._stdout_chunks)
+            stderr = "".join(self._stderr_chunks)
+            self._result = CommandResult(
+                request_id=self.invocation_id,
+                success=False,
+                output=stdout + stderr,
+                exit_code=-1,
+                stdout=stdout,
+                stderr=stderr,
+                error_message=f"Failed to execute command: {e}",
+            )
+        return self._result
+
+    async def cancel(self) -> None:
+        """
+        Stop receiving output for this command.
+
+        Iteration ends and wait() returns a failed result. The cancellation is
+        local to the client; use a separate kill command to stop the remote process.
+        """
+        if self._handle is not None:
+            await self._handle.cancel()
+
+
+def _process_start_script(proc_dir: str, command: str) -> str:
+    # The runner records the exit code atomically once the user command returns, so
+    # status checks never see a half-written file.
+    runner = 'sh -c "$1"; echo $? > "$0/exit_code.tmp"; mv "$0/exit_code.tmp" "$0/exit_code"'
+    return (
+        f"d={shlex.quote(proc_dir)}; mkdir -p \"$d\" || exit 1; "
+        f"printf '%s' {shlex.quote(command)} > \"$d/cmd\"; "
+        "S=''; command -v setsid >/dev/null 2>&1 && S=setsid; "
+        f"$S nohup sh -c {shlex.quote(runner)} \"$d\" {shlex.quote(command)} "
+        "> \"$d/stdout\" 2> \"$d/stderr\" < /dev/null & "
+        "echo $! > \"$d/pid\"; cat \"$d/pid\""
+    )
+
+
+def _process_status_script(proc_dir: str, tail_bytes: int = 0) -> str:
+    script = (
+        f"d={shlex.quote(proc_dir)}; pid=$(cat \"$d/pid\" 2>/dev/null); "
+        f"echo {_STATUS_MARKER}; "
+        "if [ -f \"$d/exit_code\" ]; then echo \"exited $(cat \"$d/exit_code\")\"; "
+        f"elif [ -n \"$pid\" ] && {_PID_ALIVE_CHECK}; then echo running; "
+        "else echo 'exited -1'; fi"
+    )
+    if tail_bytes > 0:
+        script += (
+            f"; printf '%s\\n' {_STDOUT_MARKER}; tail -c {int(tail_bytes)} \"$d/stdout\" 2>/dev/null"
+            f"; printf '\\n%s\\n' {_STDERR_MARKER}; tail -c {int(tail_bytes)} \"$d/stderr\" 2>/dev/null"
+        )
+    return script
+
+
+def _parse_process_status(output: str) -> Dict[str, Any]:
+    """
+    Parse the output of _process_status_script().
+
+    Returns a dict with "running", "exit_code", "stdout" and "stderr".
+    """
+    parsed: Dict[str, Any] = {"running": False, "exit_code": None, "stdout": "", "stderr": ""}
+    _, _, rest = output.partition(_STATUS_MARKER + "\n")
+    status_line, _, rest = rest.partition("\n")
+    status_line = status_line.strip()
+    if status_line == "running":
+        parsed["running"] = True
+    elif status_line.startswith("exited"):
+        try:
+            parsed["exit_code"] = int(status_line.split()[1])
+        except (IndexError, ValueError):
+            parsed["exit_code"] = -1
+    else:
+        raise ValueError(f"Unexpected process status output: {output!r}")
+
+    _, found, sections = rest.partition(_STDOUT_MARKER + "\n")
+    if found:
+        stdout, _, stderr = sections.partition("\n" + _STDERR_MARKER + "\n")
+        parsed["stdout"] = stdout
+        parsed["stderr"] = stderr
+    return parsed
+
+
+def _build_batch_script(
+    commands: List[str],
+    timeouts_ms: List[Optional[int]],
+    nonce: str,
+    parallel: bool,
+    stop_on_error: bool,
+) -> str:
+    """Build the remote script run by execute_many()."""
+    # Android images have no /tmp; fall back to the shell-writable temp dir there.
+    lines = [
+        'd=$(mktemp -d 2>/dev/null || mktemp -d -p /data/local/tmp) || exit 1',
+        "ok=1",
+    ]
+    for i, (command, timeout_ms) in enumerate(zip(commands, timeouts_ms)):
+        run = f"sh -c {shlex.quote(command)}"
+        if timeout_ms:
+            run = f"timeout {timeout_ms / 1000:g} {run}"
+        step = f'{run} > "$d/{i}.out" 2> "$d/{i}.err" < /dev/null; echo $? > "$d/{i}.rc"'
+        if parallel:
+            lines.append(f"{{ {step}; }} &")
+        elif stop_on_error:
+            lines.append(
+                f'if [ "$ok" = 1 ]; then {step}; [ "$(cat "$d/{i}.rc")" = 0 ] || ok=0; fi'
+            )
+        else:
+            lines.append(step)
+    if parallel:
+        lines.append("wait")
+    out_marker = f"__AGENTBAY_BATCH_{nonce}_OUT__"
+    err_marker = f"__AGENTBAY_BATCH_{nonce}_ERR__"
+    for i in range(len(commands)):
+        lines.append(
+            f"printf '\\n%s\\n' __AGENTBAY_BATCH_{nonce}_{i}__; "
+            f'cat "$d/{i}.rc" 2>/dev/null || echo skipped; '
+            f"printf '%s\\n' {out_marker}; cat \"$d/{i}.out\" 2>/dev/null; "
+            f"printf '\\n%s\\n' {err_marker}; cat \"$d/{i}.err\" 2>/dev/null"
+        )
+    lines.append('rm -rf "$d"')
+    return "\n".join(lines)
+
+
+def _parse_batch_output(
+    output: str,
+    count: int,
+    nonce: str,
+    timeouts_ms: List[Optional[int]],
+    request_id: str = "",
+) -> List[CommandResult]:
+    """
+    Split the output of a _build_batch_script() run into one CommandResult per command.
+
+    Raises:
+        ValueError: If the output does not contain a section for every command.
+    """
+    out_marker = f"__AGENTBAY_BATCH_{nonce}_OUT__\n"
+    err_marker = f"\n__AGENTBAY_BATCH_{nonce}_ERR__\n"
+    results: List[CommandResult] = []
+    for i in range(count):
+        start_marker = f"__AGENTBAY_BATCH_{nonce}_{i}__\n"
+        start = output.find(start_marker)
+        if start < 0:
+            raise ValueError(f"Missing output section for command {i}")
+        start += len(start_marker)
+        end = output.find(f"\n__AGENTBAY_BATCH_{nonce}_{i + 1}__\n", start) if i + 1 < count else -1
+        section = output[start:] if end < 0 else output[start:end]
+
+        status_line, _, rest = section.partition("\n")
+        rest = rest[len(out_marker):] if rest.startswith(out_marker) else rest
+        stdout, _, stderr = rest.partition(err_marker)
+        status_line = status_line.strip()
+
+        if status_line == "skipped":
+            results.append(
+                CommandResult(
+                    request_id=request_id,
+                    success=False,
+                    exit_code=-1,
+                    error_message="Skipped because an earlier command failed",
+                )
+            )
+            continue
+        try:
+            exit_code = int(status_line)
+        except ValueError:
+            exit_code = -1
+        error_message = ""
+        if exit_code != 0:
+            if timeouts_ms[i] and exit_code == 124:
+                error_message = f"Command timed out after {timeouts_ms[i]}ms"
+            else:
+                error_message = stderr or f"Command exited with code {exit_code}"
+        results.append(
+            CommandResult(
+                request_id=request_id,
+                success=exit_code == 0,
+                output=stdout + stderr,
+                exit_code=exit_code,
+                stdout=stdout,
+                stderr=stderr,
+                error_message=error_message,
+            )
+        )
+    return results
+
+
+class ProcessHandle:
+    """
+    Handle for a background process started with command.start().
+
+    The process keeps running after the starting call returns. Its output and exit
+    code are kept in the session so the handle can be re-attached later from
+    command.list_processes().
+    """
+
+    def __init__(self, command_service: "AsyncCommand", process_id: str, pid: int, command: str = ""):
+        self._command = command_service
+        self.process_id = process_id
+        self.pid = pid
+        self.command = command
+        self.exit_code: Optional[int] = None
+
+    @property
+    def proc_dir(self) -> str:
+        """Directory in the session holding the process output and exit code."""
+        return f"{_PROCESS_ROOT}/{self.process_id}"
+
+    def __repr__(self) -> str:
+        return f"ProcessHandle(process_id={self.process_id!r}, pid={self.pid})"
+
+    async def status(self) -> OperationResult:
+        """
+        Check whether the process is still running.
+
+        Returns:
+            OperationResult: data is a ProcessInfo on success.
+        """
+        result = await self._command.execute_command(_process_status_script(self.proc_dir))
+        if not result.success:
+            return OperationResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=result.error_message or "Failed to get process status",
+            )
+        try:
+            parsed = _parse_process_status(result.stdout or result.output)
+        except ValueError as e:
+            return OperationResult(request_id=result.request_id, success=False, error_message=str(e))
+        self.exit_code = parsed["exit_code"]
+        return OperationResult(
+            request_id=result.request_id,
+            success=True,
+            data=ProcessInfo(
+                process_id=self.process_id,
+                pid=self.pid,
+                command=self.command,
+                running=parsed["running"],
+                exit_code=parsed["exit_code"],
+            ),
+        )
+
+    async def wait(self, timeout_ms: int = 50000, tail_bytes: int = 65536) -> CommandResult:
+        """
+        Wait for the process to exit.
+
+        The wait happens inside the session in a single shell call, so no polling
+        round trips are made while the process runs.
+
+        Args:
+            timeout_ms: Maximum time to wait in milliseconds (default: 50000ms/50s).
+            tail_bytes: How many trailing bytes of stdout/stderr to return.
+
+        Returns:
+            CommandResult: exit_code and the output tail once the process has exited.
+                success is False with exit_code -1 if it is still running at timeout.
+        """
+        wait_s = max(0, (timeout_ms + 999) // 1000)
+        script = (
+            f"d={shlex.quote(self.proc_dir)}; pid=$(cat \"$d/pid\" 2>/dev/null); "
+            f"end=$(( $(date +%s) + {wait_s} )); "
+            f"while [ ! -f \"$d/exit_code\" ] && [ -n \"$pid\" ] && {_PID_ALIVE_CHECK} "
+            "&& [ $(date +%s) -lt $end ]; do sleep 0.2; done; "
+            + _process_status_script(self.proc_dir, tail_bytes=tail_bytes)
+        )
+        result = await self._command.execute_command(
+            script, timeout_ms=timeout_ms + _PROCESS_WAIT_MARGIN_MS
+        )
+        if not result.success:
+            return result
+        try:
+            parsed = _parse_process_status(result.stdout or result.output)
+        except ValueError as e:
+            return CommandResult(request_id=result.request_id, success=False, error_message=str(e))
+
+        stdout = parsed["stdout"]
+        stderr = parsed["stderr"]
+        if parsed["running"]:
+            return CommandResult(
+                request_id=result.request_id,
+                success=False,
+                output=stdout + stderr,
+                exit_code=-1,
+                stdout=stdout,
+                stderr=stderr,
+                error_message=f"Process {self.pid} is still running after {timeout_ms}ms",
+            )
+        self.exit_code = parsed["exit_code"]
+        return CommandResult(
+            request_id=result.request_id,
+            success=self.exit_code == 0,
+            output=stdout + stderr,
+            exit_code=self.exit_code,
+            stdout=stdout,
+            stderr=stderr,
+            error_message="" if self.exit_code == 0 else (stderr or f"Process exited with code {self.exit_code}"),
+        )
+
+    async def kill(self, signal: str = "TERM") -> OperationResult:
+        """
+        Send a signal to the process and its children.
+
+        Args:
+            signal: Signal name without the SIG prefix, e.g. "TERM", "KILL" or "INT".
+
+        Returns:
+            OperationResult: success is True if the signal was delivered.
+        """
+        if not signal.isalnum():
+            raise ValueError(f"Invalid signal name: {signal!r}")
+        script = (
+            f"pid=$(cat {shlex.quote(self.proc_dir + '/pid')}) || exit 1; "
+            f"kill -{signal.upper()} \"-$pid\" 2>/dev/null || kill -{signal.upper()} \"$pid\""
+        )
+        result = await self._command.execute_command(script)
+        return OperationResult(
+            request_id=result.request_id,
+            success=result.success,
+            error_message="" if result.success else (result.error_message or f"Failed to kill process {self.pid}"),
+        )
+
+    async def tail(self, lines: int = 100, stream: str = "stdout") -> OperationResult:
+        """
+        Read the last lines of the process output.
+
+        Args:
+            lines: Number of lines to return.
+            stream: "stdout" or "stderr".
+
+        Returns:
+            OperationResult: data is the output text on success.
+        """
+        if stream not in ("stdout", "stderr"):
+            raise ValueError("stream must be 'stdout' or 'stderr'")
+        result = await self._command.execute_command(
+            f"tail -n {int(lines)} {shlex.quote(f'{self.proc_dir}/{stream}')}"
+        )
+        return OperationResult(
+            request_id=result.request_id,
+            success=result.success,
+            data=result.stdout if result.success else None,
+            error_message=result.error_message,
+        )
+
+    async def stream(self, stream: str = "stdout", timeout_ms: int = 50000) -> CommandExecution:
+        """
+        Follow the process output over WebSocket until it exits.
+
+        Output already written is replayed first. Requires the session to have a
+        valid ws_url and a `tail` that supports --pid (GNU coreutils).
+
+        Args:
+            stream: "stdout" or "stderr".
+            timeout_ms: Maximum time to follow the output in milliseconds.
+
+        Returns:
+            CommandExecution: Handle yielding the output chunks.
+        """
+        if stream not in ("stdout", "stderr"):
+            raise ValueError("stream must be 'stdout' or 'stderr'")
+        d = shlex.quote(self.proc_dir)
+        return await self._command.stream(
+            f"d={d}; tail -n +1 -F --pid=\"$(cat \"$d/pid\")\" \"$d/{stream}\" 2>/dev/null",
+            timeout_ms=timeout_ms,
+            buffer_output=False,
+        )
+
 
 class AsyncCommand(AsyncBaseService):
     """
@@ -25,6 +567,10 @@ class AsyncCommand(AsyncBaseService):
         timeout_ms: int = 50000,
         cwd: Optional[str] = None,
         envs: Optional[Dict[str, str]] = None,
+        stream_beta: bool = False,
+        on_stdout: Optional[Callable[[str], None]] = None,
+        on_stderr: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[Any], None]] = None,
     ) -> CommandResult:
         """
         Execute a shell command with optional working directory and environment variables.
@@ -40,6 +586,15 @@ class AsyncCommand(AsyncBaseService):
                 the command runs in the default session directory
             envs: Environment variables as a dictionary of key-value pairs.
                 These variables are set for the command execution only
+            stream_beta: If True, use WebSocket streaming so stdout/stderr are delivered
+                while the command runs. Requires the session to have a valid ws_url.
+                Default is False.
+            on_stdout: Callback invoked with each stdout chunk during streaming.
+                Only used when stream_beta=True.
+            on_stderr: Callback invoked with each stderr chunk during streaming.
+                Only used when stream_beta=True.
+            on_error: Callback invoked when an error occurs during streaming.
+                Only used when stream_beta=True.
 
         Returns:
             CommandResult: Result object containing:
@@ -73,19 +628,22 @@ class AsyncCommand(AsyncBaseService):
             await session.delete()
         """
         # Validate environment variables - strict type checking (before try block to allow ValueError to propagate)
-        if envs is not None:
-            invalid_vars = []
-            for key, value in envs.items():
-                if not isinstance(key, str):
-                    invalid_vars.append(f"key '{key}' (type: {type(key).__name__})")
-                if not isinstance(value, str):
-                    invalid_vars.append(f"value for key '{key}' (type: {type(value).__name__})")
-
-            if invalid_vars:
-                raise ValueError(
-                    f"Invalid environment variables: all keys and values must be strings. "
-                    f"Found invalid entries: {', '.join(invalid_vars)}"
-                )
+        self._validate_envs(envs)
+
+        if stream_beta:
+            execution = await self._start_command_stream_ws(
+                command=command,
+                timeout_ms=timeout_ms,
+                cwd=cwd,
+                envs=envs,
+                execution=CommandExecution(
+                    on_stdout=on_stdout,
+                    on_stderr=on_stderr,
+                    on_error=on_error,
+                    iterable=False,
+                ),
+            )
+            return await execution.wait()
 
         try:
             # Build request arguments
@@ -189,6 +747,10 @@ class AsyncCommand(AsyncBaseService):
         timeout_ms: int = 50000,
         cwd: Optional[str] = None,
         envs: Optional[Dict[str, str]] = None,
+        stream_beta: bool = False,
+        on_stdout: Optional[Callable[[str], None]] = None,
+        on_stderr: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[Any], None]] = None,
     ) -> CommandResult:
         """
         Alias of execute_command() for better ergonomics and LLM friendliness.
@@ -198,6 +760,10 @@ class AsyncCommand(AsyncBaseService):
             timeout_ms=timeout_ms,
             cwd=cwd,
             envs=envs,
+            stream_beta=stream_beta,
+            on_stdout=on_stdout,
+            on_stderr=on_stderr,
+            on_error=on_error,
         )
 
     async def exec(
@@ -206,6 +772,10 @@ class AsyncCommand(AsyncBaseService):
         timeout_ms: int = 50000,
         cwd: Optional[str] = None,
         envs: Optional[Dict[str, str]] = None,
+        stream_beta: bool = False,
+        on_stdout: Optional[Callable[[str], None]] = None,
+        on_stderr: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[Any], None]] = None,
     ) -> CommandResult:
         """
         Alias of execute_command() for better ergonomics and LLM friendliness.
@@ -215,4 +785,302 @@ class AsyncCommand(AsyncBaseService):
             timeout_ms=timeout_ms,
             cwd=cwd,
             envs=envs,
+            stream_beta=stream_beta,
+            on_stdout=on_stdout,
+            on_stderr=on_stderr,
+            on_error=on_error,
         )
+
+    async def stream(
+        self,
+        command: str,
+        timeout_ms: int = 50000,
+        cwd: Optional[str] = None,
+        envs: Optional[Dict[str, str]] = None,
+        buffer_output: bool = True,
+    ) -> CommandExecution:
+        """
+        Start a shell command and stream its output over WebSocket.
+
+        Args:
+            command: The shell command to execute
+            timeout_ms: Timeout in milliseconds (default: 50000ms/50s).
+            cwd: The working directory for command execution.
+            envs: Environment variables for the command execution only.
+            buffer_output: If True (default), the handle also keeps the full output so
+                wait() can return it in CommandResult.stdout/stderr. Set to False for
+                chatty commands whose output is only consumed incrementally.
+
+        Returns:
+            CommandExecution: Handle that yields CommandOutputChunk objects when iterated.
+                If the stream cannot be started, iteration ends immediately and wait()
+                returns a failed CommandResult.
+
+        Example:
+            execution = await session.command.stream("make test", timeout_ms=600000)
+            async for chunk in execution:
+                print(chunk.data, end="")
+                if "FAILED" in chunk.data:
+                    await execution.cancel()
+            result = await execution.wait()
+            print(result.exit_code)
+        """
+        self._validate_envs(envs)
+        return await self._start_command_stream_ws(
+            command=command,
+            timeout_ms=timeout_ms,
+            cwd=cwd,
+            envs=envs,
+            execution=CommandExecution(buffer_output=buffer_output),
+        )
+
+    async def execute_many(
+        self,
+        commands: List[str],
+        timeout_ms: int = 50000,
+        cwd: Optional[str] = None,
+        envs: Optional[Dict[str, str]] = None,
+        parallel: bool = False,
+        stop_on_error: bool = False,
+        command_timeout_ms: Optional[Union[int, List[Optional[int]]]] = None,
+    ) -> BatchCommandResult:
+        """
+        Run several independent shell commands in a single round trip.
+
+        The commands are packed into one shell invocation. Each command runs in its
+        own `sh -c`, so a failing command does not abort the others unless
+        stop_on_error is set, and every command gets its own exit code, stdout
+        and stderr.
+
+        Args:
+            commands: The shell commands to execute.
+            timeout_ms: Timeout of the whole invocation in milliseconds (default: 50000ms/50s).
+            cwd: The working directory for all commands.
+            envs: Environment variables for all commands.
+            parallel: Run the commands concurrently on the remote side. Default is False.
+            stop_on_error: In sequential mode, skip the remaining commands once one
+                exits with a non-zero code. Ignored when parallel is True.
+            command_timeout_ms: Per-command timeout in milliseconds, either one value
+                for every command or a list aligned with commands (None entries mean
+                no limit). A command that hits its limit exits with code 124.
+
+        Returns:
+            BatchCommandResult: success is True if every command exited with 0.
+                results holds one CommandResult per command, in input order.
+
+        Example:
+            batch = await session.command.execute_many(
+                ["python3 --version", "node --version", "git --version"],
+                parallel=True,
+            )
+            for result in batch.results:
+                print(result.exit_code, result.stdout.strip())
+        """
+        if not commands:
+            return BatchCommandResult(success=True)
+        if isinstance(command_timeout_ms, list):
+            if len(command_timeout_ms) != len(commands):
+                raise ValueError("command_timeout_ms must have one entry per command")
+            timeouts_ms = list(command_timeout_ms)
+        else:
+            timeouts_ms = [command_timeout_ms] * len(commands)
+
+        nonce = uuid.uuid4().hex[:12]
+        script = _build_batch_script(commands, timeouts_ms, nonce, parallel, stop_on_error)
+        result = await self.execute_command(script, timeout_ms=timeout_ms, cwd=cwd, envs=envs)
+
+        try:
+            results = _parse_batch_output(
+                result.stdout or result.output, len(commands), nonce, timeouts_ms, result.request_id
+            )
+        except ValueError as e:
+            _logger.debug(f"Failed to parse batch output: {e}")
+            return BatchCommandResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=result.error_message or f"Failed to execute commands: {e}",
+            )
+
+        failed = [i for i, r in enumerate(results) if not r.success]
+        return BatchCommandResult(
+            request_id=result.request_id,
+            success=not failed,
+            results=results,
+            error_message=(
+                f"{len(failed)} of {len(commands)} commands failed (first: #{failed[0]})"
+                if failed
+                else ""
+            ),
+        )
+
+    async def start(
+        self,
+        command: str,
+        cwd: Optional[str] = None,
+        envs: Optional[Dict[str, str]] = None,
+    ) -> ProcessHandle:
+        """
+        Start a long-running command in the background.
+
+        The command is detached from the shell call, so it keeps running after this
+        method returns. Use the returned handle to wait for it, read or stream its
+        output, or kill it.
+
+        Args:
+            command: The shell command to run
+            cwd: The working directory of the process.
+            envs: Environment variables for the process only.
+
+        Returns:
+            ProcessHandle: Handle for the started process.
+
+        Raises:
+            CommandError: If the process could not be started.
+
+        Example:
+            server = await session.command.start("python -m http.server 8080", cwd="/tmp")
+            print(server.pid)
+            print((await server.tail(lines=20)).data)
+            await server.kill()
+        """
+        process_id = uuid.uuid4().hex[:12]
+        proc_dir = f"{_PROCESS_ROOT}/{process_id}"
+        result = await self.execute_command(
+            _process_start_script(proc_dir, command), cwd=cwd, envs=envs
+        )
+        if not result.success:
+            raise CommandError(
+                f"Failed to start process: {result.error_message or result.output}"
+            )
+        try:
+            pid = int((result.stdout or result.output).strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            raise CommandError(f"Failed to start process: unexpected output {result.output!r}")
+        _logger.info(f"Started background process {process_id} (pid {pid})")
+        return ProcessHandle(self, process_id, pid, command)
+
+    async def list_processes(self) -> BackgroundProcessListResult:
+        """
+        List background processes started with start() in this session.
+
+        Returns:
+            BackgroundProcessListResult: One ProcessInfo per started process, running or exited.
+        """
+        root = shlex.quote(_PROCESS_ROOT)
+        script = (
+            f"for d in {root}/*/; do [ -f \"$d/pid\" ] || continue; "
+            "pid=$(cat \"$d/pid\"); "
+            "if [ -f \"$d/exit_code\" ]; then st=exited; rc=$(cat \"$d/exit_code\"); "
+            f"elif {_PID_ALIVE_CHECK}; then st=running; rc=''; "
+            "else st=exited; rc=-1; fi; "
+            "printf '%s\\t%s\\t%s\\t%s\\t' \"$(basename \"$d\")\" \"$pid\" \"$st\" \"$rc\"; "
+            "head -c 1024 \"$d/cmd\" 2>/dev/null | tr '\\n\\t' '  '; echo; done"
+        )
+        result = await self.execute_command(script)
+        if not result.success:
+            return BackgroundProcessListResult(
+                request_id=result.request_id,
+                success=False,
+                error_message=result.error_message or "Failed to list processes",
+            )
+        processes: List[ProcessInfo] = []
+        for line in (result.stdout or result.output).splitlines():
+            fields = line.split("\t", 4)
+            if len(fields) < 4:
+                continue
+            try:
+                pid = int(fields[1])
+            except ValueError:
+                continue
+            exit_code: Optional[int] = None
+            if fields[3]:
+                try:
+                    exit_code = int(fields[3])
+                except ValueError:
+                    exit_code = -1
+            processes.append(
+                ProcessInfo(
+                    process_id=fields[0],
+                    pid=pid,
+                    command=fields[4] if len(fields) > 4 else "",
+                    running=fields[2] == "running",
+                    exit_code=exit_code,
+                )
+            )
+        return BackgroundProcessListResult(request_id=result.request_id, success=True, processes=processes)
+
+    def attach(self, process: ProcessInfo) -> ProcessHandle:
+        """
+        Get a handle for a process returned by list_processes().
+
+        Args:
+            process: The process to attach to.
+
+        Returns:
+            ProcessHandle: Handle for the process.
+        """
+        handle = ProcessHandle(self, process.process_id, process.pid, process.command)
+        handle.exit_code = process.exit_code
+        return handle
+
+    @staticmethod
+    def _validate_envs(envs: Optional[Dict[str, str]]) -> None:
+        if envs is None:
+            return
+        invalid_vars = []
+        for key, value in envs.items():
+            if not isinstance(key, str):
+                invalid_vars.append(f"key '{key}' (type: {type(key).__name__})")
+            if not isinstance(value, str):
+                invalid_vars.append(f"value for key '{key}' (type: {type(value).__name__})")
+
+        if invalid_vars:
+            raise ValueError(
+                f"Invalid environment variables: all keys and values must be strings. "
+                f"Found invalid entries: {', '.join(invalid_vars)}"
+            )
+
+    async def _start_command_stream_ws(
+        self,
+        *,
+        command: str,
+        timeout_ms: int,
+        cwd: Optional[str],
+        envs: Optional[Dict[str, str]],
+        execution: CommandExecution,
+    ) -> CommandExecution:
+        """
+        Start a shell command via WS streaming and attach it to the execution handle.
+
+        Internal helper. This method is async-first; sync will be generated.
+        """
+        # Determine target from MCP tool list if available.
+        target = _DEFAULT_SHELL_SERVER
+        for tool in getattr(self.session, "mcpTools", []) or []:
+            try:
+                if getattr(tool, "name", "") == "shell" and getattr(tool, "server", ""):
+                    target = tool.server
+                    break
+            except Exception:
+                continue
+
+        params: Dict[str, Any] = {"command": command, "timeoutMs": timeout_ms}
+        if cwd is not None:
+            params["cwd"] = cwd
+        if envs is not None:
+            params["envs"] = envs
+
+        try:
+            ws_client = await self.session._get_ws_client()
+            execution._handle = await ws_client.call_stream(
+                target=target,
+                data={"method": "shell", "mode": "stream", "params": params},
+                on_event=execution._handle_event,
+                on_end=execution._handle_end,
+                on_error=execution._handle_error,
+            )
+        except Exception as e:
+            _logger.error(f"Failed to start streamed command: {e}")
+            execution._record_error(e)
+            execution._emit(None)
+        return execution
@@ -26,6 +26,7 @@ from .._common.models.computer import (
     WindowListResult,
 )
 from .._common.models.response import ApiResponse, BoolResult, OperationResult
+from ._internal.single_flight import coalesced
 from .base_service import AsyncBaseService
 
 
@@ -576,6 +577,7 @@ class AsyncComputer(AsyncBaseService):
             )
 
     # Screen Operations
+    @coalesced("get_screen_size")
     async def get_screen_size(self) -> OperationResult:
         """
         Gets the screen size and DPI scaling factor.
@@ -1410,6 +1412,7 @@ class AsyncComputer(AsyncBaseService):
             )
 
     # Application Management Operations
+    @coalesced("get_installed_apps")
     async def get_installed_apps(
         self,
         start_menu: bool = True,
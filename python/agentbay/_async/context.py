@@ -1,9 +1,12 @@
 import asyncio
 import json
+import math
 import time
-from typing import TYPE_CHECKING, Any, List, Optional
+from collections import deque
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Union
 
 from .._common.exceptions import AgentBayError, ClearanceTimeoutError
+from .._common.models.context import ContextBatchResult, ContextDirSyncResult
 from .._common.models.response import (
     ApiResponse,
     OperationResult,
@@ -20,6 +23,8 @@ from ..api.models import (
     ListContextsRequest,
     ModifyContextRequest,
 )
+from ._internal.dir_sync import DirSyncEngine
+from ._internal.rate_limit import run_bounded
 
 from .._common.logger import (
     _log_api_call,
@@ -35,6 +40,10 @@ _logger = get_logger("context")
 if TYPE_CHECKING:
     from .agentbay import AsyncAgentBay
 
+# Requests in flight per bulk call. Rates and the adaptive cap are applied per
+# OpenAPI action by the client's RequestLimiter (see AgentBay(rate_limits=...)).
+_BULK_CONCURRENCY = 8
+
 
 class Context:
     """
@@ -146,6 +155,7 @@ class ContextFileEntry:
         gmt_modified: Optional[str] = None,
         size: Optional[int] = None,
         status: Optional[str] = None,
+        parent_folder_path: Optional[str] = None,
     ):
         self.file_id = file_id
         self.file_name = file_name
@@ -155,6 +165,24 @@ class ContextFileEntry:
         self.gmt_modified = gmt_modified
         self.size = size
         self.status = status
+        # Folder the entry was listed under; set by walk().
+        self.parent_folder_path = parent_folder_path
+
+    @property
+    def is_folder(self) -> bool:
+        """Whether the entry is a folder."""
+        return (self.file_type or "").upper() == "FOLDER"
+
+    @property
+    def logical_path(self) -> Optional[str]:
+        """
+        Path of the entry as used by list_files() and get_file_upload_url(), or
+        None if the parent folder is unknown. file_path may hold the raw storage path.
+        """
+        if self.parent_folder_path is None:
+            return None
+        name = self.file_name or (self.file_path or "").rstrip("/").rsplit("/", 1)[-1]
+        return self.parent_folder_path.rstrip("/") + "/" + name
 
 
 class FileUrlResult(ApiResponse):
@@ -955,6 +983,105 @@ class AsyncContextService:
             count=(getattr(body, "count", None) if body else None),
         )
 
+    async def _list_files_page(
+        self, context_id: str, folder: str, page_number: int, page_size: int
+    ) -> ContextFileListResult:
+        result = await self.list_files(
+            context_id, folder, page_number=page_number, page_size=page_size
+        )
+        if not result.success:
+            raise AgentBayError(
+                f"Failed to list files in {folder} (page {page_number}) of context {context_id}"
+            )
+        return result
+
+    async def walk(
+        self,
+        context_id: str,
+        root: str = "/",
+        max_depth: Optional[int] = None,
+        entry_filter: Optional[Callable[[ContextFileEntry], bool]] = None,
+        folder_filter: Optional[Callable[[ContextFileEntry], bool]] = None,
+        concurrency: int = 8,
+        page_size: int = 100,
+    ) -> AsyncIterator[ContextFileEntry]:
+        """
+        Iterate over all files and folders under a folder of a context.
+
+        Folders are paged through and descended into concurrently: up to
+        `concurrency` list_files() requests are in flight at a time, a new one is
+        started as soon as any finishes, and the entries of each page are yielded
+        as soon as it arrives. Every yielded entry has parent_folder_path set to
+        the folder it was listed under.
+
+        Args:
+            context_id (str): The ID of the context.
+            root (str): Folder to start from. Defaults to "/".
+            max_depth (Optional[int]): Deepest level to list. 0 lists only the entries
+                directly under root. Unlimited when None.
+            entry_filter (Optional[Callable[[ContextFileEntry], bool]]): Only entries
+                for which it returns True are yielded.
+            folder_filter (Optional[Callable[[ContextFileEntry], bool]]): Only folders
+                for which it returns True are descended into.
+            concurrency (int): Maximum concurrent list requests. Defaults to 8.
+            page_size (int): Entries per list request. Defaults to 100.
+
+        Yields:
+            ContextFileEntry: Files and folders under root, in the order their pages
+                arrive. A folder is always yielded before its contents.
+
+        Raises:
+            AgentBayError: If a folder cannot be listed.
+
+        Example:
+            ```python
+            total = 0
+            async for entry in agent_bay.context.walk(context_id, "/data"):
+                if not entry.is_folder:
+                    total += entry.size or 0
+            print(f"{total} bytes")
+            ```
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        root = "/" + root.strip("/") if root.strip("/") else "/"
+        # Each job lists one page of one folder: (folder, page_number, depth).
+        jobs = deque([(root, 1, 0)])
+        # Requests in flight, in the order they were started.
+        running: Dict[Any, Any] = {}
+        try:
+            while jobs or running:
+                while jobs and len(running) < concurrency:
+                    job = jobs.popleft()
+                    request = asyncio.ensure_future(
+                        self._list_files_page(context_id, job[0], job[1], page_size)
+                    )
+                    running[request] = job
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for request in [r for r in running if r in done]:
+                    folder, page_number, depth = running.pop(request)
+                    result = request.result()
+                    if page_number == 1 and result.count and result.count > page_size:
+                        for next_page in range(2, math.ceil(result.count / page_size) + 1):
+                            jobs.append((folder, next_page, depth))
+                    elif result.count is None and len(result.entries) >= page_size:
+                        # Total unknown: keep paging until a short page.
+                        jobs.append((folder, page_number + 1, depth))
+                    for entry in result.entries:
+                        entry.parent_folder_path = folder
+                        if (
+                            entry.is_folder
+                            and (max_depth is None or depth < max_depth)
+                            and (folder_filter is None or folder_filter(entry))
+                        ):
+                            jobs.append((entry.logical_path, 1, depth + 1))
+                        if entry_filter is None or entry_filter(entry):
+                            yield entry
+        finally:
+            # The caller stopped early or a page failed: drop the requests still running.
+            for request in running:
+                request.cancel()
+
     async def clear_async(self, context_id: str) -> ClearContextResult:
         """
         Asynchronously initiate a task to clear the context's persistent data.
@@ -1227,3 +1354,252 @@ class AsyncContextService:
         error_msg = f"Context clearing timed out after {elapsed:.2f} seconds"
         _logger.error(f"{error_msg}")
         raise ClearanceTimeoutError(error_msg)
+
+    @staticmethod
+    def _batch_result(keys: List[str], results: Dict[str, Any]) -> ContextBatchResult:
+        ordered = {key: results[key] for key in keys}
+        failed = [key for key, r in ordered.items() if not getattr(r, "success", False)]
+        return ContextBatchResult(
+            success=not failed,
+            results=ordered,
+            error_message=f"{len(failed)} of {len(keys)} item(s) failed" if failed else "",
+        )
+
+    async def delete_many(
+        self,
+        contexts: List[Union[Context, str]],
+        concurrency: int = _BULK_CONCURRENCY,
+        on_result: Optional[Callable[[str, OperationResult], None]] = None,
+    ) -> ContextBatchResult:
+        """
+        Delete many contexts concurrently.
+
+        Each DeleteContext call goes through the client's request limiter, so the
+        rate_limits and max_concurrency given to AgentBay apply.
+
+        Args:
+            contexts (List[Union[Context, str]]): Contexts or context IDs to delete.
+            concurrency (int): Maximum requests in flight. Defaults to 8.
+            on_result (Optional[Callable[[str, OperationResult], None]]): Called with the
+                context ID and its result as each deletion completes.
+
+        Returns:
+            ContextBatchResult: OperationResult per context ID.
+
+        Example:
+            ```python
+            listed = await agent_bay.context.list()
+            result = await agent_bay.context.delete_many(listed.contexts)
+            print(result.failed)
+            ```
+        """
+        targets = {}
+        for item in contexts:
+            context = item if isinstance(item, Context) else Context(id=item, name="")
+            targets.setdefault(context.id, context)
+        results: Dict[str, Any] = {}
+
+        async def _delete(context_id: str) -> None:
+            try:
+                result = await self.delete(targets[context_id])
+            except Exception as e:
+                result = OperationResult(success=False, data=False, error_message=str(e))
+            results[context_id] = result
+            if on_result is not None:
+                on_result(context_id, result)
+
+        await run_bounded(list(targets), _delete, concurrency)
+        return self._batch_result(list(targets), results)
+
+    async def get_many(
+        self,
+        context_ids: Optional[List[str]] = None,
+        names: Optional[List[str]] = None,
+        create: bool = False,
+        concurrency: int = _BULK_CONCURRENCY,
+        on_result: Optional[Callable[[str, ContextResult], None]] = None,
+    ) -> ContextBatchResult:
+        """
+        Get many contexts by ID and/or name concurrently.
+
+        Each GetContext call goes through the client's request limiter.
+
+        Args:
+            context_ids (Optional[List[str]]): Context IDs to get.
+            names (Optional[List[str]]): Context names to get.
+            create (bool): Create the contexts given by name if they do not exist.
+            concurrency (int): Maximum requests in flight. Defaults to 8.
+            on_result (Optional[Callable[[str, ContextResult], None]]): Called with the
+                ID or name and its result as each lookup completes.
+
+        Returns:
+            ContextBatchResult: ContextResult per context ID or name.
+        """
+        items = {}
+        for context_id in context_ids or []:
+            items.setdefault(context_id, {"context_id": context_id})
+        for name in names or []:
+            items.setdefault(name, {"name": name, "create": create})
+        results: Dict[str, Any] = {}
+
+        async def _get(key: str) -> None:
+            try:
+                result = await self.get(**items[key])
+            except Exception as e:
+                result = ContextResult(success=False, error_message=str(e))
+            results[key] = result
+            if on_result is not None:
+                on_result(key, result)
+
+        await run_bounded(list(items), _get, concurrency)
+        return self._batch_result(list(items), results)
+
+    async def clear_many(
+        self,
+        context_ids: List[str],
+        timeout: int = 60,
+        poll_interval: float = 2.0,
+        concurrency: int = _BULK_CONCURRENCY,
+        on_result: Optional[Callable[[str, ClearContextResult], None]] = None,
+    ) -> ContextBatchResult:
+        """
+        Clear many contexts and wait for all of them with one shared polling loop.
+
+        All clearing tasks are started first. Then every poll_interval the status of
+        all pending contexts is queried in one round, instead of one sleep loop per
+        context. ClearContext and GetContext calls go through the client's request
+        limiter.
+
+        Args:
+            context_ids (List[str]): IDs of the contexts to clear.
+            timeout (int): Seconds to wait for all clears to finish. Defaults to 60.
+            poll_interval (float): Seconds between polling rounds. Defaults to 2.0.
+            concurrency (int): Maximum requests in flight. Defaults to 8.
+            on_result (Optional[Callable[[str, ClearContextResult], None]]): Called with
+                the context ID and its final result as each clear completes or fails.
+
+        Returns:
+            ContextBatchResult: ClearContextResult per context ID. Contexts still
+                clearing at the timeout are reported as failed instead of raising
+                ClearanceTimeoutError.
+        """
+        keys = list(dict.fromkeys(context_ids))
+        results: Dict[str, Any] = {}
+        started: Dict[str, ClearContextResult] = {}
+
+        def _finish(context_id: str, result: ClearContextResult) -> None:
+            results[context_id] = result
+            if on_result is not None:
+                on_result(context_id, result)
+
+        async def _start(context_id: str) -> None:
+            try:
+                result = await self.clear_async(context_id)
+            except Exception as e:
+                result = ClearContextResult(success=False, context_id=context_id, error_message=str(e))
+            if result.success:
+                started[context_id] = result
+            else:
+                _finish(context_id, result)
+
+        async def _poll(context_id: str) -> None:
+            try:
+                status_result = await self.get_clear_status(context_id)
+            except Exception as e:
+                status_result = ClearContextResult(success=False, context_id=context_id, error_message=str(e))
+            if not status_result.success:
+                _finish(context_id, status_result)
+                return
+            started[context_id].status = status_result.status
+            if status_result.status == "available":
+                _finish(
+                    context_id,
+                    ClearContextResult(
+                        request_id=started[context_id].request_id,
+                        success=True,
+                        context_id=context_id,
+                        status="available",
+                    ),
+                )
+
+        await run_bounded(keys, _start, concurrency)
+        _logger.info(f"Started clearing {len(started)} of {len(keys)} contexts")
+
+        deadline = time.monotonic() + timeout
+        pending = [key for key in keys if key in started]
+        while pending and time.monotonic() < deadline:
+            await asyncio.sleep(poll_interval)
+            await run_bounded(pending, _poll, concurrency)
+            pending = [key for key in pending if key not in results]
+
+        for context_id in pending:
+            _finish(
+                context_id,
+                ClearContextResult(
+                    request_id=started[context_id].request_id,
+                    success=False,
+                    context_id=context_id,
+                    status=started[context_id].status,
+                    error_message=f"Context clearing timed out after {timeout} seconds",
+                ),
+            )
+        return self._batch_result(keys, results)
+
+    async def sync_dir(
+        self,
+        local_dir: str,
+        context_id: str,
+        prefix: str = "/",
+        direction: str = "upload",
+        delete: bool = False,
+        concurrency: int = 8,
+        exclude: Optional[List[str]] = None,
+        manifest_path: Optional[str] = None,
+    ) -> ContextDirSyncResult:
+        """
+        Mirror a local directory and a folder of a context, transferring only changed files.
+
+        The remote tree is listed with concurrent paging and compared with a local
+        manifest of the previous sync (size, mtime and SHA-256 of each file), so
+        repeated syncs of a mostly unchanged directory only move the files that
+        changed. Transfers run in parallel over one pooled HTTP client.
+
+        Args:
+            local_dir (str): Local directory to sync.
+            context_id (str): The ID of the context.
+            prefix (str): Context folder that mirrors local_dir. Defaults to "/".
+            direction (str): "upload" makes the context match local_dir, "download"
+                makes local_dir match the context. Defaults to "upload".
+            delete (bool): Remove files on the destination side that do not exist on
+                the source side. Defaults to False.
+            concurrency (int): Maximum parallel listing and transfer requests. Defaults to 8.
+            exclude (Optional[List[str]]): Glob patterns of relative paths or file
+                names to skip, e.g. ["Cache/*", "*.lock"].
+            manifest_path (Optional[str]): Where to keep the sync manifest. Defaults to
+                ".agentbay-sync-manifest.json" inside local_dir, which is never synced.
+
+        Returns:
+            ContextDirSyncResult: Files uploaded, downloaded, deleted, skipped and failed.
+
+        Raises:
+            ValueError: If direction or concurrency is invalid.
+
+        Example:
+            ```python
+            ctx = await agent_bay.context.get(name="workspace", create=True)
+            result = await agent_bay.context.sync_dir("./workspace", ctx.context_id, prefix="/workspace")
+            print(f"{len(result.uploaded)} uploaded, {result.skipped} unchanged")
+            ```
+        """
+        engine = DirSyncEngine(
+            self,
+            local_dir,
+            context_id,
+            prefix=prefix,
+            direction=direction,
+            delete=delete,
+            concurrency=concurrency,
+            exclude=exclude,
+            manifest_path=manifest_path,
+        )
+        return await engine.run()
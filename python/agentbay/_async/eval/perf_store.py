@@ -0,0 +1,404 @@
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+_DEFAULT_STORE = os.path.join(os.path.dirname(__file__), "eval-results.jsonl")
+
+# Run fields copied from run_single_task() results into the store.
+_PERF_FIELDS = (
+    "total_duration_s",
+    "browser_setup_s",
+    "task_duration_s",
+    "llm_duration_s",
+    "llm_call_count",
+    "total_tokens",
+)
+
+
+def current_revision(cwd: Optional[str] = None) -> str:
+    """
+    The revision results are recorded under.
+
+    ``AGENTBAY_EVAL_REVISION`` wins when set, otherwise the short git hash of
+    HEAD (suffixed with ``-dirty`` for uncommitted changes), or ``unknown``.
+    """
+    revision = os.environ.get("AGENTBAY_EVAL_REVISION")
+    if revision:
+        return revision
+    cwd = cwd or os.path.dirname(os.path.abspath(__file__))
+    try:
+        head = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=cwd, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=cwd, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{head}-dirty" if dirty else head
+
+
+class EvalResultStore:
+    """
+    Append-only JSONL store of eval runs, one line per task run.
+
+    Each record carries the revision, task name, trial, pass/fail and the
+    timing fields of ``run_single_task``, so runs from many revisions can be
+    compared and charted later.
+    """
+
+    def __init__(self, path: str = _DEFAULT_STORE):
+        self.path = path
+
+    def append(self, results: Iterable[Dict[str, Any]], revision: str) -> int:
+        """
+        Record run results under a revision.
+
+        Args:
+            results: Results as returned by ``run_single_task`` / ``run_tasks``.
+            revision: Revision the runs were made on.
+
+        Returns:
+            int: Number of records written.
+        """
+        recorded_at = time.time()
+        count = 0
+        with open(self.path, "a") as f:
+            for run in results:
+                performance = run.get("performance") or {}
+                record = {
+                    "revision": revision,
+                    "recorded_at": recorded_at,
+                    "task_name": run["task_name"],
+                    "trial": run.get("trial", 0),
+                    "success": bool(run["result"].get("_success")),
+                }
+                for field in _PERF_FIELDS:
+                    if field in performance:
+                        record[field] = performance[field]
+                f.write(json.dumps(record) + "\n")
+                count += 1
+        return count
+
+    def load(self, revision: Optional[str] = None) -> List[Dict[str, Any]]:
+        """All records, or only those of one revision, in the order written."""
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if revision is None or record["revision"] == revision:
+                    records.append(record)
+        return records
+
+    def revisions(self) -> List[str]:
+        """Revisions in the order they were first recorded."""
+        return list(dict.fromkeys(record["revision"] for record in self.load()))
+
+
+@dataclass
+class TaskComparison:
+    """
+    Baseline vs candidate statistics for one task.
+
+    Attributes:
+        task_name: The task.
+        baseline_runs: Baseline runs with a task duration.
+        candidate_runs: Candidate runs with a task duration.
+        baseline_median_s: Median baseline task duration.
+        candidate_median_s: Median candidate task duration.
+        latency_ratio: candidate_median_s / baseline_median_s.
+        latency_p_value: One-sided Mann-Whitney U p-value for the candidate
+            being slower.
+        baseline_success_rate: Baseline pass rate in percent.
+        candidate_success_rate: Candidate pass rate in percent.
+        success_p_value: One-sided two-proportion z-test p-value for the
+            candidate passing less often.
+        latency_regression: Slower by at least the threshold and significant.
+        success_regression: Passing less often and significant.
+    """
+
+    task_name: str
+    baseline_runs: int = 0
+    candidate_runs: int = 0
+    baseline_median_s: float = 0.0
+    candidate_median_s: float = 0.0
+    latency_ratio: float = 1.0
+    latency_p_value: float = 1.0
+    baseline_success_rate: float = 0.0
+    candidate_success_rate: float = 0.0
+    success_p_value: float = 1.0
+    latency_regression: bool = False
+    success_regression: bool = False
+
+    @property
+    def regression(self) -> bool:
+        return self.latency_regression or self.success_regression
+
+
+def _median(values: List[float]) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0.0 when empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _normal_sf(z: float) -> float:
+    """P(Z > z) for a standard normal Z."""
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def mann_whitney_greater(baseline: List[float], candidate: List[float]) -> float:
+    """
+    One-sided p-value that ``candidate`` values tend to be larger than ``baseline``.
+
+    Uses the normal approximation with tie and continuity corrections, which
+    is reasonable from about five runs per side.
+    """
+    n1, n2 = len(candidate), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    pooled = sorted([(v, 0) for v in candidate] + [(v, 1) for v in baseline])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0.0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, side) in zip(ranks, pooled) if side == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return _normal_sf(z)
+
+
+def proportion_lower(
+    baseline_passed: int, baseline_runs: int, candidate_passed: int, candidate_runs: int
+) -> float:
+    """One-sided two-proportion z-test p-value that the candidate pass rate is lower."""
+    if not baseline_runs or not candidate_runs:
+        return 1.0
+    pooled = (baseline_passed + candidate_passed) / (baseline_runs + candidate_runs)
+    if pooled in (0.0, 1.0):
+        return 1.0
+    se = math.sqrt(pooled * (1 - pooled) * (1 / baseline_runs + 1 / candidate_runs))
+    z = (baseline_passed / baseline_runs - candidate_passed / candidate_runs) / se
+    return _normal_sf(z)
+
+
+def compare_runs(
+    baseline: List[Dict[str, Any]],
+    candidate: List[Dict[str, Any]],
+    alpha: float = 0.05,
+    min_slowdown: float = 0.1,
+) -> List[TaskComparison]:
+    """
+    Compare two sets of stored runs task by task.
+
+    A latency regression needs the candidate median to be at least
+    ``min_slowdown`` (10% by default) slower and the Mann-Whitney p-value to
+    be below ``alpha``; a pass-rate regression needs the two-proportion
+    p-value below ``alpha``. Tasks missing from either side are skipped.
+
+    Returns:
+        List[TaskComparison]: One entry per task present on both sides.
+    """
+    def _by_task(records):
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            grouped.setdefault(record["task_name"], []).append(record)
+        return grouped
+
+    baseline_by_task = _by_task(baseline)
+    candidate_by_task = _by_task(candidate)
+    comparisons = []
+    for task_name, base_runs in baseline_by_task.items():
+        cand_runs = candidate_by_task.get(task_name)
+        if not cand_runs:
+            continue
+        base_times = [r["task_duration_s"] for r in base_runs if "task_duration_s" in r]
+        cand_times = [r["task_duration_s"] for r in cand_runs if "task_duration_s" in r]
+        base_passed = sum(1 for r in base_runs if r["success"])
+        cand_passed = sum(1 for r in cand_runs if r["success"])
+
+        comparison = TaskComparison(
+            task_name=task_name,
+            baseline_runs=len(base_times),
+            candidate_runs=len(cand_times),
+            baseline_median_s=_median(base_times),
+            candidate_median_s=_median(cand_times),
+            latency_p_value=mann_whitney_greater(base_times, cand_times),
+            baseline_success_rate=round(base_passed / len(base_runs) * 100, 1),
+            candidate_success_rate=round(cand_passed / len(cand_runs) * 100, 1),
+            success_p_value=proportion_lower(
+                base_passed, len(base_runs), cand_passed, len(cand_runs)
+            ),
+        )
+        if comparison.baseline_median_s:
+            comparison.latency_ratio = comparison.candidate_median_s / comparison.baseline_median_s
+        comparison.latency_regression = (
+            comparison.latency_ratio >= 1 + min_slowdown
+            and comparison.latency_p_value < alpha
+        )
+        comparison.success_regression = comparison.success_p_value < alpha
+        comparisons.append(comparison)
+    return comparisons
+
+
+def trend(
+    records: List[Dict[str, Any]], task_name: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Median task duration and pass rate per revision, in recording order.
+
+    Args:
+        records: Stored records, e.g. ``EvalResultStore.load()``.
+        task_name: Only include this task. All tasks are pooled when None.
+
+    Returns:
+        List[Dict[str, Any]]: Rows with revision, runs, median_task_duration_s
+            and success_rate.
+    """
+    by_revision: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        if task_name is None or record["task_name"] == task_name:
+            by_revision.setdefault(record["revision"], []).append(record)
+    rows = []
+    for revision, runs in by_revision.items():
+        times = [r["task_duration_s"] for r in runs if "task_duration_s" in r]
+        passed = sum(1 for r in runs if r["success"])
+        rows.append(
+            {
+                "revision": revision,
+                "runs": len(runs),
+                "median_task_duration_s": round(_median(times), 2),
+                "success_rate": round(passed / len(runs) * 100, 1),
+            }
+        )
+    return rows
+
+
+def _format_comparison(comparisons: List[TaskComparison]) -> str:
+    lines = [
+        f"{'task':<32} {'base_s':>8} {'cand_s':>8} {'ratio':>6} {'p':>6} "
+        f"{'base_%':>7} {'cand_%':>7} {'p':>6}  flag"
+    ]
+    for c in comparisons:
+        flags = []
+        if c.latency_regression:
+            flags.append("SLOWER")
+        if c.success_regression:
+            flags.append("FAILING")
+        lines.append(
+            f"{c.task_name:<32} {c.baseline_median_s:>8.2f} {c.candidate_median_s:>8.2f} "
+            f"{c.latency_ratio:>6.2f} {c.latency_p_value:>6.3f} "
+            f"{c.baseline_success_rate:>7.1f} {c.candidate_success_rate:>7.1f} "
+            f"{c.success_p_value:>6.3f}  {' '.join(flags)}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compare stored PageAgent eval runs across revisions."
+    )
+    parser.add_argument("--store", default=_DEFAULT_STORE, help="Path of the JSONL result store.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    compare_parser = commands.add_parser(
+        "compare", help="Flag regressions of a candidate revision against a baseline."
+    )
+    compare_parser.add_argument("--baseline", required=True, help="Baseline revision.")
+    compare_parser.add_argument(
+        "--candidate", help="Candidate revision (default: the latest recorded one)."
+    )
+    compare_parser.add_argument("--alpha", type=float, default=0.05, help="Significance level.")
+    compare_parser.add_argument(
+        "--min-slowdown", type=float, default=0.1,
+        help="Smallest relative median slowdown reported (default: 0.1).",
+    )
+    compare_parser.add_argument("--json", action="store_true", help="Print JSON instead of a table.")
+
+    trend_parser = commands.add_parser("trend", help="Median latency and pass rate per revision.")
+    trend_parser.add_argument("--task", help="Only this task (default: all tasks pooled).")
+
+    args = parser.parse_args(argv)
+    store = EvalResultStore(args.store)
+
+    if args.command == "trend":
+        print(json.dumps(trend(store.load(), args.task), indent=2))
+        return 0
+
+    candidate = args.candidate or (store.revisions() or [""])[-1]
+    baseline_runs = store.load(args.baseline)
+    candidate_runs = store.load(candidate)
+    for label, revision, runs in (
+        ("baseline", args.baseline, baseline_runs),
+        ("candidate", candidate, candidate_runs),
+    ):
+        if not runs:
+            print(f"error: no runs recorded for {label} revision {revision!r}", file=sys.stderr)
+            return 2
+    baseline_tasks = {r["task_name"] for r in baseline_runs}
+    candidate_tasks = {r["task_name"] for r in candidate_runs}
+    for label, tasks in (
+        ("baseline", baseline_tasks - candidate_tasks),
+        ("candidate", candidate_tasks - baseline_tasks),
+    ):
+        if tasks:
+            print(
+                f"warning: tasks only in the {label}, not compared: {', '.join(sorted(tasks))}",
+                file=sys.stderr,
+            )
+    if not baseline_tasks & candidate_tasks:
+        print("error: the two revisions have no task in common", file=sys.stderr)
+        return 2
+    comparisons = compare_runs(
+        baseline_runs,
+        candidate_runs,
+        alpha=args.alpha,
+        min_slowdown=args.min_slowdown,
+    )
+    if args.json:
+        print(json.dumps([asdict(c) for c in comparisons], indent=2))
+    else:
+        print(f"baseline {args.baseline} vs candidate {candidate}")
+        print(_format_comparison(comparisons))
+    # Non-zero exit status lets CI fail on a regression (1) or a bad comparison (2).
+    return 1 if any(c.regression for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,11 +5,12 @@ import os
 import threading
 import time
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Literal, Optional, overload, Tuple, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, overload, Tuple, Union
 
 import httpx
 
 from .._common.exceptions import AgentBayError, FileError
+from .._common.instrumentation import KIND_TRANSFER, instrumentation_of
 from .._common.models.filesystem import (
     BinaryFileContentResult,
     DirectoryListResult,
@@ -23,6 +24,8 @@ from .._common.models.filesystem import (
     UploadResult,
 )
 from .._common.models import ApiResponse, BoolResult, extract_request_id
+from ._internal.file_watch import FileWatch, FileWatchHub
+from ._internal.single_flight import coalesced
 from ..api.base_service import BaseService
 from ..api.models import ListContextsRequest
 from ..api.models._get_and_load_internal_context_request import GetAndLoadInternalContextRequest
@@ -215,6 +218,10 @@ class AsyncFileTransfer:
         _logger.info(f"Uploading {local_path} to {upload_url}")
 
         # 2. PUT upload to pre-signed URL
+        instrumentation = instrumentation_of(self._agent_bay)
+        call = instrumentation.start(
+            KIND_TRANSFER, "upload", session_id=getattr(self._session, "session_id", "")
+        )
         try:
             http_status, etag, bytes_sent = await asyncio.to_thread(
                 self._put_file_sync,
@@ -226,7 +233,12 @@ class AsyncFileTransfer:
                 progress_cb,
             )
             _logger.info(f"Upload completed with HTTP {http_status}")
+            if call is not None:
+                call.request_bytes = bytes_sent
             if http_status not in (200, 201, 204):
+                instrumentation.fail(
+                    call, f"Upload failed with HTTP {http_status}", status_code=http_status
+                )
                 return UploadResult(
                     success=False,
                     request_id_upload_url=req_id_upload,
@@ -237,7 +249,9 @@ class AsyncFileTransfer:
                     path=remote_path,
                     error_message=f"Upload failed with HTTP {http_status}",
                 )
+            instrumentation.end(call, status_code=http_status)
         except Exception as e:
+            instrumentation.fail(call, e)
             return UploadResult(
                 success=False,
                 request_id_upload_url=req_id_upload,
@@ -397,6 +411,8 @@ class AsyncFileTransfer:
         req_id_download = getattr(url_res, "request_id", None)
 
         # 3. Download and save to local
+        instrumentation = instrumentation_of(self._agent_bay)
+        call = None
         try:
             os.makedirs(os.path.dirname(local_path) or ".", exist_ok=True)
             if os.path.exists(local_path) and not overwrite:
@@ -411,6 +427,9 @@ class AsyncFileTransfer:
                     error_message=f"Destination exists and overwrite=False: {local_path}",
                 )
 
+            call = instrumentation.start(
+                KIND_TRANSFER, "download", session_id=getattr(self._session, "session_id", "")
+            )
             http_status, bytes_received = await asyncio.to_thread(
                 self._get_file_sync,
                 download_url,
@@ -420,6 +439,12 @@ class AsyncFileTransfer:
                 progress_cb,
             )
             if http_status != 200:
+                instrumentation.fail(
+                    call,
+                    f"Download failed with HTTP {http_status}",
+                    response_bytes=bytes_received,
+                    status_code=http_status,
+                )
                 return DownloadResult(
                     success=False,
                     request_id_download_url=req_id_download,
@@ -430,7 +455,9 @@ class AsyncFileTransfer:
                     local_path=local_path,
                     error_message=f"Download failed with HTTP {http_status}",
                 )
+            instrumentation.end(call, response_bytes=bytes_received, status_code=http_status)
         except Exception as e:
+            instrumentation.fail(call, e)
             return DownloadResult(
                 success=False,
                 request_id_download_url=req_id_download,
@@ -652,6 +679,7 @@ class AsyncFileSystem(BaseService):
         """
         super().__init__(*args, **kwargs)
         self._file_transfer: Optional[AsyncFileTransfer] = None
+        self._watch_hub = FileWatchHub(self)
 
     def _ensure_file_transfer(self) -> AsyncFileTransfer:
         """
@@ -915,6 +943,7 @@ class AsyncFileSystem(BaseService):
                 error_message=f"Failed to edit file: {e}",
             )
 
+    @coalesced("get_file_info")
     async def get_file_info(self, path: str) -> FileInfoResult:
         """
         Get information about a file or directory.
@@ -2061,6 +2090,50 @@ class AsyncFileSystem(BaseService):
                 error_message=f"Failed to get file change: {e}",
             )
 
+    def watch(
+        self,
+        path: str,
+        *,
+        interval: float = 0.5,
+        debounce: float = 0.1,
+        max_pending: int = 1000,
+    ) -> FileWatch:
+        """
+        Watch a directory and iterate over batches of file change events.
+
+        All watches of a session share their change feeds: a single WebSocket
+        subscription per directory when push is available, otherwise one
+        ``get_file_change`` poll per interval for all watched directories under
+        the same top-level directory, issued at their common ancestor and
+        routed back to each watch. No thread is started; the feed advances
+        while the watch is being iterated.
+
+        Args:
+            path: The directory path to monitor for file changes.
+            interval: Polling interval in seconds when push is unavailable.
+            debounce: In push mode, seconds to keep collecting events after the
+                first one arrives before a batch is returned.
+            max_pending: Maximum number of distinct paths buffered per watch.
+                Older entries beyond it are dropped and counted in
+                ``FileWatch.dropped``.
+
+        Returns:
+            FileWatch: Iterator of ``List[FileChangeEvent]`` batches. Each batch
+                has at most one (coalesced) event per path.
+
+        Example:
+            ```python
+            session = (await agent_bay.create()).session
+            async with session.file_system.watch("/tmp/watch_test") as watch:
+                await session.file_system.write_file("/tmp/watch_test/a.txt", "a")
+                async for events in watch:
+                    print([e.path for e in events])
+                    break
+            await session.delete()
+            ```
+        """
+        return self._watch_hub.watch(path, interval, debounce, max_pending)
+
     def watch_directory(
         self,
         path: str,
@@ -2071,13 +2144,18 @@ class AsyncFileSystem(BaseService):
         """
         Watch a directory for file changes and call the callback function when changes occur.
 
-        Uses WebSocket push notifications for near-real-time delivery when available,
-        with automatic fallback to HTTP polling.
+        The returned thread is a thin adapter over ``watch()``: it reads the
+        session's shared change feed (WebSocket push when available, otherwise
+        polling) and calls ``callback`` with each batch, so it never takes
+        events away from other watches or from ``git.status(incremental=True)``.
+        The feed is driven on the event loop that called ``watch_directory()``;
+        wait on ``ready_event`` and join the thread without blocking that loop,
+        e.g. with ``asyncio.to_thread``.
 
         Args:
             path: The directory path to monitor for file changes.
             callback: Callback function that will be called with a list of FileChangeEvent
-                objects when changes are detected.
+                objects when changes are detected. It runs on the monitoring thread.
             interval: Polling interval in seconds (default 0.5). Deprecated in WS push mode
                 where events are delivered in real time; retained for backward compatibility.
             stop_event: Optional threading.Event to stop the monitoring. If not provided,
@@ -2102,483 +2180,76 @@ class AsyncFileSystem(BaseService):
             await session.file_system.create_directory("/tmp/watch_test")
             monitor_thread = session.file_system.watch_directory("/tmp/watch_test", on_changes)
             monitor_thread.start()
-            monitor_thread.ready_event.wait(timeout=30)
+            await asyncio.to_thread(monitor_thread.ready_event.wait, 30)
             await session.file_system.write_file("/tmp/watch_test/test1.txt", "content 1")
             await session.file_system.write_file("/tmp/watch_test/test2.txt", "content 2")
+            monitor_thread.stop_event.set()
+            await asyncio.to_thread(monitor_thread.join, 5)
             await session.delete()
             ```
         """
-
-        fs_self = self
-
-        link_url = getattr(self.session, "link_url", "") or ""
-        token = getattr(self.session, "token", "") or ""
-        server_name = ""
-        for t in getattr(self.session, "mcpTools", None) or []:
-            try:
-                if getattr(t, "name", None) == "get_file_change":
-                    server_name = getattr(t, "server", "") or ""
-                    break
-            except Exception:
-                pass
-
-        # Detect WS push availability: requires ws_url, a session token,
-        # and a resolved MCP server name.  The monitor thread bridges
-        # WS calls via ``_call_ws`` which auto-detects whether the
-        # result is a coroutine (async SDK) or a direct value (sync SDK).
-        ws_url = getattr(self.session, "ws_url", "") or ""
-        try:
-            main_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            main_loop = None
-        use_ws_push = bool(ws_url and token and server_name)
-
-        def _poll_file_change():
-            """Fetch file changes using a synchronous HTTP call so the
-            background thread is fully independent of the caller's
-            event loop. Falls back to the async path in sync SDK context."""
-            if link_url and token and server_name:
-                return _poll_file_change_via_http()
-            change_result = fs_self._get_file_change(path)
-            if asyncio.iscoroutine(change_result):
-                evl = asyncio.new_event_loop()
-                try:
-                    return evl.run_until_complete(change_result)
-                finally:
-                    evl.close()
-            return change_result
-
-        def _poll_file_change_via_http():
-            """Direct synchronous HTTP call to the LinkUrl endpoint,
-            bypassing the session's async HTTP client entirely."""
-            import random as _random
-            req_id = f"link-{int(time.time() * 1000)}-{_random.randint(0, 999999999):09d}"
-            url = link_url.rstrip("/") + "/callTool"
-            payload = {
-                "args": {"path": path},
-                "server": server_name,
-                "requestId": req_id,
-                "tool": "get_file_change",
-                "token": token,
-            }
-            try:
-                resp = httpx.post(
-                    url,
-                    json=payload,
-                    headers={
-                        "Content-Type": "application/json",
-                        "X-Access-Token": token,
-                    },
-                    timeout=30,
-                )
-                if resp.status_code < 200 or resp.status_code >= 300:
-                    return FileChangeResult(
-                        request_id=req_id,
-                        success=False,
-                        error_message=f"HTTP {resp.status_code}",
-                    )
-                outer = resp.json()
-                data_field = outer.get("data")
-                if data_field is None:
-                    return FileChangeResult(
-                        request_id=req_id,
-                        success=False,
-                        error_message="No data field in response",
-                    )
-                if isinstance(data_field, str):
-                    parsed_data = json.loads(data_field)
-                elif isinstance(data_field, dict):
-                    parsed_data = data_field
-                else:
-                    return FileChangeResult(
-                        request_id=req_id,
-                        success=False,
-                        error_message="Invalid data field type",
-                    )
-                result_field = parsed_data.get("result", {})
-                if not isinstance(result_field, dict):
-                    return FileChangeResult(
-                        request_id=req_id,
-                        success=False,
-                        error_message="No result field in response data",
-                    )
-                is_error = bool(result_field.get("isError", False))
-                content = result_field.get("content", [])
-                text_content = ""
-                if isinstance(content, list) and content:
-                    first = content[0]
-                    if isinstance(first, str):
-                        text_content = first
-                    elif isinstance(first, dict):
-                        text_content = (
-                            first.get("text")
-                            or first.get("blob")
-                            or first.get("data")
-                            or ""
-                        )
-                if is_error:
-                    return FileChangeResult(
-                        request_id=req_id,
-                        success=False,
-                        error_message=str(text_content),
-                    )
-                events: List[FileChangeEvent] = []
-                try:
-                    change_data = json.loads(text_content)
-                    if isinstance(change_data, list):
-                        for ed in change_data:
-                            if isinstance(ed, dict):
-                                events.append(FileChangeEvent._from_dict(ed))
-                except (json.JSONDecodeError, TypeError):
-                    pass
-                return FileChangeResult(
-                    request_id=req_id,
-                    success=True,
-                    events=events,
-                    raw_data=text_content,
-                )
-            except Exception as e:
-                return FileChangeResult(
-                    request_id=req_id,
-                    success=False,
-                    error_message=f"HTTP request failed: {e}",
-                )
-
-        ready_event = threading.Event()
-
-        # Create stop event if not provided
         if stop_event is None:
             stop_event = threading.Event()
+        ready_event = threading.Event()
+        # Batches are handed to the callback as they come, without push debouncing.
+        watch = self.watch(path, interval=interval, debounce=0)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        # Loop of the monitoring thread when watch_directory() was called outside one.
+        own_loops: List[asyncio.AbstractEventLoop] = []
 
-        def _monitor_polling():
-            """HTTP polling monitor (original implementation, also used as fallback)."""
-            _logger.info(f"Starting polling directory monitoring for: {path}")
-            _logger.info(f"Polling interval: {interval} seconds")
-            baseline_established = False
-
-            while not stop_event.is_set():
-                try:
-                    if (
-                        hasattr(fs_self.session, "_is_expired")
-                        and fs_self.session._is_expired()
-                    ):
-                        _logger.warning(
-                            f"Session expired, stopping directory monitoring for: {path}"
-                        )
-                        stop_event.set()
-                        break
-
-                    result = _poll_file_change()
-
-                    if not baseline_established:
-                        baseline_established = True
-                        ready_event.set()
-                        stop_event.wait(interval)
-                        continue
-
-                    if result.success:
-                        current_events = result.events
-
-                        if current_events:
-                            _logger.info(f"Detected {len(current_events)} file changes:")
-                            for event in current_events:
-                                _logger.debug(f"  - {event}")
-
-                            try:
-                                callback(current_events)
-                            except Exception as e:
-                                _logger.error(f"Error in callback function: {e}")
-
-                    else:
-                        error_msg = result.error_message or ""
-                        if "session" in error_msg.lower() and (
-                            "expired" in error_msg.lower()
-                            or "invalid" in error_msg.lower()
-                        ):
-                            _logger.warning(
-                                f"Session expired, stopping directory monitoring for: {path}"
-                            )
-                            stop_event.set()
-                            break
-                        _logger.error(f"Error monitoring directory: {result.error_message}")
-
-                    stop_event.wait(interval)
-
-                except Exception as e:
-                    _logger.error(f"Unexpected error in directory monitoring: {e}")
-                    error_str = str(e).lower()
-                    if "session" in error_str and (
-                        "expired" in error_str or "invalid" in error_str
-                    ):
-                        _logger.warning(
-                            f"Session expired, stopping directory monitoring for: {path}"
-                        )
-                        stop_event.set()
-                        break
-                    stop_event.wait(interval)
-
-            _logger.info(f"Stopped polling monitoring for: {path}")
-
-        def _monitor_ws_push():
-            """WS push monitor sharing the session's WsClient.
-
-            Uses a two-phase startup to avoid deadlock:
-
-            Phase 1 (before ``ready_event``):
-              Synchronous HTTP baseline poll — no event-loop dependency,
-              so the caller's ``ready_event.wait()`` can return quickly.
+        def _call(result_or_coro: Any, timeout: Optional[float] = None) -> Any:
+            """
+            Complete one watch step from the monitoring thread.
 
-            Phase 2 (after ``ready_event``):
-              Obtain the session's shared WsClient, register callbacks,
-              and subscribe.  Uses ``_call_ws`` to bridge method calls
-              that may be coroutines (async SDK) or direct values
-              (sync SDK).  A catch-up poll fills the gap between the
-              two phases.
+            In the async SDK the step is a coroutine and runs on the caller's
+            event loop, which owns the watch hub. In the sync SDK it has already
+            run and its result is passed through.
             """
-            _logger.info(f"Starting WS push monitoring for: {path}")
-
-            def _call_ws(result_or_coro, timeout=30):
-                """Bridge WS method calls for both async and sync SDKs.
-
-                In the async SDK, WsClient methods return coroutines
-                that must be scheduled on the caller's event loop.
-                In the sync SDK (after unasync conversion), the same
-                methods return direct values that are passed through.
-                """
-                if asyncio.iscoroutine(result_or_coro):
-                    if main_loop is None:
-                        raise RuntimeError(
-                            "WS method returned a coroutine but no "
-                            "event loop is available"
-                        )
-                    future = asyncio.run_coroutine_threadsafe(
-                        result_or_coro, main_loop
-                    )
-                    return future.result(timeout=timeout)
+            if not asyncio.iscoroutine(result_or_coro):
                 return result_or_coro
-
-            # ── Phase 1: HTTP baseline (sync, no event-loop dependency) ──
-            _poll_file_change()
-            ready_event.set()
-            _logger.info(f"WS push: baseline established via HTTP for: {path}")
-
-            # ── Phase 2: Attach to session's shared WsClient ──
-            ws_client = None
-            unsubscribe_push = None
-            unsubscribe_state_listener = None
-            subscription_active = False
-
+            if loop is None:
+                if not own_loops:
+                    own_loops.append(asyncio.new_event_loop())
+                return own_loops[0].run_until_complete(result_or_coro)
+            return asyncio.run_coroutine_threadsafe(result_or_coro, loop).result(timeout)
+
+        def _run_monitor():
+            _logger.info(f"Starting directory monitoring for: {path}")
             try:
-                ws_client = _call_ws(fs_self.session._get_ws_client())
-
-                def _on_push(payload):
-                    data = payload.get("data", {})
-                    if data.get("eventType") != "file_change":
-                        return
-                    push_path = data.get("path")
-                    if push_path != path:
-                        return
-                    events_raw = data.get("events", [])
-                    events = []
-                    for ed in events_raw:
-                        if isinstance(ed, dict):
-                            events.append(FileChangeEvent._from_dict(ed))
-                    if events:
-                        _logger.info(
-                            f"WS push: {len(events)} file changes for {path}"
-                        )
-                        try:
-                            callback(events)
-                        except Exception as e:
-                            _logger.error(f"Error in watch callback: {e}")
-
-                unsubscribe_push = ws_client.register_callback(
-                    server_name, _on_push
-                )
-
-                def _on_state_change(state, _reason):
-                    if str(state) != "OPEN":
-                        return
-                    if not subscription_active or stop_event.is_set():
-                        return
-
-                    def _reconnect_worker():
-                        try:
-                            poll_result = _poll_file_change()
-                            if poll_result.success and poll_result.events:
-                                try:
-                                    callback(poll_result.events)
-                                except Exception as e:
-                                    _logger.error(
-                                        f"Catch-up callback error: {e}"
-                                    )
-
-                            h = _call_ws(ws_client.call_stream(
-                                target=server_name,
-                                data={
-                                    "method": "subscribe_file_change",
-                                    "params": {"path": path},
-                                },
-                                on_event=None,
-                                on_end=None,
-                                on_error=None,
-                            ))
-                            _call_ws(h.wait_end_with_timeout(timeout=10))
-                            _logger.info(
-                                f"Resubscribed after reconnect for: {path}"
-                            )
-                        except Exception as e:
-                            _logger.error(
-                                f"Catch-up/resubscribe failed: {e}"
-                            )
-
-                    threading.Thread(
-                        target=_reconnect_worker, daemon=True
-                    ).start()
-
-                unsubscribe_state_listener = ws_client.on_connection_state_change(
-                    _on_state_change
-                )
-
-                # Subscribe via the shared WsClient
-                handle = _call_ws(ws_client.call_stream(
-                    target=server_name,
-                    data={
-                        "method": "subscribe_file_change",
-                        "params": {"path": path},
-                    },
-                    on_event=None,
-                    on_end=None,
-                    on_error=None,
-                ))
-                _call_ws(handle.wait_end_with_timeout(timeout=15))
-                subscription_active = True
-
-                # Catch-up poll: fill the gap between Phase 1 baseline
-                # and Phase 2 subscribe completion.
-                catchup = _poll_file_change()
-                if catchup.success and catchup.events:
-                    try:
-                        callback(catchup.events)
-                    except Exception as e:
-                        _logger.error(f"Catch-up callback error: {e}")
-
-                _logger.info(f"WS push monitoring active for: {path}")
-
+                _call(watch.start())
+                ready_event.set()
                 while not stop_event.is_set():
-                    if (
-                        hasattr(fs_self.session, "_is_expired")
-                        and fs_self.session._is_expired()
-                    ):
-                        _logger.warning(
-                            f"Session expired, stopping WS monitoring "
-                            f"for: {path}"
-                        )
-                        stop_event.set()
+                    events = _call(watch._next_batch(interval))
+                    if events is None:
+                        # The session expired.
                         break
-                    stop_event.wait(1.0)
-
-            except Exception as e:
-                _logger.warning(
-                    f"WS push subscribe failed: {e}. "
-                    f"Falling back to polling."
-                )
-                if unsubscribe_push:
-                    try:
-                        unsubscribe_push()
-                    except Exception:
-                        pass
-                if unsubscribe_state_listener:
+                    if not events or stop_event.is_set():
+                        continue
+                    _logger.info(f"Detected {len(events)} file changes in {path}")
                     try:
-                        unsubscribe_state_listener()
-                    except Exception:
-                        pass
-                _monitor_polling_after_baseline()
-                return
-
-            # Normal cleanup
-            subscription_active = False
-            if unsubscribe_push:
-                try:
-                    unsubscribe_push()
-                except Exception:
-                    pass
-            if unsubscribe_state_listener:
-                try:
-                    unsubscribe_state_listener()
-                except Exception:
-                    pass
-            if ws_client is not None:
-                try:
-                    _call_ws(
-                        ws_client.send_message(
-                            target=server_name,
-                            data={
-                                "method": "unsubscribe_file_change",
-                                "params": {"path": path},
-                            },
-                        ),
-                        timeout=5,
-                    )
-                except Exception:
-                    pass
-            _logger.info(f"Stopped WS push monitoring for: {path}")
-
-        def _monitor_polling_after_baseline():
-            """Polling fallback when WS subscribe fails.
-
-            Unlike ``_monitor_polling``, this skips the initial baseline
-            poll because it was already performed in Phase 1 of the WS
-            startup.
-            """
-            _logger.info(
-                f"Polling fallback (baseline pre-established) for: {path}"
-            )
-            while not stop_event.is_set():
+                        callback(events)
+                    except Exception as e:
+                        _logger.error(f"Error in callback function: {e}")
+            except Exception as e:
+                _logger.error(f"Directory monitoring for {path} failed: {e}")
+            finally:
+                # Unblock waiters even if the baseline could not be established.
+                ready_event.set()
                 try:
-                    if (
-                        hasattr(fs_self.session, "_is_expired")
-                        and fs_self.session._is_expired()
-                    ):
-                        _logger.warning(
-                            f"Session expired, stopping monitoring for: {path}"
-                        )
-                        stop_event.set()
-                        break
-                    result = _poll_file_change()
-                    if result.success and result.events:
-                        _logger.info(
-                            f"Detected {len(result.events)} file changes:"
-                        )
-                        try:
-                            callback(result.events)
-                        except Exception as e:
-                            _logger.error(f"Error in callback: {e}")
-                    elif not result.success:
-                        error_msg = result.error_message or ""
-                        if "session" in error_msg.lower() and (
-                            "expired" in error_msg.lower()
-                            or "invalid" in error_msg.lower()
-                        ):
-                            stop_event.set()
-                            break
-                    stop_event.wait(interval)
+                    _call(watch.close(), timeout=5)
                 except Exception as e:
-                    _logger.error(f"Polling error: {e}")
-                    stop_event.wait(interval)
-            _logger.info(f"Stopped polling for: {path}")
-
-        # Choose monitoring mode
-        if use_ws_push:
-            thread_target = _monitor_ws_push
-            thread_name = f"DirectoryWatcher-WS-{path.replace('/', '_')}"
-        else:
-            thread_target = _monitor_polling
-            thread_name = f"DirectoryWatcher-{path.replace('/', '_')}"
+                    _logger.debug(f"Failed to close the watch on {path}: {e}")
+                for evl in own_loops:
+                    evl.close()
+                _logger.info(f"Stopped directory monitoring for: {path}")
 
+        mode = "WS-" if self._watch_hub._push_target() else ""
         monitor_thread = threading.Thread(
-            target=thread_target,
-            name=thread_name,
+            target=_run_monitor,
+            name=f"DirectoryWatcher-{mode}{path.replace('/', '_')}",
             daemon=True,
         )
 
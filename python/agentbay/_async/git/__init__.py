@@ -1,3 +1,4 @@
 from .git import AsyncGit
+from .status_tracker import AsyncGitStatusTracker
 
-__all__ = ["AsyncGit"]
+__all__ = ["AsyncGit", "AsyncGitStatusTracker"]
@@ -0,0 +1,206 @@
+import asyncio
+import posixpath
+from typing import Dict, Iterable, List, Optional, Set
+
+from ..._common.logger import get_logger
+from ..._common.models.git import GitFileStatus, GitStatusResult
+from .._internal.file_watch import FileWatch
+
+_logger = get_logger("git")
+
+# Above this many dirty paths a pathspec-limited refresh is no cheaper than a
+# full scan (and risks overlong command lines), so the tracker falls back.
+_DEFAULT_MAX_DIRTY_PATHS = 256
+
+# Status arguments shared by full and partial scans. Untracked files are listed
+# one by one so that a partial refresh of ``dir/file`` lines up with the entry a
+# full scan produced. ``--no-optional-locks`` keeps status from rewriting
+# ``.git/index``, which would otherwise be reported back as a change.
+_STATUS_ARGS = ["--no-optional-locks", "status", "--porcelain=1", "-b", "--untracked-files=all"]
+
+
+class AsyncGitStatusTracker:
+    """
+    Incrementally maintained ``git status`` of one repository.
+
+    The tracker watches the repository through the session's shared file change
+    feed (the one behind ``file_system.watch()`` and
+    ``file_system.watch_directory()``, so all of them see every change),
+    keeps the set of paths that changed since the last refresh and re-runs
+    ``git status`` limited to those paths. A full scan runs on the first call,
+    on demand, when the change feed is unavailable, when more than
+    ``max_dirty_paths`` paths changed, and after any change inside ``.git``
+    (commits, checkouts, fetches and index updates can affect any file).
+
+    Obtain one with ``session.git.status(repo_path, incremental=True)``.
+    """
+
+    def __init__(self, git, repo_path: str, max_dirty_paths: int = _DEFAULT_MAX_DIRTY_PATHS):
+        self._git = git
+        self.repo_path = posixpath.normpath(repo_path)
+        self.max_dirty_paths = max_dirty_paths
+        self.full_scans = 0
+        self.partial_scans = 0
+        self._header = GitStatusResult()
+        self._files: Dict[str, GitFileStatus] = {}
+        self._dirty: Set[str] = set()
+        self._needs_full_scan = True
+        self._watch: Optional[FileWatch] = None
+        self._feed_ok = False
+        self._dropped = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Force the next refresh to be a full scan."""
+        self._needs_full_scan = True
+
+    def mark_dirty(self, paths: Iterable[str]) -> None:
+        """Mark paths (absolute or relative to the repository) for the next refresh."""
+        for path in paths:
+            self._add_dirty(path)
+
+    async def status(
+        self, *, full_scan: bool = False, timeout_ms: Optional[int] = None
+    ) -> GitStatusResult:
+        """
+        Return the current status, refreshing only what changed.
+
+        Args:
+            full_scan: Ignore the dirty-path set and rescan the whole repository.
+            timeout_ms: Timeout in milliseconds for the git command.
+
+        Returns:
+            GitStatusResult in the same shape as ``AsyncGit.status()``.
+
+        Raises:
+            GitNotARepoError: If the path is not a git repository.
+            GitError: For other git errors.
+        """
+        async with self._lock:
+            await self._collect_changes()
+            if full_scan or self._needs_full_scan:
+                await self._full_scan(timeout_ms)
+            elif self._dirty:
+                await self._partial_scan(timeout_ms)
+            return self._snapshot()
+
+    # -------------------------------------------------------------------------
+    # Change feed
+    # -------------------------------------------------------------------------
+
+    async def close(self) -> None:
+        """Leave the session's change feed. The next status() rejoins it."""
+        if self._watch is not None:
+            await self._watch.close()
+            self._watch = None
+            self._feed_ok = False
+
+    async def _collect_changes(self) -> None:
+        if self._watch is None:
+            self._watch = self._git.session.file_system.watch(
+                self.repo_path, debounce=0, max_pending=self.max_dirty_paths
+            )
+            self._dropped = 0
+        events = await self._watch.poll()
+        if events is None:
+            _logger.debug(
+                "File change feed unavailable for %s, using full scans", self.repo_path
+            )
+            self._feed_ok = False
+            self._needs_full_scan = True
+            return
+        if not self._feed_ok or self._watch.dropped != self._dropped:
+            # The first successful poll only establishes the baseline; dropped
+            # events mean the watch buffer overflowed.
+            self._feed_ok = True
+            self._dropped = self._watch.dropped
+            self._needs_full_scan = True
+            return
+        for event in events:
+            self._add_dirty(event.path)
+
+    def _add_dirty(self, path: str) -> None:
+        rel = self._relative(path)
+        if rel is None:
+            return
+        if rel == "" or rel == ".git" or rel.startswith(".git/"):
+            self._needs_full_scan = True
+            return
+        self._dirty.add(rel)
+        if len(self._dirty) > self.max_dirty_paths:
+            self._needs_full_scan = True
+
+    def _relative(self, path: str) -> Optional[str]:
+        if not path:
+            return ""
+        path = posixpath.normpath(path)
+        if not posixpath.isabs(path):
+            return "" if path == "." else path
+        if path == self.repo_path:
+            return ""
+        root = self.repo_path.rstrip("/") + "/"
+        if path.startswith(root):
+            return path[len(root):]
+        return None
+
+    # -------------------------------------------------------------------------
+    # Scans
+    # -------------------------------------------------------------------------
+
+    async def _run_status(self, pathspecs: List[str], timeout_ms: Optional[int]) -> GitStatusResult:
+        args = list(_STATUS_ARGS)
+        if pathspecs:
+            args.append("--")
+            args.extend(f":(literal){p}" for p in pathspecs)
+        result = await self._git._run_git(args, self.repo_path, timeout_ms=timeout_ms)
+        if not result.success:
+            raise self._git._classify_error("status", result)
+        return self._git._parse_git_status(self._git._get_stdout(result))
+
+    async def _full_scan(self, timeout_ms: Optional[int]) -> None:
+        parsed = await self._run_status([], timeout_ms)
+        self._header = parsed
+        self._files = {f.path: f for f in parsed.files}
+        self._dirty.clear()
+        self._needs_full_scan = False
+        self.full_scans += 1
+
+    async def _partial_scan(self, timeout_ms: Optional[int]) -> None:
+        dirty = set(self._dirty)
+        # Keep both sides of a rename in the pathspec, otherwise git reports a
+        # staged rename as an add.
+        for entry in self._files.values():
+            if entry.renamed_from and (
+                self._covers(dirty, entry.path) or self._covers(dirty, entry.renamed_from)
+            ):
+                dirty.update((entry.path, entry.renamed_from))
+        parsed = await self._run_status(sorted(dirty), timeout_ms)
+        for path in [p for p, e in self._files.items() if self._covers(dirty, p)]:
+            del self._files[path]
+        for entry in parsed.files:
+            self._files[entry.path] = entry
+        self._header = parsed
+        self._dirty.clear()
+        self.partial_scans += 1
+
+    @staticmethod
+    def _covers(dirty: Set[str], path: str) -> bool:
+        """True when *path* or one of its parent directories is in *dirty*."""
+        while path:
+            if path in dirty:
+                return True
+            path = posixpath.dirname(path)
+        return False
+
+    def _snapshot(self) -> GitStatusResult:
+        files = sorted(
+            self._files.values(), key=lambda f: (f.status == "untracked", f.path)
+        )
+        return GitStatusResult(
+            current_branch=self._header.current_branch,
+            upstream=self._header.upstream,
+            ahead=self._header.ahead,
+            behind=self._header.behind,
+            detached=self._header.detached,
+            files=files,
+        )
@@ -0,0 +1,250 @@
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from .._common.logger import get_logger
+from .._common.models.metrics import (
+    DERIVED_METRICS,
+    METRIC_FIELDS,
+    SessionMetricsHistory,
+    SessionMetricsSummary,
+)
+from ._internal.rate_limit import run_bounded
+
+if TYPE_CHECKING:
+    from .session import AsyncSession
+
+_logger = get_logger("metrics_sampler")
+
+# Latest-sample gauges and summary gauges written by export().
+_EXPORT_GAUGES = (
+    ("cpu_used_pct", "CPU usage in percent"),
+    ("mem_used", "Memory in use"),
+    ("mem_total", "Memory size"),
+    ("disk_used", "Disk space in use"),
+    ("disk_total", "Disk size"),
+    ("rx_rate_kbyte_per_s", "Receive rate in KB/s"),
+    ("tx_rate_kbyte_per_s", "Transmit rate in KB/s"),
+)
+_EXPORT_SUMMARY = (
+    ("cpu_p50", "Median CPU usage in percent over the sample window"),
+    ("cpu_p95", "95th percentile CPU usage in percent over the sample window"),
+    ("mem_used_max", "Memory high-water mark over the sample window"),
+    ("rx_kbyte", "KB received over the sample window"),
+    ("tx_kbyte", "KB sent over the sample window"),
+)
+
+ThresholdCallback = Callable[[str, str, float, Dict[str, float]], Any]
+
+
+class _Threshold:
+    def __init__(self, metric: str, above: float, callback: ThresholdCallback):
+        self.metric = metric
+        self.above = above
+        self.callback = callback
+        # Session ids currently over the threshold; the callback fires on entry.
+        self.breached: set = set()
+
+
+class AsyncMetricsSampler:
+    """
+    Periodically samples ``get_metrics()`` for a set of sessions.
+
+    Each session gets a ``SessionMetricsHistory`` ring buffer of ``capacity``
+    samples, from which rolling aggregates (CPU percentiles, memory
+    high-water mark, bytes transferred) are computed on demand. Sessions are
+    sampled at most ``concurrency`` at a time; a failed sample is skipped.
+
+    Drive it with ``await sampler.run()`` in a background task (or, in the sync
+    SDK, from a background thread) and end it with ``stop()``, or call
+    ``sample_once()`` yourself.
+
+    Example:
+        sampler = AsyncMetricsSampler(interval=10)
+        sampler.add(session)
+        sampler.on_threshold("mem_used_pct", 90, lambda sid, metric, value, sample: ...)
+        runner = asyncio.create_task(sampler.run())
+        ...
+        sampler.stop()
+        await runner
+        print(sampler.summary(session.session_id).cpu_p95)
+        print(sampler.export())
+    """
+
+    def __init__(self, interval: float = 15.0, capacity: int = 240, concurrency: int = 8):
+        """
+        Args:
+            interval: Seconds between sampling passes in run().
+            capacity: Samples kept per session.
+            concurrency: Maximum number of get_metrics() calls in flight.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.capacity = capacity
+        self.concurrency = concurrency
+        self.errors = 0
+        self._sessions: Dict[str, "AsyncSession"] = {}
+        self._histories: Dict[str, SessionMetricsHistory] = {}
+        self._thresholds: List[_Threshold] = []
+        self._lock = threading.Lock()
+        self._stop_event = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._sessions
+
+    def add(self, session: "AsyncSession") -> None:
+        """Start sampling a session. Its existing history, if any, is kept."""
+        with self._lock:
+            self._sessions[session.session_id] = session
+            self._histories.setdefault(session.session_id, SessionMetricsHistory(self.capacity))
+
+    def remove(self, session_id: str, keep_history: bool = False) -> bool:
+        """
+        Stop sampling a session.
+
+        Args:
+            session_id: The session to remove.
+            keep_history: Keep its samples available to history() and summary().
+
+        Returns:
+            bool: True if the session was being sampled.
+        """
+        with self._lock:
+            removed = self._sessions.pop(session_id, None) is not None
+            if not keep_history:
+                self._histories.pop(session_id, None)
+            for threshold in self._thresholds:
+                threshold.breached.discard(session_id)
+        return removed
+
+    def on_threshold(self, metric: str, above: float, callback: ThresholdCallback) -> None:
+        """
+        Call ``callback(session_id, metric, value, sample)`` when a metric rises above a level.
+
+        The callback fires once when a session's sample crosses the level and
+        again only after the metric has dropped back to or below it.
+
+        Args:
+            metric: A ``SessionMetrics`` field such as ``cpu_used_pct``, or
+                ``mem_used_pct`` / ``disk_used_pct``.
+            above: Level the metric has to exceed.
+            callback: Function invoked with the session id, metric name, value
+                and the full sample dict.
+        """
+        if metric not in METRIC_FIELDS and metric not in DERIVED_METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        with self._lock:
+            self._thresholds.append(_Threshold(metric, above, callback))
+
+    def history(self, session_id: str) -> Optional[SessionMetricsHistory]:
+        """The sample history of a session, or None if it has none."""
+        return self._histories.get(session_id)
+
+    def summary(self, session_id: str) -> SessionMetricsSummary:
+        """Rolling aggregates for a session (empty if it has no samples)."""
+        history = self._histories.get(session_id)
+        return history.summary() if history is not None else SessionMetricsSummary()
+
+    async def _sample(self, session_id: str) -> None:
+        session = self._sessions.get(session_id)
+        if session is None:
+            return
+        try:
+            result = await session.get_metrics()
+        except Exception as e:
+            result = None
+            error = str(e)
+        else:
+            error = result.error_message
+        if result is None or not result.success or result.metrics is None:
+            self.errors += 1
+            _logger.debug(f"Metrics sample failed for session {session_id}: {error}")
+            return
+        with self._lock:
+            history = self._histories.get(session_id)
+            if history is None or session_id not in self._sessions:
+                return
+            history.append(result.metrics, time.time())
+            sample = history.latest()
+        self._check_thresholds(session_id, sample)
+
+    def _check_thresholds(self, session_id: str, sample: Dict[str, float]) -> None:
+        for threshold in list(self._thresholds):
+            value = sample[threshold.metric]
+            if value <= threshold.above:
+                threshold.breached.discard(session_id)
+                continue
+            if session_id in threshold.breached:
+                continue
+            threshold.breached.add(session_id)
+            try:
+                threshold.callback(session_id, threshold.metric, value, sample)
+            except Exception as e:
+                _logger.error(f"Error in metrics threshold callback: {e}")
+
+    async def sample_once(self) -> int:
+        """
+        Sample every registered session once.
+
+        Returns:
+            int: Number of sessions sampled in this pass.
+        """
+        session_ids = list(self._sessions)
+        if session_ids:
+            await run_bounded(session_ids, self._sample, self.concurrency)
+        return len(session_ids)
+
+    async def run(self) -> None:
+        """Sample all sessions every ``interval`` seconds until stop() is called."""
+        stop_event = self._stop_event
+        stop_event.clear()
+        while not stop_event.is_set():
+            started = time.monotonic()
+            await self.sample_once()
+            interval = max(0.0, self.interval - (time.monotonic() - started))
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        """Make run() return after the current pass."""
+        self._stop_event.set()
+
+    def export(self, openmetrics: bool = False, prefix: str = "agentbay_session") -> str:
+        """
+        Render the latest samples and rolling aggregates as metrics text.
+
+        Args:
+            openmetrics: Emit OpenMetrics text (with the ``# EOF`` trailer)
+                instead of the Prometheus text exposition format.
+            prefix: Metric name prefix.
+
+        Returns:
+            str: One gauge family per metric, labelled by ``session_id``.
+        """
+        with self._lock:
+            rows = [
+                (session_id, history.latest(), history.summary())
+                for session_id, history in sorted(self._histories.items())
+                if len(history)
+            ]
+        lines: List[str] = []
+        families = [(name, help_text, False) for name, help_text in _EXPORT_GAUGES]
+        families += [(name, help_text, True) for name, help_text in _EXPORT_SUMMARY]
+        for name, help_text, from_summary in families:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+            for session_id, latest, summary in rows:
+                value = getattr(summary, name) if from_summary else latest[name]
+                label = session_id.replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{metric}{{session_id="{label}"}} {float(value)!r}')
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
@@ -6,7 +6,7 @@ and mobile environment configuration operations.
 
 import base64
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .._common.exceptions import AgentBayError, SessionError
 from .._common.logger import get_logger
@@ -17,6 +17,8 @@ from .._common.models.response import (
     OperationResult,
 )
 from .._common.utils.command_templates import MOBILE_COMMAND_TEMPLATES
+from ._internal.link_cache import LinkCache
+from ._internal.single_flight import coalesced
 from .base_service import AsyncBaseService
 from .computer import (
     AppOperationResult,
@@ -525,6 +527,7 @@ class AsyncMobile(AsyncBaseService):
             )
 
     # Application Management Operations
+    @coalesced("get_installed_apps")
     async def get_installed_apps(
         self, start_menu: bool, desktop: bool, ignore_system_apps: bool
     ) -> InstalledAppListResult:
@@ -989,9 +992,12 @@ class AsyncMobile(AsyncBaseService):
             _logger.warning("No mobile configuration provided")
             return
 
+        # Collect every configuration step and apply them in a single shell call.
+        steps: List[Tuple[Optional[str], str]] = []
+
         # Configure resolution lock
         if mobile_config.lock_resolution is not None:
-            await self._set_resolution_lock(mobile_config.lock_resolution)
+            steps.append(self._resolution_lock_command(mobile_config.lock_resolution))
 
         # Configure app management rules
         if mobile_config.app_manager_rule and mobile_config.app_manager_rule.rule_type:
@@ -1000,9 +1006,9 @@ class AsyncMobile(AsyncBaseService):
 
             if package_names and app_rule.rule_type in ["White", "Black"]:
                 if app_rule.rule_type == "White":
-                    await self._set_app_whitelist(package_names)
+                    steps.append(self._app_whitelist_command(package_names))
                 else:
-                    await self._set_app_blacklist(package_names)
+                    steps.append(self._app_blacklist_command(package_names))
             elif not package_names:
                 _logger.warning(
                     f"No package names provided for {app_rule.rule_type} list"
@@ -1010,14 +1016,20 @@ class AsyncMobile(AsyncBaseService):
 
         # Configure navigation bar visibility
         if mobile_config.hide_navigation_bar is not None:
-            await self._set_navigation_bar_visibility(mobile_config.hide_navigation_bar)
+            steps.append(
+                self._navigation_bar_visibility_command(mobile_config.hide_navigation_bar)
+            )
 
         # Configure uninstall blacklist
         if (
             mobile_config.uninstall_blacklist
             and len(mobile_config.uninstall_blacklist) > 0
         ):
-            await self._set_uninstall_blacklist(mobile_config.uninstall_blacklist)
+            steps.append(
+                self._uninstall_blacklist_command(mobile_config.uninstall_blacklist)
+            )
+
+        await self._execute_template_commands(steps)
 
     async def set_resolution_lock(self, enable: bool):
         """
@@ -1131,16 +1143,19 @@ class AsyncMobile(AsyncBaseService):
             return
         await self._set_uninstall_blacklist(package_names)
 
-    async def get_adb_url(self, adbkey_pub: str) -> AdbUrlResult:
+    async def get_adb_url(self, adbkey_pub: str, force_refresh: bool = False) -> AdbUrlResult:
         """
         Retrieves the ADB connection URL for the mobile environment.
 
         This method is only supported in mobile environments (mobile_latest image).
         It uses the provided ADB public key to establish the connection and returns
-        the ADB connect URL.
+        the ADB connect URL. The URL is cached on the session per public key until it
+        expires; call `session.invalidate_link_cache("adb")` after a failed
+        `adb connect` to force a new one.
 
         Args:
             adbkey_pub (str): The ADB public key for connection authentication.
+            force_refresh (bool): Bypass the session link cache. Defaults to False.
 
         Returns:
             AdbUrlResult: Result object containing the ADB connection URL
@@ -1163,46 +1178,62 @@ class AsyncMobile(AsyncBaseService):
             # Build options JSON with adbkey_pub
             import json
 
-            from ..api.models import GetAdbLinkRequest
-
             options_json = json.dumps({"adbkey_pub": adbkey_pub})
+            failure: Dict[str, AdbUrlResult] = {}
 
-            # Call get_adb_link API
-            # NOTE: We need to use the async version of the client method here, but it's on session.agent_bay.client
-            # The session.agent_bay.client is the sync/async client.
-            # In async session, session.agent_bay is AsyncAgentBay, and client is AsyncClient.
-            # So we should await the method call.
+            async def _fetch():
+                from ..api.models import GetAdbLinkRequest
 
-            request = GetAdbLinkRequest(
-                authorization=f"Bearer {self.session.agent_bay.api_key}",
-                session_id=self.session.session_id,
-                option=options_json,
-            )
-            response = await self.session.agent_bay.client.get_adb_link_async(request)
-
-            # Check response
-            if response.body and response.body.success and response.body.data:
-                adb_url = response.body.data.url
-                request_id = response.body.request_id or ""
-                _logger.info(
-                    f"✅ get_adb_url completed successfully. RequestID: {request_id}"
-                )
-                return AdbUrlResult(
-                    request_id=request_id,
-                    success=True,
-                    data=adb_url,
-                    error_message="",
+                request = GetAdbLinkRequest(
+                    authorization=f"Bearer {self.session.agent_bay.api_key}",
+                    session_id=self.session.session_id,
+                    option=options_json,
                 )
-            else:
+                response = await self.session.agent_bay.client.get_adb_link_async(request)
+
+                # Check response
+                if response.body and response.body.success and response.body.data:
+                    return (response.body.data.url, response.body.request_id or "")
+
                 error_msg = response.body.message if response.body else "Unknown error"
                 request_id = response.body.request_id if response.body else ""
                 _logger.error(f"❌ Failed to get ADB URL: {error_msg}")
-                return AdbUrlResult(
+                failure["result"] = AdbUrlResult(
                     request_id=request_id,
                     success=False,
                     data="",
                     error_message=error_msg,
                 )
+                return None
+
+            link_cache = getattr(self.session, "_link_cache", None)
+            if isinstance(link_cache, LinkCache):
+                key = ("adb", None, None, options_json)
+                if force_refresh:
+                    link_cache.invalidate_key(key)
+                entry = await link_cache.get_or_fetch(key, _fetch)
+                fetched = (entry.url, entry.request_id) if entry is not None else None
+            else:
+                fetched = await _fetch()
+
+            if fetched is None:
+                return failure.get("result") or AdbUrlResult(
+                    request_id="",
+                    success=False,
+                    data="",
+                    error_message="Failed to get ADB URL: empty URL in response",
+                )
+
+            adb_url, request_id = fetched
+            _logger.info(
+                f"✅ get_adb_url completed successfully. RequestID: {request_id}"
+            )
+            return AdbUrlResult(
+                request_id=request_id,
+                success=True,
+                data=adb_url,
+                error_message="",
+            )
 
         except Exception as e:
             error_msg = f"Failed to get ADB URL: {str(e)}"
@@ -1214,58 +1245,73 @@ class AsyncMobile(AsyncBaseService):
                 error_message=error_msg,
             )
 
-    async def _execute_template_command(
-        self, template_name: str, params: Dict[str, Any], operation_name: str
-    ):
-        """Execute a command using template and parameters."""
+    @staticmethod
+    def _render_template_command(
+        template_name: str, params: Dict[str, Any]
+    ) -> Optional[str]:
+        """Render a command template with parameters."""
         template = MOBILE_COMMAND_TEMPLATES.get(template_name)
         if not template:
             _logger.error(f"Template '{template_name}' not found")
-            return
+            return None
+        return template.format(**params)
 
-        command = template.format(**params)
+    async def _execute_template_commands(
+        self, steps: List[Tuple[Optional[str], str]]
+    ):
+        """Execute rendered template commands in one round trip."""
+        steps = [(command, name) for command, name in steps if command]
+        if not steps:
+            return
 
-        _logger.info(f"Executing {operation_name}")
-        # execute_command is async in AsyncCommand
-        result = await self.session.command.execute_command(command)
+        for _, operation_name in steps:
+            _logger.info(f"Executing {operation_name}")
+        batch = await self.session.command.execute_many(
+            [command for command, _ in steps]
+        )
+        if len(batch.results) != len(steps):
+            for _, operation_name in steps:
+                _logger.error(f"❌ {operation_name} failed: {batch.error_message}")
+            return
 
-        if result.success:
-            _logger.info(f"✅ {operation_name} completed successfully")
-        else:
-            _logger.error(f"❌ {operation_name} failed: {result.error_message}")
+        for (_, operation_name), result in zip(steps, batch.results):
+            if result.success:
+                _logger.info(f"✅ {operation_name} completed successfully")
+            else:
+                _logger.error(f"❌ {operation_name} failed: {result.error_message}")
 
-    async def _set_resolution_lock(self, enable: bool):
-        """Execute resolution lock command."""
+    def _resolution_lock_command(self, enable: bool) -> Tuple[Optional[str], str]:
+        """Build the resolution lock command."""
         params = {"lock_switch": 1 if enable else 0}
         operation_name = f"Resolution lock {'enable' if enable else 'disable'}"
-        await self._execute_template_command("resolution_lock", params, operation_name)
+        return self._render_template_command("resolution_lock", params), operation_name
 
-    async def _set_app_whitelist(self, package_names: List[str]):
-        """Execute app whitelist command."""
+    def _app_whitelist_command(self, package_names: List[str]) -> Tuple[Optional[str], str]:
+        """Build the app whitelist command."""
         params = {
             "package_list": "\n".join(package_names),
             "package_count": len(package_names),
         }
         operation_name = f"App whitelist configuration ({len(package_names)} packages)"
-        await self._execute_template_command("app_whitelist", params, operation_name)
+        return self._render_template_command("app_whitelist", params), operation_name
 
-    async def _set_app_blacklist(self, package_names: List[str]):
-        """Execute app blacklist command."""
+    def _app_blacklist_command(self, package_names: List[str]) -> Tuple[Optional[str], str]:
+        """Build the app blacklist command."""
         params = {
             "package_list": "\n".join(package_names),
             "package_count": len(package_names),
         }
         operation_name = f"App blacklist configuration ({len(package_names)} packages)"
-        await self._execute_template_command("app_blacklist", params, operation_name)
+        return self._render_template_command("app_blacklist", params), operation_name
 
-    async def _set_navigation_bar_visibility(self, hide: bool):
-        """Execute navigation bar visibility command."""
+    def _navigation_bar_visibility_command(self, hide: bool) -> Tuple[Optional[str], str]:
+        """Build the navigation bar visibility command."""
         template_name = "hide_navigation_bar" if hide else "show_navigation_bar"
         operation_name = f"Navigation bar visibility (hide: {hide})"
-        await self._execute_template_command(template_name, {}, operation_name)
+        return self._render_template_command(template_name, {}), operation_name
 
-    async def _set_uninstall_blacklist(self, package_names: List[str]):
-        """Execute uninstall blacklist command."""
+    def _uninstall_blacklist_command(self, package_names: List[str]) -> Tuple[Optional[str], str]:
+        """Build the uninstall blacklist command."""
         import time
 
         # Use newline-separated format for uninstall blacklist file content
@@ -1276,6 +1322,39 @@ class AsyncMobile(AsyncBaseService):
         operation_name = (
             f"Uninstall blacklist configuration ({len(package_names)} packages)"
         )
-        await self._execute_template_command(
-            "uninstall_blacklist", params, operation_name
-        )
+        return self._render_template_command("uninstall_blacklist", params), operation_name
+
+    async def _run_template_step(self, step: Tuple[Optional[str], str]):
+        """Execute a single rendered template command."""
+        command, operation_name = step
+        if not command:
+            return
+
+        _logger.info(f"Executing {operation_name}")
+        # execute_command is async in AsyncCommand
+        result = await self.session.command.execute_command(command)
+
+        if result.success:
+            _logger.info(f"✅ {operation_name} completed successfully")
+        else:
+            _logger.error(f"❌ {operation_name} failed: {result.error_message}")
+
+    async def _set_resolution_lock(self, enable: bool):
+        """Execute resolution lock command."""
+        await self._run_template_step(self._resolution_lock_command(enable))
+
+    async def _set_app_whitelist(self, package_names: List[str]):
+        """Execute app whitelist command."""
+        await self._run_template_step(self._app_whitelist_command(package_names))
+
+    async def _set_app_blacklist(self, package_names: List[str]):
+        """Execute app blacklist command."""
+        await self._run_template_step(self._app_blacklist_command(package_names))
+
+    async def _set_navigation_bar_visibility(self, hide: bool):
+        """Execute navigation bar visibility command."""
+        await self._run_template_step(self._navigation_bar_visibility_command(hide))
+
+    async def _set_uninstall_blacklist(self, package_names: List[str]):
+        """Execute uninstall blacklist command."""
+        await self._run_template_step(self._uninstall_blacklist_command(package_names))
@@ -4,7 +4,6 @@ Provides get_metadata() to retrieve skill information without starting a sandbox
 Mounted on AgentBay as agent_bay.skills.
 """
 
-import asyncio
 from typing import TYPE_CHECKING, List, Optional
 
 from .._common.logger import get_logger
@@ -49,30 +48,7 @@ class AsyncSkillsService:
             skill_group_ids=skill_names,
         )
 
-        max_attempts = 3
-        delay_s = 0.2
-        last_err: Optional[BaseException] = None
-        resp = None
-        for attempt in range(1, max_attempts + 1):
-            try:
-                resp = await self._agent_bay.client.get_skill_meta_data_async(request)
-                last_err = None
-                break
-            except Exception as e:
-                last_err = e
-                msg = str(e)
-                if attempt < max_attempts and (
-                    "ServiceUnavailable" in msg
-                    or "statusCode': 503" in msg
-                    or "code: 503" in msg
-                ):
-                    await asyncio.sleep(delay_s)
-                    delay_s *= 2
-                    continue
-                raise
-
-        if last_err is not None:
-            raise RuntimeError(f"GetSkillMetaData failed: {last_err}") from last_err
+        resp = await self._agent_bay.client.get_skill_meta_data_async(request)  # retried by the client
 
         body = getattr(resp, "body", None)
         if body is None:
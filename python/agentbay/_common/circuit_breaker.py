@@ -0,0 +1,244 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .exceptions import CircuitOpenError
+from .logger import get_logger
+from .retry import is_timeout_error, is_transient_error
+
+_logger = get_logger("circuit_breaker")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+def session_key(session_id: str) -> str:
+    return f"session:{session_id}"
+
+
+def endpoint_key(host: str) -> str:
+    return f"endpoint:{host}"
+
+
+def _throttled(status_code: Any, code: Any) -> bool:
+    code = str(code or "").lower()
+    return status_code == 429 or "throttl" in code or "toomanyrequests" in code
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """
+    When a session or endpoint is considered dead, and for how long.
+
+    Attributes:
+        failure_threshold: Consecutive failures (network errors, 5xx) that open
+            the circuit. 0 disables circuit breaking.
+        timeout_threshold: Consecutive timeouts that open the circuit. Timeouts
+            are the expensive failure mode, so this is lower.
+        reset_timeout: Seconds an open circuit rejects calls before one probe
+            is let through. A failed probe opens it again for the same time.
+    """
+
+    failure_threshold: int = 5
+    timeout_threshold: int = 3
+    reset_timeout: float = 10.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open state of one session or endpoint.
+
+    Callers ask ``before_call()`` first: it returns False in the normal case,
+    raises ``CircuitOpenError`` while the circuit is open, and returns True for
+    the single caller allowed through once ``reset_timeout`` has passed. That
+    caller must report back with ``record_success()`` or ``record_failure()``,
+    either for its own call (endpoints) or for a health probe (sessions, which
+    probe with ``get_status``).
+
+    State changes are guarded by a plain lock and never block, so the same
+    breaker serves sync callers, async callers and WS loop threads.
+    """
+
+    def __init__(self, key: str, policy: CircuitBreakerPolicy):
+        self.key = key
+        self.policy = policy
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.timeouts = 0
+        self.opened_at = 0.0
+        self.probe_started_at = 0.0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def _retry_after(self, now: float) -> float:
+        return max(0.0, self.opened_at + self.policy.reset_timeout - now)
+
+    def open_error(self) -> CircuitOpenError:
+        with self._lock:
+            retry_after = self._retry_after(time.monotonic())
+        return CircuitOpenError(
+            f"Circuit for {self.key} is open; retry in {retry_after:.1f}s",
+            key=self.key,
+            retry_after=retry_after,
+        )
+
+    def before_call(self) -> bool:
+        """
+        Returns:
+            bool: True if the caller is the half-open probe.
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the call.
+        """
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return False
+            now = time.monotonic()
+            # A probe that never reported back (e.g. cancelled) must not wedge the
+            # circuit half-open forever.
+            probe_stale = now - self.probe_started_at >= self.policy.reset_timeout
+            if self._retry_after(now) <= 0 and (
+                self.state == STATE_OPEN or probe_stale
+            ):
+                self.state = STATE_HALF_OPEN
+                self.probe_started_at = now
+                return True
+            self.rejected += 1
+        raise self.open_error()
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != STATE_CLOSED:
+                _logger.info(f"Circuit for {self.key} closed")
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.timeouts = 0
+
+    def record_failure(self, timeout: bool = False) -> None:
+        with self._lock:
+            self.failures += 1
+            self.timeouts = self.timeouts + 1 if timeout else 0
+            tripped = self.failures >= self.policy.failure_threshold or (
+                self.policy.timeout_threshold > 0
+                and self.timeouts >= self.policy.timeout_threshold
+            )
+            if self.state == STATE_HALF_OPEN or (
+                self.state == STATE_CLOSED and tripped
+            ):
+                self.state = STATE_OPEN
+                self.opened_at = time.monotonic()
+                _logger.warning(
+                    f"Circuit for {self.key} opened after {self.failures} consecutive failures"
+                )
+
+    def record_outcome(
+        self,
+        status_code: Optional[int] = None,
+        code: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Record one call from its HTTP status, error code or exception.
+
+        Timeouts, transport errors and 5xx count against the circuit. Throttling
+        means the backend is alive but busy, which is the request limiter's
+        business rather than the breaker's, so it is not recorded at all.
+        """
+        if error is not None:
+            if is_timeout_error(error):
+                self.record_failure(timeout=True)
+                return
+            status_code = getattr(error, "status_code", None) or getattr(
+                error, "statusCode", None
+            )
+            if _throttled(status_code, getattr(error, "code", None)):
+                return
+            if is_transient_error(error):
+                self.record_failure()
+            elif isinstance(status_code, int):
+                # A 4xx still proves the other side is up.
+                self.record_success()
+            return
+        if _throttled(status_code, code):
+            return
+        if isinstance(status_code, int) and status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "key": self.key,
+                "state": self.state,
+                "failures": self.failures,
+                "timeouts": self.timeouts,
+                "rejected": self.rejected,
+                "retry_after": (
+                    self._retry_after(time.monotonic())
+                    if self.state != STATE_CLOSED
+                    else 0.0
+                ),
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers of one AgentBay client, keyed ``session:<id>`` and
+    ``endpoint:<host>``.
+    """
+
+    # Healthy breakers are dropped past this size, so finished sessions don't
+    # accumulate.
+    MAX_IDLE_ENTRIES = 1024
+
+    def __init__(self, policy: Optional[CircuitBreakerPolicy] = None):
+        self.policy = policy if policy is not None else CircuitBreakerPolicy()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                if len(self._breakers) >= self.MAX_IDLE_ENTRIES:
+                    self._breakers = {
+                        k: b
+                        for k, b in self._breakers.items()
+                        if b.state != STATE_CLOSED or b.failures
+                    }
+                breaker = self._breakers[key] = CircuitBreaker(key, self.policy)
+            return breaker
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._breakers.pop(key, None)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """State of every tracked breaker, open circuits first."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        rows = [breaker.snapshot() for breaker in breakers]
+        rows.sort(key=lambda row: (row["state"] == STATE_CLOSED, row["key"]))
+        return rows
+
+
+def circuit_breaker_of(agent_bay: Any, key: str) -> Optional[CircuitBreaker]:
+    """The breaker for `key` of an AgentBay client, or None when disabled."""
+    registry = getattr(agent_bay, "circuit_breakers", None)
+    if not isinstance(registry, CircuitBreakerRegistry) or not registry.policy.enabled:
+        return None
+    return registry.get(key)
+
+
+def discard_circuit_breaker(agent_bay: Any, key: str) -> None:
+    """Forget the breaker for `key`, e.g. once its session is deleted."""
+    registry = getattr(agent_bay, "circuit_breakers", None)
+    if isinstance(registry, CircuitBreakerRegistry):
+        registry.discard(key)
@@ -75,6 +75,29 @@ class ClearanceTimeoutError(AgentBayError):
     def __init__(self, message="Context clearing operation timed out", *args, **kwargs):
         super().__init__(message, *args, **kwargs)
 
+class DeadlineExceededError(AgentBayError):
+    """Raised when a call is attempted after the caller's deadline has passed."""
+
+    def __init__(self, message="Deadline exceeded", *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
+
+
+class CircuitOpenError(AgentBayError):
+    """
+    Raised without contacting the backend while the circuit breaker of a
+    session or endpoint is open.
+
+    Attributes:
+        key: The breaker that rejected the call, e.g. "session:<id>" or
+            "endpoint:<host>".
+        retry_after: Seconds until the breaker lets a probe through.
+    """
+
+    def __init__(self, message="Circuit open", key="", retry_after=0.0, *args, **kwargs):
+        super().__init__(message, *args, **kwargs)
+        self.key = key
+        self.retry_after = retry_after
+
 class GitError(AgentBayError):
     """
     Base exception for all git operations.
@@ -0,0 +1,428 @@
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .logger import get_logger
+
+_logger = get_logger("instrumentation")
+
+# Kinds of instrumented calls.
+KIND_API = "api"  # OpenAPI action, named after the action (e.g. "CreateMcpSession")
+KIND_TOOL = "tool"  # call_mcp_tool, named after the tool; route is "LinkUrl" or "API"
+KIND_WS = "ws"  # WS stream, named after the target
+KIND_TRANSFER = "transfer"  # pre-signed URL upload/download, named "upload" / "download"
+
+
+class RequestCall:
+    """
+    One instrumented call, passed to every hook phase of that call.
+
+    Hooks may keep per-call state (a span, for example) in ``attributes``.
+
+    Attributes:
+        kind: ``api``, ``tool``, ``ws`` or ``transfer``.
+        name: Action, tool, WS target or transfer direction.
+        route: Transport used for a tool call (``LinkUrl`` or ``API``), or "".
+        session_id: Session the call belongs to, if any.
+        request_id: Request ID reported by the backend, set when the call ends.
+        request_bytes: Size of the request payload.
+        response_bytes: Size of the response payload, set when the call ends.
+        status_code: HTTP status code, when known.
+        start_time: ``time.monotonic()`` at the start of the call.
+        end_time: ``time.monotonic()`` at the end of the call, or None.
+        error: Error message of a failed call, or "".
+    """
+
+    __slots__ = (
+        "kind",
+        "name",
+        "route",
+        "session_id",
+        "request_id",
+        "request_bytes",
+        "response_bytes",
+        "status_code",
+        "start_time",
+        "end_time",
+        "error",
+        "attributes",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        route: str = "",
+        session_id: str = "",
+        request_bytes: int = 0,
+    ):
+        self.kind = kind
+        self.name = name
+        self.route = route
+        self.session_id = session_id
+        self.request_id = ""
+        self.request_bytes = request_bytes
+        self.response_bytes = 0
+        self.status_code: Optional[int] = None
+        self.start_time = time.monotonic()
+        self.end_time: Optional[float] = None
+        self.error = ""
+        self.attributes: Dict[str, Any] = {}
+
+    @property
+    def duration_s(self) -> float:
+        end = self.end_time if self.end_time is not None else time.monotonic()
+        return end - self.start_time
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestCall(kind={self.kind!r}, name={self.name!r}, route={self.route!r}, "
+            f"duration_s={self.duration_s:.4f}, error={self.error!r})"
+        )
+
+
+class RequestHook:
+    """
+    Receives start, end and error events of instrumented calls.
+
+    Subclass it and override the phases you need. Hooks run synchronously on
+    the calling thread (the event loop, a transfer worker thread or a WS loop
+    thread), so they should be quick and thread-safe. Exceptions they raise
+    are logged and otherwise ignored.
+    """
+
+    def on_request_start(self, call: RequestCall) -> None:
+        """Called before the request is sent."""
+
+    def on_request_end(self, call: RequestCall) -> None:
+        """Called when the call completed successfully."""
+
+    def on_request_error(self, call: RequestCall, error: BaseException) -> None:
+        """Called when the call raised or returned a failure; ``call.error`` is set."""
+
+
+class Instrumentation:
+    """
+    Dispatches call events to the registered hooks.
+
+    Every ``AsyncAgentBay`` / ``AgentBay`` owns one, reachable as
+    ``agent_bay.instrumentation``. With no hooks registered, ``start()``
+    returns None and the call sites skip all measuring.
+    """
+
+    def __init__(self):
+        # Replaced rather than mutated, so dispatch never needs a lock.
+        self._hooks: Tuple[RequestHook, ...] = ()
+        self._lock = threading.Lock()
+
+    @property
+    def hooks(self) -> Tuple[RequestHook, ...]:
+        return self._hooks
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._hooks)
+
+    def add_hook(self, hook: RequestHook) -> RequestHook:
+        """Register a hook. Returns it, so it can be kept for remove_hook()."""
+        with self._lock:
+            if hook not in self._hooks:
+                self._hooks = self._hooks + (hook,)
+        return hook
+
+    def remove_hook(self, hook: RequestHook) -> bool:
+        """Unregister a hook. Returns False if it was not registered."""
+        with self._lock:
+            if hook not in self._hooks:
+                return False
+            self._hooks = tuple(h for h in self._hooks if h is not hook)
+        return True
+
+    def start(
+        self,
+        kind: str,
+        name: str,
+        route: str = "",
+        session_id: str = "",
+        request_bytes: int = 0,
+    ) -> Optional[RequestCall]:
+        """Begin a call. Returns None when no hook is registered."""
+        hooks = self._hooks
+        if not hooks:
+            return None
+        call = RequestCall(kind, name, route, session_id, request_bytes)
+        for hook in hooks:
+            try:
+                hook.on_request_start(call)
+            except Exception as e:
+                _logger.warning(f"Request hook {hook!r} failed on start: {e}")
+        return call
+
+    def end(
+        self,
+        call: Optional[RequestCall],
+        request_id: str = "",
+        response_bytes: int = 0,
+        status_code: Optional[int] = None,
+    ) -> None:
+        """Finish a successful call started with start()."""
+        if call is None or call.end_time is not None:
+            return
+        call.end_time = time.monotonic()
+        call.request_id = request_id or call.request_id
+        call.response_bytes = response_bytes or call.response_bytes
+        if status_code is not None:
+            call.status_code = status_code
+        for hook in self._hooks:
+            try:
+                hook.on_request_end(call)
+            except Exception as e:
+                _logger.warning(f"Request hook {hook!r} failed on end: {e}")
+
+    def fail(
+        self,
+        call: Optional[RequestCall],
+        error: Any,
+        request_id: str = "",
+        response_bytes: int = 0,
+        status_code: Optional[int] = None,
+    ) -> None:
+        """Finish a failed call. ``error`` is an exception or an error message."""
+        if call is None or call.end_time is not None:
+            return
+        call.end_time = time.monotonic()
+        call.request_id = request_id or call.request_id
+        call.response_bytes = response_bytes or call.response_bytes
+        if status_code is not None:
+            call.status_code = status_code
+        if not isinstance(error, BaseException):
+            error = RuntimeError(str(error) or "request failed")
+        call.error = str(error)
+        for hook in self._hooks:
+            try:
+                hook.on_request_error(call, error)
+            except Exception as e:
+                _logger.warning(f"Request hook {hook!r} failed on error: {e}")
+
+
+# Shared by clients built without an AgentBay instance (and by test doubles).
+NULL_INSTRUMENTATION = Instrumentation()
+
+
+def instrumentation_of(agent_bay: Any) -> Instrumentation:
+    """The ``Instrumentation`` of an AgentBay client, or a hook-less one."""
+    instrumentation = getattr(agent_bay, "instrumentation", None)
+    if isinstance(instrumentation, Instrumentation):
+        return instrumentation
+    return NULL_INSTRUMENTATION
+
+
+class _Histogram:
+    """Log-bucketed latency histogram; percentiles read at most 9% high."""
+
+    __slots__ = ("buckets", "count", "errors", "total_s", "max_s", "request_bytes", "response_bytes")
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.errors = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def record(self, call: RequestCall, failed: bool) -> None:
+        duration = call.duration_s
+        index = _bucket_index(duration)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.errors += failed
+        self.total_s += duration
+        self.max_s = max(self.max_s, duration)
+        self.request_bytes += call.request_bytes
+        self.response_bytes += call.response_bytes
+
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(_bucket_upper(index), self.max_s)
+        return self.max_s
+
+
+_BUCKET_MIN_S = 1e-4
+_BUCKET_GROWTH = 2 ** (1 / 8)
+_LOG_GROWTH = math.log(_BUCKET_GROWTH)
+
+
+def _bucket_index(duration_s: float) -> int:
+    if duration_s <= _BUCKET_MIN_S:
+        return 0
+    return math.ceil(math.log(duration_s / _BUCKET_MIN_S) / _LOG_GROWTH)
+
+
+def _bucket_upper(index: int) -> float:
+    return _BUCKET_MIN_S * _BUCKET_GROWTH ** index
+
+
+class HistogramCollector(RequestHook):
+    """
+    Built-in hook that keeps a latency histogram per (kind, name).
+
+    Buckets grow geometrically, so memory stays bounded per key however many
+    calls are recorded, and percentiles are accurate to within 9%.
+
+    Example:
+        collector = HistogramCollector()
+        agent_bay.add_request_hook(collector)
+        ...
+        for row in collector.snapshot():
+            print(row["kind"], row["name"], row["p99_s"])
+    """
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str], _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def _record(self, call: RequestCall, failed: bool) -> None:
+        key = (call.kind, call.name)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram()
+            histogram.record(call, failed)
+
+    def on_request_end(self, call: RequestCall) -> None:
+        self._record(call, False)
+
+    def on_request_error(self, call: RequestCall, error: BaseException) -> None:
+        self._record(call, True)
+
+    def percentile(self, kind: str, name: str, pct: float) -> float:
+        """Latency percentile in seconds of one kind/name, 0.0 if unseen."""
+        with self._lock:
+            histogram = self._histograms.get((kind, name))
+            return histogram.percentile(pct) if histogram is not None else 0.0
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Per-(kind, name) statistics, slowest p99 first.
+
+        Returns:
+            List[Dict[str, Any]]: Rows with kind, name, count, errors, mean_s,
+                p50_s, p90_s, p99_s, max_s, request_bytes and response_bytes.
+        """
+        with self._lock:
+            rows = [
+                {
+                    "kind": kind,
+                    "name": name,
+                    "count": h.count,
+                    "errors": h.errors,
+                    "mean_s": h.total_s / h.count,
+                    "p50_s": h.percentile(50),
+                    "p90_s": h.percentile(90),
+                    "p99_s": h.percentile(99),
+                    "max_s": h.max_s,
+                    "request_bytes": h.request_bytes,
+                    "response_bytes": h.response_bytes,
+                }
+                for (kind, name), h in self._histograms.items()
+            ]
+        rows.sort(key=lambda row: row["p99_s"], reverse=True)
+        return rows
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+_OTEL_REQUIRED_MSG = (
+    "OpenTelemetry is required for OpenTelemetryHook. "
+    "Install it with: pip install opentelemetry-api"
+)
+
+
+class OpenTelemetryHook(RequestHook):
+    """
+    Adapter that turns instrumented calls into OpenTelemetry spans.
+
+    Each call becomes a client span named ``"<kind> <name>"`` with
+    ``agentbay.*`` attributes (route, session ID, request ID, byte sizes). If
+    a meter is given, durations are also recorded on an
+    ``agentbay.request.duration`` histogram (seconds).
+
+    Requires ``opentelemetry-api`` unless a tracer is passed in.
+    """
+
+    def __init__(self, tracer: Any = None, meter: Any = None):
+        """
+        Args:
+            tracer: Tracer to create spans with. Defaults to
+                ``opentelemetry.trace.get_tracer("agentbay")``.
+            meter: Optional meter for the duration histogram.
+        """
+        try:
+            from opentelemetry import trace
+            from opentelemetry.trace import SpanKind, Status, StatusCode
+        except ImportError:
+            if tracer is None:
+                raise ImportError(_OTEL_REQUIRED_MSG)
+            trace = SpanKind = Status = StatusCode = None
+        self._tracer = tracer if tracer is not None else trace.get_tracer("agentbay")
+        self._span_kind = SpanKind.CLIENT if SpanKind is not None else None
+        self._status = Status
+        self._status_code = StatusCode
+        self._duration = None
+        if meter is not None:
+            self._duration = meter.create_histogram(
+                "agentbay.request.duration",
+                unit="s",
+                description="Duration of AgentBay API, tool, WS and transfer calls",
+            )
+
+    @staticmethod
+    def _attributes(call: RequestCall) -> Dict[str, Any]:
+        attributes: Dict[str, Any] = {"agentbay.kind": call.kind, "agentbay.name": call.name}
+        if call.route:
+            attributes["agentbay.route"] = call.route
+        if call.session_id:
+            attributes["agentbay.session_id"] = call.session_id
+        return attributes
+
+    def on_request_start(self, call: RequestCall) -> None:
+        kwargs: Dict[str, Any] = {"attributes": self._attributes(call)}
+        if self._span_kind is not None:
+            kwargs["kind"] = self._span_kind
+        call.attributes["otel_span"] = self._tracer.start_span(f"{call.kind} {call.name}", **kwargs)
+
+    def _finish(self, call: RequestCall, error: Optional[BaseException]) -> None:
+        span = call.attributes.pop("otel_span", None)
+        if span is not None:
+            if call.request_id:
+                span.set_attribute("agentbay.request_id", call.request_id)
+            span.set_attribute("agentbay.request_bytes", call.request_bytes)
+            span.set_attribute("agentbay.response_bytes", call.response_bytes)
+            if call.status_code is not None:
+                span.set_attribute("http.response.status_code", call.status_code)
+            if error is not None:
+                span.record_exception(error)
+                if self._status is not None:
+                    span.set_status(self._status(self._status_code.ERROR, call.error))
+            span.end()
+        if self._duration is not None:
+            attributes = self._attributes(call)
+            attributes.pop("agentbay.session_id", None)
+            attributes["agentbay.error"] = error is not None
+            self._duration.record(call.duration_s, attributes=attributes)
+
+    def on_request_end(self, call: RequestCall) -> None:
+        self._finish(call, None)
+
+    def on_request_error(self, call: RequestCall, error: BaseException) -> None:
+        self._finish(call, error)
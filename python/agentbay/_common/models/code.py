@@ -106,3 +106,34 @@ class CodeExecutionResult(ApiResponse):
         self.success = success
         self.result = result
         self.error_message = error_message
+
+
+@dataclass
+class CodeContextInfo:
+    """Summary of a persistent code execution context"""
+
+    name: str
+    process_id: str = ""
+    pid: int = 0
+    running: bool = False
+    language: str = "python"
+
+
+@dataclass
+class CodeContextResult(ApiResponse):
+    """Result of creating or restarting a code execution context"""
+
+    request_id: str = ""
+    success: bool = False
+    context: Optional[Any] = None  # CodeContext handle
+    error_message: str = ""
+
+
+@dataclass
+class CodeContextListResult(ApiResponse):
+    """Result of listing code execution contexts"""
+
+    request_id: str = ""
+    success: bool = False
+    contexts: List[CodeContextInfo] = field(default_factory=list)
+    error_message: str = ""
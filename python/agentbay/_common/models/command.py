@@ -2,6 +2,8 @@
 Command module data models.
 """
 
+from typing import List, Optional
+
 from .response import ApiResponse
 
 
@@ -42,3 +44,106 @@ class CommandResult(ApiResponse):
         self.stderr = stderr
         self.trace_id = trace_id
 
+
+class CommandOutputChunk:
+    """A piece of command output delivered while a streamed command is running."""
+
+    def __init__(self, stream: str, data: str):
+        """
+        Initialize a CommandOutputChunk.
+
+        Args:
+            stream (str): The output stream the chunk came from, "stdout" or "stderr".
+            data (str): The chunk text.
+        """
+        self.stream = stream
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"CommandOutputChunk(stream={self.stream!r}, data={self.data!r})"
+
+
+class ProcessInfo:
+    """Snapshot of a background process started with command.start()."""
+
+    def __init__(
+        self,
+        process_id: str = "",
+        pid: int = 0,
+        command: str = "",
+        running: bool = False,
+        exit_code: Optional[int] = None,
+    ):
+        """
+        Initialize a ProcessInfo.
+
+        Args:
+            process_id (str, optional): SDK-assigned identifier of the process.
+            pid (int, optional): Process id inside the session.
+            command (str, optional): The command line the process was started with.
+            running (bool, optional): Whether the process is still running.
+            exit_code (Optional[int], optional): Exit code once the process has exited.
+                -1 means the process disappeared without recording an exit code.
+        """
+        self.process_id = process_id
+        self.pid = pid
+        self.command = command
+        self.running = running
+        self.exit_code = exit_code
+
+    def __repr__(self) -> str:
+        return (
+            f"ProcessInfo(process_id={self.process_id!r}, pid={self.pid}, "
+            f"running={self.running}, exit_code={self.exit_code})"
+        )
+
+
+class BackgroundProcessListResult(ApiResponse):
+    """Result of listing background processes."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        processes: Optional[List[ProcessInfo]] = None,
+        error_message: str = "",
+    ):
+        """
+        Initialize a BackgroundProcessListResult.
+
+        Args:
+            request_id (str, optional): Unique identifier for the API request.
+            success (bool, optional): Whether the operation was successful.
+            processes (List[ProcessInfo], optional): Known background processes.
+            error_message (str, optional): Error message if the operation failed.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.processes = processes if processes is not None else []
+        self.error_message = error_message
+
+
+class BatchCommandResult(ApiResponse):
+    """Result of running several shell commands in one call with command.execute_many()."""
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        results: Optional[List[CommandResult]] = None,
+        error_message: str = "",
+    ):
+        """
+        Initialize a BatchCommandResult.
+
+        Args:
+            request_id (str, optional): Unique identifier for the API request.
+            success (bool, optional): Whether every command exited with code 0.
+            results (List[CommandResult], optional): One result per command, in input order.
+                Empty when the batch itself could not be executed.
+            error_message (str, optional): Error message if the batch or any command failed.
+        """
+        super().__init__(request_id)
+        self.success = success
+        self.results = results if results is not None else []
+        self.error_message = error_message
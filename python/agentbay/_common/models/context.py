@@ -110,4 +110,69 @@ class ContextStatusData:
             start_time=data.get("startTime", 0),
             finish_time=data.get("finishTime", 0),
             task_type=data.get("taskType", ""),
-        )
\ No newline at end of file
+        )
+
+
+class ContextDirSyncResult(ApiResponse):
+    """
+    Result of context.sync_dir().
+
+    Attributes:
+        uploaded (List[str]): Relative paths uploaded to the context.
+        downloaded (List[str]): Relative paths downloaded from the context.
+        deleted (List[str]): Relative paths removed from the destination side.
+        skipped (int): Number of files that were already in sync.
+        failed (Dict[str, str]): Error message per relative path that failed.
+        bytes_transferred (int): Total bytes uploaded and downloaded.
+    """
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        uploaded: Optional[List[str]] = None,
+        downloaded: Optional[List[str]] = None,
+        deleted: Optional[List[str]] = None,
+        skipped: int = 0,
+        failed: Optional[Dict[str, str]] = None,
+        bytes_transferred: int = 0,
+        error_message: str = "",
+    ):
+        super().__init__(request_id)
+        self.success = success
+        self.uploaded = uploaded or []
+        self.downloaded = downloaded or []
+        self.deleted = deleted or []
+        self.skipped = skipped
+        self.failed = failed or {}
+        self.bytes_transferred = bytes_transferred
+        self.error_message = error_message
+
+
+class ContextBatchResult(ApiResponse):
+    """
+    Result of a bulk context operation (delete_many, clear_many or get_many).
+
+    Attributes:
+        success (bool): True if every item succeeded.
+        results (Dict[str, Any]): Per-item result keyed by the context ID (or name),
+            in input order.
+        error_message (str): Summary of failed items, if any.
+    """
+
+    def __init__(
+        self,
+        request_id: str = "",
+        success: bool = False,
+        results: Optional[Dict[str, Any]] = None,
+        error_message: str = "",
+    ):
+        super().__init__(request_id)
+        self.success = success
+        self.results = results or {}
+        self.error_message = error_message
+
+    @property
+    def failed(self) -> List[str]:
+        """Keys of the items that failed."""
+        return [key for key, result in self.results.items() if not getattr(result, "success", False)]
@@ -175,4 +175,36 @@ class GitBranchListResult:
         current: Name of the currently checked-out branch.
     """
     branches: List[GitBranchInfo] = field(default_factory=list)
-    current: str = ""
\ No newline at end of file
+    current: str = ""
+
+@dataclass
+class GitSnapshotResult:
+    """
+    Result of a composite ``snapshot()`` or ``commit_all()`` operation.
+
+    Attributes:
+        path: The repository path.
+        committed: Whether a new commit was created. ``False`` when there
+            was nothing to commit.
+        commit_hash: Full hash of ``HEAD`` after the operation, or ``None``
+            if the repository has no commits yet.
+        status: Working tree status after the operation.
+    """
+    path: str
+    committed: bool = False
+    commit_hash: Optional[str] = None
+    status: GitStatusResult = field(default_factory=GitStatusResult)
+
+@dataclass
+class GitRepoSummary:
+    """
+    Status, recent history and branches of a repository, fetched together.
+
+    Attributes:
+        status: Working tree status.
+        log: Most recent commits (empty if the repository has no commits).
+        branches: Local branches.
+    """
+    status: GitStatusResult = field(default_factory=GitStatusResult)
+    log: GitLogResult = field(default_factory=GitLogResult)
+    branches: GitBranchListResult = field(default_factory=GitBranchListResult)
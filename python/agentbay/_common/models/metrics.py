@@ -0,0 +1,160 @@
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .response import SessionMetrics
+
+# Numeric SessionMetrics fields kept per sample, in storage order.
+METRIC_FIELDS = (
+    "cpu_used_pct",
+    "mem_used",
+    "mem_total",
+    "disk_used",
+    "disk_total",
+    "rx_rate_kbyte_per_s",
+    "tx_rate_kbyte_per_s",
+    "rx_used_kbyte",
+    "tx_used_kbyte",
+)
+
+# Values derived from a sample rather than stored.
+DERIVED_METRICS = ("mem_used_pct", "disk_used_pct")
+
+
+@dataclass
+class SessionMetricsSummary:
+    """
+    Rolling aggregates over the samples held for one session.
+
+    Attributes:
+        samples: Number of samples the aggregates are computed from.
+        window_s: Seconds between the oldest and newest sample.
+        cpu_p50: Median CPU usage in percent.
+        cpu_p95: 95th percentile CPU usage in percent.
+        cpu_max: Highest CPU usage in percent.
+        mem_used_max: Memory high-water mark.
+        mem_total: Memory size reported by the latest sample.
+        disk_used_max: Disk usage high-water mark.
+        rx_kbyte: KB received during the window.
+        tx_kbyte: KB sent during the window.
+    """
+
+    samples: int = 0
+    window_s: float = 0.0
+    cpu_p50: float = 0.0
+    cpu_p95: float = 0.0
+    cpu_max: float = 0.0
+    mem_used_max: float = 0.0
+    mem_total: float = 0.0
+    disk_used_max: float = 0.0
+    rx_kbyte: float = 0.0
+    tx_kbyte: float = 0.0
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _counter_delta(values: List[float]) -> float:
+    """Growth of a cumulative counter, tolerating resets."""
+    total = 0.0
+    for previous, current in zip(values, values[1:]):
+        total += current - previous if current >= previous else current
+    return total
+
+
+class SessionMetricsHistory:
+    """
+    Fixed-size ring buffer of metrics samples for one session.
+
+    Each metric is stored in its own ``array('d')`` column, so a history costs
+    ``8 * (len(METRIC_FIELDS) + 1)`` bytes per slot however many samples have
+    passed through it. Once full, new samples overwrite the oldest ones.
+    """
+
+    def __init__(self, capacity: int = 240):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._columns: Dict[str, array] = {
+            name: array("d", bytes(8 * capacity)) for name in METRIC_FIELDS
+        }
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, metrics: SessionMetrics, timestamp: float) -> None:
+        """Store one sample taken at *timestamp* (seconds since the epoch)."""
+        slot = self._next
+        self._timestamps[slot] = timestamp
+        for name, column in self._columns.items():
+            column[slot] = float(getattr(metrics, name, 0.0) or 0.0)
+        self._next = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def _ordered(self, column: array) -> List[float]:
+        if self._count < self.capacity:
+            return column[: self._count].tolist()
+        return column[self._next :].tolist() + column[: self._next].tolist()
+
+    def timestamps(self) -> List[float]:
+        """Sample times, oldest first."""
+        return self._ordered(self._timestamps)
+
+    def values(self, metric: str) -> List[float]:
+        """
+        Values of one metric, oldest first.
+
+        Args:
+            metric: A name from ``METRIC_FIELDS`` or ``DERIVED_METRICS``.
+        """
+        if metric in self._columns:
+            return self._ordered(self._columns[metric])
+        if metric in DERIVED_METRICS:
+            used, total = ("mem_used", "mem_total") if metric == "mem_used_pct" else ("disk_used", "disk_total")
+            return [
+                100.0 * u / t if t else 0.0
+                for u, t in zip(self.values(used), self.values(total))
+            ]
+        raise ValueError(f"Unknown metric: {metric}")
+
+    def latest(self) -> Optional[Dict[str, float]]:
+        """The newest sample as a dict (including derived values), or None."""
+        if not self._count:
+            return None
+        slot = (self._next - 1) % self.capacity
+        sample = {name: column[slot] for name, column in self._columns.items()}
+        sample["timestamp"] = self._timestamps[slot]
+        sample["mem_used_pct"] = (
+            100.0 * sample["mem_used"] / sample["mem_total"] if sample["mem_total"] else 0.0
+        )
+        sample["disk_used_pct"] = (
+            100.0 * sample["disk_used"] / sample["disk_total"] if sample["disk_total"] else 0.0
+        )
+        return sample
+
+    def summary(self) -> SessionMetricsSummary:
+        """Aggregate the samples currently held."""
+        if not self._count:
+            return SessionMetricsSummary()
+        timestamps = self.timestamps()
+        cpu = sorted(self.values("cpu_used_pct"))
+        return SessionMetricsSummary(
+            samples=self._count,
+            window_s=timestamps[-1] - timestamps[0],
+            cpu_p50=_percentile(cpu, 50),
+            cpu_p95=_percentile(cpu, 95),
+            cpu_max=cpu[-1],
+            mem_used_max=max(self.values("mem_used")),
+            mem_total=self.values("mem_total")[-1],
+            disk_used_max=max(self.values("disk_used")),
+            rx_kbyte=_counter_delta(self.values("rx_used_kbyte")),
+            tx_kbyte=_counter_delta(self.values("tx_used_kbyte")),
+        )
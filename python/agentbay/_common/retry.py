@@ -0,0 +1,383 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from .exceptions import DeadlineExceededError
+from .logger import get_logger
+
+_logger = get_logger("retry")
+
+T = TypeVar("T")
+
+# OpenAPI actions that can be sent again without changing the outcome.
+IDEMPOTENT_ACTIONS = frozenset(
+    {
+        "DescribeContextFiles",
+        "DescribeNetwork",
+        "DescribeSessionContexts",
+        "GetAdbLink",
+        "GetCdpLink",
+        "GetContext",
+        "GetContextFileDownloadUrl",
+        "GetContextFileUploadUrl",
+        "GetContextInfo",
+        "GetLabel",
+        "GetLink",
+        "GetMcpResource",
+        "GetSession",
+        "GetSessionDetail",
+        "GetSkillMetaData",
+        "ListContexts",
+        "ListMcpTools",
+        "ListSession",
+        "ListSkillMetaData",
+        "RefreshSessionIdleTime",
+    }
+)
+
+# MCP tools that only read state. Anything else (shell, write_file, clicks...) is
+# never sent twice.
+IDEMPOTENT_TOOLS = frozenset(
+    {
+        "get_active_window",
+        "get_all_ui_elements",
+        "get_clickable_ui_elements",
+        "get_cursor_position",
+        "get_file_info",
+        "get_installed_apps",
+        "get_metrics",
+        "get_screen_size",
+        "list_directory",
+        "list_root_windows",
+        "list_visible_apps",
+        "read_file",
+        "read_multiple_files",
+        "screenshot",
+        "search_files",
+        "system_screenshot",
+    }
+)
+
+# Latency-critical reads worth hedging when RetryPolicy.hedge_delay is set.
+HEDGED_TOOLS = frozenset({"read_file", "screenshot", "system_screenshot"})
+
+# Error codes the backend uses when it sheds load.
+_OVERLOAD_CODES = ("throttling", "toomanyrequests", "serviceunavailable", "overload")
+
+_TRANSPORT_ERRORS = ("NetworkError", "ReadError", "WriteError", "RemoteProtocolError")
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "agentbay_deadline", default=None
+)
+
+
+def is_idempotent(action: str, tool: Optional[str] = None) -> bool:
+    """Whether an OpenAPI action (or the MCP tool it carries) is safe to resend."""
+    if action == "CallMcpTool":
+        return tool in IDEMPOTENT_TOOLS
+    return action in IDEMPOTENT_ACTIONS
+
+
+def is_overload(status_code: Any, code: Any = None) -> bool:
+    """Whether an HTTP status or error code signals throttling or overload."""
+    if isinstance(status_code, int) and (status_code == 429 or status_code >= 500):
+        return True
+    code = str(code or "").lower()
+    return any(marker in code for marker in _OVERLOAD_CODES)
+
+
+def _error_chain(error: Optional[BaseException]) -> Iterator[BaseException]:
+    """An error and the ones it wraps, via ``inner_exception`` or ``__cause__``."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        error = getattr(error, "inner_exception", None) or error.__cause__
+
+
+def _is_transport_error(error: BaseException, name_markers: tuple) -> bool:
+    # httpx and requests transport errors, without importing either here.
+    module = type(error).__module__ or ""
+    if not module.startswith(("httpx", "httpcore", "requests", "urllib3", "aiohttp")):
+        return False
+    name = type(error).__name__
+    return any(marker in name for marker in name_markers)
+
+
+def is_timeout_error(error: BaseException) -> bool:
+    """Whether an exception, or one it wraps, is a request timeout."""
+    for e in _error_chain(error):
+        if isinstance(e, DeadlineExceededError):
+            return False
+        if isinstance(e, (TimeoutError, asyncio.TimeoutError)):
+            return True
+        if _is_transport_error(e, ("Timeout",)):
+            return True
+    return False
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Whether an exception is worth retrying: network failures, timeouts and
+    throttled or 5xx responses, including ones wrapped by the OpenAPI runtime.
+    """
+    for e in _error_chain(error):
+        if isinstance(e, DeadlineExceededError):
+            return False
+        if isinstance(e, (ConnectionError, TimeoutError, asyncio.TimeoutError)):
+            return True
+        if _is_transport_error(e, ("Timeout", "Connect") + _TRANSPORT_ERRORS):
+            return True
+        status_code = getattr(e, "status_code", None) or getattr(e, "statusCode", None)
+        if is_overload(status_code, getattr(e, "code", None)):
+            return True
+    return False
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Bound every SDK call made inside the block by an overall deadline.
+
+    Retries stop, backoff sleeps are shortened and request timeouts are clamped
+    so that no call runs past the deadline; once it has passed, calls raise
+    ``DeadlineExceededError``. Nested deadlines can only shorten the outer one.
+    The deadline follows the context into tasks started inside the block.
+
+    Example:
+        ```python
+        with deadline(10):
+            result = await session.file_system.read_file("/tmp/a.txt")
+        ```
+    """
+    expires_at = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+    token = _deadline.set(expires_at)
+    try:
+        yield expires_at
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline, or None without one."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def clamp_timeout(timeout_s: Optional[float]) -> Optional[float]:
+    """
+    A per-request timeout cut down to the current deadline.
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed.
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return timeout_s
+    if remaining <= 0:
+        raise DeadlineExceededError()
+    return remaining if timeout_s is None else min(timeout_s, remaining)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How the SDK retries idempotent calls that fail transiently.
+
+    Backoff is exponential with full jitter: before retry ``n`` the SDK sleeps
+    a random time in ``[0, min(max_backoff, initial_backoff * multiplier**n))``.
+
+    Attributes:
+        max_attempts: Attempts per call, including the first. 1 disables retries.
+        initial_backoff: Backoff cap before the first retry, in seconds.
+        max_backoff: Upper bound of the backoff cap, in seconds.
+        multiplier: Growth of the backoff cap per retry.
+        hedge_delay: If set, a latency-critical read (``HEDGED_TOOLS``) that has
+            not answered within this many seconds is sent a second time and the
+            first answer wins; the slower request is cancelled (async) or its
+            answer discarded (sync). None disables hedging.
+    """
+
+    max_attempts: int = 3
+    initial_backoff: float = 0.2
+    max_backoff: float = 5.0
+    multiplier: float = 2.0
+    hedge_delay: Optional[float] = None
+
+    def backoff(self, retry: int) -> float:
+        cap = min(self.max_backoff, self.initial_backoff * self.multiplier ** retry)
+        return random.uniform(0, cap)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _next_sleep(policy: RetryPolicy, retry: int) -> Optional[float]:
+    """Backoff before the next attempt, or None when no attempt is left."""
+    if retry + 1 >= policy.max_attempts:
+        return None
+    sleep_s = policy.backoff(retry)
+    remaining = remaining_time()
+    if remaining is not None and remaining <= sleep_s:
+        return None
+    return sleep_s
+
+
+_hedge_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_hedge_pool_lock = threading.Lock()
+
+
+def _hedge_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _hedge_pool
+    with _hedge_pool_lock:
+        if _hedge_pool is None:
+            _hedge_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=16, thread_name_prefix="agentbay-hedge"
+            )
+        return _hedge_pool
+
+
+def _hedged(fn: Callable[[], T], delay: float) -> T:
+    executor = _hedge_executor()
+    context = contextvars.copy_context()
+    primary = executor.submit(context.copy().run, fn)
+    try:
+        return primary.result(timeout=delay)
+    except concurrent.futures.TimeoutError:
+        pass
+    backup = executor.submit(context.copy().run, fn)
+    pending = {primary, backup}
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            if future.exception() is None:
+                # The slower request cannot be interrupted; its answer is dropped.
+                return future.result()
+            error = error or future.exception()
+    raise error
+
+
+async def _hedged_async(fn: Callable[[], Awaitable[T]], delay: float) -> T:
+    primary = asyncio.ensure_future(fn())
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done:
+        return primary.result()
+    pending = {primary, asyncio.ensure_future(fn())}
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    policy: RetryPolicy,
+    name: str = "",
+    retry_on_result: Optional[Callable[[T], bool]] = None,
+    hedge: bool = False,
+) -> T:
+    """
+    Call fn() until it succeeds, fails permanently or the policy runs out.
+
+    Only use this for idempotent calls. Transient exceptions (see
+    ``is_transient_error``) and results for which ``retry_on_result`` returns
+    True are retried; the last result is returned, the last error raised.
+
+    Raises:
+        DeadlineExceededError: If the current deadline passes before an attempt.
+    """
+    retry = 0
+    while True:
+        clamp_timeout(None)
+        try:
+            if hedge and policy.hedge_delay is not None:
+                result = _hedged(fn, policy.hedge_delay)
+            else:
+                result = fn()
+        except Exception as e:
+            if not is_transient_error(e):
+                raise
+            sleep_s = _next_sleep(policy, retry)
+            if sleep_s is None:
+                raise
+            _logger.debug(f"Retrying {name} in {sleep_s:.2f}s after: {e}")
+        else:
+            if retry_on_result is None or not retry_on_result(result):
+                return result
+            sleep_s = _next_sleep(policy, retry)
+            if sleep_s is None:
+                return result
+            _logger.debug(f"Retrying {name} in {sleep_s:.2f}s after a transient failure")
+        time.sleep(sleep_s)
+        retry += 1
+
+
+async def call_with_retry_async(
+    fn: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    name: str = "",
+    retry_on_result: Optional[Callable[[T], bool]] = None,
+    hedge: bool = False,
+) -> T:
+    """
+    Async variant of ``call_with_retry``. Attempts are also cancelled when the
+    current deadline passes, raising ``DeadlineExceededError``.
+    """
+    retry = 0
+    while True:
+        timeout_s = clamp_timeout(None)
+        try:
+            if hedge and policy.hedge_delay is not None:
+                attempt = _hedged_async(fn, policy.hedge_delay)
+            else:
+                attempt = fn()
+            try:
+                result = await asyncio.wait_for(attempt, timeout_s)
+            except asyncio.TimeoutError:
+                if timeout_s is None:
+                    raise
+                raise DeadlineExceededError() from None
+        except Exception as e:
+            if not is_transient_error(e):
+                raise
+            sleep_s = _next_sleep(policy, retry)
+            if sleep_s is None:
+                raise
+            _logger.debug(f"Retrying {name} in {sleep_s:.2f}s after: {e}")
+        else:
+            if retry_on_result is None or not retry_on_result(result):
+                return result
+            sleep_s = _next_sleep(policy, retry)
+            if sleep_s is None:
+                return result
+            _logger.debug(f"Retrying {name} in {sleep_s:.2f}s after a transient failure")
+        await asyncio.sleep(sleep_s)
+        retry += 1
+
+
+def retry_policy_of(agent_bay: Any) -> RetryPolicy:
+    """The RetryPolicy of an AgentBay client, or NO_RETRY (e.g. for test doubles)."""
+    policy = getattr(agent_bay, "retry_policy", None)
+    return policy if isinstance(policy, RetryPolicy) else NO_RETRY
@@ -0,0 +1,150 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .logger import get_logger
+from .models.mcp_tool import McpTool
+
+_logger = get_logger("tool_list_cache")
+
+# Tool lists only change when an image is rebuilt.
+DEFAULT_TOOL_LIST_TTL_S = 3600.0
+
+_FILE_VERSION = 1
+
+
+class ToolListCache:
+    """
+    Per-client cache of the MCP tool list of each image.
+
+    Sessions whose create/get response carries no ToolList are given the cached
+    list of their image, so ``call_mcp_tool`` can resolve the server name and
+    take the LinkUrl route without calling ListMcpTools first. Entries expire
+    after ``ttl_s`` seconds of wall-clock time, which also holds for entries
+    read back from ``path``.
+
+    The cache is filled from ToolList fields of create responses and from
+    ``list_mcp_tools`` results. Only non-empty lists are kept.
+    """
+
+    def __init__(
+        self, ttl_s: float = DEFAULT_TOOL_LIST_TTL_S, path: Optional[str] = None
+    ):
+        """
+        Args:
+            ttl_s: Seconds a tool list stays valid. 0 disables the cache.
+            path: JSON file to load entries from and save them to, so the cache
+                survives restarts. Kept in memory only when None.
+        """
+        self.ttl_s = ttl_s
+        self.path = os.path.expanduser(path) if path else None
+        self._entries: Dict[str, Tuple[float, str, List[Dict[str, str]]]] = {}
+        self._lock = threading.Lock()
+        if self.path and self.enabled:
+            self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_s > 0
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            _logger.warning(f"Ignoring unreadable tool list cache {self.path}: {e}")
+            return
+        if not isinstance(data, dict) or data.get("version") != _FILE_VERSION:
+            return
+        images = data.get("images")
+        if not isinstance(images, dict):
+            return
+        for image_id, entry in images.items():
+            try:
+                tools = [
+                    {"name": str(t["name"]), "server": str(t.get("server") or "")}
+                    for t in entry["tools"]
+                ]
+                self._entries[image_id] = (
+                    float(entry["saved_at"]),
+                    str(entry.get("request_id") or ""),
+                    tools,
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def _save(self) -> None:
+        images = {
+            image_id: {"saved_at": saved_at, "request_id": request_id, "tools": tools}
+            for image_id, (saved_at, request_id, tools) in self._entries.items()
+        }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": _FILE_VERSION, "images": images}, f, sort_keys=True
+                )
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            _logger.warning(f"Failed to save tool list cache {self.path}: {e}")
+
+    def lookup(self, image_id: Optional[str]) -> Optional[Tuple[List[McpTool], str]]:
+        """
+        Returns:
+            Optional[Tuple[List[McpTool], str]]: A fresh copy of the cached tools
+                and the request ID they were fetched with, or None.
+        """
+        if not image_id or not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(image_id)
+            if entry is None:
+                return None
+            saved_at, request_id, tools = entry
+            if time.time() - saved_at >= self.ttl_s:
+                self._entries.pop(image_id, None)
+                return None
+        return [McpTool(name=t["name"], server=t["server"]) for t in tools], request_id
+
+    def get(self, image_id: Optional[str]) -> List[McpTool]:
+        """The cached tools of an image, or [] on a miss."""
+        found = self.lookup(image_id)
+        return found[0] if found is not None else []
+
+    def put(
+        self, image_id: Optional[str], tools: List[McpTool], request_id: str = ""
+    ) -> None:
+        if not image_id or not tools or not self.enabled:
+            return
+        entry = [
+            {"name": t.name, "server": t.server or ""}
+            for t in tools
+            if getattr(t, "name", "")
+        ]
+        with self._lock:
+            current = self._entries.get(image_id)
+            self._entries[image_id] = (time.time(), request_id, entry)
+            # Unchanged lists are not rewritten; on disk they expire and are refetched.
+            if self.path and (current is None or current[2] != entry):
+                self._save()
+
+    def invalidate(self, image_id: Optional[str] = None) -> None:
+        """Drop the tool list of one image, or of every image when None."""
+        with self._lock:
+            if image_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(image_id, None)
+            if self.path:
+                self._save()
+
+
+def tool_list_cache_of(agent_bay: Any) -> Optional[ToolListCache]:
+    """The ToolListCache of an AgentBay client, or None (e.g. for test doubles)."""
+    cache = getattr(agent_bay, "tool_list_cache", None)
+    return cache if isinstance(cache, ToolListCache) and cache.enabled else None
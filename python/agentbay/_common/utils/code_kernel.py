@@ -0,0 +1,236 @@
+"""
+Sources of the persistent Python kernel used by code execution contexts.
+
+The kernel server runs as a background process inside the session and keeps one
+interpreter namespace alive across calls. It listens on a Unix socket in its
+context directory and speaks newline-delimited JSON:
+
+- {"op": "run", "code": str, "wait_s": float}: queue code and wait for it
+- {"op": "poll", "id": str, "offsets": [int, int], "wait_s": float}: wait for more
+  output or completion of a queued run
+- {"op": "interrupt"}: raise KeyboardInterrupt in the running cell
+- {"op": "ping"}: report the kernel pid and whether a cell is running
+
+Cells run one at a time on the main thread so that interrupts can use SIGINT.
+Both scripts must stay compatible with Python 3.6+.
+"""
+
+KERNEL_SERVER_SOURCE = r'''
+import ast
+import json
+import os
+import queue
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+import uuid
+
+CTX_DIR = sys.argv[1]
+SOCK_PATH = os.path.join(CTX_DIR, "kernel.sock")
+NAMESPACE = {"__name__": "__main__"}
+JOBS = queue.Queue()
+EXECUTIONS = {}
+COND = threading.Condition()
+STATE = {"count": 0, "busy": None}
+
+
+class _Capture(object):
+    def __init__(self, execution, key):
+        self.execution = execution
+        self.key = key
+
+    def write(self, text):
+        with COND:
+            self.execution[self.key].append(text)
+            COND.notify_all()
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+def _run_cell(execution):
+    saved = sys.stdout, sys.stderr
+    sys.stdout = _Capture(execution, "stdout")
+    sys.stderr = _Capture(execution, "stderr")
+    try:
+        tree = ast.parse(execution["code"], "<cell>", "exec")
+        last = None
+        if tree.body and isinstance(tree.body[-1], ast.Expr):
+            last = ast.Expression(tree.body.pop().value)
+        exec(compile(tree, "<cell>", "exec"), NAMESPACE)
+        if last is not None:
+            value = eval(compile(last, "<cell>", "eval"), NAMESPACE)
+            if value is not None:
+                execution["result"] = repr(value)
+    except KeyboardInterrupt:
+        execution["error"] = {"name": "KeyboardInterrupt", "value": "Execution interrupted", "traceback": ""}
+    except BaseException as e:
+        execution["error"] = {"name": type(e).__name__, "value": str(e), "traceback": traceback.format_exc()}
+    finally:
+        sys.stdout, sys.stderr = saved
+
+
+def _main_loop():
+    while True:
+        try:
+            execution = JOBS.get()
+        except KeyboardInterrupt:
+            continue
+        try:
+            with COND:
+                STATE["count"] += 1
+                STATE["busy"] = execution["id"]
+                execution["execution_count"] = STATE["count"]
+            _run_cell(execution)
+        except KeyboardInterrupt:
+            if execution["error"] is None:
+                execution["error"] = {"name": "KeyboardInterrupt", "value": "Execution interrupted", "traceback": ""}
+        while True:
+            try:
+                with COND:
+                    STATE["busy"] = None
+                    execution["done"] = True
+                    COND.notify_all()
+                break
+            except KeyboardInterrupt:
+                continue
+
+
+def _wait(execution, offsets, wait_s):
+    deadline = time.time() + float(wait_s or 0)
+    with COND:
+        while not execution["done"]:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            COND.wait(remaining)
+        out_offset, err_offset = offsets
+        reply = {
+            "id": execution["id"],
+            "done": execution["done"],
+            "stdout": "".join(execution["stdout"][out_offset:]),
+            "stderr": "".join(execution["stderr"][err_offset:]),
+            "offsets": [len(execution["stdout"]), len(execution["stderr"])],
+            "result": execution["result"],
+            "error": execution["error"],
+            "execution_count": execution["execution_count"],
+        }
+        if execution["done"]:
+            EXECUTIONS.pop(execution["id"], None)
+    return reply
+
+
+def _handle(conn):
+    try:
+        request = json.loads(conn.makefile("rb").readline().decode("utf-8"))
+        op = request.get("op")
+        if op == "run":
+            execution = {
+                "id": uuid.uuid4().hex,
+                "code": request.get("code", ""),
+                "stdout": [],
+                "stderr": [],
+                "done": False,
+                "result": None,
+                "error": None,
+                "execution_count": None,
+            }
+            with COND:
+                EXECUTIONS[execution["id"]] = execution
+            JOBS.put(execution)
+            reply = _wait(execution, [0, 0], request.get("wait_s", 0))
+        elif op == "poll":
+            with COND:
+                execution = EXECUTIONS.get(request.get("id"))
+            if execution is None:
+                reply = {"error_message": "Unknown execution: %s" % request.get("id")}
+            else:
+                reply = _wait(execution, request.get("offsets") or [0, 0], request.get("wait_s", 0))
+        elif op == "interrupt":
+            with COND:
+                busy = STATE["busy"]
+            if busy is not None:
+                os.kill(os.getpid(), signal.SIGINT)
+            reply = {"interrupted": busy is not None}
+        elif op == "ping":
+            with COND:
+                reply = {"pid": os.getpid(), "busy": STATE["busy"] is not None, "execution_count": STATE["count"]}
+        else:
+            reply = {"error_message": "Unknown op: %s" % op}
+    except Exception as e:
+        reply = {"error_message": str(e)}
+    try:
+        conn.sendall((json.dumps(reply) + "\n").encode("utf-8"))
+    finally:
+        conn.close()
+
+
+def _serve(server):
+    while True:
+        conn, _ = server.accept()
+        threading.Thread(target=_handle, args=(conn,), daemon=True).start()
+
+
+if __name__ == "__main__":
+    # Background jobs start with SIGINT ignored; interrupts rely on it.
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    try:
+        os.unlink(SOCK_PATH)
+    except OSError:
+        pass
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(SOCK_PATH)
+    server.listen(16)
+    threading.Thread(target=_serve, args=(server,), daemon=True).start()
+    _main_loop()
+'''
+
+KERNEL_CLIENT_SOURCE = r'''
+import json, os, socket, sys, time
+path = sys.argv[1]
+payload = sys.stdin.buffer.read().strip() + b"\n"
+deadline = time.time() + 15
+
+
+def _kernel_alive():
+    try:
+        with open(os.path.join(os.path.dirname(path), "pid")) as f:
+            pid = int(f.read().strip())
+    except (OSError, ValueError):
+        return os.path.isdir(os.path.dirname(path))
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+while True:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        break
+    except OSError:
+        sock.close()
+        if not _kernel_alive() or time.time() > deadline:
+            sys.stdout.write(json.dumps({"error_message": "Code context is not running"}) + "\n")
+            sys.exit(0)
+        time.sleep(0.1)
+sock.sendall(payload)
+buf = b""
+while not buf.endswith(b"\n"):
+    chunk = sock.recv(65536)
+    if not chunk:
+        break
+    buf += chunk
+sys.stdout.write(buf.decode("utf-8"))
+'''
@@ -0,0 +1,439 @@
+# DO NOT EDIT THIS FILE MANUALLY.
+# This file is auto-generated by scripts/generate_sync.py
+
+import fnmatch
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from ..._common.exceptions import AgentBayError
+from ..._common.instrumentation import KIND_TRANSFER, instrumentation_of
+from ..._common.logger import get_logger
+from ..._common.models.context import ContextDirSyncResult
+from .rate_limit import run_bounded
+
+if TYPE_CHECKING:
+    from ..context import ContextService
+
+_logger = get_logger("dir_sync")
+
+# Manifest written next to the synced files unless a path is given. It is never synced.
+DEFAULT_MANIFEST_NAME = ".agentbay-sync-manifest.json"
+_MANIFEST_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+SYNC_DIRECTIONS = ("upload", "download")
+
+
+@dataclass
+class LocalFile:
+    path: str
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class RemoteFile:
+    logical_path: str
+    file_path: str
+    size: Optional[int]
+    modified: Optional[str]
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _put_file(client: httpx.Client, url: str, path: str) -> int:
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        resp = client.put(url, content=f, headers={"Content-Length": str(size)})
+    if resp.status_code not in (200, 201, 204):
+        raise AgentBayError(f"Upload failed with HTTP {resp.status_code}")
+    return size
+
+
+def _get_file(client: httpx.Client, url: str, path: str) -> Tuple[int, str]:
+    """Download to a temporary file and move it into place. Returns (bytes, sha256)."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.agentbay-part"
+    digest = hashlib.sha256()
+    received = 0
+    try:
+        with client.stream("GET", url) as resp:
+            if resp.status_code != 200:
+                resp.read()
+                raise AgentBayError(f"Download failed with HTTP {resp.status_code}")
+            with open(tmp_path, "wb") as f:
+                for chunk in resp.iter_bytes():
+                    f.write(chunk)
+                    digest.update(chunk)
+                    received += len(chunk)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return received, digest.hexdigest()
+
+
+class DirSyncEngine:
+    """
+    Mirrors a local directory and a context folder, transferring only changed files.
+
+    The remote tree is listed with context.walk(), which pages through folders
+    concurrently.
+    Local files are compared to a manifest of the last sync by size and mtime, and
+    re-hashed only when those changed, so unchanged files cost no reads or
+    transfers. Transfers share one pooled HTTP client and run on a bounded number
+    of workers.
+
+    The context API exposes no content hash, so a remote file is considered
+    unchanged while its size and modification time match the manifest.
+
+    This is an internal SDK module; use context.sync_dir().
+    """
+
+    def __init__(
+        self,
+        context_service: "ContextService",
+        local_dir: str,
+        context_id: str,
+        prefix: str = "/",
+        direction: str = "upload",
+        delete: bool = False,
+        concurrency: int = 8,
+        page_size: int = 100,
+        exclude: Optional[List[str]] = None,
+        manifest_path: Optional[str] = None,
+        transfer_timeout_s: float = 300.0,
+    ):
+        if direction not in SYNC_DIRECTIONS:
+            raise ValueError(f"direction must be one of {SYNC_DIRECTIONS}, got {direction!r}")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.context_service = context_service
+        self.local_dir = os.path.abspath(local_dir)
+        self.context_id = context_id
+        self.prefix = "/" + prefix.strip("/") if prefix.strip("/") else "/"
+        self.direction = direction
+        self.delete = delete
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.exclude = list(exclude or [])
+        self.manifest_path = manifest_path or os.path.join(self.local_dir, DEFAULT_MANIFEST_NAME)
+        self.transfer_timeout_s = transfer_timeout_s
+        self._http: Optional[httpx.Client] = None
+        self._instrumentation = instrumentation_of(getattr(context_service, "agent_bay", None))
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._result = ContextDirSyncResult()
+        # Transfers of the sync SDK run on worker threads and share this bookkeeping.
+        self._result_lock = threading.Lock()
+
+    # ------------------------------------------------------------------ helpers
+
+    def _run_pool(self, items: List[Any], fn: Callable[[Any], Any]) -> None:
+        run_bounded(items, fn, self.concurrency)
+
+    def _is_excluded(self, rel_path: str) -> bool:
+        if os.path.abspath(os.path.join(self.local_dir, rel_path)) == os.path.abspath(self.manifest_path):
+            return True
+        return any(
+            fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(os.path.basename(rel_path), pattern)
+            for pattern in self.exclude
+        )
+
+    def _local_path(self, rel_path: str) -> Optional[str]:
+        """Local path of a remote file, or None if its name would land outside local_dir."""
+        root = os.path.realpath(self.local_dir)
+        path = os.path.realpath(os.path.join(root, *rel_path.split("/")))
+        try:
+            inside = os.path.commonpath([root, path]) == root
+        except ValueError:
+            # Different drives on Windows.
+            inside = False
+        return path if inside and path != root else None
+
+    def _remote_path(self, rel_path: str) -> str:
+        return self.prefix.rstrip("/") + "/" + rel_path
+
+    def _load_manifest(self) -> None:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            isinstance(data, dict)
+            and data.get("version") == _MANIFEST_VERSION
+            and data.get("context_id") == self.context_id
+            and data.get("prefix") == self.prefix
+            and isinstance(data.get("files"), dict)
+        ):
+            self._manifest = data["files"]
+
+    def _save_manifest(self) -> None:
+        os.makedirs(os.path.dirname(self.manifest_path) or ".", exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": _MANIFEST_VERSION,
+                    "context_id": self.context_id,
+                    "prefix": self.prefix,
+                    "files": self._manifest,
+                },
+                f,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, self.manifest_path)
+
+    # ------------------------------------------------------------------ listing
+
+    def _scan_local(self) -> Dict[str, LocalFile]:
+        files: Dict[str, LocalFile] = {}
+        if not os.path.isdir(self.local_dir):
+            return files
+        for root, _, names in os.walk(self.local_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                rel_path = os.path.relpath(path, self.local_dir).replace(os.sep, "/")
+                if self._is_excluded(rel_path) or name.endswith(".agentbay-part"):
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                files[rel_path] = LocalFile(path=path, size=st.st_size, mtime_ns=st.st_mtime_ns)
+        return files
+
+    def _scan_remote(self) -> Dict[str, RemoteFile]:
+        files: Dict[str, RemoteFile] = {}
+        base = len(self.prefix.rstrip("/")) + 1
+        for entry in self.context_service.walk(
+            self.context_id,
+            self.prefix,
+            concurrency=self.concurrency,
+            page_size=self.page_size,
+        ):
+            if entry.is_folder:
+                continue
+            logical = entry.logical_path
+            rel_path = logical[base:]
+            if not rel_path or self._is_excluded(rel_path):
+                continue
+            files[rel_path] = RemoteFile(
+                logical_path=logical,
+                file_path=entry.file_path or logical,
+                size=entry.size,
+                modified=entry.gmt_modified,
+            )
+        return files
+
+    # ------------------------------------------------------------------ planning
+
+    def _local_hash(self, rel_path: str, local: LocalFile) -> str:
+        record = self._manifest.get(rel_path)
+        if record and record.get("size") == local.size and record.get("mtime_ns") == local.mtime_ns:
+            return record.get("sha256", "")
+        return _hash_file(local.path)
+
+    @staticmethod
+    def _remote_unchanged(record: Dict[str, Any], remote: RemoteFile) -> bool:
+        if record.get("remote_size") != remote.size:
+            return False
+        # Right after an upload the remote modification time is not known yet; the
+        # first listing that matches the uploaded size adopts it.
+        return record.get("remote_modified") in (None, remote.modified)
+
+    def _record(self, rel_path: str, local: LocalFile, sha256: str, remote: Optional[RemoteFile]) -> None:
+        self._manifest[rel_path] = {
+            "size": local.size,
+            "mtime_ns": local.mtime_ns,
+            "sha256": sha256,
+            "remote_size": remote.size if remote is not None else local.size,
+            "remote_modified": remote.modified if remote is not None else None,
+        }
+
+    def _plan_upload(
+        self, local_files: Dict[str, LocalFile], remote_files: Dict[str, RemoteFile]
+    ) -> List[Tuple[str, LocalFile, str]]:
+        """Return (rel_path, local, sha256) for files that need uploading."""
+        todo: List[Tuple[str, LocalFile, str]] = []
+        for rel_path in sorted(local_files):
+            local = local_files[rel_path]
+            sha256 = self._local_hash(rel_path, local)
+            record = self._manifest.get(rel_path)
+            remote = remote_files.get(rel_path)
+            if (
+                remote is not None
+                and record is not None
+                and record.get("sha256") == sha256
+                and self._remote_unchanged(record, remote)
+            ):
+                self._record(rel_path, local, sha256, remote)
+                self._result.skipped += 1
+                continue
+            todo.append((rel_path, local, sha256))
+        return todo
+
+    def _plan_download(
+        self, local_files: Dict[str, LocalFile], remote_files: Dict[str, RemoteFile]
+    ) -> List[Tuple[str, RemoteFile]]:
+        todo: List[Tuple[str, RemoteFile]] = []
+        for rel_path in sorted(remote_files):
+            remote = remote_files[rel_path]
+            local = local_files.get(rel_path)
+            record = self._manifest.get(rel_path)
+            if local is not None and record is not None and self._remote_unchanged(record, remote):
+                sha256 = self._local_hash(rel_path, local)
+                if sha256 == record.get("sha256"):
+                    self._record(rel_path, local, sha256, remote)
+                    self._result.skipped += 1
+                    continue
+            todo.append((rel_path, remote))
+        return todo
+
+    # ------------------------------------------------------------------ transfers
+
+    def _upload(self, item: Tuple[str, LocalFile, str]) -> None:
+        rel_path, local, sha256 = item
+        call = None
+        try:
+            url_result = self.context_service.get_file_upload_url(
+                self.context_id, self._remote_path(rel_path)
+            )
+            if not url_result.success or not url_result.url:
+                raise AgentBayError(url_result.error_message or "No upload URL returned")
+            call = self._instrumentation.start(KIND_TRANSFER, "upload")
+            sent = _put_file(self._http, url_result.url, local.path)
+            if call is not None:
+                call.request_bytes = sent
+            self._instrumentation.end(call)
+        except Exception as e:
+            self._instrumentation.fail(call, e)
+            self._result.failed[rel_path] = str(e)
+            return
+        with self._result_lock:
+            self._record(rel_path, local, sha256, None)
+            self._result.uploaded.append(rel_path)
+            self._result.bytes_transferred += sent
+
+    def _download(self, item: Tuple[str, RemoteFile]) -> None:
+        rel_path, remote = item
+        path = self._local_path(rel_path)
+        if path is None:
+            # Remote names are not trusted: "../" or absolute parts must not escape local_dir.
+            _logger.warning(f"sync_dir: skipping remote file outside the local directory: {rel_path!r}")
+            self._result.failed[rel_path] = "Remote path resolves outside the local directory"
+            return
+        call = None
+        try:
+            url_result = self.context_service.get_file_download_url(
+                self.context_id, remote.file_path
+            )
+            if not url_result.success or not url_result.url:
+                raise AgentBayError(url_result.error_message or "No download URL returned")
+            call = self._instrumentation.start(KIND_TRANSFER, "download")
+            received, sha256 = _get_file(self._http, url_result.url, path)
+            self._instrumentation.end(call, response_bytes=received)
+            st = os.stat(path)
+        except Exception as e:
+            self._instrumentation.fail(call, e)
+            self._result.failed[rel_path] = str(e)
+            return
+        with self._result_lock:
+            self._record(rel_path, LocalFile(path, st.st_size, st.st_mtime_ns), sha256, remote)
+            self._result.downloaded.append(rel_path)
+            self._result.bytes_transferred += received
+
+    def _delete_remote(self, item: Tuple[str, RemoteFile]) -> None:
+        rel_path, remote = item
+        try:
+            result = self.context_service.delete_file(self.context_id, remote.logical_path)
+            if not result.success:
+                raise AgentBayError(result.error_message or "Failed to delete file")
+        except Exception as e:
+            self._result.failed[rel_path] = str(e)
+            return
+        with self._result_lock:
+            self._manifest.pop(rel_path, None)
+            self._result.deleted.append(rel_path)
+
+    def _delete_local(self, rel_path: str, local: LocalFile) -> None:
+        try:
+            os.remove(local.path)
+        except OSError as e:
+            self._result.failed[rel_path] = str(e)
+            return
+        self._manifest.pop(rel_path, None)
+        self._result.deleted.append(rel_path)
+
+    # ------------------------------------------------------------------ entry point
+
+    def run(self) -> ContextDirSyncResult:
+        if self.direction == "upload" and not os.path.isdir(self.local_dir):
+            return ContextDirSyncResult(
+                success=False, error_message=f"Local directory does not exist: {self.local_dir}"
+            )
+        self._load_manifest()
+        try:
+            remote_files = self._scan_remote()
+        except Exception as e:
+            return ContextDirSyncResult(success=False, error_message=str(e))
+        local_files = self._scan_local()
+        _logger.info(
+            f"sync_dir {self.direction}: {len(local_files)} local, {len(remote_files)} remote files"
+        )
+
+        self._http = httpx.Client(
+            timeout=self.transfer_timeout_s,
+            limits=httpx.Limits(max_connections=self.concurrency),
+        )
+        try:
+            if self.direction == "upload":
+                uploads = self._plan_upload(local_files, remote_files)
+                self._run_pool(uploads, self._upload)
+                if self.delete:
+                    extra = [(p, r) for p, r in sorted(remote_files.items()) if p not in local_files]
+                    self._run_pool(extra, self._delete_remote)
+            else:
+                downloads = self._plan_download(local_files, remote_files)
+                self._run_pool(downloads, self._download)
+                if self.delete:
+                    for rel_path in sorted(set(local_files) - set(remote_files)):
+                        self._delete_local(rel_path, local_files[rel_path])
+        finally:
+            self._http.close()
+            self._http = None
+
+        # Forget files that disappeared from both sides.
+        for rel_path in list(self._manifest):
+            if rel_path not in local_files and rel_path not in remote_files:
+                self._manifest.pop(rel_path, None)
+        try:
+            self._save_manifest()
+        except OSError as e:
+            _logger.warning(f"Failed to write sync manifest {self.manifest_path}: {e}")
+
+        result = self._result
+        result.success = not result.failed
+        if result.failed:
+            result.error_message = f"{len(result.failed)} file(s) failed to sync"
+        _logger.info(
+            f"sync_dir done: {len(result.uploaded)} uploaded, {len(result.downloaded)} downloaded, "
+            f"{len(result.deleted)} deleted, {result.skipped} unchanged, {len(result.failed)} failed"
+        )
+        return result
@@ -0,0 +1,166 @@
+# DO NOT EDIT THIS FILE MANUALLY.
+# This file is auto-generated by scripts/generate_sync.py
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from ..._common.logger import get_logger
+
+_logger = get_logger("link_cache")
+
+# Used when the link carries no expiry information of its own.
+DEFAULT_LINK_TTL_S = 60.0
+
+# Links are refreshed this long before their advertised expiry so a caller never
+# receives a URL that dies while it is being dialled.
+LINK_EXPIRY_MARGIN_S = 5.0
+
+# Query parameters that carry an absolute expiry timestamp (epoch seconds or ms).
+_EXPIRY_QUERY_KEYS = ("expires", "expire", "expire_time", "expiretime", "expiration", "x-oss-expires")
+
+LinkKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class LinkCacheEntry:
+    url: str
+    request_id: str
+    expires_at: float
+
+
+def _link_ttl_from_url(url: str, now_epoch: float) -> Optional[float]:
+    """
+    Derive the remaining validity of a link from expiry query parameters.
+
+    Returns None when the URL does not advertise an expiry.
+    """
+    try:
+        query = urlsplit(url).query
+    except Exception:
+        return None
+    if not query:
+        return None
+    for name, value in parse_qsl(query, keep_blank_values=False):
+        if name.lower() not in _EXPIRY_QUERY_KEYS:
+            continue
+        try:
+            expires_at = float(value)
+        except ValueError:
+            continue
+        # Millisecond timestamps are 13 digits; seconds are 10.
+        if expires_at > 1e12:
+            expires_at /= 1000.0
+        return expires_at - now_epoch
+    return None
+
+
+class LinkCache:
+    """
+    Session-scoped TTL cache for access links (CDP, ADB and GetLink URLs).
+
+    Entries are keyed by (kind, port, protocol, options). Concurrent lookups of the
+    same missing key share one backend call: the first caller fetches while the
+    others wait on a per-key lock and then read the fresh entry.
+
+    This is an internal SDK module.
+    """
+
+    def __init__(
+        self,
+        default_ttl_s: float = DEFAULT_LINK_TTL_S,
+        expiry_margin_s: float = LINK_EXPIRY_MARGIN_S,
+    ):
+        self.default_ttl_s = default_ttl_s
+        self.expiry_margin_s = expiry_margin_s
+        self._entries: Dict[LinkKey, LinkCacheEntry] = {}
+        self._locks: Dict[LinkKey, Any] = {}
+        # Guards _locks: in the sync SDK lookups come from several threads.
+        self._locks_guard = threading.Lock()
+
+    def _ttl_for(self, url: str) -> float:
+        ttl = _link_ttl_from_url(url, time.time())
+        if ttl is None:
+            return self.default_ttl_s
+        return max(0.0, ttl - self.expiry_margin_s)
+
+    def get(self, key: LinkKey) -> Optional[LinkCacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.expires_at:
+            self._entries.pop(key, None)
+            return None
+        return entry
+
+    def put(self, key: LinkKey, url: str, request_id: str = "") -> LinkCacheEntry:
+        entry = LinkCacheEntry(
+            url=url,
+            request_id=request_id,
+            expires_at=time.monotonic() + self._ttl_for(url),
+        )
+        self._entries[key] = entry
+        return entry
+
+    def _drop_lock(self, key: LinkKey) -> None:
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            # A held lock still has a fetch behind it; it goes with a later invalidation.
+            if lock is not None and not lock.locked():
+                del self._locks[key]
+
+    def invalidate_key(self, key: LinkKey) -> None:
+        self._entries.pop(key, None)
+        self._drop_lock(key)
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """
+        Drop cached links.
+
+        Args:
+            kind: Only drop entries of this kind ("cdp", "adb" or "link"). Drops
+                everything when None.
+        """
+        with self._locks_guard:
+            lock_keys = list(self._locks)
+        if kind is None:
+            self._entries.clear()
+        else:
+            for key in [k for k in self._entries if k and k[0] == kind]:
+                self._entries.pop(key, None)
+        for key in lock_keys:
+            if kind is None or (key and key[0] == kind):
+                self._drop_lock(key)
+
+    def get_or_fetch(
+        self,
+        key: LinkKey,
+        fetcher: Callable[[], Any],
+    ) -> Optional[LinkCacheEntry]:
+        """
+        Return a fresh cached entry, or call fetcher() once to populate it.
+
+        fetcher must return a (url, request_id) tuple, or None when the link could
+        not be obtained (nothing is cached in that case). Exceptions propagate.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+
+        with self._locks_guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+
+        with lock:
+            entry = self.get(key)
+            if entry is not None:
+                _logger.debug(f"Link cache hit after wait: {key[0]}")
+                return entry
+            fetched = fetcher()
+            if not fetched:
+                return None
+            url, request_id = fetched
+            if not url:
+                return None
+            return self.put(key, url, request_id)
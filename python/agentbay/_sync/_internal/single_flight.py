@@ -0,0 +1,163 @@
+# DO NOT EDIT THIS FILE MANUALLY.
+# This file is auto-generated by scripts/generate_sync.py
+
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ..._common.logger import get_logger
+
+_logger = get_logger("single_flight")
+
+FlightKey = Tuple[Hashable, ...]
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        # Set when the leading caller was cancelled; waiters then start over.
+        self.abandoned = False
+
+
+def _succeeded(result: Any) -> bool:
+    return getattr(result, "success", True) is True
+
+
+class SingleFlight:
+    """
+    Session-scoped coalescing of identical concurrent reads.
+
+    While a call for a key is in flight, further calls for the same key wait for
+    it and get its result (or exception) instead of sending their own request.
+    Actions listed in `ttls` additionally keep a successful result for that many
+    seconds, for values that rarely change such as the screen size.
+
+    Waiters receive the very same result object as the caller that fetched it.
+
+    This is an internal SDK module.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None):
+        self.ttls = dict(ttls or {})
+        self._calls: Dict[FlightKey, _Call] = {}
+        self._cache: Dict[FlightKey, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+    def _cached(self, key: FlightKey) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return False, None
+            if time.monotonic() >= entry[1]:
+                self._cache.pop(key, None)
+                return False, None
+            return True, entry[0]
+
+    def invalidate(self, action: Optional[str] = None) -> None:
+        """Drop cached results, of one action only when given."""
+        with self._lock:
+            if action is None:
+                self._cache.clear()
+                return
+            for key in [k for k in self._cache if k[0] == action]:
+                self._cache.pop(key, None)
+
+    def do(
+        self,
+        key: FlightKey,
+        fn: Callable[[], Any],
+        cacheable: Callable[[Any], bool] = _succeeded,
+    ) -> Any:
+        """
+        Return fn()'s result, sharing it with identical calls in flight.
+
+        Args:
+            key: (action, ...) tuple identifying the call; key[0] selects the TTL.
+            fn: Performs the call.
+            cacheable: Whether a result may be kept for the action's TTL.
+        """
+        while True:
+            hit, value = self._cached(key)
+            if hit:
+                return value
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = _Call()
+            if leader:
+                return self._lead(key, call, fn, cacheable)
+            _logger.debug(f"Joining in-flight call: {key[0]}")
+            call.done.wait()
+            if call.abandoned:
+                continue
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+    def _lead(
+        self,
+        key: FlightKey,
+        call: _Call,
+        fn: Callable[[], Any],
+        cacheable: Callable[[Any], bool],
+    ) -> Any:
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        except BaseException:
+            call.abandoned = True
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+                ttl = self.ttls.get(str(key[0]), 0)
+                if ttl > 0 and call.error is None and not call.abandoned:
+                    if cacheable(call.result):
+                        self._cache[key] = (call.result, time.monotonic() + ttl)
+            call.done.set()
+        return call.result
+
+
+def read_cache_ttls_of(agent_bay: Any) -> Dict[str, float]:
+    """The opt-in read cache TTLs of an AgentBay client ({} for test doubles)."""
+    ttls = getattr(agent_bay, "read_cache_ttls", None)
+    return ttls if isinstance(ttls, dict) else {}
+
+
+def coalesced(action: str) -> Callable:
+    """
+    Decorate a read method of a session (or of one of its modules) so identical
+    concurrent calls on that session share one request.
+
+    Calls are identified by `action` and the bound arguments, defaults included,
+    so `get_installed_apps()` and `get_installed_apps(True, False, True)` match.
+    """
+
+    def decorate(method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            session = getattr(self, "session", self)
+            flight = getattr(session, "_single_flight", None)
+            if not isinstance(flight, SingleFlight):
+                return method(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (action, method.__qualname__) + tuple(bound.arguments.items())[1:]
+            try:
+                hash(key)
+            except TypeError:
+                return method(self, *args, **kwargs)
+            return flight.do(key, lambda: method(self, *args, **kwargs))
+
+        return wrapper
+
+    return decorate
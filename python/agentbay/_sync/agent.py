@@ -6,7 +6,7 @@ import asyncio
 import json
 import sys
 from collections.abc import Awaitable
-from typing import TYPE_CHECKING, Any, Callable, Type, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, Callable, Type, Optional, Union
 
 from .._common.exceptions import AgentBayError, AgentError
 from .._common.logger import get_logger
@@ -29,6 +29,57 @@ _logger = get_logger("agent")
 AgentEventCallback = Optional[Callable[[AgentEvent], None]]
 SyncAgentEventCallback = Optional[Callable[[AgentEvent], Union[Awaitable[str], str]]]
 
+# Task status polling starts fast and backs off while the task keeps running.
+_POLL_INITIAL_INTERVAL = 0.5
+_POLL_MAX_INTERVAL = 3.0
+_POLL_BACKOFF_FACTOR = 1.5
+
+
+class _PollSchedule:
+    """Poll intervals for one task, bounded by a total wait budget in seconds."""
+    __slots__ = ("timeout", "waited", "interval")
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.waited = 0.0
+        self.interval = _POLL_INITIAL_INTERVAL
+
+    def expired(self) -> bool:
+        return self.waited >= self.timeout
+
+    def next_interval(self) -> float:
+        """Seconds to sleep before the next poll; grows geometrically to a cap."""
+        interval = min(self.interval, self.timeout - self.waited)
+        self.waited += interval
+        self.interval = min(self.interval * _POLL_BACKOFF_FACTOR, _POLL_MAX_INTERVAL)
+        return interval
+
+
+def _stream_since(stream: list, since_timestamp: Optional[int]) -> list:
+    """Timestamped stream items newer than ``since_timestamp`` (all of them if None)."""
+    items = []
+    for item in stream:
+        if not isinstance(item, dict):
+            continue
+        timestamp = item.get("timestamp_ms")
+        if timestamp is None:
+            continue
+        if since_timestamp is not None and timestamp <= since_timestamp:
+            continue
+        items.append(item)
+    return items
+
+
+def _parse_stream(content: dict, since_timestamp: Optional[int]) -> list:
+    stream = content.get("stream", [])
+    if not isinstance(stream, list):
+        _logger.warning(f"⚠️ Stream is not a list (type: {type(stream)}), converting to empty list")
+        return []
+    if since_timestamp is not None:
+        # The tool may not honour since_timestamp; filter here as well.
+        return _stream_since(stream, since_timestamp)
+    return stream
+
 
 class _StreamContext:
     """Mutable state shared between WS event callbacks and TaskExecution.wait()."""
@@ -70,6 +121,10 @@ class TaskExecution:
         self._agent = _agent
         self._result = _result
         self._request_id = _request_id
+        # Polling progress, kept across events() calls so a later wait() or
+        # events() resumes after the items already yielded.
+        self._cursor: Optional[int] = None
+        self._seq = 0
 
     def wait(self, timeout: int = 300) -> ExecutionResult:
         """Block until the task completes and return the final result.
@@ -138,61 +193,125 @@ class TaskExecution:
             task_result=task_result,
         )
 
-    def _wait_polling(self, timeout: int) -> ExecutionResult:
+    def events(self, timeout: int = 300) -> Iterator[AgentEvent]:
+        """
+        Iterate over the task's reasoning and content events as they arrive.
+
+        Polls ``get_task_status`` with a ``since_timestamp`` cursor, so each
+        poll only carries stream items that have not been seen yet. Polling
+        starts every 0.5 seconds and backs off to every 3 seconds while the
+        task keeps running. When iteration ends, ``wait()`` returns the final
+        result without polling again.
+
+        Only available for tasks started without ``on_*`` callbacks; streaming
+        tasks deliver their events to the callbacks instead.
+
+        Args:
+            timeout: Maximum seconds to wait. Default 300.
+
+        Yields:
+            AgentEvent: ``reasoning`` and ``content`` events in stream order.
+
+        Example:
+            ```python
+            execution = session.agent.mobile.execute_task("Open WeChat app")
+            for event in execution.events(timeout=180):
+                print(event.content, end="", flush=True)
+            result = execution.wait()
+            ```
+        """
+        if self._result is not None:
+            return
+        if self._ws_handle is not None:
+            raise RuntimeError("Events of a streaming task are delivered to its on_* callbacks")
+        if self._agent is None:
+            raise RuntimeError("TaskExecution is not properly initialized")
+
         agent = self._agent
         task_id = self.task_id
-        poll_interval = 3
-        max_poll_attempts = timeout // poll_interval
-
-        last_request_id = self._request_id
-        tried_time = 0
-        processed_timestamps: set = set()
+        schedule = _PollSchedule(timeout)
+        content_parts: list[str] = []
         last_query = None
 
-        while tried_time < max_poll_attempts:
-            query = agent.get_task_status(task_id)
-            if query.stream:
-                last_query = query
-
-            if query.stream:
-                for stream_item in query.stream:
-                    if isinstance(stream_item, dict):
-                        timestamp = stream_item.get("timestamp_ms")
-                        if timestamp is not None and timestamp not in processed_timestamps:
-                            processed_timestamps.add(timestamp)
-                            content = stream_item.get("content", "")
-                            reasoning = stream_item.get("reasoning", "")
-                            if content:
-                                sys.stdout.write(content)
-                                sys.stdout.flush()
-                            if reasoning:
-                                _logger.debug(f"💭 {reasoning}")
+        while not schedule.expired():
+            query = agent.get_task_status(task_id, since_timestamp=self._cursor)
+            last_query = query
+
+            for stream_item in _stream_since(query.stream, self._cursor):
+                # Items may arrive out of order; the cursor never moves back.
+                self._cursor = max(self._cursor or 0, stream_item["timestamp_ms"])
+                reasoning = stream_item.get("reasoning", "")
+                content = stream_item.get("content", "")
+                if reasoning:
+                    self._seq += 1
+                    yield AgentEvent(type="reasoning", seq=self._seq, content=reasoning)
+                if content:
+                    content_parts.append(content)
+                    self._seq += 1
+                    yield AgentEvent(type="content", seq=self._seq, content=content)
 
             if query.error:
                 _logger.warning(f"⚠️ Task error: {query.error}")
 
-            if query.task_status == "completed":
-                return ExecutionResult(
-                    request_id=last_request_id,
+            if query.task_status in ("completed", "finished"):
+                self._result = ExecutionResult(
+                    request_id=self._request_id,
                     success=True,
                     task_id=task_id,
                     task_status=query.task_status,
                     task_result=query.task_product,
                 )
+                return
             elif query.task_status in ("failed", "cancelled", "unsupported"):
                 error_msg = query.error or query.error_message or f"Task {query.task_status}."
-                return ExecutionResult(
+                self._result = ExecutionResult(
                     request_id=query.request_id,
                     success=False,
                     error_message=error_msg,
                     task_id=task_id,
                     task_status=query.task_status,
                 )
+                return
 
             _logger.info(f"⏳ Task {task_id} running 🚀: {query.task_action}.")
-            time.sleep(poll_interval)
-            tried_time += 1
+            time.sleep(schedule.next_interval())
+
+        self._terminate_after_timeout()
+
+        task_result_parts = [f"Task execution timed out after {timeout} seconds."]
+        if content_parts:
+            task_result_parts.append(f"Last task status output: {''.join(content_parts)}")
+        if last_query:
+            if last_query.task_action:
+                task_result_parts.append(f"Last action: {last_query.task_action}")
+            if last_query.task_product:
+                task_result_parts.append(f"Last result: {last_query.task_product}")
+            if last_query.error:
+                task_result_parts.append(f"Last error: {last_query.error}")
+            if last_query.task_status:
+                task_result_parts.append(f"Last status: {last_query.task_status}")
+
+        self._result = ExecutionResult(
+            request_id=self._request_id,
+            success=False,
+            error_message=f"Task execution timed out after {timeout} seconds. Task ID: {task_id}.",
+            task_id=task_id,
+            task_status="failed",
+            task_result=" | ".join(task_result_parts),
+        )
 
+    def _wait_polling(self, timeout: int) -> ExecutionResult:
+        for event in self.events(timeout):
+            if event.type == "content":
+                sys.stdout.write(event.content)
+                sys.stdout.flush()
+            else:
+                _logger.debug(f"💭 {event.content}")
+        return self._result
+
+    def _terminate_after_timeout(self) -> None:
+        agent = self._agent
+        task_id = self.task_id
         _logger.warning("⚠️ task execution timeout!")
         try:
             terminate_result = agent.terminate_task(task_id)
@@ -219,35 +338,6 @@ class TaskExecution:
                 time.sleep(1)
                 terminate_tried += 1
 
-        task_result_parts = [f"Task execution timed out after {timeout} seconds."]
-        if last_query:
-            if last_query.stream:
-                stream_parts = []
-                for item in last_query.stream:
-                    if isinstance(item, dict):
-                        c = item.get("content", "")
-                        if c:
-                            stream_parts.append(c)
-                if stream_parts:
-                    task_result_parts.append(f"Last task status output: {''.join(stream_parts)}")
-            if last_query.task_action:
-                task_result_parts.append(f"Last action: {last_query.task_action}")
-            if last_query.task_product:
-                task_result_parts.append(f"Last result: {last_query.task_product}")
-            if last_query.error:
-                task_result_parts.append(f"Last error: {last_query.error}")
-            if last_query.task_status:
-                task_result_parts.append(f"Last status: {last_query.task_status}")
-
-        return ExecutionResult(
-            request_id=last_request_id,
-            success=False,
-            error_message=f"Task execution timed out after {timeout} seconds. Task ID: {task_id}.",
-            task_id=task_id,
-            task_status="failed",
-            task_result=" | ".join(task_result_parts),
-        )
-
 
 class Agent(BaseService):
     """
@@ -577,7 +667,8 @@ class Agent(BaseService):
             Execute a specific task described in human language synchronously.
 
             This is a synchronous interface that blocks until the task is completed or
-            an error occurs, or timeout happens. The default polling interval is 3 seconds.
+            an error occurs, or timeout happens. Task status is polled every 0.5 seconds at
+            first, backing off to every 3 seconds while the task keeps running.
 
             Args:
                 task: Task description in human language.
@@ -596,8 +687,7 @@ class Agent(BaseService):
                 session.delete()
                 ```
             """
-            poll_interval = 3
-            max_poll_attempts = timeout // poll_interval
+            schedule = _PollSchedule(timeout)
 
             try:
                 args = {"task": task}
@@ -610,7 +700,7 @@ class Agent(BaseService):
                     content = json.loads(result.data)
                     task_id = content.get("task_id", "")
                     tried_time: int = 0
-                    while tried_time < max_poll_attempts:
+                    while not schedule.expired():
                         query = self.get_task_status(task_id)
                         if query.task_status == "finished":
                             return ExecutionResult(
@@ -642,7 +732,7 @@ class Agent(BaseService):
                         _logger.info(
                             f"⏳ Task {task_id} running 🚀: {query.task_action}."
                         )
-                        time.sleep(poll_interval)
+                        time.sleep(schedule.next_interval())
                         tried_time += 1
                     _logger.warning("⚠️ task execution timeout!")
                     try:
@@ -653,7 +743,7 @@ class Agent(BaseService):
                             _logger.warning(f"⚠️ Failed to terminate task {task_id} after timeout: {terminate_result.error_message}")
                     except Exception as e:
                         _logger.warning(f"⚠️ Exception while terminating task {task_id} after timeout: {e}")
-                    timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {tried_time} times (max: {max_poll_attempts})."
+                    timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {tried_time} times."
                     return ExecutionResult(
                         request_id=result.request_id,
                         success=False,
@@ -693,16 +783,22 @@ class Agent(BaseService):
                     task_result="Task Failed",
                 )
 
-        def get_task_status(self, task_id: str) -> QueryResult:
+        def get_task_status(
+            self, task_id: str, since_timestamp: Optional[int] = None
+        ) -> QueryResult:
             """
             Get the status of the task with the given task ID.
 
             Args:
                 task_id: The ID of the task to query.
+                since_timestamp: Only return stream items with a ``timestamp_ms``
+                    greater than this cursor. Pass the ``timestamp_ms`` of the last
+                    item already seen to fetch just the new ones. Default None
+                    returns the whole stream.
 
             Returns:
                 QueryResult: Result object containing success status, task status,
-                    task action, task product, and error message if any.
+                    task action, task product, stream items, and error message if any.
 
             Example:
                 ```python
@@ -716,6 +812,8 @@ class Agent(BaseService):
             """
             try:
                 args = {"task_id": task_id}
+                if since_timestamp is not None:
+                    args["since_timestamp"] = since_timestamp
                 tool_name = self._get_tool_name("get_status")
                 result = self.session.call_mcp_tool(
                     tool_name,
@@ -731,6 +829,8 @@ class Agent(BaseService):
                         task_status=content.get("status", "finished"),
                         task_action=content.get("action", ""),
                         task_product=content.get("product", ""),
+                        stream=_parse_stream(content, since_timestamp),
+                        error=content.get("error", ""),
                     )
                 else:
                     return QueryResult(
@@ -760,6 +860,35 @@ class Agent(BaseService):
                     task_status="failed",
                 )
 
+        def stream_task_events(
+            self, task_id: str, timeout: int = 300
+        ) -> Iterator[AgentEvent]:
+            """
+            Iterate over the reasoning and content events of a running task.
+
+            Each status poll asks only for stream items newer than the last one
+            seen, and polling backs off from 0.5 to 3 seconds while the task keeps
+            running. Iteration ends when the task finishes, fails or times out.
+
+            Args:
+                task_id: The ID of the task, as returned by ``execute_task``.
+                timeout: Maximum seconds to follow the task. Default 300. The task
+                    is terminated when it runs longer.
+
+            Yields:
+                AgentEvent: ``reasoning`` and ``content`` events in stream order.
+
+            Example:
+                ```python
+                result = session.agent.computer.execute_task("Open Chrome browser")
+                for event in session.agent.computer.stream_task_events(result.task_id):
+                    print(event.content, end="", flush=True)
+                ```
+            """
+            execution = TaskExecution(task_id=task_id, _agent=self)
+            for event in execution.events(timeout):
+                yield event
+
         def terminate_task(self, task_id: str) -> ExecutionResult:
             """
             Terminate a task with a specified task ID.
@@ -987,7 +1116,8 @@ class Agent(BaseService):
             Execute a task described in human language on a browser synchronously.
 
             This is a synchronous interface that blocks until the task is completed or
-            an error occurs, or timeout happens. The default polling interval is 3 seconds.
+            an error occurs, or timeout happens. Task status is polled every 0.5 seconds at
+            first, backing off to every 3 seconds while the task keeps running.
 
             Args:
                 task: Task description in human language.
@@ -1024,8 +1154,7 @@ class Agent(BaseService):
                         task_id="",
                     )
 
-            poll_interval = 3
-            max_poll_attempts = timeout // poll_interval
+            schedule = _PollSchedule(timeout)
 
             try:
                 args = {
@@ -1051,7 +1180,7 @@ class Agent(BaseService):
                     content = json.loads(result.data)
                     task_id = content.get("task_id", "")
                     tried_time: int = 0
-                    while tried_time < max_poll_attempts:
+                    while not schedule.expired():
                         query = self.get_task_status(task_id)
                         if query.task_status == "finished":
                             return ExecutionResult(
@@ -1083,7 +1212,7 @@ class Agent(BaseService):
                         _logger.info(
                             f"⏳ Task {task_id} running 🚀: {query.task_action}."
                         )
-                        time.sleep(poll_interval)
+                        time.sleep(schedule.next_interval())
                         tried_time += 1
                     _logger.warning("⚠️ task execution timeout!")
                     # Automatically terminate the task on timeout
@@ -1101,7 +1230,7 @@ class Agent(BaseService):
                         _logger.warning(
                             f"⚠️ Exception while terminating task {task_id} after timeout: {e}"
                         )
-                    timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {tried_time} times (max: {max_poll_attempts})."
+                    timeout_error_msg = f"Task execution timed out after {timeout} seconds. Task ID: {task_id}. Polled {tried_time} times."
                     return ExecutionResult(
                         request_id=result.request_id,
                         success=False,
@@ -1344,9 +1473,13 @@ class Agent(BaseService):
 
             return execution.wait(timeout=timeout)
 
-        def get_task_status(self, task_id: str) -> QueryResult:
+        def get_task_status(
+            self, task_id: str, since_timestamp: Optional[int] = None
+        ) -> QueryResult:
             try:
                 args = {"task_id": task_id}
+                if since_timestamp is not None:
+                    args["since_timestamp"] = since_timestamp
                 tool_name = self._get_tool_name("get_status")
                 result = self.session.call_mcp_tool(
                     tool_name,
@@ -1357,11 +1490,7 @@ class Agent(BaseService):
                     content_task_id = content.get("taskId") or content.get("task_id", task_id)
                     task_product = content.get("result") or content.get("product", "")
 
-                    stream = content.get("stream", [])
-                    if not isinstance(stream, list):
-                        _logger.warning(f"⚠️ Stream is not a list (type: {type(stream)}), converting to empty list")
-                        stream = []
-
+                    stream = _parse_stream(content, since_timestamp)
                     error = content.get("error", "")
 
                     return QueryResult(
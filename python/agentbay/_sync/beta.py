@@ -1,9 +1,8 @@
-import time
 # DO NOT EDIT THIS FILE MANUALLY.
 # This file is auto-generated by scripts/generate_sync.py
 
 import os
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from ..api.models import ListSkillMetaDataRequest, GetSkillMetaDataRequest
 from .._common.models.skill_info import SkillInfo, SkillsMetadataResult
@@ -60,30 +59,7 @@ class SyncBetaSkillsService:
             skill_group_ids=skill_names,
         )
 
-        max_attempts = 3
-        delay_s = 0.2
-        last_err: Optional[BaseException] = None
-        resp = None
-        for attempt in range(1, max_attempts + 1):
-            try:
-                resp = self._agent_bay.client.get_skill_meta_data(request)
-                last_err = None
-                break
-            except Exception as e:
-                last_err = e
-                msg = str(e)
-                if attempt < max_attempts and (
-                    "ServiceUnavailable" in msg
-                    or "statusCode': 503" in msg
-                    or "code: 503" in msg
-                ):
-                    time.sleep(delay_s)
-                    delay_s *= 2
-                    continue
-                raise
-
-        if last_err is not None:
-            raise RuntimeError(f"GetSkillMetaData failed: {last_err}") from last_err
+        resp = self._agent_bay.client.get_skill_meta_data(request)  # retried by the client
 
         body = getattr(resp, "body", None)
         if body is None:
@@ -129,28 +105,7 @@ class SyncBetaSkillsService:
             authorization=f"Bearer {self._agent_bay.api_key}",
         )
 
-        max_attempts = 3
-        delay_s = 0.2
-        last_err: Optional[BaseException] = None
-        resp: Any = None
-        for attempt in range(1, max_attempts + 1):
-            try:
-                resp = self._agent_bay.client.list_skill_meta_data(request)
-                last_err = None
-                break
-            except Exception as e:
-                last_err = e
-                msg = str(e)
-                if attempt < max_attempts and (
-                    "ServiceUnavailable" in msg or "statusCode': 503" in msg or "code: 503" in msg
-                ):
-                    time.sleep(delay_s)
-                    delay_s *= 2
-                    continue
-                raise
-
-        if last_err is not None:
-            raise RuntimeError(f"ListSkillMetaData failed: {last_err}") from last_err
+        resp = self._agent_bay.client.list_skill_meta_data(request)  # retried by the client
 
         body = getattr(resp, "body", None)
         if body is None:
@@ -29,6 +29,7 @@ from .._common.models.computer import (
     WindowListResult,
 )
 from .._common.models.response import ApiResponse, BoolResult, OperationResult
+from ._internal.single_flight import coalesced
 from .base_service import BaseService
 
 
@@ -579,6 +580,7 @@ class Computer(BaseService):
             )
 
     # Screen Operations
+    @coalesced("get_screen_size")
     def get_screen_size(self) -> OperationResult:
         """
         Gets the screen size and DPI scaling factor.
@@ -1413,6 +1415,7 @@ class Computer(BaseService):
             )
 
     # Application Management Operations
+    @coalesced("get_installed_apps")
     def get_installed_apps(
         self,
         start_menu: bool = True,
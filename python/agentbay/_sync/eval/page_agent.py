@@ -58,6 +58,8 @@ class PageAgent:
         self._task_queue: Optional[asyncio.Queue] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._run_local: bool = False
+        # Browser context opened by new_context(); closed when the next one opens.
+        self._task_context: Optional[Any] = None
 
     def get_test_api_key(self) -> str:
         """Get API key for testing"""
@@ -141,6 +143,25 @@ class PageAgent:
             raise
         _logger.info("Initialize browser agent successfully")
 
+    def new_context(self) -> None:
+        """
+        Switch to a fresh browser context and page on the current session.
+
+        Lets one initialized session run task after task without sharing
+        cookies, storage or open pages between them. The context opened by the
+        previous call is closed, and the metrics are reset.
+        """
+        if self.browser is None:
+            raise RuntimeError("Browser is not initialized. Call initialize() first.")
+        if self._task_context is not None:
+            try:
+                self._task_context.close()
+            except Exception as e:
+                _logger.warning(f"Failed to close previous browser context: {e}")
+        self._task_context = self.browser.new_context()
+        self.current_page = self._task_context.new_page()
+        self.reset_metrics()
+
     def _interactive_loop(self) -> None:
         """Run interactive loop."""
         while True:
@@ -402,7 +423,8 @@ class PageAgent:
             self.browser.close()
         if self.playwright:
             self.playwright.stop()
-        self.session = self.playwright = self.browser = self.current_page = None
         if not self._run_local:
             if self.agent_bay and self.session:
                 self.agent_bay.delete(self.session)
+        self.session = self.playwright = self.browser = self.current_page = None
+        self._task_context = None
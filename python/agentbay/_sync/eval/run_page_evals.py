@@ -2,38 +2,77 @@
 # This file is auto-generated by scripts/generate_sync.py
 
 import argparse
+import csv
 import importlib
 import json
 import os
 import time
-from typing import Any, Dict
+from collections import deque
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 
 from agentbay import get_logger
 
 from agentbay._sync.eval.page_agent import PageAgent
+from agentbay._sync.eval.perf_store import EvalResultStore, current_revision, percentile
 
 _logger = get_logger("run_page_evals")
 
+# Per-task latency statistics written to the perf report, in column order.
+_PERF_COLUMNS = (
+    "task_name",
+    "runs",
+    "passed",
+    "success_rate",
+    "latency_p50_s",
+    "latency_p90_s",
+    "latency_p95_s",
+    "latency_max_s",
+    "latency_mean_s",
+    "browser_setup_mean_s",
+    "llm_time_percentage",
+)
+
+
+def _load_task(task_name: str) -> Any:
+    return importlib.import_module(f"agentbay._sync.eval.page_tasks.{task_name}")
+
 
 def run_single_task(
-    task_name: str, task_config: Dict[str, Any]
+    task_name: str,
+    task_config: Dict[str, Any],
+    agent: Optional[PageAgent] = None,
+    trial: int = 0,
 ) -> Dict[str, Any]:
-    _logger.info(f"🚀 Starting task: {task_name}")
+    """
+    Run one evaluation task.
+
+    Args:
+        task_name: Module name under ``page_tasks``.
+        task_config: The task's entry from ``page_evals.config.json``.
+        agent: An initialized agent to run on. The task gets a fresh browser
+            context on it and the agent is left open. When None, a new agent
+            (and session) is created and closed around the task.
+        trial: Trial number, recorded in the result.
+    """
+    _logger.info(f"🚀 Starting task: {task_name} (trial {trial})")
     overall_start = time.perf_counter()
 
-    agent = PageAgent(enable_metrics=True)
+    owns_agent = agent is None
     browser_setup_s = 0.0
-    open_start = time.perf_counter()
-    agent.initialize()
-    open_end = time.perf_counter()
-    browser_setup_s += open_end - open_start
-
+    browser_ready = False
     try:
-        task_module = importlib.import_module(
-            f"agentbay._sync.eval.page_tasks.{task_name}"
-        )
+        open_start = time.perf_counter()
+        if owns_agent:
+            agent = PageAgent(enable_metrics=True)
+            agent.initialize()
+        else:
+            agent.new_context()
+        browser_setup_s += time.perf_counter() - open_start
+        browser_ready = True
+
+        task_module = _load_task(task_name)
 
         result = task_module.run(agent, _logger, task_config)
         # result = agent.run_task(task_module, _logger, task_config)
@@ -44,20 +83,29 @@ def run_single_task(
             _logger.error(f"Error: {result.get('error')}")
 
     except Exception as e:
-        _logger.error(f"💥 Unhandled exception in task {task_name}: {e}", exc_info=True)
-        result = {"_success": False, "error": str(e)}
+        if browser_ready:
+            _logger.error(f"💥 Unhandled exception in task {task_name}: {e}", exc_info=True)
+            result = {"_success": False, "error": str(e)}
+        else:
+            _logger.error(f"💥 Browser setup failed for task {task_name}: {e}")
+            result = {"_success": False, "error": f"Browser setup failed: {e}"}
     finally:
-        close_start = time.perf_counter()
-        agent.close()
-        close_end = time.perf_counter()
-        browser_setup_s += close_end - close_start
+        if owns_agent and agent is not None:
+            close_start = time.perf_counter()
+            agent.close()
+            close_end = time.perf_counter()
+            browser_setup_s += close_end - close_start
         browser_setup_s = round(browser_setup_s, 2)
 
+    if not browser_ready:
+        # No timed run: left out of the latency statistics.
+        return {"task_name": task_name, "trial": trial, "result": result, "performance": {}}
+
     overall_end = time.perf_counter()
     total_duration_s = round(overall_end - overall_start, 2)
     task_duration_s = round(total_duration_s - browser_setup_s, 2)
 
-    llm_metrics = agent.get_metrics()
+    llm_metrics = dict(agent.get_metrics())
     llm_metrics["llm_duration_s"] = int(
         round(llm_metrics.get("llm_duration_s", 0.0), 2)
     )
@@ -78,11 +126,129 @@ def run_single_task(
 
     return {
         "task_name": task_name,
+        "trial": trial,
         "result": result,
         "performance": performance,
     }
 
 
+def run_tasks(
+    task_configs: List[Dict[str, Any]], workers: int = 1, trials: int = 1
+) -> List[Dict[str, Any]]:
+    """
+    Run every task config ``trials`` times, one at a time on one session.
+
+    One ``PageAgent`` (one browser session) is initialized for the first task
+    and reused for every task after that, giving each task its own browser
+    context. ``workers`` is accepted for parity with the async runner and
+    ignored.
+
+    Returns:
+        List[Dict[str, Any]]: One ``run_single_task`` result per run, ordered
+            by trial, then by task order.
+    """
+    jobs = deque(
+        enumerate((task, trial) for trial in range(trials) for task in task_configs)
+    )
+    results: Dict[int, Dict[str, Any]] = {}
+
+    def _worker():
+        agent: Optional[PageAgent] = None
+        try:
+            while jobs:
+                index, (task, trial) = jobs.popleft()
+                if agent is None:
+                    setup_start = time.perf_counter()
+                    agent = PageAgent(enable_metrics=True)
+                    try:
+                        agent.initialize()
+                    except Exception as e:
+                        _logger.error(f"💥 Failed to initialize a pooled session: {e}")
+                        agent.close()
+                        agent = None
+                        results[index] = {
+                            "task_name": task["name"],
+                            "trial": trial,
+                            "result": {"_success": False, "error": f"Session setup failed: {e}"},
+                            "performance": {},
+                        }
+                        continue
+                    _logger.info(
+                        f"Pooled session ready in {time.perf_counter() - setup_start:.2f}s"
+                    )
+                results[index] = run_single_task(task["name"], task, agent, trial)
+                if not results[index]["performance"]:
+                    # The pooled browser is broken; the next task gets a new session.
+                    try:
+                        agent.close()
+                    except Exception as e:
+                        _logger.warning(f"Failed to close a broken pooled session: {e}")
+                    agent = None
+        finally:
+            if agent is not None:
+                agent.close()
+
+    tasks = [_worker() for _ in range(min(max(1, workers), len(jobs)))]
+    [task for task in tasks]
+    return [results[index] for index in sorted(results)]
+
+
+def build_perf_report(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Aggregate run results into per-task latency statistics.
+
+    Latencies are the ``task_duration_s`` of each run, which excludes browser
+    setup. ``llm_time_percentage`` is the LLM time over the task time of all
+    runs.
+
+    Returns:
+        List[Dict[str, Any]]: One row per task with the ``_PERF_COLUMNS`` keys.
+    """
+    by_task: Dict[str, List[Dict[str, Any]]] = {}
+    for run in results:
+        by_task.setdefault(run["task_name"], []).append(run)
+
+    rows = []
+    for task_name, runs in by_task.items():
+        performances = [run["performance"] for run in runs if run["performance"]]
+        latencies = sorted(p["task_duration_s"] for p in performances)
+        setups = [p["browser_setup_s"] for p in performances]
+        task_time = sum(latencies)
+        llm_time = sum(p.get("llm_duration_s", 0) for p in performances)
+        passed = sum(1 for run in runs if run["result"].get("_success"))
+        rows.append(
+            {
+                "task_name": task_name,
+                "runs": len(runs),
+                "passed": passed,
+                "success_rate": round(passed / len(runs) * 100, 1),
+                "latency_p50_s": percentile(latencies, 50),
+                "latency_p90_s": percentile(latencies, 90),
+                "latency_p95_s": percentile(latencies, 95),
+                "latency_max_s": latencies[-1] if latencies else 0.0,
+                "latency_mean_s": round(task_time / len(latencies), 2) if latencies else 0.0,
+                "browser_setup_mean_s": round(sum(setups) / len(setups), 2) if setups else 0.0,
+                "llm_time_percentage": (
+                    round(llm_time / task_time * 100, 1) if task_time else 0.0
+                ),
+            }
+        )
+    return rows
+
+
+def write_perf_report(
+    rows: List[Dict[str, Any]], json_path: str, csv_path: Optional[str] = None
+) -> None:
+    """Write the rows of ``build_perf_report`` as JSON and, optionally, CSV."""
+    with open(json_path, "w") as f:
+        json.dump({"tasks": rows}, f, indent=2)
+    if csv_path:
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=_PERF_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="""
@@ -93,7 +259,10 @@ def main():
         tasks are available and their categories.
 
         The results, including pass/fail status and performance metrics, are
-        aggregated and saved to 'eval-summary.json'.
+        aggregated and saved to 'eval-summary.json'. Per-task latency
+        percentiles are saved to 'eval-perf.json' and 'eval-perf.csv', and
+        every run is appended to 'eval-results.jsonl' under the current git
+        revision for regression tracking with perf_store.py.
         """,
         epilog="""
         Usage Examples:
@@ -101,13 +270,16 @@ def main():
         1. Run all evaluation tasks defined in the config file:
         python run_page_evals.py
 
-        2. Run all tasks belonging to the 'observe' category:
+        2. Run all tasks on 4 sessions at once, 3 trials each:
+        python run_page_evals.py --workers 4 --trials 3
+
+        3. Run all tasks belonging to the 'observe' category:
         python run_page_evals.py --category observe
 
-        3. Run only the 'arxiv' evaluation task:
+        4. Run only the 'arxiv' evaluation task:
         python run_page_evals.py --eval_name arxiv
 
-        4. Run a task and pass a specific configuration override from the command line
+        5. Run a task and pass a specific configuration override from the command line
         (This requires adding functionality to parse extra args, see advanced example):
         python run_page_evals.py --eval_name allrecipes --config --config '{"extract_method": "textExtract"}'
         """,
@@ -123,6 +295,26 @@ def main():
         type=str,
         help="Run all evaluations in a specific category (e.g., 'observe').",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Ignored by the sync runner, which runs tasks one at a time on one "
+        "session; use the async runner for concurrent sessions (default: 1).",
+    )
+    parser.add_argument(
+        "--trials",
+        type=int,
+        default=1,
+        help="Number of times each task is run (default: 1).",
+    )
+    parser.add_argument(
+        "--store",
+        type=str,
+        default=EvalResultStore().path,
+        help="JSONL file the runs are appended to, keyed by git revision "
+        "(compare revisions with perf_store.py).",
+    )
     args = parser.parse_args()
     try:
         with open("page_evals.config.json", "r") as f:
@@ -153,20 +345,16 @@ def main():
             return
     else:
         tasks_to_run = all_tasks
-    all_results = []
-
-    for task in tasks_to_run:
-        task_result = run_single_task(task["name"], task)
-        all_results.append(task_result)
+    all_results = run_tasks(tasks_to_run, workers=args.workers, trials=args.trials)
 
     passed_tasks = [r for r in all_results if r["result"]["_success"]]
     failed_tasks = [r for r in all_results if not r["result"]["_success"]]
 
     summary = {
         "experimentName": "page_agent_local_run",
-        "passed": [{"eval": r["task_name"]} for r in passed_tasks],
+        "passed": [{"eval": r["task_name"], "trial": r["trial"]} for r in passed_tasks],
         "failed": [
-            {"eval": r["task_name"], "error": r["result"].get("error")}
+            {"eval": r["task_name"], "trial": r["trial"], "error": r["result"].get("error")}
             for r in failed_tasks
         ],
         "summary": {
@@ -186,6 +374,18 @@ def main():
 
     _logger.info(f"📊 Evaluation summary written to {summary_path}")
 
+    perf_path = os.path.join(os.path.dirname(__file__), "eval-perf.json")
+    write_perf_report(
+        build_perf_report(all_results),
+        perf_path,
+        os.path.join(os.path.dirname(__file__), "eval-perf.csv"),
+    )
+    _logger.info(f"📊 Performance report written to {perf_path}")
+
+    revision = current_revision()
+    EvalResultStore(args.store).append(all_results, revision)
+    _logger.info(f"📊 Runs recorded in {args.store} under revision {revision}")
+
 
 if __name__ == "__main__":
     load_dotenv()
@@ -2,5 +2,6 @@
 # This file is auto-generated by scripts/generate_sync.py
 
 from .git import SyncGit
+from .status_tracker import SyncGitStatusTracker
 
-__all__ = ["SyncGit"]
+__all__ = ["SyncGit", "SyncGitStatusTracker"]
@@ -24,8 +24,11 @@ from ..._common.models.git import (
     GitInitResult,
     GitLogEntry,
     GitLogResult,
+    GitRepoSummary,
+    GitSnapshotResult,
     GitStatusResult,
 )
+from .status_tracker import SyncGitStatusTracker
 
 # Initialize logger for this module
 _logger = get_logger("git")
@@ -50,6 +53,13 @@ _DEFAULT_PULL_TIMEOUT_MS = 120000
 # Valid reset modes for parameter validation.
 _VALID_RESET_MODES = {"soft", "mixed", "hard", "merge", "keep"}
 
+# Output formats understood by _parse_git_log() and _parse_git_branches().
+_GIT_LOG_FORMAT = "%H%x01%h%x01%an%x01%ae%x01%aI%x01%s%x00"
+_GIT_BRANCH_FORMAT = "%(refname:short)\t%(HEAD)"
+
+# Printed instead of committing when a composite commit finds nothing staged.
+_NOTHING_TO_COMMIT_MARKER = "__AGENTBAY_GIT_NOTHING_TO_COMMIT__"
+
 
 class SyncGit(BaseService):
     """
@@ -76,6 +86,7 @@ class SyncGit(BaseService):
     def __init__(self, session):
         super().__init__(session)
         self._git_available = None
+        self._status_trackers: Dict[str, SyncGitStatusTracker] = {}
 
     # -------------------------------------------------------------------------
     # Private helpers
@@ -166,11 +177,7 @@ class SyncGit(BaseService):
         """
         cmd = self._build_git_command(args, repo_path)
         _logger.debug("Executing git command: %s", cmd)
-        result = self.session.command.execute_command(
-            cmd,
-            timeout_ms=timeout_ms or _DEFAULT_GIT_TIMEOUT_MS,
-            envs=_DEFAULT_GIT_ENV,
-        )
+        result = self._run_shell(cmd, timeout_ms=timeout_ms)
         if not result.success:
             _logger.debug(
                 "Git command failed: cmd=%s, exit_code=%s, stderr=%s",
@@ -182,33 +189,75 @@ class SyncGit(BaseService):
         """
         Execute a raw shell command with git environment variables.
 
+        Until git availability has been confirmed, the ``git --version`` check
+        is sent in the same round trip as the command.
+
         Args:
             cmd: The raw shell command string.
             timeout_ms: Optional timeout in milliseconds.
 
         Returns:
             The CommandResult from executing the shell command.
+
+        Raises:
+            GitNotFoundError: If git is not installed or not reachable.
         """
-        return self.session.command.execute_command(
-            cmd,
-            timeout_ms=timeout_ms or _DEFAULT_GIT_TIMEOUT_MS,
-            envs=_DEFAULT_GIT_ENV,
-        )
+        if self._git_available is True:
+            return self.session.command.execute_command(
+                cmd,
+                timeout_ms=timeout_ms or _DEFAULT_GIT_TIMEOUT_MS,
+                envs=_DEFAULT_GIT_ENV,
+            )
+        return (self._run_shell_many([cmd], timeout_ms=timeout_ms))[0]
 
-    def _ensure_git_available(self) -> None:
+    def _run_shell_many(
+        self, cmds: List[str], timeout_ms: Optional[int] = None
+    ) -> List[CommandResult]:
         """
-        Check whether git is available on the remote environment.
+        Execute several shell commands in one round trip, stopping at the first failure.
+
+        The ``git --version`` check is prepended while git availability is
+        still unknown.
 
-        The result is cached after the first successful check.
+        Args:
+            cmds: The raw shell command strings.
+            timeout_ms: Optional timeout in milliseconds for the whole batch.
+
+        Returns:
+            One CommandResult per command. Commands skipped after a failure have
+            ``exit_code`` -1.
 
         Raises:
             GitNotFoundError: If git is not installed or not reachable.
         """
-        if self._git_available is True:
-            return
+        check_git = self._git_available is not True
+        batch_cmds = [self._build_git_command(["--version"]), *cmds] if check_git else list(cmds)
+        batch = self.session.command.execute_many(
+            batch_cmds,
+            timeout_ms=timeout_ms or _DEFAULT_GIT_TIMEOUT_MS,
+            envs=_DEFAULT_GIT_ENV,
+            stop_on_error=True,
+        )
+        if len(batch.results) != len(batch_cmds):
+            failed = CommandResult(
+                request_id=batch.request_id,
+                success=False,
+                exit_code=-1,
+                error_message=batch.error_message or "Failed to execute git command",
+            )
+            return [failed for _ in cmds]
+        if check_git:
+            self._record_git_version(batch.results[0])
+            return batch.results[1:]
+        return batch.results
 
-        result = self._run_git(["--version"])
+    def _record_git_version(self, result: CommandResult) -> None:
+        """
+        Cache the outcome of a ``git --version`` check.
 
+        Raises:
+            GitNotFoundError: If the check failed.
+        """
         if not result.success:
             self._git_available = False
             _logger.warning("Git is not available on the remote environment")
@@ -222,6 +271,27 @@ class SyncGit(BaseService):
         self._git_available = True
         _logger.info("Git is available on the remote environment")
 
+    def _ensure_git_available(self) -> None:
+        """
+        Check whether git is available on the remote environment.
+
+        The result is cached after the first successful check. Git operations
+        do not need to call this first: they piggyback the check on their own
+        shell call.
+
+        Raises:
+            GitNotFoundError: If git is not installed or not reachable.
+        """
+        if self._git_available is True:
+            return
+
+        result = self.session.command.execute_command(
+            self._build_git_command(["--version"]),
+            timeout_ms=_DEFAULT_GIT_TIMEOUT_MS,
+            envs=_DEFAULT_GIT_ENV,
+        )
+        self._record_git_version(result)
+
     def _classify_error(self, operation: str, result: CommandResult) -> GitError:
         """
         Classify a failed git command result into a specific error type.
@@ -562,8 +632,6 @@ class SyncGit(BaseService):
             )
             print(result.path)
         """
-        self._ensure_git_available()
-
         _logger.info(
             "Cloning repository: url=%s, branch=%s, depth=%s, path=%s",
             url, branch, depth, path,
@@ -627,8 +695,6 @@ class SyncGit(BaseService):
             result = session.git.init("/home/user/project", initial_branch="main")
             print(result.path)
         """
-        self._ensure_git_available()
-
         args: List[str] = ["init"]
 
         if initial_branch:
@@ -677,8 +743,6 @@ class SyncGit(BaseService):
             session.git.add("/home/user/project")
             session.git.add("/home/user/project", files=["README.md"])
         """
-        self._ensure_git_available()
-
         args: List[str] = ["add"]
 
         if files and len(files) > 0:
@@ -731,8 +795,6 @@ class SyncGit(BaseService):
             result = session.git.commit("/home/user/project", "Initial commit")
             print(result.commit_hash)
         """
-        self._ensure_git_available()
-
         # -c parameters must come BEFORE the 'commit' subcommand
         args: List[str] = []
 
@@ -764,6 +826,8 @@ class SyncGit(BaseService):
         repo_path: str,
         *,
         timeout_ms: Optional[int] = None,
+        incremental: bool = False,
+        full_scan: bool = False,
     ) -> GitStatusResult:
         """
         Get the status of the working tree and staging area.
@@ -771,9 +835,18 @@ class SyncGit(BaseService):
         Returns a structured result parsed from
         ``git status --porcelain=1 -b``.
 
+        With ``incremental=True`` the repository is tracked through the
+        session's file change notifications and later calls only re-check the
+        paths that changed (see ``AsyncGitStatusTracker``). Untracked files are
+        then listed individually rather than collapsed into their directory.
+        The notifications are shared with ``file_system.watch()`` and
+        ``file_system.watch_directory()``.
+
         Args:
             repo_path: The repository path.
             timeout_ms: Timeout in milliseconds.
+            incremental: Refresh only paths reported as changed since the last call.
+            full_scan: With ``incremental``, rescan the whole repository now.
 
         Returns:
             GitStatusResult with branch info and file statuses.
@@ -787,7 +860,12 @@ class SyncGit(BaseService):
             status = session.git.status("/home/user/project")
             print(status.current_branch, status.is_clean)
         """
-        self._ensure_git_available()
+        if incremental:
+            tracker = self._status_trackers.get(repo_path)
+            if tracker is None:
+                tracker = SyncGitStatusTracker(self, repo_path)
+                self._status_trackers[repo_path] = tracker
+            return tracker.status(full_scan=full_scan, timeout_ms=timeout_ms)
 
         result = self._run_git(
             ["status", "--porcelain=1", "-b"], repo_path, timeout_ms=timeout_ms
@@ -828,10 +906,7 @@ class SyncGit(BaseService):
             for entry in log.entries:
                 print(entry.short_hash, entry.message)
         """
-        self._ensure_git_available()
-
-        fmt = "%H%x01%h%x01%an%x01%ae%x01%aI%x01%s%x00"
-        args: List[str] = ["log", f"--format={fmt}"]
+        args: List[str] = ["log", f"--format={_GIT_LOG_FORMAT}"]
 
         if max_count:
             args.extend(["--max-count", str(max_count)])
@@ -870,10 +945,8 @@ class SyncGit(BaseService):
             branches = session.git.list_branches("/home/user/project")
             print(branches.current)
         """
-        self._ensure_git_available()
-
         result = self._run_git(
-            ["branch", "--format=%(refname:short)\t%(HEAD)"],
+            ["branch", f"--format={_GIT_BRANCH_FORMAT}"],
             repo_path,
             timeout_ms=timeout_ms,
         )
@@ -913,8 +986,6 @@ class SyncGit(BaseService):
         Example:
             session.git.create_branch("/home/user/project", "feature-x")
         """
-        self._ensure_git_available()
-
         if checkout:
             args = ["checkout", "-b", branch]
         else:
@@ -948,8 +1019,6 @@ class SyncGit(BaseService):
         Example:
             session.git.checkout_branch("/home/user/project", "main")
         """
-        self._ensure_git_available()
-
         result = self._run_git(
             ["checkout", branch], repo_path, timeout_ms=timeout_ms
         )
@@ -982,8 +1051,6 @@ class SyncGit(BaseService):
         Example:
             session.git.delete_branch("/home/user/project", "old-branch")
         """
-        self._ensure_git_available()
-
         delete_flag = "-D" if force else "-d"
         result = self._run_git(
             ["branch", delete_flag, branch], repo_path, timeout_ms=timeout_ms
@@ -1027,8 +1094,6 @@ class SyncGit(BaseService):
                 "https://github.com/user/repo.git",
             )
         """
-        self._ensure_git_available()
-
         add_args: List[str] = ["remote", "add"]
         if fetch:
             add_args.append("-f")
@@ -1078,8 +1143,6 @@ class SyncGit(BaseService):
             url = session.git.remote_get("/home/user/project", "origin")
             print(url)
         """
-        self._ensure_git_available()
-
         result = self._run_git(
             ["remote", "get-url", name], repo_path, timeout_ms=timeout_ms
         )
@@ -1125,8 +1188,6 @@ class SyncGit(BaseService):
                 f"Invalid reset mode: '{mode}'. Must be one of {sorted(_VALID_RESET_MODES)}"
             )
 
-        self._ensure_git_available()
-
         args: List[str] = ["reset"]
         if mode:
             args.append(f"--{mode}")
@@ -1170,8 +1231,6 @@ class SyncGit(BaseService):
         Example:
             session.git.restore("/home/user/project", ["file.txt"])
         """
-        self._ensure_git_available()
-
         resolved_staged = staged
         resolved_worktree = worktree if worktree is not None else (not resolved_staged)
 
@@ -1213,8 +1272,6 @@ class SyncGit(BaseService):
         Example:
             session.git.pull("/home/user/project", remote="origin", branch="main")
         """
-        self._ensure_git_available()
-
         _logger.info(
             "Pulling from remote: repo=%s, remote=%s, branch=%s",
             repo_path, remote, branch,
@@ -1266,22 +1323,19 @@ class SyncGit(BaseService):
                 "/home/user/project", "Alice", "alice@example.com",
             )
         """
-        self._ensure_git_available()
-
         scope_flag = "--local" if scope == "local" else "--global"
         base_args = ["config", scope_flag]
 
-        name_result = self._run_git(
-            [*base_args, "user.name", name], repo_path, timeout_ms=timeout_ms
-        )
-        if not name_result.success:
-            raise self._classify_error("configure_user", name_result)
-
-        email_result = self._run_git(
-            [*base_args, "user.email", email], repo_path, timeout_ms=timeout_ms
+        results = self._run_shell_many(
+            [
+                self._build_git_command([*base_args, "user.name", name], repo_path),
+                self._build_git_command([*base_args, "user.email", email], repo_path),
+            ],
+            timeout_ms=timeout_ms,
         )
-        if not email_result.success:
-            raise self._classify_error("configure_user", email_result)
+        for result in results:
+            if not result.success:
+                raise self._classify_error("configure_user", result)
 
     def set_config(
         self,
@@ -1310,8 +1364,6 @@ class SyncGit(BaseService):
         Example:
             session.git.set_config("/home/user/project", "core.autocrlf", "false")
         """
-        self._ensure_git_available()
-
         scope_flag = "--local" if scope == "local" else "--global"
         args = ["config", scope_flag, key, value]
 
@@ -1348,8 +1400,6 @@ class SyncGit(BaseService):
             name = session.git.get_config("/home/user/project", "user.name")
             print(name)
         """
-        self._ensure_git_available()
-
         scope_flag = "--local" if scope == "local" else "--global"
         args = ["config", scope_flag, "--get", key]
 
@@ -1363,3 +1413,220 @@ class SyncGit(BaseService):
                 return None
             raise self._classify_error("get_config", result)
         return self._get_stdout(result).strip() or None
+
+    # -------------------------------------------------------------------------
+    # Composite operations (one round trip each)
+    # -------------------------------------------------------------------------
+
+    def _commit_all_commands(
+        self,
+        repo_path: str,
+        message: str,
+        files: Optional[List[str]],
+        author_name: Optional[str],
+        author_email: Optional[str],
+        allow_empty: bool,
+    ) -> List[str]:
+        """
+        Build the add, commit, rev-parse and status commands of a composite commit.
+
+        The commit is skipped (printing ``_NOTHING_TO_COMMIT_MARKER``) when
+        nothing is staged, unless *allow_empty* is set.
+        """
+        add_args = ["add", "--", *files] if files else ["add", "-A"]
+        commit_args: List[str] = []
+        if author_name:
+            commit_args.extend(["-c", f"user.name={author_name}"])
+        if author_email:
+            commit_args.extend(["-c", f"user.email={author_email}"])
+        commit_args.extend(["commit", "-m", message])
+        if allow_empty:
+            commit_args.append("--allow-empty")
+        commit_cmd = self._build_git_command(commit_args, repo_path)
+        if not allow_empty:
+            commit_cmd = (
+                f"if {self._build_git_command(['diff', '--cached', '--quiet'], repo_path)}; "
+                f"then echo {_NOTHING_TO_COMMIT_MARKER}; else {commit_cmd}; fi"
+            )
+        head_cmd = self._build_git_command(["rev-parse", "-q", "--verify", "HEAD"], repo_path) + " || true"
+        return [
+            self._build_git_command(add_args, repo_path),
+            commit_cmd,
+            head_cmd,
+            self._build_git_command(["status", "--porcelain=1", "-b"], repo_path),
+        ]
+
+    def _parse_commit_all_results(
+        self, repo_path: str, operation: str, results: List[CommandResult]
+    ) -> GitSnapshotResult:
+        """Raise on the first failed step, then parse the trailing commit steps."""
+        for result in results:
+            if not result.success:
+                raise self._classify_error(operation, result)
+        _, commit_result, head_result, status_result = results[-4:]
+        head = self._get_stdout(head_result).strip()
+        return GitSnapshotResult(
+            path=repo_path,
+            committed=_NOTHING_TO_COMMIT_MARKER not in self._get_stdout(commit_result),
+            commit_hash=head or None,
+            status=self._parse_git_status(self._get_stdout(status_result)),
+        )
+
+    def commit_all(
+        self,
+        repo_path: str,
+        message: str,
+        *,
+        files: Optional[List[str]] = None,
+        author_name: Optional[str] = None,
+        author_email: Optional[str] = None,
+        allow_empty: bool = False,
+        timeout_ms: Optional[int] = None,
+    ) -> GitSnapshotResult:
+        """
+        Stage changes, commit them and read back the new state in one round trip.
+
+        Equivalent to ``add()`` + ``commit()`` + ``status()``, but sent as a
+        single shell call. When nothing is staged the commit is skipped instead
+        of failing, so it is safe to call after every edit step.
+
+        Args:
+            repo_path: The repository path.
+            message: The commit message.
+            files: Specific files to add. All changes are staged when omitted.
+            author_name: Author name (temporary, not persisted).
+            author_email: Author email (temporary, not persisted).
+            allow_empty: Create a commit even when nothing is staged.
+            timeout_ms: Timeout in milliseconds for the whole operation.
+
+        Returns:
+            GitSnapshotResult with whether a commit was made, the ``HEAD`` hash
+            and the status after committing.
+
+        Raises:
+            GitNotFoundError: If git is not installed.
+            GitNotARepoError: If the path is not a git repository.
+            GitError: For other git errors.
+
+        Example:
+            result = session.git.commit_all("/home/user/project", "Edit step 3")
+            if result.committed:
+                print(result.commit_hash)
+        """
+        results = self._run_shell_many(
+            self._commit_all_commands(
+                repo_path, message, files, author_name, author_email, allow_empty
+            ),
+            timeout_ms=timeout_ms,
+        )
+        return self._parse_commit_all_results(repo_path, "commit_all", results)
+
+    def snapshot(
+        self,
+        repo_path: str,
+        message: str,
+        *,
+        initial_branch: Optional[str] = None,
+        user_name: Optional[str] = None,
+        user_email: Optional[str] = None,
+        allow_empty: bool = False,
+        timeout_ms: Optional[int] = None,
+    ) -> GitSnapshotResult:
+        """
+        Snapshot a directory into git: init, configure the user, add and commit
+        in one round trip.
+
+        ``git init`` is harmless on an existing repository, so the same call
+        works for the first and every later snapshot. The user name and email
+        are written to the repository's local config when given.
+
+        Args:
+            repo_path: Directory to snapshot. Created if it does not exist.
+            message: The commit message.
+            initial_branch: Initial branch name used when the repository is created.
+            user_name: ``user.name`` to set in the local config.
+            user_email: ``user.email`` to set in the local config.
+            allow_empty: Create a commit even when nothing changed.
+            timeout_ms: Timeout in milliseconds for the whole operation.
+
+        Returns:
+            GitSnapshotResult with whether a commit was made, the ``HEAD`` hash
+            and the status after committing.
+
+        Raises:
+            GitNotFoundError: If git is not installed.
+            GitError: For other git errors.
+
+        Example:
+            result = session.git.snapshot(
+                "/home/user/project", "Agent checkpoint",
+                user_name="Agent", user_email="agent@example.com",
+            )
+            print(result.committed, result.commit_hash)
+        """
+        init_args = ["init", "-q"]
+        if initial_branch:
+            init_args.extend(["--initial-branch", initial_branch])
+        init_args.append(repo_path)
+        cmds = [self._build_git_command(init_args)]
+        if user_name:
+            cmds.append(self._build_git_command(["config", "--local", "user.name", user_name], repo_path))
+        if user_email:
+            cmds.append(self._build_git_command(["config", "--local", "user.email", user_email], repo_path))
+        cmds.extend(
+            self._commit_all_commands(repo_path, message, None, None, None, allow_empty)
+        )
+        results = self._run_shell_many(cmds, timeout_ms=timeout_ms)
+        return self._parse_commit_all_results(repo_path, "snapshot", results)
+
+    def repo_summary(
+        self,
+        repo_path: str,
+        *,
+        max_count: int = 10,
+        timeout_ms: Optional[int] = None,
+    ) -> GitRepoSummary:
+        """
+        Get status, recent commits and branches of a repository in one round trip.
+
+        Args:
+            repo_path: The repository path.
+            max_count: Maximum number of log entries to return (default: 10).
+            timeout_ms: Timeout in milliseconds for the whole operation.
+
+        Returns:
+            GitRepoSummary combining ``status()``, ``log()`` and
+            ``list_branches()``. The log is empty for a repository without commits.
+
+        Raises:
+            GitNotFoundError: If git is not installed.
+            GitNotARepoError: If the path is not a git repository.
+            GitError: For other git errors.
+
+        Example:
+            summary = session.git.repo_summary("/home/user/project", max_count=5)
+            print(summary.branches.current, summary.status.is_clean)
+            for entry in summary.log.entries:
+                print(entry.short_hash, entry.message)
+        """
+        has_head = self._build_git_command(["rev-parse", "-q", "--verify", "HEAD"], repo_path)
+        log_cmd = self._build_git_command(
+            ["log", f"--format={_GIT_LOG_FORMAT}", "--max-count", str(max_count)], repo_path
+        )
+        results = self._run_shell_many(
+            [
+                self._build_git_command(["status", "--porcelain=1", "-b"], repo_path),
+                f"if {has_head} >/dev/null; then {log_cmd}; fi",
+                self._build_git_command(["branch", f"--format={_GIT_BRANCH_FORMAT}"], repo_path),
+            ],
+            timeout_ms=timeout_ms,
+        )
+        for result in results:
+            if not result.success:
+                raise self._classify_error("repo_summary", result)
+        status_result, log_result, branch_result = results
+        return GitRepoSummary(
+            status=self._parse_git_status(self._get_stdout(status_result)),
+            log=self._parse_git_log(self._get_stdout(log_result)),
+            branches=self._parse_git_branches(self._get_stdout(branch_result)),
+        )
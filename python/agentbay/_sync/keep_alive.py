@@ -0,0 +1,248 @@
+# DO NOT EDIT THIS FILE MANUALLY.
+# This file is auto-generated by scripts/generate_sync.py
+
+import heapq
+import random
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .._common.logger import get_logger
+from ._internal.rate_limit import run_bounded
+
+if TYPE_CHECKING:
+    from .session import Session
+
+_logger = get_logger("keep_alive")
+
+# Idle timeout assumed for sessions created without idle_release_timeout.
+_DEFAULT_IDLE_TIMEOUT_S = 300
+
+# Longest the run() loop sleeps, so newly registered sessions and stop() are
+# noticed promptly.
+_MAX_SLEEP_S = 1.0
+
+# Fragments of RefreshSessionIdleTime errors meaning the session is gone.
+_GONE_MARKERS = ("notfound", "not found", "not exist", "expired", "released", "finish")
+
+
+class _Registration:
+    def __init__(self, session: "Session", idle_timeout: float):
+        self.session = session
+        self.idle_timeout = idle_timeout
+        self.last_success = time.monotonic()
+        self.failures = 0
+        self.generation = 0
+
+
+class KeepAliveScheduler:
+    """
+    Client-level scheduler that keeps registered sessions from idling out.
+
+    Sessions sit in one min-heap ordered by their next refresh time, so the
+    cost per tick does not depend on how many sessions are registered. Each
+    session is refreshed with ``keep_alive()`` after ``refresh_ratio`` of its
+    idle timeout, minus a random share of up to ``jitter_ratio`` so that
+    sessions registered together do not refresh together. Due refreshes run at
+    most ``concurrency`` at a time. Failed refreshes are retried sooner; a
+    session is unregistered when the backend reports it gone or when its idle
+    deadline passes without a successful refresh. Deleting a session through
+    the SDK unregisters it as well.
+
+    Available as ``agent_bay.keep_alive_scheduler``. Drive it with
+    ``scheduler.run()`` in a background task (or, in the sync SDK, from a
+    background thread) and end it with ``stop()``.
+
+    Example:
+        scheduler = agent_bay.keep_alive_scheduler
+        runner = threading.Thread(target=scheduler.run, daemon=True)
+        runner.start()
+        session = (agent_bay.create(params)).session
+        scheduler.register(session)
+        ...
+        scheduler.stop()
+        runner.join()
+    """
+
+    def __init__(
+        self,
+        refresh_ratio: float = 0.5,
+        jitter_ratio: float = 0.2,
+        concurrency: int = 16,
+        default_idle_timeout: float = _DEFAULT_IDLE_TIMEOUT_S,
+        on_unregister: Optional[Callable[["Session", str], None]] = None,
+    ):
+        """
+        Args:
+            refresh_ratio: Fraction of the idle timeout after which a session is
+                refreshed (0 < ratio < 1).
+            jitter_ratio: Largest fraction of the refresh period taken off at
+                random to spread refreshes out.
+            concurrency: Maximum number of keep_alive() calls in flight.
+            default_idle_timeout: Idle timeout in seconds for sessions that do
+                not carry ``idle_release_timeout``.
+            on_unregister: Called with ``(session, reason)`` when the scheduler
+                drops a session on its own.
+        """
+        if not 0 < refresh_ratio < 1:
+            raise ValueError("refresh_ratio must be between 0 and 1")
+        if not 0 <= jitter_ratio < 1:
+            raise ValueError("jitter_ratio must be in [0, 1)")
+        self.refresh_ratio = refresh_ratio
+        self.jitter_ratio = jitter_ratio
+        self.concurrency = concurrency
+        self.default_idle_timeout = default_idle_timeout
+        self.on_unregister = on_unregister
+        self.refreshed = 0
+        self.failed = 0
+        self._registrations: Dict[str, _Registration] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        # register() may be called from any thread while run() is active.
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+
+    def __len__(self) -> int:
+        return len(self._registrations)
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._registrations
+
+    def _period(self, registration: _Registration) -> float:
+        return registration.idle_timeout * self.refresh_ratio
+
+    def _schedule(self, session_id: str, registration: _Registration, delay: float) -> None:
+        """Push the next refresh of a registration; the caller holds the lock."""
+        self._seq += 1
+        # Superseded heap items are skipped lazily by comparing this stamp.
+        registration.generation = self._seq
+        heapq.heappush(self._heap, (time.monotonic() + delay, self._seq, session_id))
+
+    def register(self, session: "Session", idle_timeout: Optional[float] = None) -> None:
+        """
+        Keep a session alive until it is unregistered, deleted or expires.
+
+        Args:
+            session: The session to refresh.
+            idle_timeout: Idle timeout of the session in seconds. Defaults to the
+                session's ``idle_release_timeout``, then ``default_idle_timeout``.
+        """
+        timeout = idle_timeout or getattr(session, "idle_release_timeout", None) or self.default_idle_timeout
+        registration = _Registration(session, float(timeout))
+        period = self._period(registration)
+        with self._lock:
+            self._registrations[session.session_id] = registration
+            self._schedule(
+                session.session_id,
+                registration,
+                period * (1 - self.jitter_ratio * random.random()),
+            )
+
+    def unregister(self, session_id: str) -> bool:
+        """
+        Stop refreshing a session.
+
+        Returns:
+            bool: True if the session was registered.
+        """
+        with self._lock:
+            return self._registrations.pop(session_id, None) is not None
+
+    def next_due_in(self) -> Optional[float]:
+        """Seconds until the next refresh is due, or None when nothing is registered."""
+        with self._lock:
+            while self._heap:
+                due, generation, session_id = self._heap[0]
+                registration = self._registrations.get(session_id)
+                if registration is not None and registration.generation == generation:
+                    return max(0.0, due - time.monotonic())
+                heapq.heappop(self._heap)
+        return None
+
+    def _pop_due(self) -> List[str]:
+        now = time.monotonic()
+        due_ids: List[str] = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, generation, session_id = heapq.heappop(self._heap)
+                registration = self._registrations.get(session_id)
+                if registration is not None and registration.generation == generation:
+                    due_ids.append(session_id)
+        return due_ids
+
+    def _drop(self, session_id: str, registration: _Registration, reason: str) -> None:
+        with self._lock:
+            if self._registrations.get(session_id) is not registration:
+                return
+            del self._registrations[session_id]
+        _logger.info(f"Keep-alive stopped for session {session_id}: {reason}")
+        if self.on_unregister is not None:
+            try:
+                self.on_unregister(registration.session, reason)
+            except Exception as e:
+                _logger.error(f"Error in keep-alive on_unregister callback: {e}")
+
+    def _refresh(self, session_id: str) -> None:
+        registration = self._registrations.get(session_id)
+        if registration is None:
+            return
+        try:
+            result = registration.session.keep_alive()
+            success, error = result.success, result.error_message or ""
+        except Exception as e:
+            success, error = False, str(e)
+        if success:
+            self.refreshed += 1
+            registration.last_success = time.monotonic()
+            registration.failures = 0
+            period = self._period(registration)
+            with self._lock:
+                if self._registrations.get(session_id) is registration:
+                    self._schedule(
+                        session_id, registration, period * (1 - self.jitter_ratio * random.random())
+                    )
+            return
+
+        self.failed += 1
+        registration.failures += 1
+        if any(marker in error.lower() for marker in _GONE_MARKERS):
+            self._drop(session_id, registration, error)
+            return
+        remaining = registration.last_success + registration.idle_timeout - time.monotonic()
+        if remaining <= 0:
+            self._drop(session_id, registration, f"idle deadline passed: {error}")
+            return
+        # Retry with backoff, but leave room for a few more attempts before the deadline.
+        retry_in = min(2 ** registration.failures, remaining / 3)
+        _logger.warning(
+            f"Keep-alive failed for session {session_id} (retry in {retry_in:.1f}s): {error}"
+        )
+        with self._lock:
+            if self._registrations.get(session_id) is registration:
+                self._schedule(session_id, registration, retry_in)
+
+    def run_pending(self) -> int:
+        """
+        Refresh every session whose refresh is due.
+
+        Returns:
+            int: Number of sessions refreshed or retried in this pass.
+        """
+        due_ids = self._pop_due()
+        if due_ids:
+            run_bounded(due_ids, self._refresh, self.concurrency)
+        return len(due_ids)
+
+    def run(self) -> None:
+        """Refresh sessions as they come due until stop() is called."""
+        stop_event = self._stop_event
+        stop_event.clear()
+        while not stop_event.is_set():
+            self.run_pending()
+            next_due = self.next_due_in()
+            interval = _MAX_SLEEP_S if next_due is None else min(next_due, _MAX_SLEEP_S)
+            stop_event.wait(timeout=interval)
+
+    def stop(self) -> None:
+        """Make run() return after the current pass."""
+        self._stop_event.set()
@@ -4,11 +4,16 @@
 import json
 import random
 import time
+from urllib.parse import urlparse
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import httpx
 
 from .._common.exceptions import SessionError
+from .._common.circuit_breaker import circuit_breaker_of, endpoint_key, session_key
+from .._common.enums import SessionStatus
+from .._common.instrumentation import KIND_TOOL, instrumentation_of
+from .._common.tool_list_cache import tool_list_cache_of
 from .._common.logger import (
     _log_api_call,
     _log_api_response_with_details,
@@ -32,6 +37,14 @@ from .._common.models import (
     extract_request_id,
 )
 from .._common.models.mcp_tool import McpTool
+from .._common.retry import (
+    HEDGED_TOOLS,
+    call_with_retry,
+    clamp_timeout,
+    is_idempotent,
+    is_overload,
+    retry_policy_of,
+)
 from ..api.models import (
     CallMcpToolRequest,
     DeleteSessionAsyncRequest,
@@ -54,6 +67,15 @@ from .command import Command
 from .computer import Computer
 from .context_manager import ContextManager
 from .filesystem import FileSystem
+from ._internal.rate_limit import (
+    LINK_URL_ACTION,
+    OUTCOME_FAILED,
+    OUTCOME_OK,
+    OUTCOME_OVERLOADED,
+    request_limiter_of,
+)
+from ._internal.single_flight import SingleFlight, coalesced, read_cache_ttls_of
+from .keep_alive import KeepAliveScheduler
 from .mobile import Mobile
 from .oss import Oss
 
@@ -138,12 +160,23 @@ class Session:
         # Shared HTTP client for LinkUrl calls (lazy initialized)
         self._link_http_client: Optional[httpx.Client] = None
 
+        # TTL cache for CDP/ADB/GetLink URLs of this session
+        from ._internal.link_cache import LinkCache
+
+        self._link_cache = LinkCache()
+
+        # Shares identical concurrent reads; also holds the client's opt-in read cache
+        self._single_flight = SingleFlight(read_cache_ttls_of(agent_bay))
+
         # Recording functionality
         self.enableBrowserReplay = (
             # Whether browser recording is enabled for this session (None = server default)
             None
         )
 
+        # Idle release timeout requested at creation (None = server default)
+        self.idle_release_timeout: Optional[int] = None
+
         # MCP tool list returned by backend for this session
         self.mcpTools: list[McpTool] = []
 
@@ -179,6 +212,29 @@ class Session:
         if client is not None:
             client.close()
 
+    def invalidate_link_cache(self, kind: Optional[str] = None) -> None:
+        """
+        Drop cached access links of this session.
+
+        Call this when connecting with a cached link fails (for example a Playwright
+        `connect_over_cdp` or `adb connect` error) so the next lookup fetches a new one.
+
+        Args:
+            kind (Optional[str]): "cdp", "adb" or "link" to drop one kind only.
+                Drops all cached links when None.
+        """
+        self._link_cache.invalidate(kind)
+
+    def invalidate_read_cache(self, action: Optional[str] = None) -> None:
+        """
+        Drop results kept by the client's `read_cache_ttls`.
+
+        Args:
+            action (Optional[str]): e.g. "get_installed_apps" to drop one kind of
+                result only. Drops everything when None.
+        """
+        self._single_flight.invalidate(action)
+
     def _get_ws_client(self):
         """
         Internal: get or create a session-scoped WS client.
@@ -193,7 +249,11 @@ class Session:
         if self._ws_client is None:
             from ._internal.ws_client import WsClient
 
-            self._ws_client = WsClient(ws_url=self.ws_url, ws_token=self.token)
+            self._ws_client = WsClient(
+                ws_url=self.ws_url,
+                ws_token=self.token,
+                instrumentation=instrumentation_of(self.agent_bay),
+            )
         return self._ws_client
 
     @property
@@ -291,6 +351,7 @@ class Session:
         )
         return self._get_link_url()
 
+    @coalesced("get_status")
     def get_status(self) -> "SessionStatusResult":
         """
         Get basic session status synchronously.
@@ -604,6 +665,10 @@ class Session:
                 key_fields={"session_id": self.session_id},
             )
 
+            scheduler = getattr(self.agent_bay, "keep_alive_scheduler", None)
+            if isinstance(scheduler, KeepAliveScheduler):
+                scheduler.unregister(self.session_id)
+
             # Return success result with request ID
             return DeleteResult(request_id=request_id, success=True)
 
@@ -770,6 +835,7 @@ class Session:
                 f"Failed to get labels for session {self.session_id}: {e}"
             )
 
+    @coalesced("info")
     def info(self) -> OperationResult:
         """
         Get detailed information about this session synchronously.
@@ -869,10 +935,44 @@ class Session:
         protocol_type: Optional[str] = None,
         port: Optional[int] = None,
         options: Optional[str] = None,
+        force_refresh: bool = False,
     ) -> OperationResult:
         """
         Synchronously get a link associated with the current session.
+
+        Links are cached per (protocol_type, port, options) until they expire.
+
+        Args:
+            protocol_type (Optional[str]): Protocol of the link, e.g. "https" or "adb".
+            port (Optional[int]): Port to expose.
+            options (Optional[str]): Extra options as a JSON string.
+            force_refresh (bool): Bypass the link cache and fetch a new link.
         """
+        if force_refresh:
+            self._link_cache.invalidate_key(("link", protocol_type, port, options))
+
+        fetched: Dict[str, Any] = {}
+
+        def _fetch():
+            result = self._get_link_uncached(protocol_type, port, options)
+            fetched["result"] = result
+            return (result.data, result.request_id)
+
+        entry = self._link_cache.get_or_fetch(
+            ("link", protocol_type, port, options), _fetch
+        )
+        if "result" in fetched:
+            return fetched["result"]
+        if entry is None:
+            raise SessionError("Failed to get link: empty URL in response")
+        return OperationResult(request_id=entry.request_id, success=True, data=entry.url)
+
+    def _get_link_uncached(
+        self,
+        protocol_type: Optional[str] = None,
+        port: Optional[int] = None,
+        options: Optional[str] = None,
+    ) -> OperationResult:
         try:
             # Log API call with parameters
             _log_api_call(
@@ -943,9 +1043,19 @@ class Session:
                 f"❌ Failed to get link for session {self.session_id}: {e}")
             raise SessionError(f"Failed to get link: {e}")
 
-    def list_mcp_tools(self, image_id: Optional[str] = None):
+    @coalesced("list_mcp_tools")
+    def list_mcp_tools(
+        self, image_id: Optional[str] = None, force_refresh: bool = False
+    ):
         """
         List MCP tools available for this session synchronously.
+
+        Tool lists are cached per image by the client (see `tool_list_cache_ttl`).
+
+        Args:
+            image_id (Optional[str]): Image to list tools of. Defaults to the
+                session's image.
+            force_refresh (bool): Bypass the tool list cache and call ListMcpTools.
         """
         from .._common.models.response import McpToolsResult
         from .._common.models.mcp_tool import McpTool
@@ -954,6 +1064,12 @@ class Session:
         if image_id is None:
             image_id = getattr(self, "image_id", "") or "linux_latest"
 
+        tool_list_cache = tool_list_cache_of(self.agent_bay)
+        if tool_list_cache is not None and not force_refresh:
+            cached = tool_list_cache.lookup(image_id)
+            if cached is not None:
+                return McpToolsResult(request_id=cached[1], tools=cached[0])
+
         request = ListMcpToolsRequest(
             authorization=f"Bearer {self._get_api_key()}", image_id=image_id
         )
@@ -993,6 +1109,8 @@ class Session:
             key_fields={"image_id": image_id, "tools_count": len(tools)},
         )
 
+        if tool_list_cache is not None:
+            tool_list_cache.put(image_id, tools, request_id)
         return McpToolsResult(request_id=request_id, tools=tools)
 
     def _get_mcp_server_for_tool(self, tool_name: str) -> Optional[str]:
@@ -1021,7 +1139,14 @@ class Session:
     ):
         """
         Call an MCP tool directly synchronously.
+
+        Raises:
+            CircuitOpenError: If the session's circuit breaker is open, i.e. recent
+                calls to this session kept failing or timing out.
         """
+        self._check_session_circuit()
+        instrumentation = instrumentation_of(self.agent_bay)
+        call = None
         try:
             # Normalize press_keys arguments for better case compatibility
             if tool_name == "press_keys" and "keys" in args:
@@ -1041,21 +1166,37 @@ class Session:
             # LinkUrl route requires explicit server name. If it's not available,
             # fall back to API-based call to let backend resolve the server.
             if self._get_link_url() and self._get_token() and server_name:
-                return self._call_mcp_tool_link_url(
+                call = instrumentation.start(
+                    KIND_TOOL, tool_name, "LinkUrl", self.session_id, len(args_json)
+                )
+                result = self._call_mcp_tool_link_url(
                     tool_name=tool_name,
                     args=args,
                     server_name=server_name,
                 )
-
-            return self._call_mcp_tool_api(
-                tool_name,
-                args_json,
-                read_timeout,
-                connect_timeout,
-                auto_gen_session,
-                server_name=server_name,
-            )
+            else:
+                call = instrumentation.start(
+                    KIND_TOOL, tool_name, "API", self.session_id, len(args_json)
+                )
+                result = self._call_mcp_tool_api(
+                    tool_name,
+                    args_json,
+                    read_timeout,
+                    connect_timeout,
+                    auto_gen_session,
+                    server_name=server_name,
+                )
+            if call is not None:
+                response_bytes = len(result.data) if isinstance(result.data, str) else 0
+                if result.success:
+                    instrumentation.end(call, result.request_id, response_bytes)
+                else:
+                    instrumentation.fail(
+                        call, result.error_message, result.request_id, response_bytes
+                    )
+            return result
         except Exception as e:
+            instrumentation.fail(call, e)
             _logger.error(f"❌ Failed to call MCP tool {tool_name}: {e}")
             return McpToolResult(
                 request_id="",
@@ -1064,6 +1205,85 @@ class Session:
                 error_message=f"Failed to call MCP tool: {e}",
             )
 
+    def _check_session_circuit(self) -> None:
+        """
+        Reject the call while this session's circuit is open. Once it is due for
+        a probe, the caller checks the session with get_status before going on.
+        """
+        breaker = circuit_breaker_of(self.agent_bay, session_key(self.session_id))
+        if breaker is None or not breaker.before_call():
+            return
+        status = self.get_status()
+        if status.success and status.status == SessionStatus.RUNNING.value:
+            breaker.record_success()
+            return
+        breaker.record_failure()
+        raise breaker.open_error()
+
+    def _record_session_outcome(
+        self,
+        status_code: Optional[int] = None,
+        code: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        breaker = circuit_breaker_of(self.agent_bay, session_key(self.session_id))
+        if breaker is None:
+            return
+        if "InvalidMcpSession.NotFound" in str(code or getattr(error, "code", "")):
+            # The session is gone for good, however fast the backend says so.
+            breaker.record_failure()
+        else:
+            breaker.record_outcome(status_code, code, error)
+
+    def _post_link_url(
+        self, url: str, payload: Dict[str, Any], token: str
+    ) -> httpx.Response:
+        """
+        POST one LinkUrl tool call through the client's request limiter and the
+        circuit breakers of the session and the LinkUrl host.
+        """
+        host_breaker = circuit_breaker_of(
+            self.agent_bay, endpoint_key(urlparse(url).netloc)
+        )
+        if host_breaker is not None:
+            host_breaker.before_call()
+        kwargs: Dict[str, Any] = {}
+        timeout_s = clamp_timeout(None)
+        if timeout_s is not None:
+            kwargs["timeout"] = timeout_s
+        client = self._get_link_http_client()
+        limiter = request_limiter_of(self.agent_bay)
+        started = limiter.acquire(LINK_URL_ACTION) if limiter is not None else None
+        outcome = OUTCOME_FAILED
+        try:
+            resp = client.post(
+                url,
+                json=payload,
+                headers={
+                    "Content-Type": "application/json",
+                    "X-Access-Token": token,
+                },
+                **kwargs,
+            )
+            if is_overload(resp.status_code):
+                outcome = OUTCOME_OVERLOADED
+            elif 200 <= resp.status_code < 300:
+                outcome = OUTCOME_OK
+        except Exception as e:
+            if isinstance(e, httpx.TimeoutException):
+                outcome = OUTCOME_OVERLOADED
+            if host_breaker is not None:
+                host_breaker.record_outcome(error=e)
+            self._record_session_outcome(error=e)
+            raise
+        finally:
+            if started is not None:
+                limiter.release(LINK_URL_ACTION, started, outcome)
+        if host_breaker is not None:
+            host_breaker.record_outcome(resp.status_code)
+        self._record_session_outcome(resp.status_code)
+        return resp
+
     def _call_mcp_tool_link_url(
         self,
         tool_name: str,
@@ -1095,16 +1315,18 @@ class Session:
             "token": token,
         }
 
+        policy = retry_policy_of(self.agent_bay)
         try:
-            client = self._get_link_http_client()
-            resp = client.post(
-                url,
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Access-Token": token,
-                },
-            )
+            if policy.max_attempts > 1 and is_idempotent("CallMcpTool", tool_name):
+                resp = call_with_retry(
+                    lambda: self._post_link_url(url, payload, token),
+                    policy,
+                    name=tool_name,
+                    retry_on_result=lambda r: is_overload(r.status_code),
+                    hedge=tool_name in HEDGED_TOOLS,
+                )
+            else:
+                resp = self._post_link_url(url, payload, token)
 
             if resp.status_code < 200 or resp.status_code >= 300:
                 _log_api_response_with_details(
@@ -1327,9 +1549,13 @@ class Session:
         try:
             # Try async method first, fall back to sync wrapped in asyncio.to_thread
             client = self._get_client()
-            response = client.call_mcp_tool(
-                request, read_timeout=read_timeout, connect_timeout=connect_timeout
-            )
+            try:
+                response = client.call_mcp_tool(
+                    request, read_timeout=read_timeout, connect_timeout=connect_timeout
+                )
+            except Exception as e:
+                self._record_session_outcome(error=e)
+                raise
 
             # Extract request ID
             request_id = extract_request_id(response)
@@ -1352,6 +1578,7 @@ class Session:
                     data="",
                     error_message="Invalid response body",
                 )
+            self._record_session_outcome(body.get("HttpStatusCode"), body.get("Code"))
 
             # Parse the Data field
             data_str = body.get("Data", "")
@@ -0,0 +1,359 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from alibabacloud_tea_openapi import utils_models as open_api_util_models
+from darabonba.runtime import RuntimeOptions
+
+from .._async._internal.rate_limit import OUTCOME_FAILED, OUTCOME_OK, OUTCOME_OVERLOADED
+from .._common.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    endpoint_key,
+)
+from .._common.instrumentation import KIND_API, Instrumentation, RequestCall
+from .._common.retry import (
+    NO_RETRY,
+    RetryPolicy,
+    call_with_retry,
+    call_with_retry_async,
+    clamp_timeout,
+    is_idempotent,
+    is_overload,
+)
+from .client import Client
+
+
+def _payload_size(payload: Optional[Dict[str, Any]]) -> int:
+    """Approximate encoded size of a form/query map without encoding it."""
+    if not payload:
+        return 0
+    return sum(len(str(key)) + len(str(value)) + 2 for key, value in payload.items())
+
+
+def _response_outcome(response: Any) -> str:
+    if not isinstance(response, dict):
+        return OUTCOME_OK
+    body = response.get("body")
+    status_code = response.get("statusCode")
+    if isinstance(body, dict) and body.get("Success") is False:
+        if is_overload(body.get("HttpStatusCode") or status_code, body.get("Code")):
+            return OUTCOME_OVERLOADED
+        return OUTCOME_FAILED
+    return OUTCOME_OVERLOADED if is_overload(status_code) else OUTCOME_OK
+
+
+def _record_response(breaker: CircuitBreaker, response: Any) -> None:
+    if not isinstance(response, dict):
+        breaker.record_success()
+        return
+    body = response.get("body")
+    status_code = response.get("statusCode")
+    if isinstance(body, dict) and body.get("Success") is False:
+        breaker.record_outcome(
+            body.get("HttpStatusCode") or status_code, body.get("Code")
+        )
+        return
+    breaker.record_outcome(status_code)
+
+
+def _overloaded(response: Any) -> bool:
+    return _response_outcome(response) == OUTCOME_OVERLOADED
+
+
+def _error_outcome(error: BaseException) -> str:
+    status_code = getattr(error, "status_code", None) or getattr(
+        error, "statusCode", None
+    )
+    if is_overload(status_code, getattr(error, "code", None)):
+        return OUTCOME_OVERLOADED
+    return OUTCOME_FAILED
+
+
+class InstrumentedClient(Client):
+    """
+    OpenAPI client that reports every action to an ``Instrumentation``,
+    passes it through the owning client's ``RequestLimiter`` and endpoint
+    circuit breaker, and retries idempotent actions under its ``RetryPolicy``.
+
+    The generated ``*_with_options`` methods reach the network either through
+    ``call_api`` (which dispatches to ``do_request``) or by calling
+    ``do_rpcrequest`` directly, so wrapping those two transports (and their
+    async variants) covers every action exactly once.
+    """
+
+    def __init__(
+        self,
+        config: open_api_util_models.Config,
+        instrumentation: Instrumentation,
+        limiter: Any = None,
+        retry_policy: RetryPolicy = NO_RETRY,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+    ):
+        """
+        Args:
+            config: OpenAPI client configuration.
+            instrumentation: Receives start/end/error events of every action.
+            limiter: ``RequestLimiter`` of the owning client, or None. The sync
+                client passes the sync limiter and only uses the sync transports;
+                the async client does the same with the async ones.
+            retry_policy: Retries of idempotent actions (see ``is_idempotent``).
+            circuit_breakers: Registry holding the breaker of this client's
+                endpoint, or None to never fail fast.
+        """
+        super().__init__(config)
+        self.instrumentation = instrumentation
+        self.limiter = limiter
+        self.retry_policy = retry_policy
+        self.circuit_breakers = circuit_breakers
+        self._breaker_key = endpoint_key(config.endpoint or "")
+
+    def _breaker(self) -> Optional[CircuitBreaker]:
+        registry = self.circuit_breakers
+        if registry is None or not registry.policy.enabled:
+            return None
+        return registry.get(self._breaker_key)
+
+    def _start(
+        self,
+        action: str,
+        request: open_api_util_models.OpenApiRequest,
+    ) -> Optional[RequestCall]:
+        if not self.instrumentation.enabled:
+            return None
+        body = request.body if isinstance(request.body, dict) else None
+        query = request.query if isinstance(request.query, dict) else None
+        session_id = (
+            (body or {}).get("SessionId") or (query or {}).get("SessionId") or ""
+        )
+        return self.instrumentation.start(
+            KIND_API,
+            action,
+            session_id=str(session_id),
+            request_bytes=_payload_size(body) + _payload_size(query),
+        )
+
+    def _finish(self, call: RequestCall, response: Any) -> None:
+        body = response.get("body") if isinstance(response, dict) else None
+        headers = response.get("headers") if isinstance(response, dict) else None
+        status_code = response.get("statusCode") if isinstance(response, dict) else None
+        request_id = ""
+        if isinstance(body, dict):
+            request_id = body.get("RequestId") or body.get("requestId") or ""
+        response_bytes = 0
+        if isinstance(headers, dict):
+            try:
+                response_bytes = int(headers.get("content-length") or 0)
+            except (TypeError, ValueError):
+                response_bytes = 0
+        if isinstance(body, dict) and body.get("Success") is False:
+            self.instrumentation.fail(
+                call,
+                f"{body.get('Code', '')}: {body.get('Message', '')}".strip(": "),
+                request_id=request_id,
+                response_bytes=response_bytes,
+                status_code=status_code,
+            )
+            return
+        self.instrumentation.end(
+            call,
+            request_id=request_id,
+            response_bytes=response_bytes,
+            status_code=status_code,
+        )
+
+    def _traced(
+        self,
+        action: str,
+        request: open_api_util_models.OpenApiRequest,
+        send: Callable[[], dict],
+    ) -> dict:
+        breaker = self._breaker()
+        if breaker is not None:
+            breaker.before_call()
+        started = self.limiter.acquire(action) if self.limiter is not None else None
+        call = self._start(action, request)
+        outcome = OUTCOME_FAILED
+        try:
+            response = send()
+            outcome = _response_outcome(response)
+        except Exception as e:
+            outcome = _error_outcome(e)
+            self.instrumentation.fail(call, e)
+            if breaker is not None:
+                breaker.record_outcome(error=e)
+            raise
+        finally:
+            if started is not None:
+                self.limiter.release(action, started, outcome)
+        if breaker is not None:
+            _record_response(breaker, response)
+        if call is not None:
+            self._finish(call, response)
+        return response
+
+    async def _traced_async(
+        self,
+        action: str,
+        request: open_api_util_models.OpenApiRequest,
+        send: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        breaker = self._breaker()
+        if breaker is not None:
+            breaker.before_call()
+        started = (
+            await self.limiter.acquire(action) if self.limiter is not None else None
+        )
+        call = self._start(action, request)
+        outcome = OUTCOME_FAILED
+        try:
+            response = await send()
+            outcome = _response_outcome(response)
+        except Exception as e:
+            outcome = _error_outcome(e)
+            self.instrumentation.fail(call, e)
+            if breaker is not None:
+                breaker.record_outcome(error=e)
+            raise
+        finally:
+            if started is not None:
+                await self.limiter.release(action, started, outcome)
+        if breaker is not None:
+            _record_response(breaker, response)
+        if call is not None:
+            self._finish(call, response)
+        return response
+
+    def _retryable(
+        self, action: str, request: open_api_util_models.OpenApiRequest
+    ) -> bool:
+        if self.retry_policy.max_attempts <= 1:
+            return False
+        tool = request.body.get("Name") if isinstance(request.body, dict) else None
+        return is_idempotent(action, tool)
+
+    def _apply_deadline(self, runtime: RuntimeOptions) -> None:
+        """Clamp the attempt's timeouts to the caller's deadline, if any."""
+        read_timeout = runtime.read_timeout or self._read_timeout
+        timeout_s = clamp_timeout(read_timeout / 1000 if read_timeout else None)
+        if timeout_s is not None:
+            runtime.read_timeout = max(1, int(timeout_s * 1000))
+            connect_timeout = runtime.connect_timeout or self._connect_timeout
+            if not connect_timeout or connect_timeout > runtime.read_timeout:
+                runtime.connect_timeout = runtime.read_timeout
+
+    def _send(
+        self,
+        action: str,
+        request: open_api_util_models.OpenApiRequest,
+        runtime: RuntimeOptions,
+        send: Callable[[], dict],
+    ) -> dict:
+        def _attempt() -> dict:
+            self._apply_deadline(runtime)
+            return self._traced(action, request, send)
+
+        if not self._retryable(action, request):
+            return _attempt()
+        return call_with_retry(
+            _attempt, self.retry_policy, name=action, retry_on_result=_overloaded
+        )
+
+    async def _send_async(
+        self,
+        action: str,
+        request: open_api_util_models.OpenApiRequest,
+        runtime: RuntimeOptions,
+        send: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        async def _attempt() -> dict:
+            self._apply_deadline(runtime)
+            return await self._traced_async(action, request, send)
+
+        if not self._retryable(action, request):
+            return await _attempt()
+        return await call_with_retry_async(
+            _attempt, self.retry_policy, name=action, retry_on_result=_overloaded
+        )
+
+    def do_request(
+        self,
+        params: open_api_util_models.Params,
+        request: open_api_util_models.OpenApiRequest,
+        runtime: RuntimeOptions,
+    ) -> dict:
+        return self._send(
+            params.action,
+            request,
+            runtime,
+            lambda: super(InstrumentedClient, self).do_request(
+                params, request, runtime
+            ),
+        )
+
+    async def do_request_async(
+        self,
+        params: open_api_util_models.Params,
+        request: open_api_util_models.OpenApiRequest,
+        runtime: RuntimeOptions,
+    ) -> dict:
+        return await self._send_async(
+            params.action,
+            request,
+            runtime,
+            lambda: super(InstrumentedClient, self).do_request_async(
+                params, request, runtime
+            ),
+        )
+
+    def do_rpcrequest(
+        self,
+        action: str,
+        version: str,
+        protocol: str,
+        method: str,
+        auth_type: str,
+        body_type: str,
+        request: open_api_util_models.OpenApiRequest,
+        runtime: RuntimeOptions,
+    ) -> dict:
+        return self._send(
+            action,
+            request,
+            runtime,
+            lambda: super(InstrumentedClient, self).do_rpcrequest(
+                action,
+                version,
+                protocol,
+                method,
+                auth_type,
+                body_type,
+                request,
+                runtime,
+            ),
+        )
+
+    async def do_rpcrequest_async(
+        self,
+        action: str,
+        version: str,
+        protocol: str,
+        method: str,
+        auth_type: str,
+        body_type: str,
+        request: open_api_util_models.OpenApiRequest,
+        runtime: RuntimeOptions,
+    ) -> dict:
+        return await self._send_async(
+            action,
+            request,
+            runtime,
+            lambda: super(InstrumentedClient, self).do_rpcrequest_async(
+                action,
+                version,
+                protocol,
+                method,
+                auth_type,
+                body_type,
+                request,
+                runtime,
+            ),
+        )
@@ -0,0 +1,7 @@
+"""
+Test utilities for exercising the SDK without the live service.
+"""
+
+from .mock_backend import DEFAULT_TOOL_SERVER, Fault, MockAgentBayServer, MockSession
+
+__all__ = ["DEFAULT_TOOL_SERVER", "Fault", "MockAgentBayServer", "MockSession"]
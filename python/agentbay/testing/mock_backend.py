@@ -0,0 +1,748 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from .._common.config import Config
+from .._common.logger import get_logger
+
+_logger = get_logger("mock_backend")
+
+# Server name reported for the built-in tools in ToolList / ListMcpTools.
+DEFAULT_TOOL_SERVER = "mock_mcp_server"
+
+ToolHandler = Callable[["MockSession", Dict[str, Any]], Any]
+WsHandler = Callable[["MockSession", Dict[str, Any]], Iterable[Dict[str, Any]]]
+
+
+@dataclass
+class Fault:
+    """
+    Latency, error and payload injection for one action, tool or WS target.
+
+    Attributes:
+        latency: Seconds to wait before answering, or a ``(low, high)`` range
+            to draw from uniformly.
+        error_rate: Probability in [0, 1] that a call fails.
+        error_code: Code returned for injected failures.
+        http_status: HTTP status of injected OpenAPI failures. With 200 the
+            failure is reported in the body (``Success: false``) instead.
+        payload_bytes: Pad successful tool results to at least this many bytes.
+    """
+
+    latency: Union[float, Tuple[float, float]] = 0.0
+    error_rate: float = 0.0
+    error_code: str = "ServiceUnavailable"
+    http_status: int = 503
+    payload_bytes: int = 0
+
+
+@dataclass
+class MockSession:
+    """State the mock backend keeps for one session."""
+
+    session_id: str
+    image_id: str = ""
+    token: str = ""
+    status: str = "RUNNING"
+    labels: Dict[str, str] = field(default_factory=dict)
+    created_at: float = field(default_factory=time.time)
+    last_refresh: float = field(default_factory=time.time)
+    files: Dict[str, str] = field(default_factory=dict)
+    context_tasks: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class _InjectedError(Exception):
+    def __init__(self, fault: Fault, name: str):
+        super().__init__(f"Injected failure for {name}")
+        self.fault = fault
+
+
+class MockAgentBayServer:
+    """
+    In-process stand-in for the AgentBay backend.
+
+    Serves the OpenAPI actions used by ``agentbay.api.client`` over plain HTTP,
+    the LinkUrl ``/callTool`` endpoint and the WS protocol spoken by
+    ``WsClient``, all from an asyncio loop on a background thread, so it can
+    back both the async and the sync SDK. Sessions, labels, contexts and a
+    small in-memory file system are kept in process; tools are plain Python
+    callables. Per-action, per-tool and per-WS-target faults inject latency,
+    errors and payload padding, drawn from a seeded RNG so runs repeat.
+
+    Example:
+        with MockAgentBayServer(seed=1) as server:
+            server.set_fault("shell", latency=(0.01, 0.05), error_rate=0.02)
+            agent_bay = AsyncAgentBay(api_key="test", cfg=server.config())
+            session = (await agent_bay.create()).session
+            await session.command.execute_command("echo hi")
+            print(server.calls)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        *,
+        seed: Optional[int] = None,
+        link_url: bool = True,
+        ws: bool = True,
+        tool_list: bool = True,
+    ):
+        """
+        Args:
+            host: Interface to listen on. Ports are picked by the OS.
+            seed: Seed for latency and error draws.
+            link_url: Return LinkUrl/Token from CreateMcpSession so tool calls
+                take the direct ``/callTool`` route.
+            ws: Return a WsUrl from CreateMcpSession and serve WS connections.
+            tool_list: Return ToolList from CreateMcpSession and GetSession.
+                Without it the SDK only learns tool servers from ListMcpTools.
+        """
+        self.host = host
+        self.link_url_enabled = link_url
+        self.ws_enabled = ws
+        self.tool_list_enabled = tool_list
+        self.sessions: Dict[str, MockSession] = {}
+        self.contexts: Dict[str, Dict[str, Any]] = {}
+        self.calls: Dict[str, int] = {}
+        self._rng = random.Random(seed)
+        self._faults: Dict[str, Fault] = {}
+        self._tools: Dict[str, Tuple[str, ToolHandler]] = {}
+        self._ws_handlers: Dict[str, WsHandler] = {}
+        self._ws_connections: Dict[str, Set[Any]] = {}
+        self._http_writers: Set[asyncio.StreamWriter] = set()
+        self._counter = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._http_server: Optional[asyncio.AbstractServer] = None
+        self._ws_server: Any = None
+        self.http_port = 0
+        self.ws_port = 0
+        self._register_builtin_tools()
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> "MockAgentBayServer":
+        """Start serving on a background thread. Returns self."""
+        if self._thread is not None:
+            return self
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        self._thread = threading.Thread(
+            target=loop.run_forever, name="agentbay-mock-backend", daemon=True
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start_servers(), loop).result()
+        _logger.info(f"Mock AgentBay backend listening on {self.endpoint}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and join the background thread."""
+        loop, thread = self._loop, self._thread
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._stop_servers(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self) -> "MockAgentBayServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    @property
+    def endpoint(self) -> str:
+        """Plain-HTTP OpenAPI endpoint, e.g. ``http://127.0.0.1:50123``."""
+        return f"http://{self.host}:{self.http_port}"
+
+    def config(self, timeout_ms: int = 60000) -> Config:
+        """A client ``Config`` pointing at this server."""
+        return Config(endpoint=self.endpoint, timeout_ms=timeout_ms, region_id="")
+
+    async def _start_servers(self) -> None:
+        self._http_server = await asyncio.start_server(self._handle_http, self.host, 0)
+        self.http_port = self._http_server.sockets[0].getsockname()[1]
+        if self.ws_enabled:
+            from websockets.asyncio.server import serve
+
+            self._ws_server = await serve(
+                self._handle_ws, self.host, 0, process_request=self._check_ws_request
+            )
+            self.ws_port = next(iter(self._ws_server.sockets)).getsockname()[1]
+
+    async def _stop_servers(self) -> None:
+        if self._ws_server is not None:
+            self._ws_server.close()
+            await self._ws_server.wait_closed()
+            self._ws_server = None
+        if self._http_server is not None:
+            self._http_server.close()
+            # Idle keep-alive connections would otherwise hold wait_closed().
+            for writer in list(self._http_writers):
+                writer.close()
+            await self._http_server.wait_closed()
+            self._http_server = None
+
+    # -------------------------------------------------------------------------
+    # Configuration
+    # -------------------------------------------------------------------------
+
+    def set_fault(self, name: str = "*", fault: Optional[Fault] = None, **kwargs: Any) -> Fault:
+        """
+        Inject latency, errors or payload padding.
+
+        Args:
+            name: An OpenAPI action (``CreateMcpSession``), a tool name
+                (``shell``), ``CallMcpTool(LinkUrl)`` for HTTP-level failures of
+                the LinkUrl route, ``ws:<target>`` for WS calls, or ``*`` for
+                every call without a more specific fault.
+            fault: The fault to install; built from ``kwargs`` when omitted.
+            **kwargs: ``Fault`` fields.
+
+        Returns:
+            Fault: The installed fault.
+        """
+        fault = fault or Fault(**kwargs)
+        self._faults[name] = fault
+        return fault
+
+    def clear_faults(self) -> None:
+        """Remove every injected fault."""
+        self._faults.clear()
+
+    def register_tool(self, name: str, handler: ToolHandler, server: str = DEFAULT_TOOL_SERVER) -> None:
+        """
+        Serve an MCP tool.
+
+        ``handler(session, args)`` returns the tool's text result (a dict or
+        list is JSON-encoded). Raising an exception reports ``isError``.
+        """
+        self._tools[name] = (server, handler)
+
+    def register_ws_handler(self, target: str, handler: WsHandler) -> None:
+        """
+        Answer WS calls to ``target``.
+
+        ``handler(session, data)`` returns the messages to send back. Messages
+        without a ``phase`` are sent as ``event``; the last one is sent as
+        ``end`` unless it names a phase itself. Unknown targets get a bare
+        ``end``.
+        """
+        self._ws_handlers[target] = handler
+
+    def push(self, session_id: str, target: str, data: Dict[str, Any]) -> None:
+        """Send an unsolicited WS message from ``target`` to a session's clients."""
+        if self._loop is None:
+            raise RuntimeError("Server is not running")
+        message = {
+            "invocationId": self._next_id("push"),
+            "source": target,
+            "target": "SDK",
+            "data": data,
+        }
+        asyncio.run_coroutine_threadsafe(self._broadcast(session_id, message), self._loop).result()
+
+    # -------------------------------------------------------------------------
+    # Shared helpers
+    # -------------------------------------------------------------------------
+
+    def _next_id(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}-{self._counter:06d}"
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def _fault_for(self, *names: str) -> Optional[Fault]:
+        for name in names + ("*",):
+            if name in self._faults:
+                return self._faults[name]
+        return None
+
+    async def _apply_fault(self, fault: Optional[Fault], name: str) -> None:
+        if fault is None:
+            return
+        latency = fault.latency
+        if isinstance(latency, tuple):
+            latency = self._rng.uniform(*latency)
+        if latency > 0:
+            await asyncio.sleep(latency)
+        if fault.error_rate and self._rng.random() < fault.error_rate:
+            raise _InjectedError(fault, name)
+
+    @staticmethod
+    def _pad(text: str, fault: Optional[Fault]) -> str:
+        if fault is not None and fault.payload_bytes > len(text):
+            # Trailing whitespace keeps JSON results parseable.
+            text += " " * (fault.payload_bytes - len(text))
+        return text
+
+    def _tool_list(self) -> List[Dict[str, str]]:
+        return [{"name": name, "server": server} for name, (server, _) in sorted(self._tools.items())]
+
+    async def _run_tool(self, session: MockSession, name: str, args: Dict[str, Any]) -> Tuple[bool, str]:
+        """Run a tool for either route. Returns ``(is_error, text)``."""
+        self._count(name)
+        fault = self._fault_for(name)
+        try:
+            await self._apply_fault(fault, name)
+        except _InjectedError as e:
+            return True, f"[{e.fault.error_code}] {e}"
+        entry = self._tools.get(name)
+        if entry is None:
+            return True, f"Tool not found: {name}"
+        try:
+            result = entry[1](session, args)
+            if asyncio.iscoroutine(result):
+                result = await result
+        except Exception as e:
+            return True, str(e)
+        text = result if isinstance(result, str) else json.dumps(result, ensure_ascii=False)
+        return False, self._pad(text, fault)
+
+    # -------------------------------------------------------------------------
+    # HTTP transport
+    # -------------------------------------------------------------------------
+
+    async def _handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._http_writers.add(writer)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length") or 0))
+                status, payload = await self._dispatch_http(method, target, headers, body)
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                        "Content-Type: application/json;charset=utf-8\r\n"
+                        f"Content-Length: {len(data)}\r\n\r\n"
+                    ).encode("latin-1")
+                    + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            self._http_writers.discard(writer)
+            writer.close()
+
+    async def _dispatch_http(
+        self, method: str, target: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Any]:
+        url = urlsplit(target)
+        parts = [p for p in url.path.split("/") if p]
+        if len(parts) == 3 and parts[0] == "link" and parts[2] == "callTool":
+            return await self._handle_link_call(parts[1], headers, body)
+        query = dict(parse_qsl(url.query))
+        action = query.get("Action") or headers.get("x-acs-action", "")
+        if method != "POST" or not action:
+            return 404, {"Code": "NotFound", "Message": f"{method} {url.path}"}
+        # RPC actions put some parameters (e.g. GetSessionDetail's SessionId) in
+        # the query string and the rest in the form body.
+        params = {**query, **dict(parse_qsl(body.decode("utf-8"), keep_blank_values=True))}
+        return await self._handle_action(action, params)
+
+    # -------------------------------------------------------------------------
+    # OpenAPI actions
+    # -------------------------------------------------------------------------
+
+    async def _handle_action(self, action: str, params: Dict[str, str]) -> Tuple[int, Any]:
+        self._count(action)
+        request_id = self._next_id("req")
+        handler = getattr(self, f"_action_{action}", None)
+        if action == "CallMcpTool":
+            # Tool faults (and the "*" default) are applied by the tool call
+            # itself, so both routes report them the same way.
+            fault = self._faults.get(action)
+        else:
+            fault = self._fault_for(action)
+        try:
+            await self._apply_fault(fault, action)
+        except _InjectedError as e:
+            error = {
+                "RequestId": request_id,
+                "Success": False,
+                "Code": e.fault.error_code,
+                "Message": str(e),
+                "HttpStatusCode": e.fault.http_status,
+            }
+            return (e.fault.http_status if e.fault.http_status >= 400 else 200), error
+        if handler is None:
+            return 400, {"RequestId": request_id, "Code": "InvalidAction.NotFound", "Message": action}
+        try:
+            data = handler(params)
+            if asyncio.iscoroutine(data):
+                data = await data
+        except _NotFound as e:
+            return 200, {
+                "RequestId": request_id,
+                "Success": False,
+                "Code": e.code,
+                "Message": str(e),
+                "HttpStatusCode": 400,
+            }
+        body = {"RequestId": request_id, "Success": True, "Code": "ok", "HttpStatusCode": 200}
+        if isinstance(data, tuple):
+            data, extra = data
+            body.update(extra)
+        if data is not None:
+            body["Data"] = data
+        return 200, body
+
+    def _session(self, params: Dict[str, str]) -> MockSession:
+        session = self.sessions.get(params.get("SessionId", ""))
+        if session is None:
+            raise _NotFound("InvalidMcpSession.NotFound", f"Session {params.get('SessionId')} not found")
+        return session
+
+    def _session_data(self, session: MockSession) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "SessionId": session.session_id,
+            "Success": True,
+            "ResourceId": f"res-{session.session_id}",
+            "AppInstanceId": f"ai-{session.session_id}",
+            "ResourceUrl": f"{self.endpoint}/resource/{session.session_id}",
+            "Status": session.status,
+        }
+        if self.tool_list_enabled:
+            data["ToolList"] = json.dumps(self._tool_list())
+        if self.link_url_enabled or self.ws_enabled:
+            data["Token"] = session.token
+        if self.link_url_enabled:
+            data["LinkUrl"] = f"{self.endpoint}/link/{session.session_id}"
+        if self.ws_enabled:
+            data["WsUrl"] = f"ws://{self.host}:{self.ws_port}/ws/{session.session_id}"
+        return data
+
+    def _action_CreateMcpSession(self, params: Dict[str, str]) -> Dict[str, Any]:
+        session_id = self._next_id("session")
+        session = MockSession(
+            session_id=session_id,
+            image_id=params.get("ImageId", ""),
+            token=f"token-{session_id}",
+            labels=json.loads(params.get("Labels") or "{}"),
+        )
+        # Context persistence arrives flattened as PersistenceDataList.N.Field.
+        index = 1
+        while f"PersistenceDataList.{index}.ContextId" in params:
+            self._record_context_task(
+                session,
+                params[f"PersistenceDataList.{index}.ContextId"],
+                params.get(f"PersistenceDataList.{index}.Path", ""),
+                "download",
+            )
+            index += 1
+        self.sessions[session_id] = session
+        return self._session_data(session)
+
+    def _release(self, params: Dict[str, str]) -> None:
+        session = self._session(params)
+        session.status = "FINISH"
+        del self.sessions[session.session_id]
+        for connection in self._ws_connections.pop(session.session_id, set()):
+            asyncio.ensure_future(connection.close())
+
+    def _action_ReleaseMcpSession(self, params: Dict[str, str]) -> None:
+        self._release(params)
+
+    def _action_DeleteSessionAsync(self, params: Dict[str, str]) -> None:
+        self._release(params)
+
+    def _action_GetSession(self, params: Dict[str, str]) -> Dict[str, Any]:
+        return self._session_data(self._session(params))
+
+    def _action_GetSessionDetail(self, params: Dict[str, str]) -> Dict[str, Any]:
+        session = self._session(params)
+        return {"SessionId": session.session_id, "Status": session.status}
+
+    def _action_ListSession(self, params: Dict[str, str]):
+        wanted = json.loads(params.get("Labels") or "{}")
+        matches = [
+            s for s in self.sessions.values()
+            if all(s.labels.get(k) == v for k, v in wanted.items())
+        ]
+        start = int(params.get("NextToken") or 0)
+        limit = int(params.get("MaxResults") or 10)
+        page = matches[start:start + limit]
+        next_token = str(start + limit) if start + limit < len(matches) else ""
+        data = [{"SessionId": s.session_id, "SessionStatus": s.status} for s in page]
+        return data, {"NextToken": next_token, "MaxResults": limit, "TotalCount": len(matches)}
+
+    def _action_RefreshSessionIdleTime(self, params: Dict[str, str]) -> None:
+        self._session(params).last_refresh = time.time()
+
+    def _action_PauseSessionAsync(self, params: Dict[str, str]) -> None:
+        self._session(params).status = "PAUSED"
+
+    def _action_ResumeSessionAsync(self, params: Dict[str, str]) -> None:
+        self._session(params).status = "RUNNING"
+
+    def _action_GetLabel(self, params: Dict[str, str]) -> Dict[str, Any]:
+        return {"Labels": json.dumps(self._session(params).labels)}
+
+    def _action_SetLabel(self, params: Dict[str, str]) -> None:
+        self._session(params).labels = json.loads(params.get("Labels") or "{}")
+
+    def _action_GetLink(self, params: Dict[str, str]) -> Dict[str, Any]:
+        session = self._session(params)
+        return {"Url": f"{self.endpoint}/resource/{session.session_id}/{params.get('Port', '')}"}
+
+    def _action_ListMcpTools(self, params: Dict[str, str]) -> str:
+        return json.dumps(
+            [dict(tool, description="", inputSchema={}) for tool in self._tool_list()]
+        )
+
+    async def _action_CallMcpTool(self, params: Dict[str, str]) -> Dict[str, Any]:
+        session = self._session(params)
+        is_error, text = await self._run_tool(
+            session, params.get("Name", ""), json.loads(params.get("Args") or "{}")
+        )
+        return {"content": [{"type": "text", "text": text}], "isError": is_error}
+
+    # Contexts
+
+    def _context(self, params: Dict[str, str]) -> Dict[str, Any]:
+        context_id = params.get("ContextId", "")
+        if context_id in self.contexts:
+            return self.contexts[context_id]
+        name = params.get("Name", "")
+        for context in self.contexts.values():
+            if name and context["Name"] == name:
+                return context
+        raise _NotFound("InvalidContext.NotFound", f"Context {context_id or name} not found")
+
+    def _action_GetContext(self, params: Dict[str, str]) -> Dict[str, Any]:
+        try:
+            return self._context(params)
+        except _NotFound:
+            if params.get("AllowCreate", "").lower() != "true":
+                raise
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        context = {
+            "Id": self._next_id("context"),
+            "Name": params.get("Name", ""),
+            "State": "available",
+            "CreateTime": now,
+            "LastUsedTime": now,
+            "OsType": "linux",
+        }
+        self.contexts[context["Id"]] = context
+        return context
+
+    def _action_ListContexts(self, params: Dict[str, str]):
+        contexts = list(self.contexts.values())
+        start = int(params.get("NextToken") or 0)
+        limit = int(params.get("MaxResults") or 10)
+        next_token = str(start + limit) if start + limit < len(contexts) else ""
+        return contexts[start:start + limit], {
+            "NextToken": next_token,
+            "MaxResults": limit,
+            "TotalCount": len(contexts),
+        }
+
+    def _action_ModifyContext(self, params: Dict[str, str]) -> None:
+        self._context({"ContextId": params.get("Id", "")})["Name"] = params.get("Name", "")
+
+    def _action_DeleteContext(self, params: Dict[str, str]) -> None:
+        del self.contexts[self._context({"ContextId": params.get("Id", "")})["Id"]]
+
+    def _action_ClearContext(self, params: Dict[str, str]) -> None:
+        self._context({"ContextId": params.get("Id", "")})
+
+    def _record_context_task(self, session: MockSession, context_id: str, path: str, task_type: str) -> None:
+        now = int(time.time())
+        session.context_tasks.append(
+            {
+                "contextId": context_id,
+                "path": path,
+                "status": "Success",
+                "taskType": task_type,
+                "startTime": now,
+                "finishTime": now,
+                "errorMessage": "",
+            }
+        )
+
+    def _action_SyncContext(self, params: Dict[str, str]) -> None:
+        session = self._session(params)
+        self._record_context_task(
+            session, params.get("ContextId", ""), params.get("Path", ""), params.get("Mode") or "upload"
+        )
+
+    def _action_GetContextInfo(self, params: Dict[str, str]) -> Dict[str, Any]:
+        session = self._session(params)
+        tasks = [
+            t for t in session.context_tasks
+            if (not params.get("ContextId") or t["contextId"] == params["ContextId"])
+            and (not params.get("Path") or t["path"] == params["Path"])
+            and (not params.get("TaskType") or t["taskType"] == params["TaskType"])
+        ]
+        return {"ContextStatus": json.dumps([{"type": "data", "data": json.dumps(tasks)}])}
+
+    # -------------------------------------------------------------------------
+    # LinkUrl
+    # -------------------------------------------------------------------------
+
+    async def _handle_link_call(self, session_id: str, headers: Dict[str, str], body: bytes) -> Tuple[int, Any]:
+        self._count("CallMcpTool(LinkUrl)")
+        session = self.sessions.get(session_id)
+        if session is None or headers.get("x-access-token") != session.token:
+            return 401, {"code": "Unauthorized", "message": "invalid session or token"}
+        try:
+            # Route-level faults (HTTP errors, slow links); tool faults apply below.
+            await self._apply_fault(self._faults.get("CallMcpTool(LinkUrl)"), "CallMcpTool(LinkUrl)")
+        except _InjectedError as e:
+            return e.fault.http_status, {"code": e.fault.error_code, "message": str(e)}
+        payload = json.loads(body or b"{}")
+        is_error, text = await self._run_tool(session, payload.get("tool", ""), payload.get("args") or {})
+        return 200, {
+            "code": "ok",
+            "requestId": payload.get("requestId", ""),
+            "data": {"result": {"content": [{"type": "text", "text": text}], "isError": is_error}},
+        }
+
+    # -------------------------------------------------------------------------
+    # WS
+    # -------------------------------------------------------------------------
+
+    def _check_ws_request(self, connection: Any, request: Any) -> Any:
+        session = self.sessions.get(request.path.rstrip("/").rsplit("/", 1)[-1])
+        if session is None or request.headers.get("X-Access-Token") != session.token:
+            return connection.respond(HTTPStatus.UNAUTHORIZED, "invalid session or token\n")
+        return None
+
+    async def _handle_ws(self, connection: Any) -> None:
+        session_id = connection.request.path.rstrip("/").rsplit("/", 1)[-1]
+        connections = self._ws_connections.setdefault(session_id, set())
+        connections.add(connection)
+        tasks: Set[asyncio.Task] = set()
+        try:
+            async for raw in connection:
+                message = json.loads(raw)
+                task = asyncio.ensure_future(self._answer_ws(connection, session_id, message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except Exception:
+            pass
+        finally:
+            connections.discard(connection)
+
+    async def _answer_ws(self, connection: Any, session_id: str, message: Dict[str, Any]) -> None:
+        target = message.get("target", "")
+        invocation_id = message.get("invocationId", "")
+        self._count(f"ws:{target}")
+
+        def _frame(data: Dict[str, Any]) -> str:
+            return json.dumps(
+                {"invocationId": invocation_id, "source": target, "target": "SDK", "data": data},
+                ensure_ascii=False,
+            )
+
+        session = self.sessions.get(session_id)
+        try:
+            await self._apply_fault(self._fault_for(f"ws:{target}"), target)
+            handler = self._ws_handlers.get(target)
+            replies = list(handler(session, message.get("data") or {})) if handler and session else []
+        except Exception as e:
+            await connection.send(_frame({"phase": "error", "error": str(e)}))
+            return
+        if not replies or "phase" in replies[-1]:
+            replies.append({"phase": "end"})
+        for index, reply in enumerate(replies):
+            default_phase = "end" if index == len(replies) - 1 else "event"
+            await connection.send(_frame(dict({"phase": default_phase}, **reply)))
+
+    async def _broadcast(self, session_id: str, message: Dict[str, Any]) -> None:
+        raw = json.dumps(message, ensure_ascii=False)
+        for connection in list(self._ws_connections.get(session_id, ())):
+            await connection.send(raw)
+
+    # -------------------------------------------------------------------------
+    # Built-in tools
+    # -------------------------------------------------------------------------
+
+    def _register_builtin_tools(self) -> None:
+        self.register_tool("shell", _tool_shell)
+        self.register_tool("read_file", _tool_read_file)
+        self.register_tool("write_file", _tool_write_file)
+        self.register_tool("get_file_info", _tool_get_file_info)
+        self.register_tool("get_metrics", self._tool_get_metrics)
+
+    def _tool_get_metrics(self, session: MockSession, args: Dict[str, Any]) -> Dict[str, Any]:
+        mem_total = 8 * 1024 ** 3
+        return {
+            "cpu_count": 4,
+            "cpu_used_pct": round(self._rng.uniform(0, 100), 2),
+            "mem_total": mem_total,
+            "mem_used": int(mem_total * self._rng.uniform(0.1, 0.9)),
+            "disk_total": 100 * 1024 ** 3,
+            "disk_used": 10 * 1024 ** 3,
+            "rx_rate_kbyte_per_s": round(self._rng.uniform(0, 1000), 2),
+            "tx_rate_kbyte_per_s": round(self._rng.uniform(0, 1000), 2),
+            "rx_used_kbyte": 0.0,
+            "tx_used_kbyte": 0.0,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+
+
+class _NotFound(Exception):
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+def _tool_shell(session: MockSession, args: Dict[str, Any]) -> Dict[str, Any]:
+    command = str(args.get("command", ""))
+    stdout = command[5:] + "\n" if command.startswith("echo ") else ""
+    return {"stdout": stdout, "stderr": "", "exit_code": 0, "traceId": ""}
+
+
+def _tool_read_file(session: MockSession, args: Dict[str, Any]) -> str:
+    path = args.get("path", "")
+    if path not in session.files:
+        raise FileNotFoundError(f"No such file: {path}")
+    content = session.files[path]
+    offset = int(args.get("offset") or 0)
+    length = int(args.get("length") or 0)
+    return content[offset:offset + length] if length > 0 else content[offset:]
+
+
+def _tool_write_file(session: MockSession, args: Dict[str, Any]) -> str:
+    path = args.get("path", "")
+    content = str(args.get("content", ""))
+    if args.get("mode") == "append":
+        content = session.files.get(path, "") + content
+    session.files[path] = content
+    return "True"
+
+
+def _tool_get_file_info(session: MockSession, args: Dict[str, Any]) -> str:
+    path = args.get("path", "")
+    if path not in session.files:
+        raise FileNotFoundError(f"No such file: {path}")
+    name = path.rsplit("/", 1)[-1]
+    return f"name: {name}\nsize: {len(session.files[path].encode('utf-8'))}\nisDirectory: false"
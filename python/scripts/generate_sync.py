@@ -153,11 +153,162 @@ def _apply_custom_replacements(content: str, file_path: str) -> str:
         "                    try:\n                        asyncio.wait_for(stop_event.wait(), timeout=interval)\n                    except asyncio.TimeoutError:\n                        pass",
         "                    stop_event.wait(timeout=interval)"
     )
+    # Same block at any indentation (e.g. the FileWatch iterator in _internal/file_watch.py)
+    content = re.sub(
+        r"(?m)^([ \t]*)try:\n[ \t]*(?:await )?asyncio\.wait_for\(stop_event\.wait\(\), timeout=interval\)\n"
+        r"[ \t]*except asyncio\.TimeoutError:\n[ \t]*pass$",
+        r"\1stop_event.wait(timeout=interval)",
+        content,
+    )
     # Also handle the case where it's just the call without try-except
     content = content.replace(
         "asyncio.wait_for(stop_event.wait(), timeout=interval)",
         "stop_event.wait(timeout=interval)"
     )
+    # Docstring examples that drive a scheduler in a background task: the sync
+    # SDK drives it from a thread instead.
+    content = re.sub(
+        r"(?m)^([ \t]*)(\w+) = asyncio\.create_task\((\w+)\.run\(\)\)$",
+        r"\1\2 = threading.Thread(target=\3.run, daemon=True)\n\1\2.start()",
+        content,
+    )
+    content = re.sub(r"(?m)^([ \t]*)(?:await )?runner$", r"\1runner.join()", content)
+    # run_in_contexts(): the generic gather rewrite would run the cells one after
+    # another, so the sync SDK runs each context's cell in its own thread.
+    gathered_cells = (
+        "        tasks = [self.get_context(name).run(jobs[name], timeout_s=timeout_s) for name in names]\n"
+        "        results = [task for task in tasks]\n"
+    )
+    if gathered_cells in content:
+        content = content.replace(
+            gathered_cells,
+            "        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(names))) as executor:\n"
+            "            futures = [\n"
+            "                executor.submit(\n"
+            "                    contextvars.copy_context().run,\n"
+            "                    self.get_context(name).run,\n"
+            "                    jobs[name],\n"
+            "                    timeout_s=timeout_s,\n"
+            "                )\n"
+            "                for name in names\n"
+            "            ]\n"
+            "            results = [future.result() for future in futures]\n",
+        )
+        content = re.sub(
+            r"(?m)^import json$",
+            "import concurrent.futures\nimport contextvars\nimport json",
+            content,
+            count=1,
+        )
+    # context.walk(): keep up to `concurrency` pages in flight on a thread pool
+    # instead of asyncio tasks, yielding each page as it arrives.
+    if file_path.endswith("context.py") and "asyncio.ensure_future(\n" in content:
+        content = content.replace(
+            "        running: Dict[Any, Any] = {}\n        try:\n",
+            "        running: Dict[Any, Any] = {}\n"
+            "        executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)\n"
+            "        try:\n",
+        )
+        content = content.replace(
+            "                    request = asyncio.ensure_future(\n"
+            "                        self._list_files_page(context_id, job[0], job[1], page_size)\n"
+            "                    )\n",
+            "                    request = executor.submit(\n"
+            "                        contextvars.copy_context().run,\n"
+            "                        self._list_files_page,\n"
+            "                        context_id,\n"
+            "                        job[0],\n"
+            "                        job[1],\n"
+            "                        page_size,\n"
+            "                    )\n",
+        )
+        content = content.replace(
+            "asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)",
+            "concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)",
+        )
+        content = content.replace(
+            "            # The caller stopped early or a page failed: drop the requests still running.\n"
+            "            for request in running:\n"
+            "                request.cancel()\n",
+            "            # The caller stopped early or a page failed: drop the requests not started yet.\n"
+            "            executor.shutdown(wait=False, cancel_futures=True)\n",
+        )
+        content = re.sub(
+            r"(?m)^import json$",
+            "import concurrent.futures\nimport contextvars\nimport json",
+            content,
+            count=1,
+        )
+    # watch_directory(): the sync monitoring thread calls the watch directly, so
+    # the event-loop bridge of the async SDK is dropped.
+    if file_path.endswith("filesystem.py") and "def _call(result_or_coro" in content:
+        content = content.replace(
+            "        The feed is driven on the event loop that called ``watch_directory()``;\n"
+            "        wait on ``ready_event`` and join the thread without blocking that loop,\n"
+            "        e.g. with ``asyncio.to_thread``.\n",
+            "",
+        )
+        content = re.sub(
+            r"(?ms)^        try:\n            loop = asyncio\.get_running_loop\(\)\n.*?(?=^        def _run_monitor\(\):)",
+            "\n",
+            content,
+        )
+        content = re.sub(r"_call\((watch\.\w+\([^()]*\))(?:, timeout=\d+)?\)", r"\1", content)
+        content = content.replace("                for evl in own_loops:\n                    evl.close()\n", "")
+        content = content.replace("from typing import Any, Callable,", "from typing import Callable,")
+    # Docstring examples iterate and enter sync objects with plain for/with.
+    content = re.sub(r"(?m)^([ \t]*)async (for|with) ", r"\1\2 ", content)
+    # The sync eval runner's first worker drains the whole job queue, so
+    # --workers has no effect there; say so instead of promising concurrency.
+    if "run_page_evals" in file_path:
+        content = content.replace(
+            "Run every task config ``trials`` times on up to ``workers`` sessions at once.\n"
+            "\n"
+            "    Each worker initializes one ``PageAgent`` (one browser session) the first\n"
+            "    time it picks up a task, and reuses it for every task it runs after that,\n"
+            "    giving each task its own browser context. Trials are interleaved, so\n"
+            "    repeats of a task land on different sessions.\n",
+            "Run every task config ``trials`` times, one at a time on one session.\n"
+            "\n"
+            "    One ``PageAgent`` (one browser session) is initialized for the first task\n"
+            "    and reused for every task after that, giving each task its own browser\n"
+            "    context. ``workers`` is accepted for parity with the async runner and\n"
+            "    ignored.\n",
+        )
+        content = content.replace(
+            'help="Number of browser sessions running tasks concurrently (default: 1).",',
+            'help="Ignored by the sync runner, which runs tasks one at a time on one "\n'
+            '        "session; use the async runner for concurrent sessions (default: 1).",',
+        )
+    # The limiter's loop-aware waiter is a plain threading.Event in the sync SDK.
+    if file_path.endswith(os.path.join("_internal", "rate_limit.py")):
+        content = re.sub(r"(?ms)^class _Waiter:\n.*?\n\n\n", "", content)
+        content = content.replace("_Waiter()", "threading.Event()")
+        # run_bounded(): the generic gather rewrite would run the workers one after
+        # another, so the sync SDK runs the items on a thread pool instead.
+        content = content.replace(
+            "    pending = deque(items)\n\n"
+            "    def _worker():\n"
+            "        while pending:\n"
+            "            item = pending.popleft()\n"
+            "            fn(item)\n\n"
+            "    tasks = [_worker() for _ in range(min(max(1, limit), len(pending)))]\n"
+            "    [task for task in tasks]\n",
+            "    pending = list(items)\n"
+            "    if not pending:\n"
+            "        return\n"
+            "    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max(1, limit), len(pending))) as executor:\n"
+            "        futures = [executor.submit(contextvars.copy_context().run, fn, item) for item in pending]\n"
+            "        for future in futures:\n"
+            "            future.result()\n",
+        )
+        content = content.replace("    Await fn(item) for every", "    Call fn(item) for every")
+        content = content.replace(
+            "import threading\nimport time\nfrom collections import deque\n",
+            "import concurrent.futures\nimport contextvars\nimport threading\nimport time\n",
+        )
+    # unasync does not rename classes inside docstrings.
+    content = re.sub(r"= AsyncMetricsSampler\(", "= MetricsSampler(", content)
     # Ensure context start_clear alias is not renamed to clear_async (avoids recursion)
     content = re.sub(
         r"def clear_async\(self, context_id: str\) -> ClearContextResult:\n(\s+\"\"\"\n\s+Deprecated alias for `clear_async`.\n)",
@@ -223,6 +374,8 @@ def generate_sync():
         # Class Renames
         "AsyncAgentBay": "AgentBay",
         "AsyncSession": "Session",
+        "AsyncKeepAliveScheduler": "KeepAliveScheduler",
+        "AsyncMetricsSampler": "MetricsSampler",
         "AsyncBrowser": "Browser",
         "AsyncCommand": "Command",
         "AsyncCode": "Code",
@@ -245,6 +398,7 @@ def generate_sync():
         "init_browser_async": "init_browser",
         "initialize_async": "initialize",
         "call_mcp_tool_async": "call_mcp_tool",
+        "call_with_retry_async": "call_with_retry",
         "call_mcp_tool_with_options_async": "call_mcp_tool_with_options",
         "release_mcp_session_async": "release_mcp_session",
         "create_mcp_session_async": "create_mcp_session",
@@ -432,6 +586,14 @@ def generate_sync():
                         content = content.replace("asyncio.sleep", "time.sleep")
                         # Replace asyncio.Lock() with threading.Lock() for sync code
                         content = content.replace("asyncio.Lock()", "threading.Lock()")
+                        # Replace asyncio.Event() with threading.Event() (wake-ups set from the WS thread)
+                        if os.path.join("", "eval", "") not in path:
+                            content = content.replace("asyncio.Event()", "threading.Event()")
+                        # Replace asyncio.Queue() with queue.Queue() so stream handles fed from the
+                        # WS loop thread can be consumed by blocking sync iterators.
+                        # Eval helpers run their own event loop and keep asyncio queues.
+                        if os.path.join("", "eval", "") not in path:
+                            content = content.replace("asyncio.Queue()", "queue.Queue()")
                         # Replace asyncio.gather(*tasks) with a list comprehension to keep the expression valid
                         content = content.replace("asyncio.gather(*tasks)", "[task for task in tasks]")
                         # Also handle asyncio.gather with return_exceptions parameter
@@ -533,6 +695,11 @@ def generate_sync():
                                 insert_pos = last_import_match.end()
                                 content = content[:insert_pos] + 'import threading\n' + content[insert_pos:]
 
+                    # Add queue import if queue.Queue() is used
+                    # (placed next to `import asyncio`, which is dropped later if it became unused)
+                    if 'queue.Queue()' in content and not re.search(r"^import queue$", content, flags=re.MULTILINE):
+                        content = re.sub(r"^import asyncio$", "import asyncio\nimport queue", content, count=1, flags=re.MULTILINE)
+
                     # Add time import if time.sleep or time.time is used
                     if ('time.sleep' in content or 'time.time' in content) and 'import time' not in content:
                         content = "import time\n" + content
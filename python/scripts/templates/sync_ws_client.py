@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import threading
 from concurrent.futures import Future
 from typing import Any, Callable, Optional
 
 from ..._common.exceptions import AgentBayError
+from ..._common.instrumentation import Instrumentation
 from ..._async._internal.ws_client import (
     WsClient as _AsyncWsClient,
     WsConnectionState,
@@ -17,6 +19,123 @@ OnEvent = Callable[[str, dict[str, Any]], None]
 OnEnd = Callable[[str, dict[str, Any]], None]
 OnError = Callable[[str, Exception], None]
 
+# Loop threads shared by all sync WS clients unless set_ws_loop_threads() says otherwise.
+_DEFAULT_LOOP_THREADS = 1
+
+
+class _LoopThread:
+    """One event loop running on a daemon thread, shared by several WS clients."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.refs = 0
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self._run, name=f"agentbay-ws-loop-{index}", daemon=True
+        )
+        self.thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_forever()
+        finally:
+            try:
+                pending = asyncio.all_tasks(self.loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    self.loop.run_until_complete(
+                        asyncio.gather(*pending, return_exceptions=True)
+                    )
+                self.loop.close()
+            except Exception:
+                pass
+
+    def stop(self) -> None:
+        try:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        except RuntimeError:
+            pass
+
+
+class WsLoopPool:
+    """
+    Refcounted event-loop threads hosting the async clients behind every sync WsClient.
+
+    A client borrows the least-used loop when it first needs one and returns it on
+    close(); a loop thread starts with its first client and stops with its last, so
+    an idle process runs no WS threads at all. One loop serves any number of
+    connections; more loops only help when push callbacks do real work, because
+    callbacks run on the loop thread of their client.
+    """
+
+    def __init__(self, size: int = _DEFAULT_LOOP_THREADS):
+        self._size = max(1, int(size))
+        self._threads: dict[int, _LoopThread] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def resize(self, size: int) -> None:
+        """Set the number of loop threads. Clients already placed stay on their loop."""
+        with self._lock:
+            self._size = max(1, int(size))
+
+    def acquire(self) -> _LoopThread:
+        with self._lock:
+            index = min(
+                range(self._size),
+                key=lambda i: (self._threads[i].refs if i in self._threads else 0, i),
+            )
+            loop_thread = self._threads.get(index)
+            if loop_thread is None:
+                loop_thread = _LoopThread(index)
+                self._threads[index] = loop_thread
+            loop_thread.refs += 1
+            return loop_thread
+
+    def release(self, loop_thread: _LoopThread) -> None:
+        with self._lock:
+            loop_thread.refs -= 1
+            if loop_thread.refs > 0:
+                return
+            if self._threads.get(loop_thread.index) is loop_thread:
+                del self._threads[loop_thread.index]
+        loop_thread.stop()
+
+    def client_counts(self) -> dict[int, int]:
+        """Number of clients on each running loop thread, by thread index."""
+        with self._lock:
+            return {i: t.refs for i, t in sorted(self._threads.items())}
+
+
+def _initial_loop_threads() -> int:
+    try:
+        return int(os.getenv("AGENTBAY_WS_LOOP_THREADS") or _DEFAULT_LOOP_THREADS)
+    except ValueError:
+        return _DEFAULT_LOOP_THREADS
+
+
+_loop_pool = WsLoopPool(_initial_loop_threads())
+
+
+def get_ws_loop_pool() -> WsLoopPool:
+    """The process-wide pool of WS loop threads."""
+    return _loop_pool
+
+
+def set_ws_loop_threads(count: int) -> None:
+    """
+    Size the shared WS loop pool used by the sync SDK.
+
+    Defaults to 1, or ``AGENTBAY_WS_LOOP_THREADS``. Raise it when many sessions
+    receive heavy push traffic whose callbacks take noticeable time.
+    """
+    _loop_pool.resize(count)
+
 
 class WsStreamHandle:
     def __init__(
@@ -60,58 +179,51 @@ class WsClient:
         heartbeat_interval_s: float = 20.0,
         reconnect_initial_delay_s: float = 0.5,
         reconnect_max_delay_s: float = 5.0,
+        instrumentation: Optional[Instrumentation] = None,
     ):
         self._ws_url = ws_url
         self._ws_token = ws_token
+        self._instrumentation = instrumentation
         self._heartbeat_interval_s = heartbeat_interval_s
         self._reconnect_initial_delay_s = reconnect_initial_delay_s
         self._reconnect_max_delay_s = reconnect_max_delay_s
 
         self._loop: Optional[asyncio.AbstractEventLoop] = None
-        self._thread: Optional[threading.Thread] = None
-        self._thread_started = threading.Event()
-        self._thread_error: Optional[BaseException] = None
+        self._loop_thread: Optional[_LoopThread] = None
+        self._init_lock = threading.Lock()
         self._async_client: Optional[_AsyncWsClient] = None
         self._closed = False
 
     def _ensure_thread(self) -> None:
         if self._closed:
             raise AgentBayError("WS client is closed")
-        if self._thread is not None and self._loop is not None:
+        if self._loop is not None and self._async_client is not None:
             return
+        with self._init_lock:
+            if self._loop is not None and self._async_client is not None:
+                return
+            loop_thread = _loop_pool.acquire()
 
-        loop = asyncio.new_event_loop()
-        self._loop = loop
-
-        def _runner() -> None:
-            try:
-                asyncio.set_event_loop(loop)
-                self._async_client = _AsyncWsClient(
+            async def _create() -> _AsyncWsClient:
+                return _AsyncWsClient(
                     ws_url=self._ws_url,
                     ws_token=self._ws_token,
                     heartbeat_interval_s=self._heartbeat_interval_s,
                     reconnect_initial_delay_s=self._reconnect_initial_delay_s,
                     reconnect_max_delay_s=self._reconnect_max_delay_s,
+                    instrumentation=self._instrumentation,
+                )
+
+            try:
+                client = asyncio.run_coroutine_threadsafe(_create(), loop_thread.loop).result(
+                    timeout=10.0
                 )
-                self._thread_started.set()
-                loop.run_forever()
             except BaseException as e:
-                self._thread_error = e
-                self._thread_started.set()
-            finally:
-                try:
-                    loop.close()
-                except Exception:
-                    pass
-
-        t = threading.Thread(target=_runner, name="agentbay-ws-loop", daemon=True)
-        self._thread = t
-        t.start()
-        self._thread_started.wait(timeout=10.0)
-        if self._thread_error is not None:
-            raise AgentBayError(f"Failed to start WS loop thread: {self._thread_error}")
-        if self._async_client is None:
-            raise AgentBayError("Failed to initialize async WS client")
+                _loop_pool.release(loop_thread)
+                raise AgentBayError(f"Failed to start WS loop thread: {e}") from e
+            self._loop_thread = loop_thread
+            self._async_client = client
+            self._loop = loop_thread.loop
 
     def _call_in_loop(self, fn: Callable[[_AsyncWsClient], Any]) -> Any:
         self._ensure_thread()
@@ -157,22 +269,21 @@ class WsClient:
         self._call_in_loop(lambda c: c.unregister_callback(target, callback))
 
     def close(self) -> None:
-        if self._closed:
-            return
-        self._closed = True
-        loop = self._loop
-        client = self._async_client
-        if loop is None or client is None:
+        with self._init_lock:
+            if self._closed:
+                return
+            self._closed = True
+            loop_thread = self._loop_thread
+            client = self._async_client
+            self._loop_thread = None
+        if loop_thread is None or client is None:
             return
         try:
-            f = asyncio.run_coroutine_threadsafe(client.close(), loop)
+            f = asyncio.run_coroutine_threadsafe(client.close(), loop_thread.loop)
             f.result(timeout=10.0)
         except Exception:
             pass
-        try:
-            loop.call_soon_threadsafe(loop.stop)
-        except Exception:
-            pass
+        _loop_pool.release(loop_thread)
 
     def call_stream(
         self,
@@ -1,3 +1,4 @@
+import json
 import os
 import pytest
 import time
@@ -533,12 +534,7 @@ class TestAsyncAgentMobile(unittest.IsolatedAsyncioTestCase):
             success=True,
             data='{"task_id": "task-123", "status": "running", "action": "Processing"}',
         )
-        self.session.call_mcp_tool.side_effect = [
-            mock_result_execute,
-            mock_result_status,
-            mock_result_status,
-            mock_result_status,
-        ]
+        self.session.call_mcp_tool.side_effect = [mock_result_execute] + [mock_result_status] * 10
 
         with patch("asyncio.sleep", new=AsyncMock(return_value=None)) as sleep_mock:
             result = await self.agent.mobile.execute_task_and_wait(
@@ -627,6 +623,149 @@ class TestAsyncAgentMobile(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(args["task"], "Open WeChat app")
         self.assertEqual(args["max_steps"], 50)  # default value
 
+    @pytest.mark.asyncio
+    async def test_mobile_events_poll_with_cursor(self):
+        """
+        Test that TaskExecution.events() yields each stream item once and advances the cursor.
+        """
+        from agentbay import McpToolResult
+
+        def _status(status, stream, product=""):
+            return McpToolResult(
+                request_id="request-124",
+                success=True,
+                data=json.dumps(
+                    {"taskId": "task-123", "status": status, "stream": stream, "result": product}
+                ),
+            )
+
+        self.session.call_mcp_tool.side_effect = [
+            McpToolResult(request_id="request-123", success=True, data='{"task_id": "task-123"}'),
+            _status("running", [
+                {"content": "", "reasoning": "Looking for WeChat", "timestamp_ms": 1},
+                {"content": "Opening ", "timestamp_ms": 2},
+            ]),
+            # A tool that ignores since_timestamp resends the old items.
+            _status("running", [
+                {"content": "Opening ", "timestamp_ms": 2},
+                {"content": "WeChat", "timestamp_ms": 3},
+            ]),
+            _status("completed", [], product="Done"),
+        ]
+
+        execution = await self.agent.mobile.execute_task("Open WeChat app")
+        with patch("asyncio.sleep", new=AsyncMock(return_value=None)):
+            events = [event async for event in execution.events(timeout=30)]
+
+        self.assertEqual(
+            [(e.type, e.content) for e in events],
+            [("reasoning", "Looking for WeChat"), ("content", "Opening "), ("content", "WeChat")],
+        )
+        self.assertEqual([e.seq for e in events], [1, 2, 3])
+        status_args = [c[0][1] for c in self.session.call_mcp_tool.call_args_list[1:]]
+        self.assertNotIn("since_timestamp", status_args[0])
+        self.assertEqual([a.get("since_timestamp") for a in status_args[1:]], [2, 3])
+
+        result = await execution.wait()
+        self.assertTrue(result.success)
+        self.assertEqual(result.task_result, "Done")
+        self.assertEqual(self.session.call_mcp_tool.call_count, 4)
+
+    @pytest.mark.asyncio
+    async def test_wait_resumes_events_cursor(self):
+        """
+        Test that the cursor never moves back and wait() after an early stop does not replay items.
+        """
+        import io
+
+        from agentbay import McpToolResult
+
+        def _status(status, stream):
+            return McpToolResult(
+                request_id="request-124",
+                success=True,
+                data=json.dumps({"taskId": "task-123", "status": status, "stream": stream, "result": "Done"}),
+            )
+
+        self.session.call_mcp_tool.side_effect = [
+            McpToolResult(request_id="request-123", success=True, data='{"task_id": "task-123"}'),
+            _status("running", [
+                {"content": "second ", "timestamp_ms": 2},
+                {"content": "first ", "timestamp_ms": 1},
+            ]),
+            _status("running", [{"content": "third", "timestamp_ms": 3}]),
+            _status("completed", []),
+        ]
+
+        execution = await self.agent.mobile.execute_task("Open WeChat app")
+        with patch("asyncio.sleep", new=AsyncMock(return_value=None)):
+            seen = []
+            async for event in execution.events(timeout=30):
+                seen.append(event)
+                if len(seen) == 2:
+                    break
+            with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+                result = await execution.wait()
+
+        self.assertEqual([(e.content, e.seq) for e in seen], [("second ", 1), ("first ", 2)])
+        self.assertTrue(result.success)
+        self.assertEqual(stdout.getvalue(), "third")
+        status_args = [c[0][1] for c in self.session.call_mcp_tool.call_args_list[2:]]
+        self.assertEqual([a.get("since_timestamp") for a in status_args], [2, 3])
+
+    @pytest.mark.asyncio
+    async def test_get_task_status_filters_since_timestamp(self):
+        """
+        Test get_task_status drops stream items at or before since_timestamp.
+        """
+        from agentbay import McpToolResult
+
+        self.session.call_mcp_tool.return_value = McpToolResult(
+            request_id="request-124",
+            success=True,
+            data=json.dumps({
+                "task_id": "task-123",
+                "status": "running",
+                "stream": [{"content": "a", "timestamp_ms": 5}, {"content": "b", "timestamp_ms": 9}],
+            }),
+        )
+
+        query = await self.agent.computer.get_task_status("task-123", since_timestamp=5)
+
+        self.assertEqual(query.stream, [{"content": "b", "timestamp_ms": 9}])
+        args = self.session.call_mcp_tool.call_args[0][1]
+        self.assertEqual(args["since_timestamp"], 5)
+
+    @pytest.mark.asyncio
+    async def test_stream_task_events_backs_off(self):
+        """
+        Test stream_task_events polls fast at first and backs off to the cap.
+        """
+        from agentbay import McpToolResult
+
+        running = McpToolResult(
+            request_id="request-124",
+            success=True,
+            data='{"task_id": "task-123", "status": "running", "action": "Thinking"}',
+        )
+        finished = McpToolResult(
+            request_id="request-125",
+            success=True,
+            data='{"task_id": "task-123", "status": "finished", "product": "Done"}',
+        )
+        self.session.call_mcp_tool.side_effect = [running] * 7 + [finished]
+
+        with patch("asyncio.sleep", new=AsyncMock(return_value=None)) as sleep_mock:
+            events = [
+                event async for event in self.agent.computer.stream_task_events("task-123")
+            ]
+
+        self.assertEqual(events, [])
+        intervals = [c[0][0] for c in sleep_mock.call_args_list]
+        self.assertEqual(intervals[:3], [0.5, 0.75, 1.125])
+        self.assertEqual(intervals[-1], 3.0)
+        self.assertEqual(intervals, sorted(intervals))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for failing fast on dead sessions and endpoints, driven through the
+offline mock backend.
+"""
+
+import asyncio
+import unittest
+
+import pytest
+
+from agentbay import AsyncAgentBay, CircuitBreakerPolicy, CircuitOpenError, RetryPolicy
+from agentbay.testing import MockAgentBayServer
+
+
+class TestAsyncCircuitBreaker(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = MockAgentBayServer(seed=13).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _agent_bay(self, reset_timeout=60.0):
+        return AsyncAgentBay(
+            api_key="test-key",
+            cfg=self.server.config(),
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=CircuitBreakerPolicy(
+                failure_threshold=2, reset_timeout=reset_timeout
+            ),
+        )
+
+    async def _trip(self, session):
+        await session.file_system.write_file("/tmp/a.txt", "content")
+        self.server.set_fault("CallMcpTool(LinkUrl)", error_rate=1.0, http_status=502)
+        for _ in range(2):
+            result = await session.call_mcp_tool("read_file", {"path": "/tmp/a.txt"})
+            self.assertFalse(result.success)
+
+    @pytest.mark.asyncio
+    async def test_dead_session_fails_fast(self):
+        agent_bay = self._agent_bay()
+        session = (await agent_bay.create()).session
+        other = (await agent_bay.create()).session
+        await self._trip(session)
+        sent = self.server.calls["CallMcpTool(LinkUrl)"]
+
+        with self.assertRaises(CircuitOpenError) as info:
+            await session.call_mcp_tool("read_file", {"path": "/tmp/a.txt"})
+        self.assertEqual(info.exception.key, f"session:{session.session_id}")
+        self.assertEqual(self.server.calls["CallMcpTool(LinkUrl)"], sent)
+        # The LinkUrl host is shared, so its circuit is open for other sessions too.
+        self.assertFalse((await other.file_system.read_file("/tmp/a.txt")).success)
+        self.assertEqual(self.server.calls["CallMcpTool(LinkUrl)"], sent)
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_closes_the_circuit(self):
+        agent_bay = self._agent_bay(reset_timeout=0.05)
+        session = (await agent_bay.create()).session
+        await self._trip(session)
+        self.server.clear_faults()
+        await asyncio.sleep(0.06)
+        probes = self.server.calls.get("GetSessionDetail", 0)
+
+        result = await session.call_mcp_tool("read_file", {"path": "/tmp/a.txt"})
+
+        self.assertTrue(result.success)
+        self.assertEqual(self.server.calls["GetSessionDetail"], probes + 1)
+        states = {
+            row["key"]: row["state"] for row in agent_bay.circuit_breakers.snapshot()
+        }
+        self.assertEqual(states[f"session:{session.session_id}"], "closed")
+
+    @pytest.mark.asyncio
+    async def test_openapi_endpoint_fails_fast(self):
+        agent_bay = self._agent_bay()
+        session = (await agent_bay.create()).session
+        self.server.set_fault("GetSession", error_rate=1.0, http_status=503)
+
+        for _ in range(3):
+            self.assertFalse((await agent_bay.get(session.session_id)).success)
+
+        self.assertEqual(self.server.calls["GetSession"], 2)
+
+    @pytest.mark.asyncio
+    async def test_throttling_does_not_trip(self):
+        agent_bay = self._agent_bay()
+        session = (await agent_bay.create()).session
+        self.server.set_fault(
+            "GetSession", error_rate=1.0, http_status=429, error_code="Throttling"
+        )
+
+        for _ in range(3):
+            await agent_bay.get(session.session_id)
+
+        self.assertEqual(self.server.calls["GetSession"], 3)
@@ -0,0 +1,182 @@
+"""
+Unit tests for persistent code contexts (code.create_context() and CodeContext).
+"""
+
+import json
+import shlex
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agentbay import AsyncCode, CodeContextInfo, CommandResult
+
+
+def _ok(stdout, request_id="req-1"):
+    return CommandResult(request_id=request_id, success=True, output=stdout, exit_code=0, stdout=stdout)
+
+
+def _reply(**payload):
+    return _ok(json.dumps(payload) + "\n")
+
+
+class TestCodeContext(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.session.command.execute_command = AsyncMock()
+        self.code = AsyncCode(self.session)
+
+    def _sent_requests(self):
+        requests = []
+        for call in self.session.command.execute_command.call_args_list:
+            script = call.args[0]
+            requests.append(json.loads(shlex.split(script)[2]))
+        return requests
+
+    @pytest.mark.asyncio
+    async def test_create_context_starts_kernel(self):
+        self.session.command.execute_command.return_value = _ok("4242\n")
+
+        result = await self.code.create_context("analysis")
+
+        self.assertTrue(result.success)
+        ctx = result.context
+        self.assertEqual(ctx.name, "analysis")
+        self.assertEqual(ctx.process.pid, 4242)
+        self.assertEqual(ctx.context_dir, "/tmp/.agentbay/kernels/analysis")
+        script = self.session.command.execute_command.call_args.args[0]
+        self.assertIn("__AGENTBAY_KERNEL_EOF__", script)
+        self.assertIn("python3 -u /tmp/.agentbay/kernels/analysis/kernel.py", script)
+
+    @pytest.mark.asyncio
+    async def test_create_context_reuses_running_kernel(self):
+        self.session.command.execute_command.return_value = _ok("__AGENTBAY_CTX__ abc123 77\n")
+
+        result = await self.code.create_context("analysis")
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.context.process.process_id, "abc123")
+        self.assertEqual(result.context.process.pid, 77)
+
+    @pytest.mark.asyncio
+    async def test_create_context_validates_name_and_language(self):
+        with self.assertRaises(ValueError):
+            await self.code.create_context("../etc")
+        result = await self.code.create_context("js", language="javascript")
+        self.assertFalse(result.success)
+        self.assertIn("python", result.error_message)
+        self.session.command.execute_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_and_logs(self):
+        self.session.command.execute_command.return_value = _reply(
+            id="e1", done=True, stdout="hi\n", stderr="", offsets=[1, 0],
+            result="42", error=None, execution_count=3,
+        )
+        ctx = self.code.get_context("analysis")
+
+        result = await ctx.run("print('hi')\n6 * 7")
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.result, "42")
+        self.assertEqual(result.logs.stdout, ["hi\n"])
+        self.assertEqual(result.execution_count, 3)
+        self.assertEqual(self._sent_requests()[0]["op"], "run")
+
+    @pytest.mark.asyncio
+    async def test_run_continues_with_polls_until_done(self):
+        self.session.command.execute_command.side_effect = [
+            _reply(id="e1", done=False, stdout="0\n", stderr="", offsets=[1, 0]),
+            _reply(id="e1", done=False, stdout="1\n", stderr="", offsets=[2, 0]),
+            _reply(id="e1", done=True, stdout="", stderr="", offsets=[2, 0], result=None, error=None),
+        ]
+        seen = []
+        ctx = self.code.get_context("analysis")
+
+        result = await ctx.run("loop()", chunk_timeout_s=1, on_stdout=seen.append)
+
+        self.assertTrue(result.success)
+        self.assertEqual(seen, ["0\n", "1\n"])
+        requests = self._sent_requests()
+        self.assertEqual([r["op"] for r in requests], ["run", "poll", "poll"])
+        self.assertEqual(requests[2]["offsets"], [2, 0])
+        self.assertEqual(requests[1]["id"], "e1")
+
+    @pytest.mark.asyncio
+    async def test_run_reports_cell_error(self):
+        self.session.command.execute_command.return_value = _reply(
+            id="e1", done=True, stdout="", stderr="", offsets=[0, 0], result=None,
+            error={"name": "ZeroDivisionError", "value": "division by zero", "traceback": "tb"},
+        )
+
+        result = await self.code.get_context("analysis").run("1/0")
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error.name, "ZeroDivisionError")
+        self.assertEqual(result.error_message, "ZeroDivisionError: division by zero")
+
+    @pytest.mark.asyncio
+    async def test_run_timeout_interrupts_cell(self):
+        self.session.command.execute_command.side_effect = [
+            _reply(id="e1", done=False, stdout="start\n", stderr="", offsets=[1, 0]),
+            _reply(interrupted=True),
+            _reply(id="e1", done=True, stdout="", stderr="", offsets=[1, 0], result=None,
+                   error={"name": "KeyboardInterrupt", "value": "Execution interrupted"}),
+        ]
+
+        result = await self.code.get_context("analysis").run("sleep()", timeout_s=0)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error.name, "TimeoutError")
+        self.assertEqual(result.logs.stdout, ["start\n"])
+        self.assertEqual([r["op"] for r in self._sent_requests()], ["run", "interrupt", "poll"])
+
+    @pytest.mark.asyncio
+    async def test_run_on_stopped_context_fails(self):
+        self.session.command.execute_command.return_value = _reply(error_message="Code context is not running")
+
+        result = await self.code.get_context("gone").run("1")
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_message, "Code context is not running")
+
+    @pytest.mark.asyncio
+    async def test_list_contexts_parses_rows(self):
+        self.session.command.execute_command.return_value = _ok(
+            "a\tp1\t10\trunning\nb\tp2\t\tstopped\n"
+        )
+
+        result = await self.code.list_contexts()
+
+        self.assertTrue(result.success)
+        self.assertEqual(
+            result.contexts,
+            [
+                CodeContextInfo(name="a", process_id="p1", pid=10, running=True),
+                CodeContextInfo(name="b", process_id="p2", pid=0, running=False),
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_in_contexts_runs_each_job(self):
+        async def _execute(script, timeout_ms=None):
+            value = "1" if "/kernels/a/" in script else "2"
+            return _reply(id="e", done=True, stdout="", stderr="", offsets=[0, 0], result=value, error=None)
+
+        self.session.command.execute_command.side_effect = _execute
+
+        results = await self.code.run_in_contexts({"a": "1", "b": "2"})
+
+        self.assertEqual({name: r.result for name, r in results.items()}, {"a": "1", "b": "2"})
+
+    @pytest.mark.asyncio
+    async def test_destroy_kills_process_and_removes_dir(self):
+        self.session.command.execute_command.return_value = _ok("")
+        ctx = self.code.get_context("analysis")
+
+        result = await ctx.destroy()
+
+        self.assertTrue(result.success)
+        script = self.session.command.execute_command.call_args.args[0]
+        self.assertIn("kill -TERM", script)
+        self.assertIn("rm -rf \"$d\"", script)
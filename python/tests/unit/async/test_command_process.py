@@ -0,0 +1,161 @@
+"""
+Unit tests for background process handles (command.start / list_processes).
+"""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agentbay import AsyncCommand, CommandResult, ProcessInfo
+from agentbay._async.command import (
+    _STATUS_MARKER,
+    _STDERR_MARKER,
+    _STDOUT_MARKER,
+    _parse_process_status,
+)
+from agentbay._common.exceptions import CommandError
+
+
+def _ok(stdout):
+    return CommandResult(request_id="req-1", success=True, output=stdout, stdout=stdout)
+
+
+def _status_output(status, stdout=None, stderr=""):
+    text = f"{_STATUS_MARKER}\n{status}\n"
+    if stdout is not None:
+        text += f"{_STDOUT_MARKER}\n{stdout}\n{_STDERR_MARKER}\n{stderr}"
+    return text
+
+
+class TestParseProcessStatus(unittest.TestCase):
+    def test_running(self):
+        parsed = _parse_process_status(_status_output("running"))
+        self.assertTrue(parsed["running"])
+        self.assertIsNone(parsed["exit_code"])
+
+    def test_exited_with_output_sections(self):
+        parsed = _parse_process_status(_status_output("exited 3", "out\nmore", "err"))
+        self.assertFalse(parsed["running"])
+        self.assertEqual(parsed["exit_code"], 3)
+        self.assertEqual(parsed["stdout"], "out\nmore")
+        self.assertEqual(parsed["stderr"], "err")
+
+    def test_garbage_raises(self):
+        with self.assertRaises(ValueError):
+            _parse_process_status("sh: not found")
+
+
+class TestCommandProcess(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.command = AsyncCommand(MagicMock())
+        self.command.execute_command = AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_start_returns_handle_with_pid(self):
+        self.command.execute_command.return_value = _ok("4242\n")
+
+        handle = await self.command.start("python -m http.server 8080", cwd="/srv", envs={"A": "1"})
+
+        self.assertEqual(handle.pid, 4242)
+        self.assertEqual(handle.command, "python -m http.server 8080")
+        self.assertTrue(handle.proc_dir.endswith(handle.process_id))
+        args, kwargs = self.command.execute_command.call_args
+        self.assertIn("nohup", args[0])
+        self.assertIn("'python -m http.server 8080'", args[0])
+        self.assertEqual(kwargs, {"cwd": "/srv", "envs": {"A": "1"}})
+
+    @pytest.mark.asyncio
+    async def test_start_failure_raises(self):
+        self.command.execute_command.return_value = CommandResult(
+            request_id="req-1", success=False, error_message="permission denied"
+        )
+        with self.assertRaises(CommandError):
+            await self.command.start("server")
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_exit_code_and_output_tail(self):
+        self.command.execute_command.return_value = _ok("4242\n")
+        handle = await self.command.start("make")
+        self.command.execute_command.return_value = _ok(_status_output("exited 0", "done\n", ""))
+
+        result = await handle.wait(timeout_ms=10000, tail_bytes=1024)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.stdout, "done\n")
+        self.assertEqual(handle.exit_code, 0)
+        script = self.command.execute_command.call_args[0][0]
+        self.assertIn("tail -c 1024", script)
+        self.assertEqual(self.command.execute_command.call_args[1]["timeout_ms"], 15000)
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout_while_running(self):
+        self.command.execute_command.return_value = _ok("7\n")
+        handle = await self.command.start("sleep 100")
+        self.command.execute_command.return_value = _ok(_status_output("running", "", ""))
+
+        result = await handle.wait(timeout_ms=1000)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.exit_code, -1)
+        self.assertIn("still running", result.error_message)
+        self.assertIsNone(handle.exit_code)
+
+    @pytest.mark.asyncio
+    async def test_status_and_kill(self):
+        self.command.execute_command.return_value = _ok("7\n")
+        handle = await self.command.start("sleep 100")
+
+        self.command.execute_command.return_value = _ok(_status_output("running"))
+        status = await handle.status()
+        self.assertTrue(status.success)
+        self.assertTrue(status.data.running)
+
+        self.command.execute_command.return_value = _ok("")
+        killed = await handle.kill("KILL")
+        self.assertTrue(killed.success)
+        self.assertIn("kill -KILL", self.command.execute_command.call_args[0][0])
+
+        with self.assertRaises(ValueError):
+            await handle.kill("TERM; rm -rf /")
+
+    @pytest.mark.asyncio
+    async def test_tail_and_stream(self):
+        self.command.execute_command.return_value = _ok("7\n")
+        handle = await self.command.start("server")
+        self.command.execute_command.return_value = _ok("last line\n")
+
+        tail = await handle.tail(lines=5, stream="stderr")
+
+        self.assertEqual(tail.data, "last line\n")
+        self.assertIn("tail -n 5", self.command.execute_command.call_args[0][0])
+        self.assertTrue(self.command.execute_command.call_args[0][0].endswith("/stderr"))
+
+        self.command.stream = AsyncMock(return_value="execution")
+        self.assertEqual(await handle.stream(timeout_ms=60000), "execution")
+        args, kwargs = self.command.stream.call_args
+        self.assertIn("--pid=", args[0])
+        self.assertEqual(kwargs, {"timeout_ms": 60000, "buffer_output": False})
+
+    @pytest.mark.asyncio
+    async def test_list_processes_and_attach(self):
+        self.command.execute_command.return_value = _ok(
+            "abc\t10\trunning\t\tpython server.py\n"
+            "def\t11\texited\t2\tmake test\n"
+            "broken line\n"
+        )
+
+        result = await self.command.list_processes()
+
+        self.assertTrue(result.success)
+        self.assertEqual([p.process_id for p in result.processes], ["abc", "def"])
+        self.assertTrue(result.processes[0].running)
+        self.assertIsNone(result.processes[0].exit_code)
+        self.assertEqual(result.processes[1].exit_code, 2)
+        self.assertEqual(result.processes[1].command, "make test")
+
+        handle = self.command.attach(result.processes[1])
+        self.assertEqual(handle.pid, 11)
+        self.assertEqual(handle.exit_code, 2)
+        self.assertIsInstance(result.processes[0], ProcessInfo)
@@ -0,0 +1,200 @@
+"""
+Unit tests for streamed shell execution (execute_command(stream_beta=True) and command.stream()).
+"""
+
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agentbay import AsyncCommand, CommandOutputChunk
+
+
+class _FakeStreamHandle:
+    def __init__(self, end_data, error=None):
+        self.invocation_id = "inv-1"
+        self._end_data = end_data
+        self._error = error
+        self.cancelled = False
+
+    async def wait_end(self):
+        if self._error is not None:
+            raise self._error
+        return self._end_data
+
+    async def cancel(self):
+        self.cancelled = True
+
+
+class _FakeWsClient:
+    """Replays a fixed list of events to the stream callbacks."""
+
+    def __init__(self, events, end_data, error=None):
+        self.events = events
+        self.end_data = end_data
+        self.error = error
+        self.calls = []
+        self.handle = _FakeStreamHandle(end_data, error)
+
+    async def call_stream(self, *, target, data, on_event, on_end, on_error):
+        self.calls.append({"target": target, "data": data})
+        for event in self.events:
+            on_event("inv-1", event)
+        if self.error is not None:
+            on_error("inv-1", self.error)
+        else:
+            on_end("inv-1", self.end_data)
+        return self.handle
+
+
+def _chunk(event_type, text):
+    return {"phase": "event", "eventType": event_type, "chunk": text}
+
+
+class DummySession:
+    def __init__(self, ws_client):
+        self.mcpTools = []
+        self._get_ws_client = AsyncMock(return_value=ws_client)
+        self.call_mcp_tool = MagicMock()
+
+
+class TestCommandStreaming(unittest.IsolatedAsyncioTestCase):
+    def _command(self, ws_client):
+        self.session = DummySession(ws_client)
+        return AsyncCommand(self.session)
+
+    @pytest.mark.asyncio
+    async def test_execute_command_stream_beta_collects_output(self):
+        ws = _FakeWsClient(
+            [_chunk("stdout", "line 1\n"), _chunk("stderr", "warn\n"), _chunk("stdout", "line 2\n")],
+            {"phase": "end", "status": "finished", "exitCode": 0},
+        )
+        command = self._command(ws)
+        stdout, stderr = [], []
+
+        result = await command.execute_command(
+            "make",
+            timeout_ms=1000,
+            cwd="/tmp",
+            stream_beta=True,
+            on_stdout=stdout.append,
+            on_stderr=stderr.append,
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.stdout, "line 1\nline 2\n")
+        self.assertEqual(result.stderr, "warn\n")
+        self.assertEqual(result.output, "line 1\nline 2\nwarn\n")
+        self.assertEqual(result.request_id, "inv-1")
+        self.assertEqual(stdout, ["line 1\n", "line 2\n"])
+        self.assertEqual(stderr, ["warn\n"])
+        self.session.call_mcp_tool.assert_not_called()
+
+        call = ws.calls[0]
+        self.assertEqual(call["target"], "wuying_shell")
+        self.assertEqual(call["data"]["method"], "shell")
+        self.assertEqual(call["data"]["mode"], "stream")
+        self.assertEqual(
+            call["data"]["params"],
+            {"command": "make", "timeoutMs": 1000, "cwd": "/tmp"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_beta_nonzero_exit_code_fails(self):
+        ws = _FakeWsClient(
+            [_chunk("stderr", "boom\n")],
+            {"phase": "end", "status": "finished", "exitCode": 2, "traceId": "t-1"},
+        )
+        command = self._command(ws)
+
+        result = await command.execute_command("false", stream_beta=True)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(result.trace_id, "t-1")
+        self.assertEqual(result.error_message, "boom\n")
+
+    @pytest.mark.asyncio
+    async def test_stream_target_from_mcp_tools(self):
+        ws = _FakeWsClient([], {"exitCode": 0})
+        command = self._command(ws)
+        tool = MagicMock()
+        tool.name = "shell"
+        tool.server = "custom_shell_server"
+        self.session.mcpTools = [tool]
+
+        await command.execute_command("ls", stream_beta=True)
+
+        self.assertEqual(ws.calls[0]["target"], "custom_shell_server")
+
+    @pytest.mark.asyncio
+    async def test_stream_iterates_chunks_in_order(self):
+        ws = _FakeWsClient(
+            [_chunk("stdout", "a"), _chunk("stderr", "b"), {"eventType": "progress"}, _chunk("stdout", "c")],
+            {"exitCode": 0},
+        )
+        command = self._command(ws)
+
+        execution = await command.stream("build.sh")
+        chunks = [chunk async for chunk in execution]
+        result = await execution.wait()
+
+        self.assertTrue(all(isinstance(c, CommandOutputChunk) for c in chunks))
+        self.assertEqual([(c.stream, c.data) for c in chunks], [("stdout", "a"), ("stderr", "b"), ("stdout", "c")])
+        self.assertTrue(result.success)
+        self.assertEqual(result.stdout, "ac")
+
+    @pytest.mark.asyncio
+    async def test_stream_without_buffering_keeps_exit_code_only(self):
+        ws = _FakeWsClient([_chunk("stdout", "x" * 10)], {"exitCode": 0})
+        command = self._command(ws)
+
+        execution = await command.stream("yes | head", buffer_output=False)
+        chunks = [chunk async for chunk in execution]
+        result = await execution.wait()
+
+        self.assertEqual(len(chunks), 1)
+        self.assertTrue(result.success)
+        self.assertEqual(result.stdout, "")
+
+    @pytest.mark.asyncio
+    async def test_stream_error_ends_iteration_and_fails(self):
+        errors = []
+        ws = _FakeWsClient([_chunk("stdout", "partial")], {}, error=RuntimeError("connection lost"))
+        command = self._command(ws)
+
+        result = await command.execute_command("sleep 100", stream_beta=True, on_error=errors.append)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.stdout, "partial")
+        self.assertIn("connection lost", result.error_message)
+        self.assertEqual(len(errors), 1)
+
+    @pytest.mark.asyncio
+    async def test_stream_open_failure_returns_failed_handle(self):
+        command = self._command(None)
+        self.session._get_ws_client = AsyncMock(side_effect=RuntimeError("ws_url is missing"))
+
+        execution = await command.stream("ls")
+        chunks = [chunk async for chunk in execution]
+        result = await execution.wait()
+
+        self.assertEqual(chunks, [])
+        self.assertFalse(result.success)
+        self.assertIn("ws_url is missing", result.error_message)
+
+    @pytest.mark.asyncio
+    async def test_stream_cancel_delegates_to_ws_handle(self):
+        ws = _FakeWsClient([], {"exitCode": 0})
+        command = self._command(ws)
+
+        execution = await command.stream("tail -f log")
+        await execution.cancel()
+
+        self.assertTrue(ws.handle.cancelled)
+
+    @pytest.mark.asyncio
+    async def test_stream_rejects_invalid_envs(self):
+        command = self._command(_FakeWsClient([], {}))
+        with self.assertRaises(ValueError):
+            await command.stream("env", envs={"A": 1})
@@ -0,0 +1,241 @@
+"""
+Unit tests for context.sync_dir() and the directory sync engine.
+"""
+
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agentbay import AsyncContextService, ContextDirSyncResult
+from agentbay._async._internal import dir_sync
+from agentbay._async._internal.dir_sync import DEFAULT_MANIFEST_NAME, DirSyncEngine
+from agentbay._async.context import ContextFileEntry, ContextFileListResult, FileUrlResult
+from agentbay._common.models.response import OperationResult
+
+
+class FakeRemote:
+    """In-memory context file store behind the context service file APIs."""
+
+    def __init__(self):
+        self.files = {}
+        self.clock = 0
+        self.puts = []
+        self.gets = []
+
+    def write(self, path, data):
+        self.clock += 1
+        self.files[path] = (data, f"2026-01-01 00:00:{self.clock:02d}")
+
+    async def list_files(self, context_id, parent_folder_path, page_number=1, page_size=50):
+        folder = parent_folder_path.rstrip("/") + "/"
+        children = {}
+        for path, (data, modified) in self.files.items():
+            if not path.startswith(folder):
+                continue
+            name, _, rest = path[len(folder):].partition("/")
+            if rest:
+                children[name] = ContextFileEntry("", name, f"oss://bucket{folder}{name}/", file_type="FOLDER")
+            else:
+                children[name] = ContextFileEntry(
+                    "", name, f"oss://bucket{path}", file_type="FILE", size=len(data), gmt_modified=modified
+                )
+        names = sorted(children)
+        page = names[(page_number - 1) * page_size:page_number * page_size]
+        return ContextFileListResult(
+            success=True, entries=[children[n] for n in page], count=len(names)
+        )
+
+    async def get_file_upload_url(self, context_id, file_path):
+        return FileUrlResult(success=True, url=f"put:{file_path}")
+
+    async def get_file_download_url(self, context_id, file_path):
+        return FileUrlResult(success=True, url=f"get:{file_path[len('oss://bucket'):]}")
+
+    async def delete_file(self, context_id, file_path):
+        self.files.pop(file_path, None)
+        return OperationResult(success=True, data=True)
+
+    def put_file(self, client, url, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        self.puts.append(url[len("put:"):])
+        self.write(url[len("put:"):], data)
+        return len(data)
+
+    def get_file(self, client, url, path):
+        data = self.files[url[len("get:"):]][0]
+        self.gets.append(url[len("get:"):])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return len(data), hashlib.sha256(data).hexdigest()
+
+
+def _write(root, rel_path, data):
+    path = os.path.join(root, *rel_path.split("/"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+class TestContextDirSync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.remote = FakeRemote()
+        self.service = AsyncContextService(MagicMock())
+        self.service.list_files = AsyncMock(side_effect=self.remote.list_files)
+        self.service.get_file_upload_url = AsyncMock(side_effect=self.remote.get_file_upload_url)
+        self.service.get_file_download_url = AsyncMock(side_effect=self.remote.get_file_download_url)
+        self.service.delete_file = AsyncMock(side_effect=self.remote.delete_file)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.local = self.tmp.name
+        patchers = [
+            patch.object(dir_sync, "_put_file", side_effect=self.remote.put_file),
+            patch.object(dir_sync, "_get_file", side_effect=self.remote.get_file),
+        ]
+        for p in patchers:
+            p.start()
+            self.addCleanup(p.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_upload_transfers_only_changed_files(self):
+        _write(self.local, "a.txt", b"alpha")
+        _write(self.local, "sub/b.txt", b"beta")
+
+        first = await self.service.sync_dir(self.local, "ctx-1", prefix="/ws")
+
+        self.assertIsInstance(first, ContextDirSyncResult)
+        self.assertTrue(first.success)
+        self.assertEqual(sorted(first.uploaded), ["a.txt", "sub/b.txt"])
+        self.assertEqual(first.bytes_transferred, 9)
+        self.assertEqual(sorted(self.remote.files), ["/ws/a.txt", "/ws/sub/b.txt"])
+        self.assertTrue(os.path.exists(os.path.join(self.local, DEFAULT_MANIFEST_NAME)))
+
+        second = await self.service.sync_dir(self.local, "ctx-1", prefix="/ws")
+        self.assertEqual(second.uploaded, [])
+        self.assertEqual(second.skipped, 2)
+
+        _write(self.local, "sub/b.txt", b"beta v2")
+        third = await self.service.sync_dir(self.local, "ctx-1", prefix="/ws")
+        self.assertEqual(third.uploaded, ["sub/b.txt"])
+        self.assertEqual(third.skipped, 1)
+        self.assertEqual(self.remote.files["/ws/sub/b.txt"][0], b"beta v2")
+
+    @pytest.mark.asyncio
+    async def test_touched_file_with_same_content_is_not_uploaded(self):
+        path = _write(self.local, "a.txt", b"alpha")
+        await self.service.sync_dir(self.local, "ctx-1")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000_000))
+
+        result = await self.service.sync_dir(self.local, "ctx-1")
+
+        self.assertEqual(result.uploaded, [])
+        self.assertEqual(result.skipped, 1)
+
+    @pytest.mark.asyncio
+    async def test_remote_change_is_overwritten_on_upload(self):
+        _write(self.local, "a.txt", b"alpha")
+        await self.service.sync_dir(self.local, "ctx-1")
+        await self.service.sync_dir(self.local, "ctx-1")
+        self.remote.write("/a.txt", b"changed remotely")
+
+        result = await self.service.sync_dir(self.local, "ctx-1")
+
+        self.assertEqual(result.uploaded, ["a.txt"])
+        self.assertEqual(self.remote.files["/a.txt"][0], b"alpha")
+
+    @pytest.mark.asyncio
+    async def test_upload_delete_removes_extraneous_remote_files(self):
+        _write(self.local, "keep.txt", b"k")
+        self.remote.write("/ws/stale.txt", b"old")
+
+        result = await self.service.sync_dir(self.local, "ctx-1", prefix="ws", delete=True)
+
+        self.assertEqual(result.deleted, ["stale.txt"])
+        self.assertEqual(sorted(self.remote.files), ["/ws/keep.txt"])
+
+    @pytest.mark.asyncio
+    async def test_download_then_incremental(self):
+        self.remote.write("/ws/a.txt", b"alpha")
+        self.remote.write("/ws/deep/b.txt", b"beta")
+        _write(self.local, "local-only.txt", b"x")
+
+        first = await self.service.sync_dir(self.local, "ctx-1", prefix="/ws", direction="download", delete=True)
+
+        self.assertTrue(first.success)
+        self.assertEqual(sorted(first.downloaded), ["a.txt", "deep/b.txt"])
+        self.assertEqual(first.deleted, ["local-only.txt"])
+        with open(os.path.join(self.local, "deep", "b.txt"), "rb") as f:
+            self.assertEqual(f.read(), b"beta")
+
+        second = await self.service.sync_dir(self.local, "ctx-1", prefix="/ws", direction="download")
+        self.assertEqual(second.downloaded, [])
+        self.assertEqual(second.skipped, 2)
+
+        self.remote.write("/ws/a.txt", b"alpha v2")
+        third = await self.service.sync_dir(self.local, "ctx-1", prefix="/ws", direction="download")
+        self.assertEqual(third.downloaded, ["a.txt"])
+
+    @pytest.mark.asyncio
+    async def test_exclude_patterns(self):
+        _write(self.local, "a.txt", b"a")
+        _write(self.local, "Cache/blob", b"c")
+        _write(self.local, "x.lock", b"l")
+
+        result = await self.service.sync_dir(self.local, "ctx-1", exclude=["Cache/*", "*.lock"])
+
+        self.assertEqual(result.uploaded, ["a.txt"])
+
+    @pytest.mark.asyncio
+    async def test_remote_listing_pages_are_all_read(self):
+        for i in range(7):
+            self.remote.write(f"/ws/f{i}.txt", b"x")
+        engine = DirSyncEngine(self.service, self.local, "ctx-1", prefix="/ws", direction="download", page_size=2)
+
+        result = await engine.run()
+
+        self.assertEqual(len(result.downloaded), 7)
+        pages = [c.kwargs["page_number"] for c in self.service.list_files.call_args_list]
+        self.assertEqual(sorted(pages), [1, 2, 3, 4])
+
+    @pytest.mark.asyncio
+    async def test_failed_transfer_is_reported_and_retried_next_time(self):
+        _write(self.local, "a.txt", b"a")
+        self.service.get_file_upload_url = AsyncMock(
+            return_value=FileUrlResult(success=False, error_message="[Forbidden] denied")
+        )
+
+        result = await self.service.sync_dir(self.local, "ctx-1")
+
+        self.assertFalse(result.success)
+        self.assertIn("denied", result.failed["a.txt"])
+        self.service.get_file_upload_url = AsyncMock(side_effect=self.remote.get_file_upload_url)
+        retry = await self.service.sync_dir(self.local, "ctx-1")
+        self.assertEqual(retry.uploaded, ["a.txt"])
+
+    @pytest.mark.asyncio
+    async def test_download_never_writes_outside_local_dir(self):
+        self.remote.write("/ws/ok.txt", b"ok")
+        self.remote.write("/ws/../escape.txt", b"x")
+        self.remote.write("/ws/sub/../../../escape.txt", b"x")
+        local = os.path.join(self.local, "target")
+
+        result = await self.service.sync_dir(local, "ctx-1", prefix="/ws", direction="download")
+
+        self.assertEqual(result.downloaded, ["ok.txt"])
+        self.assertEqual(sorted(result.failed), ["../escape.txt", "sub/../../../escape.txt"])
+        self.assertFalse(os.path.exists(os.path.join(self.local, "escape.txt")))
+        self.assertEqual(self.remote.gets, ["/ws/ok.txt"])
+
+    @pytest.mark.asyncio
+    async def test_invalid_direction(self):
+        with self.assertRaises(ValueError):
+            await self.service.sync_dir(self.local, "ctx-1", direction="both")
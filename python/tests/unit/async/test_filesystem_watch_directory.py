@@ -288,7 +288,7 @@ class TestAsyncFileSystemWatchDirectory(unittest.IsolatedAsyncioTestCase):
             callback_events.extend(events)
 
         # Mock _get_file_change to return some events
-        mock_events = [FileChangeEvent("create", "/tmp/test.txt", "file")]
+        mock_events = [FileChangeEvent("create", "/tmp/test_dir/test.txt", "file")]
         mock_result = FileChangeResult(success=True, events=mock_events)
 
         self.filesystem._get_file_change = AsyncMock(return_value=mock_result)
@@ -309,17 +309,17 @@ class TestAsyncFileSystemWatchDirectory(unittest.IsolatedAsyncioTestCase):
 
         # Start the thread
         thread.start()
-        # Use async sleep so the event loop can process run_coroutine_threadsafe calls
+        # The watch runs on this event loop; sleep and join without blocking it
         await asyncio.sleep(0.5)
 
         # Stop the thread
         stop_event.set()
-        thread.join(timeout=2.0)
+        await asyncio.to_thread(thread.join, 2.0)
 
         # Verify callback was called with events
         self.assertGreater(len(callback_events), 0)
         self.assertEqual(callback_events[0].event_type, "create")
-        self.assertEqual(callback_events[0].path, "/tmp/test.txt")
+        self.assertEqual(callback_events[0].path, "/tmp/test_dir/test.txt")
 
     @pytest.mark.asyncio
 
@@ -331,7 +331,7 @@ class TestAsyncFileSystemWatchDirectory(unittest.IsolatedAsyncioTestCase):
             raise Exception("Callback error")
 
         # Mock _get_file_change to return some events
-        mock_events = [FileChangeEvent("create", "/tmp/test.txt", "file")]
+        mock_events = [FileChangeEvent("create", "/tmp/test_dir/test.txt", "file")]
         mock_result = FileChangeResult(success=True, events=mock_events)
 
         self.filesystem._get_file_change = AsyncMock(return_value=mock_result)
@@ -347,12 +347,12 @@ class TestAsyncFileSystemWatchDirectory(unittest.IsolatedAsyncioTestCase):
 
         # Start the thread
         thread.start()
-        # Use async sleep so the event loop can process run_coroutine_threadsafe calls
+        # The watch runs on this event loop; sleep and join without blocking it
         await asyncio.sleep(0.5)
 
         # Stop the thread - should not crash despite callback exception
         stop_event.set()
-        thread.join(timeout=2.0)
+        await asyncio.to_thread(thread.join, 2.0)
 
         # Thread should have completed without crashing
         self.assertFalse(thread.is_alive())
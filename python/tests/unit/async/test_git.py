@@ -24,13 +24,15 @@ from agentbay._common.exceptions import (
     GitNotARepoError,
     GitNotFoundError,
 )
-from agentbay._common.models.command import CommandResult
+from agentbay._common.models.command import BatchCommandResult, CommandResult
 from agentbay._common.models.git import (
     GitBranchListResult,
     GitCloneResult,
     GitCommitResult,
     GitInitResult,
     GitLogResult,
+    GitRepoSummary,
+    GitSnapshotResult,
     GitStatusResult,
 )
 
@@ -46,6 +48,7 @@ class DummySession:
     def __init__(self):
         self.command = MagicMock()
         self.command.execute_command = AsyncMock()
+        self.command.execute_many = AsyncMock()
 
 
 def _ok(stdout="", stderr="", output="", exit_code=0):
@@ -59,6 +62,14 @@ def _ok(stdout="", stderr="", output="", exit_code=0):
     )
 
 
+def _batch(*results):
+    """Build a BatchCommandResult from per-command results."""
+    return BatchCommandResult(
+        success=all(r.success for r in results),
+        results=list(results),
+    )
+
+
 def _fail(stderr="", exit_code=1, output="", error_message=""):
     """Build a failed CommandResult."""
     return CommandResult(
@@ -494,6 +505,51 @@ class TestAsyncGitAvailability(unittest.IsolatedAsyncioTestCase):
             await git._ensure_git_available()
         assert git._git_available is False
 
+    @pytest.mark.asyncio
+    async def test_first_operation_checks_git_in_same_round_trip(self):
+        session = DummySession()
+        git = AsyncGit(session)
+        session.command.execute_many.return_value = _batch(
+            _ok(stdout="git version 2.39.0"), _ok(stdout="## main\n")
+        )
+        status = await git.status("/repo")
+        assert status.current_branch == "main"
+        assert git._git_available is True
+        session.command.execute_command.assert_not_called()
+        cmds = session.command.execute_many.call_args[0][0]
+        assert cmds[0] == "git '--version'"
+        assert "'status'" in cmds[1]
+        assert session.command.execute_many.call_args[1]["stop_on_error"] is True
+
+        # Once confirmed, operations go straight to execute_command.
+        session.command.execute_command.return_value = _ok(stdout="## main\n")
+        await git.status("/repo")
+        session.command.execute_command.assert_called_once()
+        assert session.command.execute_many.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_first_operation_raises_when_git_missing(self):
+        session = DummySession()
+        git = AsyncGit(session)
+        session.command.execute_many.return_value = _batch(
+            _fail(stderr="git: not found", exit_code=127),
+            CommandResult(success=False, exit_code=-1),
+        )
+        with pytest.raises(GitNotFoundError):
+            await git.status("/repo")
+        assert git._git_available is False
+
+    @pytest.mark.asyncio
+    async def test_batch_transport_failure_is_classified(self):
+        session = DummySession()
+        git = AsyncGit(session)
+        session.command.execute_many.return_value = BatchCommandResult(
+            success=False, error_message="connection reset"
+        )
+        with pytest.raises(GitError):
+            await git.status("/repo")
+        assert git._git_available is None
+
 
 # =========================================================================
 # 1.6 Public API tests
@@ -1103,12 +1159,10 @@ class TestAsyncGitConfig(unittest.IsolatedAsyncioTestCase):
 
     @pytest.mark.asyncio
     async def test_configure_user_global(self):
-        self.session.command.execute_command.return_value = _ok()
+        self.session.command.execute_many.return_value = _batch(_ok(), _ok())
         await self.git.configure_user("/repo", "Alice", "alice@x.com")
-        calls = self.session.command.execute_command.call_args_list
-        assert len(calls) == 2
-        name_cmd = calls[0][0][0]
-        email_cmd = calls[1][0][0]
+        self.session.command.execute_command.assert_not_called()
+        name_cmd, email_cmd = self.session.command.execute_many.call_args[0][0]
         assert "'--global'" in name_cmd
         assert "'user.name'" in name_cmd
         assert "'Alice'" in name_cmd
@@ -1117,23 +1171,25 @@ class TestAsyncGitConfig(unittest.IsolatedAsyncioTestCase):
 
     @pytest.mark.asyncio
     async def test_configure_user_local(self):
-        self.session.command.execute_command.return_value = _ok()
+        self.session.command.execute_many.return_value = _batch(_ok(), _ok())
         await self.git.configure_user("/repo", "Alice", "alice@x.com", scope="local")
-        cmd = self.session.command.execute_command.call_args_list[0][0][0]
+        cmd = self.session.command.execute_many.call_args[0][0][0]
         assert "'--local'" in cmd
 
     @pytest.mark.asyncio
     async def test_configure_user_name_failure(self):
-        self.session.command.execute_command.return_value = _fail(stderr="error")
+        self.session.command.execute_many.return_value = _batch(
+            _fail(stderr="error"), CommandResult(success=False, exit_code=-1)
+        )
         with pytest.raises(GitError):
             await self.git.configure_user("/repo", "Alice", "alice@x.com")
 
     @pytest.mark.asyncio
     async def test_configure_user_email_failure(self):
-        self.session.command.execute_command.side_effect = [
+        self.session.command.execute_many.return_value = _batch(
             _ok(),
             _fail(stderr="error setting email"),
-        ]
+        )
         with pytest.raises(GitError):
             await self.git.configure_user("/repo", "Alice", "alice@x.com")
 
@@ -1188,3 +1244,110 @@ class TestAsyncGitConfig(unittest.IsolatedAsyncioTestCase):
         )
         with pytest.raises(GitError):
             await self.git.get_config("/repo", "user.name")
+
+
+class TestAsyncGitComposite(unittest.IsolatedAsyncioTestCase):
+    """Tests for commit_all, snapshot and repo_summary."""
+
+    def setUp(self):
+        self.session = DummySession()
+        self.git = AsyncGit(self.session)
+        self.git._git_available = True
+
+    @pytest.mark.asyncio
+    async def test_commit_all_single_round_trip(self):
+        self.session.command.execute_many.return_value = _batch(
+            _ok(),
+            _ok(stdout="[main abc1234] Edit\n"),
+            _ok(stdout="abc1234def\n"),
+            _ok(stdout="## main\n"),
+        )
+        result = await self.git.commit_all("/repo", "Edit", author_name="Agent")
+        assert isinstance(result, GitSnapshotResult)
+        assert result.committed is True
+        assert result.commit_hash == "abc1234def"
+        assert result.status.current_branch == "main"
+        self.session.command.execute_command.assert_not_called()
+        self.session.command.execute_many.assert_called_once()
+        add_cmd, commit_cmd, _, status_cmd = self.session.command.execute_many.call_args[0][0]
+        assert "'-A'" in add_cmd
+        assert "'diff' '--cached' '--quiet'" in commit_cmd
+        assert "'user.name=Agent'" in commit_cmd
+        assert "'--porcelain=1'" in status_cmd
+
+    @pytest.mark.asyncio
+    async def test_commit_all_nothing_to_commit(self):
+        self.session.command.execute_many.return_value = _batch(
+            _ok(),
+            _ok(stdout="__AGENTBAY_GIT_NOTHING_TO_COMMIT__\n"),
+            _ok(stdout="abc1234def\n"),
+            _ok(stdout="## main\n"),
+        )
+        result = await self.git.commit_all("/repo", "Edit", files=["a.txt"])
+        assert result.committed is False
+        assert result.commit_hash == "abc1234def"
+        add_cmd = self.session.command.execute_many.call_args[0][0][0]
+        assert "'--' 'a.txt'" in add_cmd
+
+    @pytest.mark.asyncio
+    async def test_commit_all_allow_empty_skips_guard(self):
+        self.session.command.execute_many.return_value = _batch(
+            _ok(), _ok(), _ok(stdout="abc\n"), _ok(stdout="## main\n")
+        )
+        await self.git.commit_all("/repo", "Empty", allow_empty=True)
+        commit_cmd = self.session.command.execute_many.call_args[0][0][1]
+        assert "'--allow-empty'" in commit_cmd
+        assert "diff" not in commit_cmd
+
+    @pytest.mark.asyncio
+    async def test_commit_all_not_a_repo(self):
+        self.session.command.execute_many.return_value = _batch(
+            _fail(stderr="fatal: not a git repository", exit_code=128),
+            CommandResult(success=False, exit_code=-1),
+            CommandResult(success=False, exit_code=-1),
+            CommandResult(success=False, exit_code=-1),
+        )
+        with pytest.raises(GitNotARepoError):
+            await self.git.commit_all("/repo", "Edit")
+
+    @pytest.mark.asyncio
+    async def test_snapshot_inits_and_configures(self):
+        self.session.command.execute_many.return_value = _batch(
+            _ok(), _ok(), _ok(), _ok(), _ok(), _ok(stdout="abc\n"), _ok(stdout="## main\n")
+        )
+        result = await self.git.snapshot(
+            "/repo", "Checkpoint", initial_branch="main",
+            user_name="Agent", user_email="agent@x.com",
+        )
+        assert result.committed is True
+        assert result.path == "/repo"
+        cmds = self.session.command.execute_many.call_args[0][0]
+        assert len(cmds) == 7
+        assert "'init'" in cmds[0] and "'--initial-branch' 'main'" in cmds[0]
+        assert "'--local' 'user.name' 'Agent'" in cmds[1]
+        assert "'--local' 'user.email' 'agent@x.com'" in cmds[2]
+
+    @pytest.mark.asyncio
+    async def test_repo_summary(self):
+        record = "abc\x01ab\x01A\x01a@x\x01d\x01msg\x00"
+        self.session.command.execute_many.return_value = _batch(
+            _ok(stdout="## main\n M a.txt\n"),
+            _ok(stdout=record),
+            _ok(stdout="main\t*\ndev\t \n"),
+        )
+        summary = await self.git.repo_summary("/repo", max_count=3)
+        assert isinstance(summary, GitRepoSummary)
+        assert summary.status.is_clean is False
+        assert [e.short_hash for e in summary.log.entries] == ["ab"]
+        assert summary.branches.current == "main"
+        assert len(summary.branches.branches) == 2
+        log_cmd = self.session.command.execute_many.call_args[0][0][1]
+        assert "'--max-count' '3'" in log_cmd
+
+    @pytest.mark.asyncio
+    async def test_repo_summary_empty_repository(self):
+        self.session.command.execute_many.return_value = _batch(
+            _ok(stdout="## No commits yet on main\n"), _ok(), _ok()
+        )
+        summary = await self.git.repo_summary("/repo")
+        assert summary.log.entries == []
@@ -0,0 +1,198 @@
+"""
+Unit tests for incremental git status (AsyncGitStatusTracker).
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agentbay import AsyncFileSystem
+from agentbay._async.git import AsyncGit, AsyncGitStatusTracker
+from agentbay._common.exceptions import GitNotARepoError
+from agentbay._common.models.command import CommandResult
+from agentbay._common.models.filesystem import FileChangeEvent, FileChangeResult
+
+
+def _changes(*paths, success=True):
+    return FileChangeResult(
+        success=success,
+        events=[FileChangeEvent("modify", p, "file") for p in paths],
+        error_message="" if success else "tool not found",
+    )
+
+
+def _status(stdout):
+    return CommandResult(success=True, stdout=stdout, exit_code=0)
+
+
+class TestAsyncGitStatusTracker(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.session.command.execute_command = AsyncMock()
+        self.session._is_expired.return_value = False
+        self.session.ws_url = ""
+        self.session.file_system = AsyncFileSystem(self.session)
+        self.session.file_system._get_file_change = AsyncMock(return_value=_changes())
+        self.git = AsyncGit(self.session)
+        self.git._git_available = True
+
+    def _cmd(self, index=-1):
+        return self.session.command.execute_command.call_args_list[index][0][0]
+
+    async def _baseline(self):
+        self.session.command.execute_command.return_value = _status(
+            "## main\n M a.txt\n?? dir/new.txt\n"
+        )
+        return await self.git.status("/repo", incremental=True)
+
+    @pytest.mark.asyncio
+    async def test_first_call_is_full_scan(self):
+        result = await self._baseline()
+
+        self.assertEqual([f.path for f in result.files], ["a.txt", "dir/new.txt"])
+        self.assertEqual(result.current_branch, "main")
+        self.assertNotIn("'--'", self._cmd())
+        self.assertIn("'--no-optional-locks'", self._cmd())
+        self.assertIsInstance(self.git._status_trackers["/repo"], AsyncGitStatusTracker)
+
+    @pytest.mark.asyncio
+    async def test_no_changes_skips_git(self):
+        await self._baseline()
+
+        result = await self.git.status("/repo", incremental=True)
+
+        self.assertEqual(self.session.command.execute_command.call_count, 1)
+        self.assertEqual(len(result.files), 2)
+
+    @pytest.mark.asyncio
+    async def test_changed_paths_are_refreshed_with_pathspecs(self):
+        await self._baseline()
+        self.session.file_system._get_file_change.return_value = _changes(
+            "/repo/a.txt", "/repo/b.txt", "/elsewhere/x"
+        )
+        self.session.command.execute_command.return_value = _status("## main\n M b.txt\n")
+
+        result = await self.git.status("/repo", incremental=True)
+
+        self.assertTrue(self._cmd().endswith("'--' ':(literal)a.txt' ':(literal)b.txt'"))
+        self.assertEqual([f.path for f in result.files], ["b.txt", "dir/new.txt"])
+        tracker = self.git._status_trackers["/repo"]
+        self.assertEqual((tracker.full_scans, tracker.partial_scans), (1, 1))
+
+    @pytest.mark.asyncio
+    async def test_directory_change_drops_entries_below_it(self):
+        await self._baseline()
+        self.session.file_system._get_file_change.return_value = _changes("/repo/dir")
+        self.session.command.execute_command.return_value = _status("## main\n")
+
+        result = await self.git.status("/repo", incremental=True)
+
+        self.assertEqual([f.path for f in result.files], ["a.txt"])
+
+    @pytest.mark.asyncio
+    async def test_git_dir_change_forces_full_scan(self):
+        await self._baseline()
+        self.session.file_system._get_file_change.return_value = _changes("/repo/.git/HEAD")
+        self.session.command.execute_command.return_value = _status("## dev\n")
+
+        result = await self.git.status("/repo", incremental=True)
+
+        self.assertNotIn("'--'", self._cmd())
+        self.assertEqual(result.current_branch, "dev")
+        self.assertTrue(result.is_clean)
+
+    @pytest.mark.asyncio
+    async def test_overflow_and_feed_errors_force_full_scan(self):
+        await self._baseline()
+        self.git._status_trackers["/repo"].max_dirty_paths = 2
+        self.session.file_system._get_file_change.return_value = _changes(
+            "/repo/1", "/repo/2", "/repo/3"
+        )
+        self.session.command.execute_command.return_value = _status("## main\n")
+        await self.git.status("/repo", incremental=True)
+        self.assertNotIn("'--'", self._cmd())
+
+        self.session.file_system._get_file_change.return_value = _changes(success=False)
+        await self.git.status("/repo", incremental=True)
+        self.assertEqual(self.session.command.execute_command.call_count, 3)
+        self.assertEqual(self.git._status_trackers["/repo"].full_scans, 3)
+
+    @pytest.mark.asyncio
+    async def test_watch_and_incremental_status_share_the_feed(self):
+        await self._baseline()
+        fs = self.session.file_system
+        self.session.command.execute_command.return_value = _status("## main\n")
+
+        async with fs.watch("/repo", interval=0.01) as watch:
+            # The watch's poll must not take the change away from the tracker...
+            fs._get_file_change.return_value = _changes("/repo/a.txt")
+            batch = await watch.__anext__()
+            fs._get_file_change.return_value = _changes()
+            await self.git.status("/repo", incremental=True)
+            self.assertEqual([e.path for e in batch], ["/repo/a.txt"])
+            self.assertTrue(self._cmd().endswith("'--' ':(literal)a.txt'"))
+
+            # ...nor the tracker's poll from the watch.
+            fs._get_file_change.return_value = _changes("/repo/b.txt")
+            await self.git.status("/repo", incremental=True)
+            fs._get_file_change.return_value = _changes()
+            batch = await watch.__anext__()
+            self.assertTrue(self._cmd().endswith("'--' ':(literal)b.txt'"))
+            self.assertEqual([e.path for e in batch], ["/repo/b.txt"])
+
+        tracker = self.git._status_trackers["/repo"]
+        self.assertEqual((tracker.full_scans, tracker.partial_scans), (1, 2))
+
+    @pytest.mark.asyncio
+    async def test_watch_directory_thread_shares_the_feed(self):
+        await self._baseline()
+        seen = []
+        monitor = self.session.file_system.watch_directory("/repo", seen.extend, interval=0.01)
+        monitor.start()
+        await asyncio.to_thread(monitor.ready_event.wait, 5)
+
+        fs = self.session.file_system
+        fs._get_file_change.return_value = _changes("/repo/a.txt")
+        await self.git.status("/repo", incremental=True)
+        fs._get_file_change.return_value = _changes()
+        for _ in range(200):
+            if seen:
+                break
+            await asyncio.sleep(0.01)
+        monitor.stop_event.set()
+        await asyncio.to_thread(monitor.join, 5)
+
+        # Whichever of the two polled first, both saw the change.
+        self.assertTrue(self._cmd().endswith("'--' ':(literal)a.txt'"))
+        self.assertEqual({e.path for e in seen}, {"/repo/a.txt"})
+        tracker = self.git._status_trackers["/repo"]
+        self.assertEqual((tracker.full_scans, tracker.partial_scans), (1, 1))
+
+    @pytest.mark.asyncio
+    async def test_full_scan_on_demand(self):
+        await self._baseline()
+
+        await self.git.status("/repo", incremental=True, full_scan=True)
+
+        self.assertEqual(self.session.command.execute_command.call_count, 2)
+        self.assertNotIn("'--'", self._cmd())
+
+    @pytest.mark.asyncio
+    async def test_rename_refreshes_both_paths(self):
+        self.session.command.execute_command.return_value = _status("## main\nR  old.txt -> new.txt\n")
+        await self.git.status("/repo", incremental=True)
+        self.session.file_system._get_file_change.return_value = _changes("/repo/new.txt")
+
+        await self.git.status("/repo", incremental=True)
+
+        self.assertTrue(self._cmd().endswith("'--' ':(literal)new.txt' ':(literal)old.txt'"))
+
+    @pytest.mark.asyncio
+    async def test_git_errors_are_classified(self):
+        self.session.command.execute_command.return_value = CommandResult(
+            success=False, stderr="fatal: not a git repository", exit_code=128
+        )
+        with self.assertRaises(GitNotARepoError):
+            await self.git.status("/repo", incremental=True)
@@ -0,0 +1,77 @@
+"""
+Unit tests for request instrumentation hooks, driven through the offline mock backend.
+"""
+
+import unittest
+
+import pytest
+
+from agentbay import AsyncAgentBay, HistogramCollector, RequestHook, RetryPolicy
+from agentbay.testing import MockAgentBayServer
+
+
+class _Recorder(RequestHook):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, call):
+        self.events.append(("start", call.kind, call.name, call.route))
+
+    def on_request_end(self, call):
+        self.events.append(("end", call.kind, call.name, call.route))
+
+    def on_request_error(self, call, error):
+        self.events.append(("error", call.kind, call.name, call.error))
+
+
+class TestAsyncInstrumentation(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = MockAgentBayServer(seed=3).start()
+        self.agent_bay = AsyncAgentBay(
+            api_key="test-key",
+            cfg=self.server.config(),
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+        self.recorder = self.agent_bay.add_request_hook(_Recorder())
+
+    def tearDown(self):
+        self.server.stop()
+
+    @pytest.mark.asyncio
+    async def test_api_and_tool_calls_are_reported(self):
+        collector = self.agent_bay.add_request_hook(HistogramCollector())
+        session = (await self.agent_bay.create()).session
+
+        await session.command.execute_command("echo hi")
+
+        self.assertIn(("end", "api", "CreateMcpSession", ""), self.recorder.events)
+        self.assertIn(("start", "tool", "shell", "LinkUrl"), self.recorder.events)
+        self.assertIn(("end", "tool", "shell", "LinkUrl"), self.recorder.events)
+        rows = {(row["kind"], row["name"]): row for row in collector.snapshot()}
+        self.assertEqual(rows[("tool", "shell")]["count"], 1)
+        self.assertGreater(rows[("api", "CreateMcpSession")]["request_bytes"], 0)
+        self.assertGreater(collector.percentile("tool", "shell", 99), 0.0)
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported(self):
+        self.server.link_url_enabled = False
+        session = (await self.agent_bay.create()).session
+        self.server.set_fault("shell", error_rate=1.0, error_code="Throttling")
+        self.server.set_fault("RefreshSessionIdleTime", error_rate=1.0, http_status=200)
+
+        await session.command.execute_command("echo hi")
+        await session.keep_alive()
+
+        errors = [event for event in self.recorder.events if event[0] == "error"]
+        self.assertEqual([event[1:3] for event in errors], [("tool", "shell"), ("api", "RefreshSessionIdleTime")])
+        self.assertIn("Throttling", errors[0][3])
+
+    @pytest.mark.asyncio
+    async def test_removed_hook_sees_nothing(self):
+        self.assertTrue(self.agent_bay.remove_request_hook(self.recorder))
+        self.assertFalse(self.agent_bay.remove_request_hook(self.recorder))
+
+        await self.agent_bay.create()
+
+        self.assertEqual(self.recorder.events, [])
+        self.assertFalse(self.agent_bay.instrumentation.enabled)
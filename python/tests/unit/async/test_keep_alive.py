@@ -0,0 +1,166 @@
+"""
+Unit tests for the client-level keep-alive scheduler.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agentbay import AsyncKeepAliveScheduler, AsyncSession
+from agentbay._common.models.response import OperationResult
+
+
+def _session(session_id, idle_release_timeout=None, result=None):
+    session = MagicMock()
+    session.session_id = session_id
+    session.idle_release_timeout = idle_release_timeout
+    session.keep_alive = AsyncMock(
+        return_value=result or OperationResult(request_id="r", success=True)
+    )
+    return session
+
+
+def _force_due(scheduler):
+    """Make every scheduled refresh due now."""
+    scheduler._heap = [(0.0, seq, session_id) for _, seq, session_id in scheduler._heap]
+
+
+class TestAsyncKeepAliveScheduler(unittest.IsolatedAsyncioTestCase):
+    @pytest.mark.asyncio
+    async def test_due_sessions_are_refreshed_within_concurrency(self):
+        scheduler = AsyncKeepAliveScheduler(concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def _keep_alive():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return OperationResult(request_id="r", success=True)
+
+        sessions = [_session(f"s-{i}") for i in range(5)]
+        for session in sessions:
+            session.keep_alive = AsyncMock(side_effect=_keep_alive)
+            scheduler.register(session)
+
+        self.assertEqual(await scheduler.run_pending(), 0)
+        _force_due(scheduler)
+        self.assertEqual(await scheduler.run_pending(), 5)
+
+        self.assertLessEqual(peak, 2)
+        self.assertEqual(scheduler.refreshed, 5)
+        self.assertEqual(len(scheduler), 5)
+        self.assertEqual(await scheduler.run_pending(), 0)
+
+    @pytest.mark.asyncio
+    async def test_refresh_time_follows_idle_timeout_with_jitter(self):
+        scheduler = AsyncKeepAliveScheduler(refresh_ratio=0.5, jitter_ratio=0.2)
+        with patch("agentbay._async.keep_alive.random.random", side_effect=[0.0, 1.0]):
+            scheduler.register(_session("a", idle_release_timeout=100))
+            scheduler.register(_session("b"), idle_timeout=100)
+
+        due = sorted(d for d, _, _ in scheduler._heap)
+        self.assertAlmostEqual(due[1] - due[0], 10, delta=0.5)
+        self.assertAlmostEqual(scheduler.next_due_in(), 40, delta=0.5)
+
+    @pytest.mark.asyncio
+    async def test_gone_session_is_unregistered(self):
+        on_unregister = MagicMock()
+        scheduler = AsyncKeepAliveScheduler(on_unregister=on_unregister)
+        session = _session(
+            "s-1",
+            result=OperationResult(
+                request_id="r", success=False, error_message="[InvalidSession.NotFound] session not found"
+            ),
+        )
+        scheduler.register(session)
+        _force_due(scheduler)
+
+        await scheduler.run_pending()
+
+        self.assertNotIn("s-1", scheduler)
+        on_unregister.assert_called_once()
+        self.assertIs(on_unregister.call_args[0][0], session)
+        self.assertIsNone(scheduler.next_due_in())
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried_before_deadline(self):
+        scheduler = AsyncKeepAliveScheduler()
+        session = _session("s-1", idle_release_timeout=60)
+        session.keep_alive.side_effect = [RuntimeError("connection reset"), OperationResult(success=True)]
+        scheduler.register(session)
+        _force_due(scheduler)
+
+        await scheduler.run_pending()
+
+        self.assertIn("s-1", scheduler)
+        self.assertEqual(scheduler.failed, 1)
+        self.assertLessEqual(scheduler.next_due_in(), 2)
+
+        _force_due(scheduler)
+        await scheduler.run_pending()
+        self.assertEqual(scheduler.refreshed, 1)
+        self.assertGreater(scheduler.next_due_in(), 20)
+
+    @pytest.mark.asyncio
+    async def test_session_is_dropped_after_idle_deadline(self):
+        scheduler = AsyncKeepAliveScheduler()
+        session = _session("s-1", result=OperationResult(success=False, error_message="timeout"))
+        scheduler.register(session, idle_timeout=10)
+        scheduler._registrations["s-1"].last_success -= 11
+        _force_due(scheduler)
+
+        await scheduler.run_pending()
+
+        self.assertNotIn("s-1", scheduler)
+
+    @pytest.mark.asyncio
+    async def test_reregister_supersedes_old_schedule(self):
+        scheduler = AsyncKeepAliveScheduler()
+        session = _session("s-1")
+        scheduler.register(session, idle_timeout=10)
+        scheduler.register(session, idle_timeout=1000)
+
+        self.assertGreater(scheduler.next_due_in(), 300)
+        self.assertEqual(len(scheduler._heap), 1)
+
+    @pytest.mark.asyncio
+    async def test_session_delete_unregisters(self):
+        agent_bay = MagicMock()
+        agent_bay.api_key = "key"
+        agent_bay.keep_alive_scheduler = AsyncKeepAliveScheduler()
+        session = AsyncSession(agent_bay, "s-1")
+        agent_bay.keep_alive_scheduler.register(session)
+        response = MagicMock()
+        response.to_map.return_value = {"body": {"Success": True, "RequestId": "r"}}
+        agent_bay.client.delete_session_async_async = AsyncMock(return_value=response)
+        session.get_status = AsyncMock(
+            return_value=OperationResult(success=False, error_message="session not found")
+        )
+
+        result = await session.delete()
+
+        self.assertTrue(result.success)
+        self.assertNotIn("s-1", agent_bay.keep_alive_scheduler)
+
+    @pytest.mark.asyncio
+    async def test_run_until_stopped(self):
+        scheduler = AsyncKeepAliveScheduler()
+        session = _session("s-1")
+
+        async def _keep_alive():
+            scheduler.stop()
+            return OperationResult(request_id="r", success=True)
+
+        session.keep_alive.side_effect = _keep_alive
+        scheduler.register(session)
+        _force_due(scheduler)
+
+        await scheduler.run()
+
+        session.keep_alive.assert_called_once()
+        self.assertIn("s-1", scheduler)
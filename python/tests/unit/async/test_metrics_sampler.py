@@ -0,0 +1,138 @@
+"""
+Unit tests for the session metrics sampler.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from agentbay import AsyncMetricsSampler, SessionMetrics, SessionMetricsResult
+
+
+def _result(cpu=10.0, mem_used=100, success=True):
+    return SessionMetricsResult(
+        success=success,
+        metrics=SessionMetrics(cpu_used_pct=cpu, mem_used=mem_used, mem_total=1000) if success else None,
+        error_message="" if success else "tool failed",
+    )
+
+
+def _session(session_id, *results):
+    session = MagicMock()
+    session.session_id = session_id
+    session.get_metrics = AsyncMock(side_effect=list(results) or None, return_value=_result())
+    return session
+
+
+class TestAsyncMetricsSampler(unittest.IsolatedAsyncioTestCase):
+    @pytest.mark.asyncio
+    async def test_samples_sessions_within_concurrency(self):
+        sampler = AsyncMetricsSampler(concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        async def _get_metrics():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _result()
+
+        for i in range(4):
+            session = _session(f"s-{i}")
+            session.get_metrics.side_effect = _get_metrics
+            sampler.add(session)
+
+        self.assertEqual(await sampler.sample_once(), 4)
+        await sampler.sample_once()
+
+        self.assertLessEqual(peak, 2)
+        self.assertEqual(len(sampler.history("s-0")), 2)
+
+    @pytest.mark.asyncio
+    async def test_failed_samples_are_skipped(self):
+        sampler = AsyncMetricsSampler()
+        session = _session("s-1", _result(cpu=20.0), _result(success=False), RuntimeError("boom"))
+        sampler.add(session)
+
+        for _ in range(3):
+            await sampler.sample_once()
+
+        self.assertEqual(len(sampler.history("s-1")), 1)
+        self.assertEqual(sampler.errors, 2)
+        self.assertEqual(sampler.summary("s-1").cpu_max, 20.0)
+
+    @pytest.mark.asyncio
+    async def test_threshold_fires_on_crossing(self):
+        sampler = AsyncMetricsSampler()
+        callback = MagicMock()
+        sampler.on_threshold("mem_used_pct", 80, callback)
+        sampler.add(
+            _session(
+                "s-1",
+                _result(mem_used=500), _result(mem_used=900), _result(mem_used=950),
+                _result(mem_used=700), _result(mem_used=850),
+            )
+        )
+
+        for _ in range(5):
+            await sampler.sample_once()
+
+        self.assertEqual(callback.call_count, 2)
+        session_id, metric, value, sample = callback.call_args_list[0][0]
+        self.assertEqual((session_id, metric, value), ("s-1", "mem_used_pct", 90.0))
+        self.assertEqual(sample["mem_used"], 900)
+        with self.assertRaises(ValueError):
+            sampler.on_threshold("gpu", 1, callback)
+
+    @pytest.mark.asyncio
+    async def test_remove_stops_sampling(self):
+        sampler = AsyncMetricsSampler()
+        session = _session("s-1")
+        sampler.add(session)
+        await sampler.sample_once()
+
+        self.assertTrue(sampler.remove("s-1", keep_history=True))
+        await sampler.sample_once()
+
+        session.get_metrics.assert_called_once()
+        self.assertEqual(len(sampler.history("s-1")), 1)
+        sampler.remove("s-1")
+        self.assertIsNone(sampler.history("s-1"))
+
+    @pytest.mark.asyncio
+    async def test_export_formats(self):
+        sampler = AsyncMetricsSampler()
+        sampler.add(_session("s-1", _result(cpu=12.5, mem_used=2048)))
+        sampler.add(_session("s-2"))
+        sampler.remove("s-2")
+        await sampler.sample_once()
+
+        text = sampler.export()
+
+        self.assertIn("# TYPE agentbay_session_cpu_used_pct gauge", text)
+        self.assertIn('agentbay_session_cpu_used_pct{session_id="s-1"} 12.5', text)
+        self.assertIn('agentbay_session_mem_used_max{session_id="s-1"} 2048.0', text)
+        self.assertNotIn("s-2", text)
+        self.assertNotIn("# EOF", text)
+        self.assertTrue(sampler.export(openmetrics=True).endswith("# EOF\n"))
+
+    @pytest.mark.asyncio
+    async def test_run_until_stopped(self):
+        sampler = AsyncMetricsSampler(interval=0.01)
+        session = _session("s-1")
+
+        async def _get_metrics():
+            if session.get_metrics.call_count == 2:
+                sampler.stop()
+            return _result()
+
+        session.get_metrics.side_effect = _get_metrics
+        sampler.add(session)
+
+        await sampler.run()
+
+        self.assertEqual(len(sampler.history("s-1")), 2)
@@ -0,0 +1,116 @@
+"""
+Unit tests for the offline mock backend (agentbay.testing), driven through the SDK.
+"""
+
+import asyncio
+import time
+import unittest
+
+import pytest
+
+from agentbay import AsyncAgentBay, CreateSessionParams
+from agentbay.testing import MockAgentBayServer
+
+
+class TestAsyncMockBackend(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = MockAgentBayServer(seed=7).start()
+        self.agent_bay = AsyncAgentBay(api_key="test-key", cfg=self.server.config())
+
+    def tearDown(self):
+        self.server.stop()
+
+    async def _create(self, **kwargs):
+        result = await self.agent_bay.create(CreateSessionParams(**kwargs))
+        self.assertTrue(result.success, result.error_message)
+        return result.session
+
+    @pytest.mark.asyncio
+    async def test_session_lifecycle(self):
+        session = await self._create(labels={"team": "perf"})
+        await self._create(labels={"team": "other"})
+
+        listed = await self.agent_bay.list(labels={"team": "perf"})
+        self.assertEqual([s["sessionId"] for s in listed.session_ids], [session.session_id])
+        self.assertTrue((await session.keep_alive()).success)
+        self.assertTrue((await self.agent_bay.get(session.session_id)).success)
+
+        self.assertTrue((await session.delete()).success)
+        self.assertNotIn(session.session_id, self.server.sessions)
+        self.assertEqual(self.server.calls["CreateMcpSession"], 2)
+
+    @pytest.mark.asyncio
+    async def test_tools_over_link_url(self):
+        session = await self._create()
+
+        command = await session.command.execute_command("echo hello")
+        await session.file_system.write_file("/tmp/a.txt", "content")
+        read = await session.file_system.read_file("/tmp/a.txt")
+        metrics = await session.get_metrics()
+
+        self.assertEqual(command.stdout, "hello\n")
+        self.assertEqual(read.content, "content")
+        self.assertTrue(metrics.success)
+        self.assertEqual(self.server.calls["shell"], 1)
+        self.assertGreaterEqual(self.server.calls["CallMcpTool(LinkUrl)"], 4)
+        self.assertNotIn("CallMcpTool", self.server.calls)
+
+    @pytest.mark.asyncio
+    async def test_tools_over_openapi(self):
+        self.server.link_url_enabled = False
+        session = await self._create()
+
+        command = await session.command.execute_command("echo api")
+
+        self.assertEqual(command.stdout, "api\n")
+        self.assertEqual(self.server.calls["CallMcpTool"], 1)
+
+    @pytest.mark.asyncio
+    async def test_fault_injection(self):
+        session = await self._create()
+        self.server.set_fault("shell", error_rate=1.0, error_code="Throttling")
+        self.server.set_fault("RefreshSessionIdleTime", error_rate=1.0, http_status=200)
+        self.server.set_fault("write_file", payload_bytes=64)
+
+        command = await session.command.execute_command("echo hi")
+        keep_alive = await session.keep_alive()
+        write = await session.file_system.write_file("/tmp/a", "x")
+
+        self.assertFalse(command.success)
+        self.assertIn("Throttling", command.error_message)
+        self.assertFalse(keep_alive.success)
+        self.assertTrue(write.success)
+
+        self.server.clear_faults()
+        self.server.set_fault("CreateMcpSession", latency=0.2)
+        started = time.monotonic()
+        await self._create()
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+    @pytest.mark.asyncio
+    async def test_ws_calls_and_push(self):
+        session = await self._create()
+        self.server.register_ws_handler("echo_server", lambda s, data: [{"seen": data}, {"ok": True}])
+        ws_client = await session._get_ws_client()
+        events = []
+        pushed = []
+
+        handle = await ws_client.call_stream(
+            target="echo_server",
+            data={"n": 1},
+            on_event=lambda invocation_id, data: events.append(data),
+            on_end=None,
+            on_error=None,
+        )
+        end = await handle.wait_end_with_timeout(5)
+        ws_client.register_callback("notifier", pushed.append)
+        await asyncio.to_thread(self.server.push, session.session_id, "notifier", {"k": "v"})
+        for _ in range(50):
+            if pushed:
+                break
+            await asyncio.sleep(0.01)
+        await ws_client.close()
+
+        self.assertEqual(events, [{"phase": "event", "seen": {"n": 1}}])
+        self.assertEqual(end, {"phase": "end", "ok": True})
+        self.assertEqual(pushed[0]["data"], {"k": "v"})
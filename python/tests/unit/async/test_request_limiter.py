@@ -0,0 +1,49 @@
+"""
+Unit tests for client-side request limiting, driven through the offline mock backend.
+"""
+
+import unittest
+
+import pytest
+
+from agentbay import AsyncAgentBay, RetryPolicy
+from agentbay.testing import MockAgentBayServer
+
+
+class TestAsyncRequestLimiter(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = MockAgentBayServer(seed=5).start()
+        self.agent_bay = AsyncAgentBay(
+            api_key="test-key",
+            cfg=self.server.config(),
+            max_concurrency=8,
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _row(self, action):
+        return {row["action"]: row for row in self.agent_bay.request_limiter.snapshot()}[action]
+
+    @pytest.mark.asyncio
+    async def test_throttling_shrinks_cap(self):
+        session = (await self.agent_bay.create()).session
+        self.server.set_fault(
+            "RefreshSessionIdleTime", error_rate=1.0, error_code="Throttling", http_status=200
+        )
+
+        self.assertFalse((await session.keep_alive()).success)
+
+        self.assertEqual(self._row("RefreshSessionIdleTime")["limit"], 4)
+        self.assertEqual(self._row("RefreshSessionIdleTime")["overloaded"], 1)
+        self.assertEqual(self._row("CreateMcpSession")["limit"], 8)
+
+    @pytest.mark.asyncio
+    async def test_link_url_calls_are_limited(self):
+        session = (await self.agent_bay.create()).session
+
+        await session.command.execute_command("echo hi")
+
+        row = self._row("CallMcpTool(LinkUrl)")
+        self.assertEqual((row["calls"], row["in_flight"], row["overloaded"]), (1, 0, 0))
@@ -0,0 +1,147 @@
+"""
+Unit tests for the circuit breaker state machine and its registry.
+"""
+
+import time
+
+import pytest
+
+from agentbay import CircuitBreakerPolicy, CircuitOpenError
+from agentbay._common.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    circuit_breaker_of,
+)
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code=None, code=None):
+        super().__init__(code or status_code)
+        self.status_code = status_code
+        self.code = code
+
+
+def _breaker(**kwargs):
+    policy = CircuitBreakerPolicy(
+        **{"failure_threshold": 3, "reset_timeout": 60, **kwargs}
+    )
+    return CircuitBreaker("session:s-1", policy)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = _breaker()
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+        assert breaker.before_call() is False
+
+        breaker.record_failure()
+
+        assert breaker.state == STATE_OPEN
+        with pytest.raises(CircuitOpenError) as info:
+            breaker.before_call()
+        assert info.value.key == "session:s-1"
+        assert 0 < info.value.retry_after <= 60
+        assert breaker.snapshot()["rejected"] == 1
+
+    def test_timeouts_trip_sooner(self):
+        breaker = _breaker(timeout_threshold=2)
+        breaker.record_outcome(error=TimeoutError())
+        breaker.record_outcome(error=TimeoutError())
+        assert breaker.state == STATE_OPEN
+
+    def test_single_probe_after_reset_timeout(self):
+        breaker = _breaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+
+        assert breaker.before_call() is True
+        assert breaker.state == STATE_HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+        assert breaker.before_call() is False
+
+    def test_failed_probe_reopens(self):
+        breaker = _breaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.before_call() is True
+
+        breaker.record_failure()
+
+        assert breaker.state == STATE_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_abandoned_probe_is_replaced(self):
+        breaker = _breaker(failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        assert breaker.before_call() is True
+        time.sleep(0.06)
+        assert breaker.before_call() is True
+
+    def test_outcome_classification(self):
+        breaker = _breaker(failure_threshold=1)
+        breaker.record_outcome(429)
+        breaker.record_outcome(error=_StatusError(400, "Throttling.User"))
+        breaker.record_outcome(error=ValueError("bug"))
+        assert breaker.state == STATE_CLOSED
+        assert breaker.failures == 0
+
+        breaker.record_outcome(error=_StatusError(502))
+        assert breaker.state == STATE_OPEN
+
+        breaker = _breaker(failure_threshold=2)
+        breaker.record_outcome(503)
+        breaker.record_outcome(error=_StatusError(404, "NotFound"))
+        assert breaker.failures == 0
+
+
+class TestCircuitBreakerRegistry:
+    def test_snapshot_lists_open_circuits_first(self):
+        registry = CircuitBreakerRegistry(CircuitBreakerPolicy(failure_threshold=1))
+        registry.get("endpoint:a")
+        registry.get("session:z").record_failure()
+
+        rows = registry.snapshot()
+
+        assert [row["key"] for row in rows] == ["session:z", "endpoint:a"]
+        assert rows[0]["state"] == STATE_OPEN
+
+    def test_healthy_breakers_are_evicted(self, monkeypatch):
+        monkeypatch.setattr(CircuitBreakerRegistry, "MAX_IDLE_ENTRIES", 3)
+        registry = CircuitBreakerRegistry(CircuitBreakerPolicy(failure_threshold=1))
+        registry.get("session:dead").record_failure()
+        registry.get("session:a")
+        registry.get("session:b")
+
+        registry.get("session:c")
+
+        assert [row["key"] for row in registry.snapshot()] == [
+            "session:dead",
+            "session:c",
+        ]
+
+    def test_lookup_from_client(self):
+        class _Client:
+            circuit_breakers = CircuitBreakerRegistry()
+
+        assert circuit_breaker_of(
+            _Client(), "session:a"
+        ) is _Client.circuit_breakers.get("session:a")
+        assert circuit_breaker_of(object(), "session:a") is None
+        _Client.circuit_breakers = CircuitBreakerRegistry(
+            CircuitBreakerPolicy(failure_threshold=0)
+        )
+        assert circuit_breaker_of(_Client(), "session:a") is None
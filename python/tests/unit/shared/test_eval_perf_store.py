@@ -0,0 +1,134 @@
+"""
+Unit tests for the eval result store and regression comparison.
+"""
+
+import json
+
+import pytest
+
+from agentbay._async.eval.perf_store import (
+    EvalResultStore,
+    compare_runs,
+    current_revision,
+    main,
+    mann_whitney_greater,
+    percentile,
+    trend,
+)
+
+
+def _run(task_name, duration, success=True, trial=0):
+    return {
+        "task_name": task_name,
+        "trial": trial,
+        "result": {"_success": success},
+        "performance": {"task_duration_s": duration, "browser_setup_s": 1.0},
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return EvalResultStore(str(tmp_path / "results.jsonl"))
+
+
+class TestEvalResultStore:
+    def test_append_and_load_by_revision(self, store):
+        assert store.append([_run("arxiv", 10.0), _run("apple", 5.0, success=False)], "abc") == 2
+        store.append([_run("arxiv", 11.0)], "def")
+
+        assert [r["task_name"] for r in store.load("abc")] == ["arxiv", "apple"]
+        assert store.load("abc")[1]["success"] is False
+        assert store.load("def")[0]["task_duration_s"] == 11.0
+        assert store.revisions() == ["abc", "def"]
+
+    def test_missing_store_is_empty(self, store):
+        assert store.load() == []
+
+    def test_revision_override(self, monkeypatch):
+        monkeypatch.setenv("AGENTBAY_EVAL_REVISION", "nightly-42")
+        assert current_revision() == "nightly-42"
+
+
+class TestCompareRuns:
+    def test_significant_slowdown_is_flagged(self, store):
+        store.append([_run("arxiv", 10.0 + i * 0.1, trial=i) for i in range(8)], "base")
+        store.append([_run("arxiv", 13.0 + i * 0.1, trial=i) for i in range(8)], "cand")
+
+        (comparison,) = compare_runs(store.load("base"), store.load("cand"))
+
+        assert comparison.latency_regression
+        assert not comparison.success_regression
+        assert comparison.latency_ratio == pytest.approx(1.3, rel=0.01)
+        assert comparison.latency_p_value < 0.01
+
+    def test_noise_is_not_flagged(self, store):
+        store.append([_run("arxiv", d) for d in (10, 12, 11, 13, 10, 12)], "base")
+        store.append([_run("arxiv", d) for d in (11, 12, 10, 13, 12, 11)], "cand")
+
+        (comparison,) = compare_runs(store.load("base"), store.load("cand"))
+
+        assert not comparison.regression
+
+    def test_pass_rate_drop_is_flagged(self, store):
+        store.append([_run("apple", 5.0) for _ in range(20)], "base")
+        store.append([_run("apple", 5.0, success=i < 8) for i in range(20)], "cand")
+
+        (comparison,) = compare_runs(store.load("base"), store.load("cand"))
+
+        assert comparison.success_regression
+        assert comparison.candidate_success_rate == 40.0
+
+    def test_mann_whitney_direction(self):
+        assert mann_whitney_greater([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]) < 0.01
+        assert mann_whitney_greater([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) > 0.99
+        assert mann_whitney_greater([], [1.0]) == 1.0
+
+    def test_nearest_rank_percentile(self):
+        values = [float(v) for v in range(1, 11)]
+        assert [percentile(values, p) for p in (10, 50, 90, 95, 100)] == [1.0, 5.0, 9.0, 10.0, 10.0]
+        assert percentile([], 50) == 0.0
+
+
+class TestTrendAndCli:
+    def test_trend_per_revision(self, store):
+        store.append([_run("arxiv", 10.0), _run("arxiv", 12.0, success=False)], "r1")
+        store.append([_run("arxiv", 9.0), _run("apple", 3.0)], "r2")
+
+        rows = trend(store.load(), "arxiv")
+
+        assert rows == [
+            {"revision": "r1", "runs": 2, "median_task_duration_s": 11.0, "success_rate": 50.0},
+            {"revision": "r2", "runs": 1, "median_task_duration_s": 9.0, "success_rate": 100.0},
+        ]
+
+    def test_compare_exit_status(self, store, capsys):
+        store.append([_run("arxiv", 10.0 + i * 0.1) for i in range(8)], "base")
+        store.append([_run("arxiv", 20.0 + i * 0.1) for i in range(8)], "cand")
+
+        assert main(["--store", store.path, "compare", "--baseline", "base", "--json"]) == 1
+        (row,) = json.loads(capsys.readouterr().out)
+        assert row["latency_regression"] is True
+        assert main(["--store", store.path, "compare", "--baseline", "base", "--candidate", "base"]) == 0
+
+    def test_compare_unknown_revision_fails(self, store, capsys):
+        store.append([_run("arxiv", 10.0)], "base")
+
+        assert main(["--store", store.path, "compare", "--baseline", "typo"]) == 2
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert "no runs recorded for baseline revision 'typo'" in captured.err
+        assert main(["--store", store.path, "compare", "--baseline", "base", "--candidate", "typo"]) == 2
+
+    def test_compare_warns_about_one_sided_tasks(self, store, capsys):
+        store.append([_run("arxiv", 10.0), _run("github", 5.0)], "base")
+        store.append([_run("arxiv", 10.0), _run("maps", 7.0)], "cand")
+
+        assert main(["--store", store.path, "compare", "--baseline", "base", "--json"]) == 0
+        captured = capsys.readouterr()
+        assert [row["task_name"] for row in json.loads(captured.out)] == ["arxiv"]
+        assert "only in the baseline, not compared: github" in captured.err
+        assert "only in the candidate, not compared: maps" in captured.err
+
+        store.append([_run("maps", 7.0)], "other")
+        assert main(["--store", store.path, "compare", "--baseline", "base", "--candidate", "other"]) == 2
+        assert "no task in common" in capsys.readouterr().err
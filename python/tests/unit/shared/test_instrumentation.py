@@ -0,0 +1,146 @@
+"""
+Unit tests for the instrumentation dispatcher and its built-in hooks.
+"""
+
+import pytest
+
+from agentbay import HistogramCollector, Instrumentation, OpenTelemetryHook, RequestHook
+
+
+class _Failing(RequestHook):
+    def on_request_start(self, call):
+        raise ValueError("boom")
+
+
+class _Recorder(RequestHook):
+    def __init__(self):
+        self.errors = []
+        self.ended = []
+
+    def on_request_end(self, call):
+        self.ended.append(call)
+
+    def on_request_error(self, call, error):
+        self.errors.append((call.error, error))
+
+
+def _timed(instrumentation, name, duration, failed=False):
+    call = instrumentation.start("tool", name)
+    call.start_time -= duration
+    if failed:
+        instrumentation.fail(call, "failed")
+    else:
+        instrumentation.end(call)
+
+
+class TestInstrumentation:
+    def test_disabled_without_hooks(self):
+        instrumentation = Instrumentation()
+
+        call = instrumentation.start("api", "GetSession")
+        instrumentation.end(call)
+
+        assert call is None
+        assert not instrumentation.enabled
+
+    def test_hook_errors_are_isolated(self):
+        instrumentation = Instrumentation()
+        instrumentation.add_hook(_Failing())
+        recorder = instrumentation.add_hook(_Recorder())
+
+        call = instrumentation.start("api", "GetSession", session_id="s-1")
+        instrumentation.end(call, request_id="req-1", status_code=200)
+        instrumentation.fail(call, "ignored after end")
+
+        assert recorder.ended == [call]
+        assert call.request_id == "req-1"
+        assert recorder.errors == []
+
+    def test_fail_wraps_messages(self):
+        instrumentation = Instrumentation()
+        recorder = instrumentation.add_hook(_Recorder())
+
+        instrumentation.fail(instrumentation.start("api", "GetSession"), "NotFound")
+
+        (message, error), = recorder.errors
+        assert message == "NotFound"
+        assert isinstance(error, RuntimeError)
+
+
+class TestHistogramCollector:
+    def test_percentiles_within_bucket_error(self):
+        instrumentation = Instrumentation()
+        collector = instrumentation.add_hook(HistogramCollector())
+        for i in range(1, 101):
+            _timed(instrumentation, "shell", i / 100)
+        _timed(instrumentation, "read_file", 0.01, failed=True)
+
+        assert collector.percentile("tool", "shell", 50) == pytest.approx(0.5, rel=0.1)
+        assert collector.percentile("tool", "shell", 99) == pytest.approx(0.99, rel=0.1)
+        assert collector.percentile("tool", "missing", 99) == 0.0
+        shell, read_file = collector.snapshot()
+        assert (shell["name"], shell["count"], shell["errors"]) == ("shell", 100, 0)
+        assert shell["max_s"] == pytest.approx(1.0, rel=0.01)
+        assert (read_file["name"], read_file["errors"]) == ("read_file", 1)
+
+        collector.reset()
+        assert collector.snapshot() == []
+
+
+class _Span:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exceptions = []
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, error):
+        self.exceptions.append(error)
+
+    def set_status(self, status):
+        self.status = status
+
+    def end(self):
+        self.ended = True
+
+
+class _Tracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None, **kwargs):
+        span = _Span(name, attributes or {})
+        self.spans.append(span)
+        return span
+
+
+class TestOpenTelemetryHook:
+    def test_spans_carry_call_attributes(self):
+        tracer = _Tracer()
+        instrumentation = Instrumentation()
+        instrumentation.add_hook(OpenTelemetryHook(tracer=tracer))
+
+        call = instrumentation.start("tool", "shell", "LinkUrl", "s-1", request_bytes=12)
+        instrumentation.end(call, request_id="req-1", response_bytes=34)
+        instrumentation.fail(instrumentation.start("api", "GetSession"), "NotFound")
+
+        ok, failed = tracer.spans
+        assert ok.name == "tool shell" and ok.ended
+        assert ok.attributes["agentbay.route"] == "LinkUrl"
+        assert ok.attributes["agentbay.session_id"] == "s-1"
+        assert ok.attributes["agentbay.request_id"] == "req-1"
+        assert ok.attributes["agentbay.response_bytes"] == 34
+        assert failed.name == "api GetSession"
+        assert len(failed.exceptions) == 1
+
+    def test_requires_opentelemetry_without_tracer(self):
+        try:
+            import opentelemetry  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="opentelemetry-api"):
+                OpenTelemetryHook()
+        else:
+            pytest.skip("opentelemetry is installed")
@@ -0,0 +1,63 @@
+"""
+Unit tests for the session metrics ring buffer and its aggregates.
+"""
+
+import pytest
+
+from agentbay import SessionMetrics, SessionMetricsHistory
+
+
+def _metrics(cpu=0.0, mem_used=0, rx_used=0.0, **kwargs):
+    return SessionMetrics(
+        cpu_used_pct=cpu, mem_used=mem_used, mem_total=1000, rx_used_kbyte=rx_used, **kwargs
+    )
+
+
+class TestSessionMetricsHistory:
+    def test_oldest_samples_are_overwritten(self):
+        history = SessionMetricsHistory(capacity=3)
+        for i in range(5):
+            history.append(_metrics(cpu=float(i)), timestamp=100.0 + i)
+
+        assert len(history) == 3
+        assert history.values("cpu_used_pct") == [2.0, 3.0, 4.0]
+        assert history.timestamps() == [102.0, 103.0, 104.0]
+        assert history.latest()["cpu_used_pct"] == 4.0
+
+    def test_summary_aggregates(self):
+        history = SessionMetricsHistory(capacity=100)
+        for i in range(1, 21):
+            history.append(_metrics(cpu=float(i * 5), mem_used=i * 10, rx_used=float(i)), float(i))
+
+        summary = history.summary()
+
+        assert summary.samples == 20
+        assert summary.window_s == 19.0
+        assert summary.cpu_p50 == 50.0
+        assert summary.cpu_p95 == 95.0
+        assert summary.cpu_max == 100.0
+        assert summary.mem_used_max == 200
+        assert summary.mem_total == 1000
+        assert summary.rx_kbyte == 19.0
+
+    def test_counter_reset_is_not_negative(self):
+        history = SessionMetricsHistory()
+        for rx in (10.0, 30.0, 5.0, 15.0):
+            history.append(_metrics(rx_used=rx), 0.0)
+
+        assert history.summary().rx_kbyte == 20.0 + 5.0 + 10.0
+
+    def test_derived_percentages(self):
+        history = SessionMetricsHistory()
+        history.append(_metrics(mem_used=250, disk_used=0, disk_total=0), 0.0)
+
+        assert history.values("mem_used_pct") == [25.0]
+        assert history.latest()["disk_used_pct"] == 0.0
+        with pytest.raises(ValueError):
+            history.values("gpu")
+
+    def test_empty_history(self):
+        history = SessionMetricsHistory()
+
+        assert history.latest() is None
+        assert history.summary().samples == 0
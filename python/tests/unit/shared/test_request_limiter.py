@@ -0,0 +1,170 @@
+"""
+Unit tests for the per-action request limiter (token bucket + AIMD in-flight cap).
+"""
+
+import asyncio
+import threading
+import time
+
+from agentbay._async._internal.rate_limit import (
+    OUTCOME_FAILED,
+    OUTCOME_OVERLOADED,
+    RequestLimiter as AsyncRequestLimiter,
+)
+from agentbay._sync._internal.rate_limit import RequestLimiter
+from agentbay.api.instrumented_client import _error_outcome, _response_outcome
+
+
+def _row(limiter, action):
+    return {row["action"]: row for row in limiter.snapshot()}[action]
+
+
+class TestAimd:
+    def test_overload_halves_once_per_round_trip(self):
+        limiter = RequestLimiter(max_concurrency=16)
+        early = [limiter.acquire("CreateMcpSession") for _ in range(4)]
+
+        for started in early:
+            limiter.release("CreateMcpSession", started, OUTCOME_OVERLOADED)
+        late = limiter.acquire("CreateMcpSession")
+        limiter.release("CreateMcpSession", late, OUTCOME_OVERLOADED)
+
+        row = _row(limiter, "CreateMcpSession")
+        assert row["limit"] == 4
+        assert row["overloaded"] == 5
+        assert row["in_flight"] == 0
+
+    def test_success_grows_cap_back_and_failures_keep_it(self):
+        limiter = RequestLimiter(max_concurrency=4, min_concurrency=2)
+        for _ in range(3):
+            limiter.release("GetSession", limiter.acquire("GetSession"), OUTCOME_OVERLOADED)
+        assert _row(limiter, "GetSession")["limit"] == 2
+
+        limiter.release("GetSession", limiter.acquire("GetSession"), OUTCOME_FAILED)
+        assert _row(limiter, "GetSession")["limit"] == 2
+
+        for _ in range(10):
+            held = [limiter.acquire("GetSession") for _ in range(_row(limiter, "GetSession")["limit"])]
+            for started in held:
+                limiter.release("GetSession", started)
+        assert _row(limiter, "GetSession")["limit"] == 4
+
+    def test_rates_per_action_with_default(self):
+        limiter = RequestLimiter(rates={"CreateMcpSession": 100, "*": 1000})
+        start = time.monotonic()
+        # The bucket holds one second's worth of tokens; ten more take 0.1s.
+        for _ in range(110):
+            limiter.release("CreateMcpSession", limiter.acquire("CreateMcpSession"))
+        assert time.monotonic() - start >= 0.09
+        assert limiter._bucket("GetSession").rate == 1000
+
+
+class TestQueueing:
+    def test_threads_queue_behind_cap(self):
+        limiter = RequestLimiter(max_concurrency=2)
+        peak = []
+        lock = threading.Lock()
+        running = [0]
+
+        everyone_queued = threading.Event()
+
+        def _call():
+            started = limiter.acquire("CallMcpTool")
+            with lock:
+                running[0] += 1
+                peak.append(running[0])
+            # Hold the first slots until every other thread is queued, however slowly threads start.
+            everyone_queued.wait(5)
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            limiter.release("CallMcpTool", started)
+
+        threads = [threading.Thread(target=_call) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while sum(row["queued"] for row in limiter.snapshot()) < 4 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        everyone_queued.set()
+        for thread in threads:
+            thread.join(5)
+
+        row = _row(limiter, "CallMcpTool")
+        assert max(peak) == 2
+        assert row["calls"] == 6 and row["queued_calls"] >= 4
+        assert row["max_wait_s"] >= 0.02 and row["queued"] == 0
+
+    def test_tasks_queue_behind_cap(self):
+        async def _run():
+            limiter = AsyncRequestLimiter(max_concurrency=1)
+
+            async def _call():
+                started = await limiter.acquire("CallMcpTool")
+                await asyncio.sleep(0.01)
+                await limiter.release("CallMcpTool", started)
+
+            await asyncio.gather(*[_call() for _ in range(3)])
+            return _row(limiter, "CallMcpTool")
+
+        row = asyncio.run(_run())
+        assert (row["calls"], row["queued_calls"], row["max_queued"]) == (3, 2, 2)
+
+    def test_cancelled_waiter_leaves_queue(self):
+        async def _run():
+            limiter = AsyncRequestLimiter(max_concurrency=1)
+            started = await limiter.acquire("CallMcpTool")
+            waiter = asyncio.ensure_future(limiter.acquire("CallMcpTool"))
+            await asyncio.sleep(0.01)
+            assert _row(limiter, "CallMcpTool")["queued"] == 1
+
+            waiter.cancel()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                pass
+            queued = _row(limiter, "CallMcpTool")["queued"]
+            await limiter.release("CallMcpTool", started)
+            next_started = await asyncio.wait_for(limiter.acquire("CallMcpTool"), 1)
+            await limiter.release("CallMcpTool", next_started)
+            return queued, _row(limiter, "CallMcpTool")
+
+        queued, row = asyncio.run(_run())
+        assert queued == 0
+        assert (row["queued"], row["in_flight"], row["calls"]) == (0, 0, 2)
+
+    def test_limiter_is_reused_across_event_loops(self):
+        limiter = AsyncRequestLimiter(max_concurrency=1, rates={"*": 1000})
+
+        async def _run():
+            async def _call():
+                started = await limiter.acquire("CallMcpTool")
+                await asyncio.sleep(0.01)
+                await limiter.release("CallMcpTool", started)
+
+            await asyncio.wait_for(asyncio.gather(*[_call() for _ in range(3)]), 5)
+
+        # Each asyncio.run() creates a fresh loop; both must queue on the same limiter.
+        asyncio.run(_run())
+        asyncio.run(_run())
+
+        row = _row(limiter, "CallMcpTool")
+        assert (row["calls"], row["queued_calls"], row["in_flight"], row["queued"]) == (6, 4, 0, 0)
+
+
+class TestOutcomes:
+    def test_response_and_error_classification(self):
+        throttled = {"statusCode": 200, "body": {"Success": False, "Code": "Throttling.User"}}
+        not_found = {"statusCode": 200, "body": {"Success": False, "Code": "InvalidSession.NotFound"}}
+
+        class _Error(Exception):
+            def __init__(self, status_code=None, code=None):
+                self.status_code = status_code
+                self.code = code
+
+        assert _response_outcome(throttled) == OUTCOME_OVERLOADED
+        assert _response_outcome(not_found) == OUTCOME_FAILED
+        assert _response_outcome({"statusCode": 200, "body": {"Success": True}}) == "ok"
+        assert _error_outcome(_Error(status_code=503)) == OUTCOME_OVERLOADED
+        assert _error_outcome(_Error(code="Throttling")) == OUTCOME_OVERLOADED
+        assert _error_outcome(_Error(status_code=400, code="InvalidParameter")) == OUTCOME_FAILED
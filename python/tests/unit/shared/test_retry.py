@@ -0,0 +1,183 @@
+"""
+Unit tests for the retry engine: backoff, classification, deadlines and hedging.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agentbay import DeadlineExceededError, RetryPolicy, deadline
+from agentbay._common.retry import (
+    call_with_retry,
+    call_with_retry_async,
+    clamp_timeout,
+    is_idempotent,
+    is_transient_error,
+)
+
+FAST = RetryPolicy(max_attempts=4, initial_backoff=0.001, max_backoff=0.002)
+
+
+class _Flaky:
+    def __init__(self, failures, error=ConnectionError("reset")):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return "ok"
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code=None, code=None):
+        super().__init__(code or status_code)
+        self.status_code = status_code
+        self.code = code
+
+
+class TestClassification:
+    def test_idempotency(self):
+        assert is_idempotent("GetSession")
+        assert not is_idempotent("CreateMcpSession")
+        assert is_idempotent("CallMcpTool", "read_file")
+        assert not is_idempotent("CallMcpTool", "shell")
+
+    def test_transient_errors(self):
+        wrapped = RuntimeError("outer")
+        wrapped.__cause__ = _StatusError(status_code=503)
+
+        assert is_transient_error(ConnectionError())
+        assert is_transient_error(wrapped)
+        assert is_transient_error(_StatusError(code="Throttling.User"))
+        assert not is_transient_error(_StatusError(status_code=400, code="InvalidParameter"))
+        assert not is_transient_error(DeadlineExceededError())
+
+    def test_backoff_is_jittered_and_capped(self):
+        policy = RetryPolicy(initial_backoff=1.0, max_backoff=3.0)
+        samples = [policy.backoff(5) for _ in range(200)]
+        assert max(samples) <= 3.0
+        assert len(set(samples)) > 100
+
+
+class TestCallWithRetry:
+    def test_retries_transient_errors(self):
+        flaky = _Flaky(2)
+        assert call_with_retry(flaky, FAST) == "ok"
+        assert flaky.calls == 3
+
+    def test_gives_up_after_max_attempts(self):
+        flaky = _Flaky(10)
+        with pytest.raises(ConnectionError):
+            call_with_retry(flaky, FAST)
+        assert flaky.calls == 4
+
+    def test_permanent_errors_are_raised_at_once(self):
+        flaky = _Flaky(1, error=ValueError("bad"))
+        with pytest.raises(ValueError):
+            call_with_retry(flaky, FAST)
+        assert flaky.calls == 1
+
+    def test_retry_on_result_returns_last_result(self):
+        results = iter([503, 503, 200])
+        assert call_with_retry(lambda: next(results), FAST, retry_on_result=lambda r: r >= 500) == 200
+
+    def test_async_retries(self):
+        flaky = _Flaky(2)
+
+        async def _call():
+            return flaky()
+
+        assert asyncio.run(call_with_retry_async(_call, FAST)) == "ok"
+        assert flaky.calls == 3
+
+
+class TestDeadline:
+    def test_deadline_stops_retries(self):
+        flaky = _Flaky(100)
+        policy = RetryPolicy(max_attempts=100, initial_backoff=0.05, max_backoff=0.05)
+
+        start = time.monotonic()
+        with deadline(0.2):
+            with pytest.raises(ConnectionError):
+                call_with_retry(flaky, policy)
+
+        assert time.monotonic() - start < 0.3
+        assert 1 < flaky.calls < 100
+
+    def test_nested_deadline_only_shortens(self):
+        with deadline(0.5):
+            with deadline(10):
+                assert clamp_timeout(30) <= 0.5
+        assert clamp_timeout(30) == 30
+
+    def test_expired_deadline_raises(self):
+        with deadline(0):
+            with pytest.raises(DeadlineExceededError):
+                call_with_retry(lambda: "never", FAST)
+
+    def test_async_attempt_is_cancelled_at_deadline(self):
+        async def _slow():
+            await asyncio.sleep(5)
+
+        async def _run():
+            with deadline(0.05):
+                await call_with_retry_async(_slow, FAST)
+
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(_run())
+
+
+class TestHedging:
+    def test_sync_hedge_returns_first_answer(self):
+        calls = []
+        release = threading.Event()
+
+        def _read():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(2)
+                return "slow"
+            return "fast"
+
+        policy = RetryPolicy(hedge_delay=0.02)
+        assert call_with_retry(_read, policy, hedge=True) == "fast"
+        release.set()
+        assert len(calls) == 2
+
+    def test_async_hedge_cancels_loser(self):
+        cancelled = []
+        calls = []
+
+        async def _read():
+            calls.append(1)
+            if len(calls) == 1:
+                try:
+                    await asyncio.sleep(2)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+                return "slow"
+            return "fast"
+
+        async def _run():
+            result = await call_with_retry_async(_read, RetryPolicy(hedge_delay=0.02), hedge=True)
+            await asyncio.sleep(0)
+            return result
+
+        assert asyncio.run(_run()) == "fast"
+        assert cancelled == [True]
+
+    def test_no_hedge_when_primary_is_fast(self):
+        calls = []
+
+        def _read():
+            calls.append(1)
+            return "ok"
+
+        assert call_with_retry(_read, RetryPolicy(hedge_delay=0.5), hedge=True) == "ok"
+        assert len(calls) == 1
@@ -0,0 +1,176 @@
+"""
+Unit tests for the PageAgent eval runner: worker pool, ordering and perf report.
+"""
+
+import asyncio
+import csv
+import json
+import types
+
+import pytest
+
+# The runner imports PageAgent, which needs the eval-only dependencies (mcp, ...).
+run_page_evals = pytest.importorskip("agentbay._async.eval.run_page_evals")
+
+
+class _StubAgent:
+    """Stands in for PageAgent; records what the runner does with each session."""
+
+    instances = []
+    fail_initializations = 0
+    fail_contexts = 0
+
+    def __init__(self, enable_metrics=False):
+        self.index = len(_StubAgent.instances)
+        self.initialized = False
+        self.contexts = 0
+        self.closed = 0
+        _StubAgent.instances.append(self)
+
+    async def initialize(self):
+        if _StubAgent.fail_initializations:
+            _StubAgent.fail_initializations -= 1
+            raise RuntimeError("no session quota")
+        self.initialized = True
+
+    async def new_context(self):
+        if _StubAgent.fail_contexts:
+            _StubAgent.fail_contexts -= 1
+            raise RuntimeError("browser crashed")
+        self.contexts += 1
+
+    async def close(self):
+        self.closed += 1
+
+    def get_metrics(self):
+        return {"llm_duration_s": 0.0, "llm_call_count": 1}
+
+
+@pytest.fixture
+def started(monkeypatch):
+    """Patch in the stub agent and a task module; returns the (task, agent) start log."""
+    _StubAgent.instances = []
+    _StubAgent.fail_initializations = 0
+    _StubAgent.fail_contexts = 0
+    log = []
+
+    async def _run(agent, logger, config):
+        log.append((config["name"], agent.index))
+        # Later tasks finish first, so completion order differs from job order.
+        await asyncio.sleep(config["delay"])
+        return {"_success": True}
+
+    monkeypatch.setattr(run_page_evals, "PageAgent", _StubAgent)
+    monkeypatch.setattr(run_page_evals, "_load_task", lambda name: types.SimpleNamespace(run=_run))
+    return log
+
+
+def _configs(*names):
+    return [
+        {"name": name, "delay": 0.03 - i * 0.01}
+        for i, name in enumerate(names)
+    ]
+
+
+def _perf_run(task_name, duration, success=True, llm_s=0, setup_s=1.0):
+    return {
+        "task_name": task_name,
+        "trial": 0,
+        "result": {"_success": success},
+        "performance": {
+            "task_duration_s": duration,
+            "browser_setup_s": setup_s,
+            "llm_duration_s": llm_s,
+        },
+    }
+
+
+class TestRunTasks:
+    def test_workers_reuse_one_session_each(self, started):
+        results = asyncio.run(run_page_evals.run_tasks(_configs("a", "b", "c"), workers=2, trials=2))
+
+        assert len(results) == 6
+        assert len(_StubAgent.instances) == 2
+        assert all(a.initialized and a.closed == 1 for a in _StubAgent.instances)
+        assert sum(a.contexts for a in _StubAgent.instances) == 6
+        assert {agent for _, agent in started} == {0, 1}
+
+    def test_trials_are_interleaved(self, started):
+        asyncio.run(run_page_evals.run_tasks(_configs("a", "b"), workers=1, trials=2))
+
+        assert [task for task, _ in started] == ["a", "b", "a", "b"]
+
+    def test_results_ordered_by_trial_then_task(self, started):
+        results = asyncio.run(run_page_evals.run_tasks(_configs("a", "b", "c"), workers=3, trials=2))
+
+        assert [(r["task_name"], r["trial"]) for r in results] == [
+            ("a", 0), ("b", 0), ("c", 0), ("a", 1), ("b", 1), ("c", 1)
+        ]
+        assert all(r["result"]["_success"] for r in results)
+
+    def test_failed_session_setup_fails_its_task_only(self, started):
+        _StubAgent.fail_initializations = 1
+
+        results = asyncio.run(run_page_evals.run_tasks(_configs("a", "b"), workers=1))
+
+        failed, passed = results
+        assert failed["task_name"] == "a" and failed["performance"] == {}
+        assert failed["result"] == {"_success": False, "error": "Session setup failed: no session quota"}
+        assert passed["task_name"] == "b" and passed["result"]["_success"] is True
+        broken, replacement = _StubAgent.instances
+        assert broken.closed == 1 and broken.contexts == 0
+        assert replacement.initialized and replacement.closed == 1
+
+    def test_broken_pooled_browser_fails_its_task_only(self, started):
+        _StubAgent.fail_contexts = 1
+
+        results = asyncio.run(run_page_evals.run_tasks(_configs("a", "b", "c"), workers=1))
+
+        assert [r["result"]["_success"] for r in results] == [False, True, True]
+        assert results[0]["result"]["error"] == "Browser setup failed: browser crashed"
+        assert results[0]["performance"] == {}
+        broken, replacement = _StubAgent.instances
+        assert broken.closed == 1 and broken.contexts == 0
+        assert replacement.contexts == 2 and replacement.closed == 1
+
+
+class TestPerfReport:
+    def test_percentiles_and_llm_share(self):
+        runs = [_perf_run("arxiv", float(d), llm_s=d // 2) for d in range(10, 0, -1)]
+        runs.append(_perf_run("arxiv", 0.0, success=False))
+        runs[-1]["performance"] = {}
+
+        (row,) = run_page_evals.build_perf_report(runs)
+
+        assert (row["runs"], row["passed"], row["success_rate"]) == (11, 10, 90.9)
+        # Nearest rank over the ten timed runs; the setup failure has no timing.
+        assert (row["latency_p50_s"], row["latency_p90_s"], row["latency_p95_s"]) == (5.0, 9.0, 10.0)
+        assert (row["latency_max_s"], row["latency_mean_s"]) == (10.0, 5.5)
+        assert row["browser_setup_mean_s"] == 1.0
+        # sum(d // 2 for d in 1..10) = 25 of 55 seconds of task time.
+        assert row["llm_time_percentage"] == 45.5
+
+    def test_tasks_without_timings_report_zeros(self):
+        run = _perf_run("maps", 0.0, success=False)
+        run["performance"] = {}
+
+        (row,) = run_page_evals.build_perf_report([run])
+
+        assert row["latency_p50_s"] == row["latency_mean_s"] == row["llm_time_percentage"] == 0.0
+
+    def test_write_json_and_csv(self, tmp_path):
+        rows = run_page_evals.build_perf_report(
+            [_perf_run("arxiv", 2.0, llm_s=1), _perf_run("maps", 4.0)]
+        )
+        json_path, csv_path = tmp_path / "perf.json", tmp_path / "perf.csv"
+
+        run_page_evals.write_perf_report(rows, str(json_path), str(csv_path))
+
+        assert json.loads(json_path.read_text()) == {"tasks": rows}
+        with open(csv_path, newline="") as f:
+            reader = csv.DictReader(f)
+            assert tuple(reader.fieldnames) == run_page_evals._PERF_COLUMNS
+            assert [(r["task_name"], r["llm_time_percentage"]) for r in reader] == [
+                ("arxiv", "50.0"),
+                ("maps", "0.0"),
+            ]
@@ -0,0 +1,159 @@
+"""
+Unit tests for coalescing identical concurrent session reads and the opt-in
+read cache.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agentbay import AsyncAgentBay, RetryPolicy
+from agentbay._async._internal.single_flight import SingleFlight as AsyncSingleFlight
+from agentbay._sync._internal.single_flight import SingleFlight
+from agentbay.testing import MockAgentBayServer
+
+
+class _Result:
+    def __init__(self, success=True):
+        self.success = success
+
+
+class TestSingleFlight:
+    def test_concurrent_threads_share_one_call(self):
+        flight = SingleFlight()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return _Result()
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(flight.do(("get_status",), fetch))
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len(results) == 8 and all(r is results[0] for r in results)
+        # Nothing is kept once the call is over.
+        flight.do(("get_status",), fetch)
+        assert len(calls) == 2
+
+    def test_errors_are_shared(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            raise ConnectionError("reset")
+
+        async def run():
+            return await asyncio.gather(
+                *(flight.do(("info",), fetch) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        assert len(calls) == 1
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    def test_cancelled_leader_hands_over(self):
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return _Result()
+
+        async def run():
+            leader = asyncio.ensure_future(flight.do(("info",), fetch))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flight.do(("info",), fetch))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return await waiter
+
+        assert asyncio.run(run()).success
+        assert len(calls) == 2
+
+    def test_ttl_keeps_only_successful_results(self):
+        flight = SingleFlight({"get_screen_size": 60})
+        results = iter([_Result(False), _Result(), _Result()])
+
+        first = flight.do(("get_screen_size",), lambda: next(results))
+        second = flight.do(("get_screen_size",), lambda: next(results))
+        third = flight.do(("get_screen_size",), lambda: next(results))
+
+        assert not first.success
+        assert second is third
+        flight.invalidate("get_screen_size")
+        assert flight.do(("get_screen_size",), lambda: next(results)) is not second
+
+
+@pytest.fixture
+def server():
+    server = MockAgentBayServer(seed=17).start()
+    server.register_tool(
+        "get_screen_size",
+        lambda session, args: {"width": 1920, "height": 1080, "dpiScalingFactor": 1.0},
+    )
+    yield server
+    server.stop()
+
+
+def _agent_bay(server, **kwargs):
+    return AsyncAgentBay(
+        api_key="test-key",
+        cfg=server.config(),
+        retry_policy=RetryPolicy(max_attempts=1),
+        **kwargs,
+    )
+
+
+class TestSessionReads:
+    def test_concurrent_reads_are_coalesced(self, server):
+        async def run():
+            session = (await _agent_bay(server).create()).session
+            await session.file_system.write_file("/tmp/a.txt", "content")
+            server.set_fault("GetSessionDetail", latency=0.05)
+            server.set_fault("get_file_info", latency=0.05)
+
+            statuses = await asyncio.gather(*(session.get_status() for _ in range(5)))
+            infos = await asyncio.gather(
+                session.file_system.get_file_info("/tmp/a.txt"),
+                session.file_system.get_file_info(path="/tmp/a.txt"),
+                session.file_system.get_file_info("/tmp"),
+            )
+            return statuses, infos
+
+        statuses, infos = asyncio.run(run())
+
+        assert server.calls["GetSessionDetail"] == 1
+        assert all(s.success and s.status == "RUNNING" for s in statuses)
+        assert server.calls["get_file_info"] == 2
+        assert infos[0] is infos[1] and infos[2] is not infos[0]
+
+    def test_read_cache_is_opt_in(self, server):
+        async def run(agent_bay):
+            session = (await agent_bay.create()).session
+            for _ in range(3):
+                assert (await session.computer.get_screen_size()).data["width"] == 1920
+            session.invalidate_read_cache()
+            await session.computer.get_screen_size()
+
+        asyncio.run(run(_agent_bay(server)))
+        assert server.calls["get_screen_size"] == 4
+
+        asyncio.run(run(_agent_bay(server, read_cache_ttls={"get_screen_size": 60})))
+        assert server.calls["get_screen_size"] == 6
@@ -0,0 +1,34 @@
+"""
+Unit tests for running cells in several code contexts from the sync SDK.
+"""
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+from agentbay import Code, CommandResult
+
+
+def _reply(value):
+    stdout = json.dumps(
+        {"id": "e", "done": True, "stdout": "", "stderr": "", "offsets": [0, 0], "result": value, "error": None}
+    )
+    return CommandResult(request_id="req-1", success=True, output=stdout, exit_code=0, stdout=stdout)
+
+
+class TestSyncRunInContexts:
+    def test_cells_run_concurrently(self):
+        # Each cell only returns once the other one is in flight too.
+        both_running = threading.Barrier(2, timeout=2)
+
+        def _execute(script, timeout_ms=None):
+            both_running.wait()
+            return _reply("1" if "/kernels/a/" in script else "2")
+
+        session = MagicMock()
+        session.command.execute_command.side_effect = _execute
+
+        results = Code(session).run_in_contexts({"a": "1", "b": "2"})
+
+        assert {name: r.result for name, r in results.items()} == {"a": "1", "b": "2"}
+        assert all(r.success for r in results.values())
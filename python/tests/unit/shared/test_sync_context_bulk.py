@@ -0,0 +1,48 @@
+"""
+Unit tests for bulk context operations from the sync SDK.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+from agentbay import ContextService, ContextResult, OperationResult
+
+
+class TestSyncContextBulk:
+    def test_deletes_run_concurrently(self):
+        # Each deletion only returns once three others are in flight too.
+        all_running = threading.Barrier(4, timeout=2)
+
+        def _delete(context):
+            all_running.wait()
+            return OperationResult(success=True, data=True)
+
+        service = ContextService(MagicMock())
+        service.delete = MagicMock(side_effect=_delete)
+
+        result = service.delete_many([f"ctx-{i}" for i in range(8)], concurrency=4)
+
+        assert result.success
+        assert list(result.results) == [f"ctx-{i}" for i in range(8)]
+
+    def test_get_many_keeps_concurrency_bound(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = []
+
+        def _get(context_id=None, **kwargs):
+            with lock:
+                running[0] += 1
+                peak.append(running[0])
+            threading.Event().wait(0.01)
+            with lock:
+                running[0] -= 1
+            return ContextResult(success=True, context_id=context_id)
+
+        service = ContextService(MagicMock())
+        service.get = MagicMock(side_effect=_get)
+
+        result = service.get_many(context_ids=[f"ctx-{i}" for i in range(10)], concurrency=3)
+
+        assert result.success
+        assert max(peak) == 3
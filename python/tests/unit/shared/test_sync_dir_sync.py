@@ -0,0 +1,45 @@
+"""
+Unit tests for context.sync_dir() transfers from the sync SDK.
+"""
+
+import hashlib
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+from agentbay import ContextFileEntry, ContextFileListResult, ContextService, FileUrlResult
+from agentbay._sync._internal import dir_sync
+
+
+class TestSyncDirSyncThreads:
+    def test_downloads_run_concurrently(self, tmp_path):
+        names = [f"f{i}.txt" for i in range(4)]
+        # Each download only finishes once all four are in flight.
+        all_running = threading.Barrier(4, timeout=2)
+
+        def _get_file(client, url, path):
+            all_running.wait()
+            with open(path, "wb") as f:
+                f.write(b"x")
+            return 1, hashlib.sha256(b"x").hexdigest()
+
+        service = ContextService(MagicMock())
+        service.list_files = MagicMock(
+            return_value=ContextFileListResult(
+                success=True,
+                entries=[
+                    ContextFileEntry("", n, f"oss://bucket/ws/{n}", file_type="FILE", size=1, gmt_modified="t")
+                    for n in names
+                ],
+                count=len(names),
+            )
+        )
+        service.get_file_download_url = MagicMock(return_value=FileUrlResult(success=True, url="get:x"))
+
+        with patch.object(dir_sync, "_get_file", side_effect=_get_file):
+            result = service.sync_dir(str(tmp_path), "ctx-1", prefix="/ws", direction="download", concurrency=4)
+
+        assert result.success
+        assert sorted(result.downloaded) == names
+        assert result.bytes_transferred == 4
+        assert sorted(os.listdir(tmp_path)) == sorted(names + [dir_sync.DEFAULT_MANIFEST_NAME])
@@ -0,0 +1,46 @@
+"""
+Unit tests for the sync LinkCache used from several threads.
+"""
+
+import threading
+import time
+
+from agentbay._sync._internal.link_cache import LinkCache
+
+
+class TestSyncLinkCacheThreads:
+    def test_threads_share_one_fetch(self):
+        cache = LinkCache()
+        fetches = []
+        start = threading.Barrier(8)
+
+        def _fetch():
+            fetches.append(1)
+            time.sleep(0.05)
+            return "wss://cdp.example.com/x", "req-1"
+
+        def _lookup(urls):
+            start.wait()
+            urls.append(cache.get_or_fetch(("cdp",), _fetch).url)
+
+        urls = []
+        threads = [threading.Thread(target=_lookup, args=(urls,)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert len(fetches) == 1
+        assert urls == ["wss://cdp.example.com/x"] * 8
+
+    def test_invalidation_drops_key_locks(self):
+        cache = LinkCache()
+        for key in (("cdp",), ("adb", "pk"), ("link", 8080)):
+            cache.get_or_fetch(key, lambda: ("https://x", ""))
+
+        cache.invalidate_key(("cdp",))
+        assert set(cache._locks) == {("adb", "pk"), ("link", 8080)}
+        cache.invalidate("adb")
+        assert set(cache._locks) == {("link", 8080)}
+        cache.invalidate()
+        assert cache._locks == {}
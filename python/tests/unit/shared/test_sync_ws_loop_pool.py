@@ -0,0 +1,82 @@
+"""
+Unit tests for the shared event-loop threads behind the sync WsClient.
+"""
+
+import pytest
+
+from agentbay import AgentBay, set_ws_loop_threads
+from agentbay._sync._internal.ws_client import WsClient, get_ws_loop_pool
+from agentbay.testing import MockAgentBayServer
+
+
+@pytest.fixture(autouse=True)
+def _restore_pool_size():
+    size = get_ws_loop_pool().size
+    yield
+    set_ws_loop_threads(size)
+
+
+class TestWsLoopPool:
+    def test_clients_share_one_loop_thread(self):
+        set_ws_loop_threads(1)
+        clients = [WsClient("ws://127.0.0.1:1/ws", "t") for _ in range(5)]
+        for client in clients:
+            client._ensure_thread()
+
+        assert len({id(c._loop) for c in clients}) == 1
+        assert get_ws_loop_pool().client_counts() == {0: 5}
+
+        for client in clients:
+            client.close()
+        assert get_ws_loop_pool().client_counts() == {}
+
+    def test_pool_spreads_clients_and_stops_idle_threads(self):
+        set_ws_loop_threads(2)
+        clients = [WsClient("ws://127.0.0.1:1/ws", "t") for _ in range(4)]
+        for client in clients:
+            client._ensure_thread()
+
+        assert get_ws_loop_pool().client_counts() == {0: 2, 1: 2}
+        threads = {c._loop_thread.thread for c in clients}
+        assert len(threads) == 2
+
+        clients[0].close()
+        clients[0].close()
+        clients[2].close()
+        assert get_ws_loop_pool().client_counts() == {1: 2}
+        clients[1].close()
+        clients[3].close()
+        for thread in threads:
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+    def test_closed_client_cannot_be_reused(self):
+        client = WsClient("ws://127.0.0.1:1/ws", "t")
+        client.close()
+
+        with pytest.raises(Exception):
+            client._ensure_thread()
+
+    def test_sessions_stream_over_shared_loop(self):
+        set_ws_loop_threads(1)
+        with MockAgentBayServer() as server:
+            server.register_ws_handler("echo", lambda session, data: [data])
+            agent_bay = AgentBay(api_key="test-key", cfg=server.config())
+            sessions = [agent_bay.create().session for _ in range(3)]
+
+            ends = []
+            for session in sessions:
+                handle = session._get_ws_client().call_stream(
+                    target="echo",
+                    data={"id": session.session_id},
+                    on_event=None,
+                    on_end=None,
+                    on_error=None,
+                )
+                ends.append(handle.wait_end_with_timeout(5))
+
+            assert [e["id"] for e in ends] == [s.session_id for s in sessions]
+            assert len({s._get_ws_client()._loop for s in sessions}) == 1
+            for session in sessions:
+                assert session.delete().success
+            assert get_ws_loop_pool().client_counts() == {}
@@ -0,0 +1,72 @@
+"""
+Unit tests for the per-image MCP tool list cache.
+"""
+
+import json
+
+from agentbay._common.models.mcp_tool import McpTool
+from agentbay._common.tool_list_cache import ToolListCache, tool_list_cache_of
+
+TOOLS = [
+    McpTool(name="shell", server="wuying_shell"),
+    McpTool(name="read_file", server="fs"),
+]
+
+
+class TestToolListCache:
+    def test_hit_returns_copies(self):
+        cache = ToolListCache()
+        cache.put("linux_latest", TOOLS, "req-1")
+
+        tools, request_id = cache.lookup("linux_latest")
+
+        assert tools == TOOLS and tools[0] is not TOOLS[0]
+        assert request_id == "req-1"
+        assert cache.get("other") == []
+        assert cache.get(None) == []
+
+    def test_entries_expire(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(
+            "agentbay._common.tool_list_cache.time.time", lambda: now[0]
+        )
+        cache = ToolListCache(ttl_s=60)
+        cache.put("linux_latest", TOOLS)
+
+        now[0] += 59
+        assert cache.get("linux_latest") == TOOLS
+        now[0] += 1
+        assert cache.get("linux_latest") == []
+
+    def test_empty_lists_and_disabled_cache_store_nothing(self):
+        cache = ToolListCache()
+        cache.put("linux_latest", [])
+        assert cache.lookup("linux_latest") is None
+
+        disabled = ToolListCache(ttl_s=0)
+        disabled.put("linux_latest", TOOLS)
+        assert disabled.lookup("linux_latest") is None
+
+        class _Client:
+            tool_list_cache = disabled
+
+        assert tool_list_cache_of(_Client()) is None
+        assert tool_list_cache_of(object()) is None
+
+    def test_persisted_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache" / "tools.json")
+        ToolListCache(path=path).put("linux_latest", TOOLS, "req-1")
+
+        reloaded = ToolListCache(path=path)
+
+        assert reloaded.lookup("linux_latest") == (TOOLS, "req-1")
+        reloaded.invalidate("linux_latest")
+        assert ToolListCache(path=path).lookup("linux_latest") is None
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        path = tmp_path / "tools.json"
+        path.write_text("{not json")
+        assert ToolListCache(path=str(path)).lookup("linux_latest") is None
+
+        path.write_text(json.dumps({"version": 1, "images": {"a": {"tools": "x"}}}))
+        assert ToolListCache(path=str(path)).lookup("a") is None
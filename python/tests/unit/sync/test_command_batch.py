@@ -0,0 +1,148 @@
+"""
+Unit tests for command.execute_many and the modules built on it.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentbay import Command, BatchCommandResult, CommandResult, MobileExtraConfig
+from agentbay._sync.command import _build_batch_script, _parse_batch_output
+from agentbay._sync.mobile import Mobile
+
+
+def _section(nonce, i, status, stdout="", stderr=""):
+    return (
+        f"\n__AGENTBAY_BATCH_{nonce}_{i}__\n{status}\n"
+        f"__AGENTBAY_BATCH_{nonce}_OUT__\n{stdout}"
+        f"\n__AGENTBAY_BATCH_{nonce}_ERR__\n{stderr}"
+    )
+
+
+class TestBatchScript(unittest.TestCase):
+    def test_sequential_script_quotes_commands(self):
+        script = _build_batch_script(["echo 'a'", "ls"], [None, 1500], "n1", False, False)
+        self.assertIn("sh -c 'echo '\"'\"'a'\"'\"''", script)
+        self.assertIn("timeout 1.5 sh -c ls", script)
+        self.assertNotIn("&\n", script)
+        self.assertTrue(script.endswith('rm -rf "$d"'))
+
+    def test_parallel_script_waits(self):
+        script = _build_batch_script(["a", "b"], [None, None], "n1", True, True)
+        self.assertEqual(script.count("} &"), 2)
+        self.assertIn("\nwait\n", script)
+        self.assertNotIn('"$ok" = 1', script)
+
+    def test_stop_on_error_guards_each_command(self):
+        script = _build_batch_script(["a", "b"], [None, None], "n1", False, True)
+        self.assertEqual(script.count('if [ "$ok" = 1 ]'), 2)
+
+    def test_parse_sections(self):
+        output = (
+            _section("n1", 0, "0", "line\n", "")
+            + _section("n1", 1, "3", "", "bad\n")
+            + _section("n1", 2, "124")
+            + _section("n1", 3, "skipped")
+        )
+        results = _parse_batch_output(output, 4, "n1", [None, None, 200, None], "req")
+
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].stdout, "line\n")
+        self.assertEqual(results[1].exit_code, 3)
+        self.assertEqual(results[1].stderr, "bad\n")
+        self.assertEqual(results[1].error_message, "bad\n")
+        self.assertIn("timed out after 200ms", results[2].error_message)
+        self.assertEqual(results[3].exit_code, -1)
+        self.assertIn("Skipped", results[3].error_message)
+        self.assertTrue(all(r.request_id == "req" for r in results))
+
+    def test_parse_missing_section_raises(self):
+        with self.assertRaises(ValueError):
+            _parse_batch_output(_section("n1", 0, "0"), 2, "n1", [None, None])
+
+
+class TestExecuteMany(unittest.TestCase):
+    def setUp(self):
+        self.command = Command(MagicMock())
+        self.command.execute_command = MagicMock()
+
+    def _reply_with(self, *sections):
+        def _execute(script, **kwargs):
+            nonce = script.split("__AGENTBAY_BATCH_")[1].split("_")[0]
+            output = "".join(_section(nonce, i, *sec) for i, sec in enumerate(sections))
+            return CommandResult(request_id="req-1", success=True, output=output, stdout=output)
+
+        self.command.execute_command.side_effect = _execute
+
+    @pytest.mark.sync
+    def test_single_round_trip_with_per_command_results(self):
+        self._reply_with(("0", "a\n"), ("2", "", "err\n"))
+
+        batch = self.command.execute_many(
+            ["echo a", "false"], timeout_ms=9000, cwd="/w", envs={"K": "V"}, parallel=True
+        )
+
+        self.assertIsInstance(batch, BatchCommandResult)
+        self.assertFalse(batch.success)
+        self.assertEqual([r.exit_code for r in batch.results], [0, 2])
+        self.assertEqual(batch.results[0].stdout, "a\n")
+        self.assertIn("1 of 2", batch.error_message)
+        self.command.execute_command.assert_called_once()
+        kwargs = self.command.execute_command.call_args[1]
+        self.assertEqual(kwargs, {"timeout_ms": 9000, "cwd": "/w", "envs": {"K": "V"}})
+
+    @pytest.mark.sync
+    def test_all_success(self):
+        self._reply_with(("0",), ("0",))
+        batch = self.command.execute_many(["true", "true"], command_timeout_ms=1000)
+        self.assertTrue(batch.success)
+        self.assertEqual(batch.error_message, "")
+        self.assertIn("timeout 1 sh -c true", self.command.execute_command.call_args[0][0])
+
+    @pytest.mark.sync
+    def test_empty_and_invalid_timeouts(self):
+        batch = self.command.execute_many([])
+        self.assertTrue(batch.success)
+        self.command.execute_command.assert_not_called()
+        with self.assertRaises(ValueError):
+            self.command.execute_many(["a", "b"], command_timeout_ms=[1000])
+
+    @pytest.mark.sync
+    def test_transport_failure_returns_failed_batch(self):
+        self.command.execute_command.return_value = CommandResult(
+            request_id="req-2", success=False, error_message="session not found"
+        )
+        batch = self.command.execute_many(["a"])
+        self.assertFalse(batch.success)
+        self.assertEqual(batch.results, [])
+        self.assertEqual(batch.error_message, "session not found")
+
+
+class TestMobileConfigureBatch(unittest.TestCase):
+    @pytest.mark.sync
+    def test_configure_applies_all_settings_in_one_call(self):
+        session = MagicMock()
+        session.command.execute_command = MagicMock()
+        session.command.execute_many = MagicMock(
+            return_value=BatchCommandResult(
+                success=True,
+                results=[CommandResult(success=True) for _ in range(3)],
+            )
+        )
+        mobile = Mobile(session)
+
+        mobile.configure(
+            MobileExtraConfig(
+                lock_resolution=True,
+                hide_navigation_bar=True,
+                uninstall_blacklist=["com.example.app"],
+            )
+        )
+
+        session.command.execute_command.assert_not_called()
+        commands = session.command.execute_many.call_args[0][0]
+        self.assertEqual(len(commands), 3)
+        self.assertIn("setprop sys.wuying.lockres 1", commands[0])
+        self.assertIn("persist.wy.hasnavibar false", commands[1])
+        self.assertIn("com.example.app", commands[2])
@@ -0,0 +1,138 @@
+"""
+Unit tests for bulk context operations (delete_many, get_many, clear_many) and the
+token bucket behind the client's request limiter.
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentbay import ContextService, ContextBatchResult
+from agentbay._sync._internal.rate_limit import TokenBucket
+from agentbay._sync.context import ClearContextResult, Context, ContextResult
+from agentbay._common.exceptions import AgentBayError
+from agentbay._common.models.response import OperationResult
+
+
+class TestTokenBucket(unittest.TestCase):
+    @pytest.mark.sync
+    def test_acquire_waits_for_refill(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+        self.assertGreaterEqual(elapsed, 0.07)
+
+    @pytest.mark.sync
+    def test_unlimited_bucket_never_waits(self):
+        bucket = TokenBucket(rate=None)
+        start = time.monotonic()
+        for _ in range(100):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.05)
+
+
+class TestContextBulkOperations(unittest.TestCase):
+    def setUp(self):
+        self.service = ContextService(MagicMock())
+
+    @pytest.mark.sync
+    def test_delete_many_reports_each_item(self):
+        def _delete(context):
+            if context.id == "ctx-bad":
+                raise AgentBayError("boom")
+            return OperationResult(request_id=f"req-{context.id}", success=True, data=True)
+
+        self.service.delete = MagicMock(side_effect=_delete)
+        seen = []
+
+        result = self.service.delete_many(
+            [Context(id="ctx-1", name="one"), "ctx-2", "ctx-bad", "ctx-2"],
+            on_result=lambda key, r: seen.append((key, r.success)),
+        )
+
+        self.assertIsInstance(result, ContextBatchResult)
+        self.assertFalse(result.success)
+        self.assertEqual(list(result.results), ["ctx-1", "ctx-2", "ctx-bad"])
+        self.assertEqual(result.failed, ["ctx-bad"])
+        self.assertIn("boom", result.results["ctx-bad"].error_message)
+        self.assertEqual(sorted(seen), [("ctx-1", True), ("ctx-2", True), ("ctx-bad", False)])
+        self.assertEqual(self.service.delete.call_count, 3)
+
+    @pytest.mark.sync
+    def test_get_many_by_id_and_name(self):
+        def _get(name=None, create=False, context_id=None):
+            key = context_id or name
+            return ContextResult(success=True, context_id=context_id or f"id-{name}", context=Context(id=key, name=key))
+
+        self.service.get = MagicMock(side_effect=_get)
+
+        result = self.service.get_many(context_ids=["ctx-1"], names=["alpha"], create=True)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.results["alpha"].context_id, "id-alpha")
+        self.service.get.assert_any_call(name="alpha", create=True)
+        self.service.get.assert_any_call(context_id="ctx-1")
+
+    @pytest.mark.sync
+    def test_clear_many_shares_one_polling_loop(self):
+        rounds_until_done = {"ctx-1": 1, "ctx-2": 3}
+        polls = {"ctx-1": 0, "ctx-2": 0}
+
+        def _status(context_id):
+            polls[context_id] += 1
+            done = polls[context_id] >= rounds_until_done[context_id]
+            return ClearContextResult(success=True, context_id=context_id, status="available" if done else "clearing")
+
+        self.service.clear_async = MagicMock(
+            side_effect=lambda cid: ClearContextResult(request_id=f"req-{cid}", success=True, context_id=cid, status="clearing")
+        )
+        self.service.get_clear_status = MagicMock(side_effect=_status)
+        completed = []
+
+        result = self.service.clear_many(
+            ["ctx-1", "ctx-2"], timeout=5, poll_interval=0.01,
+            on_result=lambda key, r: completed.append(key),
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(completed, ["ctx-1", "ctx-2"])
+        self.assertEqual(polls, {"ctx-1": 1, "ctx-2": 3})
+        self.assertEqual(result.results["ctx-2"].status, "available")
+        self.assertEqual(result.results["ctx-2"].request_id, "req-ctx-2")
+
+    @pytest.mark.sync
+    def test_clear_many_reports_start_failures_and_timeouts(self):
+        def _start(context_id):
+            if context_id == "ctx-bad":
+                return ClearContextResult(success=False, error_message="[NotFound] no such context")
+            return ClearContextResult(success=True, context_id=context_id, status="clearing")
+
+        self.service.clear_async = MagicMock(side_effect=_start)
+        self.service.get_clear_status = MagicMock(
+            return_value=ClearContextResult(success=True, status="clearing")
+        )
+
+        result = self.service.clear_many(
+            ["ctx-slow", "ctx-bad"], timeout=0.05, poll_interval=0.01
+        )
+
+        self.assertFalse(result.success)
+        self.assertEqual(sorted(result.failed), ["ctx-bad", "ctx-slow"])
+        self.assertIn("timed out", result.results["ctx-slow"].error_message)
+        self.assertEqual(result.results["ctx-slow"].status, "clearing")
+        self.assertIn("NotFound", result.results["ctx-bad"].error_message)
+
+    @pytest.mark.sync
+    def test_bulk_calls_add_no_rate_limit_of_their_own(self):
+        # Rates are the client's RequestLimiter's job; a bulk call only bounds concurrency.
+        self.service.delete = MagicMock(return_value=OperationResult(success=True, data=True))
+        start = time.monotonic()
+
+        result = self.service.delete_many([f"ctx-{i}" for i in range(60)], concurrency=60)
+
+        self.assertTrue(result.success)
+        self.assertLess(time.monotonic() - start, 1.0)
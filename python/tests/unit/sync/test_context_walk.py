@@ -0,0 +1,123 @@
+import time
+"""
+Unit tests for context.walk().
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentbay import ContextService
+from agentbay._sync.context import ContextFileEntry, ContextFileListResult
+from agentbay._common.exceptions import AgentBayError
+
+TREE = {
+    "/": ["a.txt", "docs/", "logs/"],
+    "/docs": ["d1.md", "d2.md", "d3.md", "d4.md", "d5.md", "img/"],
+    "/docs/img": ["p.png"],
+    "/logs": ["l.log"],
+}
+
+
+def _list_files_from(tree, with_count=True):
+    def _list_files(context_id, parent_folder_path, page_number=1, page_size=50):
+        names = tree[parent_folder_path]
+        page = names[(page_number - 1) * page_size:page_number * page_size]
+        entries = [
+            ContextFileEntry(
+                file_id="",
+                file_name=name.rstrip("/"),
+                file_path=f"oss://bucket{parent_folder_path.rstrip('/')}/{name}",
+                file_type="FOLDER" if name.endswith("/") else "FILE",
+                size=None if name.endswith("/") else 10,
+            )
+            for name in page
+        ]
+        return ContextFileListResult(
+            success=True, entries=entries, count=len(names) if with_count else None
+        )
+
+    return _list_files
+
+
+class TestContextWalk(unittest.TestCase):
+    def setUp(self):
+        self.service = ContextService(MagicMock())
+        self.service.list_files = MagicMock(side_effect=_list_files_from(TREE))
+
+    def _paths(self, **kwargs):
+        return sorted([e.logical_path for e in self.service.walk("ctx-1", **kwargs)])
+
+    @pytest.mark.sync
+    def test_walk_yields_whole_tree(self):
+        paths = self._paths(page_size=2)
+
+        self.assertEqual(
+            paths,
+            [
+                "/a.txt", "/docs", "/docs/d1.md", "/docs/d2.md", "/docs/d3.md",
+                "/docs/d4.md", "/docs/d5.md", "/docs/img", "/docs/img/p.png",
+                "/logs", "/logs/l.log",
+            ],
+        )
+        calls = [(c.args[1], c.kwargs["page_number"]) for c in self.service.list_files.call_args_list]
+        self.assertEqual(
+            sorted(calls),
+            [("/", 1), ("/", 2), ("/docs", 1), ("/docs", 2), ("/docs", 3), ("/docs/img", 1), ("/logs", 1)],
+        )
+
+    @pytest.mark.sync
+    def test_walk_sets_parent_folder_and_folder_flag(self):
+        entries = [e for e in self.service.walk("ctx-1", root="/docs", max_depth=0)]
+
+        img = [e for e in entries if e.file_name == "img"][0]
+        self.assertTrue(img.is_folder)
+        self.assertEqual(img.parent_folder_path, "/docs")
+        self.assertEqual(img.file_path, "oss://bucket/docs/img/")
+        self.assertEqual(len(entries), 6)
+
+    @pytest.mark.sync
+    def test_walk_max_depth_and_filters(self):
+        self.assertEqual(self._paths(max_depth=0), ["/a.txt", "/docs", "/logs"])
+        files = self._paths(entry_filter=lambda e: not e.is_folder, folder_filter=lambda e: e.file_name != "docs")
+        self.assertEqual(files, ["/a.txt", "/logs/l.log"])
+
+    @pytest.mark.sync
+    def test_walk_pages_sequentially_without_count(self):
+        self.service.list_files = MagicMock(side_effect=_list_files_from(TREE, with_count=False))
+
+        paths = self._paths(root="/docs", page_size=2, max_depth=0)
+
+        self.assertEqual(len(paths), 6)
+        pages = [c.kwargs["page_number"] for c in self.service.list_files.call_args_list]
+        self.assertEqual(pages, [1, 2, 3, 4])
+
+    @pytest.mark.sync
+    def test_walk_yields_pages_as_they_arrive(self):
+        list_files = _list_files_from(TREE)
+        yielded = []
+
+        def _slow_docs(context_id, parent_folder_path, page_number=1, page_size=50):
+            if parent_folder_path == "/docs":
+                # Hold /docs back until /logs, listed alongside it, has been yielded.
+                for _ in range(200):
+                    if "/logs/l.log" in yielded:
+                        break
+                    time.sleep(0.01)
+            return list_files(context_id, parent_folder_path, page_number, page_size)
+
+        self.service.list_files = MagicMock(side_effect=_slow_docs)
+
+        for entry in self.service.walk("ctx-1"):
+            yielded.append(entry.logical_path)
+
+        self.assertLess(yielded.index("/logs/l.log"), yielded.index("/docs/d1.md"))
+        self.assertEqual(len(yielded), 11)
+
+    @pytest.mark.sync
+    def test_walk_raises_when_listing_fails(self):
+        self.service.list_files = MagicMock(return_value=ContextFileListResult(success=False))
+
+        with self.assertRaises(AgentBayError):
+            [e for e in self.service.walk("ctx-1")]
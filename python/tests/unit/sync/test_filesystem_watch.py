@@ -0,0 +1,260 @@
+import time
+"""
+Unit tests for file_system.watch() and the shared file change feed behind it.
+"""
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentbay import FileSystem, FileChangeEvent, FileChangeResult
+
+
+def _changes(*events):
+    return FileChangeResult(
+        success=True,
+        events=[FileChangeEvent(kind, path, "file") for kind, path in events],
+    )
+
+
+def _session(push=False):
+    session = MagicMock()
+    session._is_expired.return_value = False
+    session.ws_url = "wss://ws.example.com" if push else ""
+    session.token = "tok" if push else ""
+    session.mcpTools = [SimpleNamespace(name="get_file_change", server="fs-server")]
+    return session
+
+
+class FakeWsClient:
+    def __init__(self):
+        self.callbacks = []
+        self.state_listeners = []
+        self.handle = MagicMock()
+        self.handle.wait_end_with_timeout = MagicMock(return_value={})
+        self.call_stream = MagicMock(return_value=self.handle)
+        self.send_message = MagicMock()
+        self.released = 0
+
+    def register_callback(self, target, callback):
+        self.callbacks.append((target, callback))
+        return self._release
+
+    def on_connection_state_change(self, listener):
+        self.state_listeners.append(listener)
+        return self._release
+
+    def _release(self):
+        self.released += 1
+
+    def push(self, path, *events):
+        payload = {
+            "data": {
+                "eventType": "file_change",
+                "path": path,
+                "events": [{"eventType": kind, "path": p, "pathType": "file"} for kind, p in events],
+            }
+        }
+        for _, callback in self.callbacks:
+            callback(payload)
+
+
+class TestFileSystemWatchPolling(unittest.TestCase):
+    def setUp(self):
+        self.fs = FileSystem(_session())
+        self.feed = {}
+
+        def _get_file_change(path):
+            queued = self.feed.get(path) or [_changes()]
+            return queued.pop(0)
+
+        self.fs._get_file_change = MagicMock(side_effect=_get_file_change)
+
+    @pytest.mark.sync
+    def test_watches_on_same_path_share_one_poll(self):
+        self.feed["/d"] = [_changes(("create", "/d/stale")), _changes(("modify", "/d/a"))]
+
+        with self.fs.watch("/d", interval=0.01) as first, self.fs.watch("/d", interval=0.01) as second:
+            batch_first = first.__next__()
+            batch_second = second.__next__()
+
+        self.assertEqual([e.path for e in batch_first], ["/d/a"])
+        self.assertEqual([e.path for e in batch_second], ["/d/a"])
+        self.assertEqual(self.fs._get_file_change.call_count, 2)
+        self.assertEqual(self.fs._watch_hub._paths, {})
+
+    @pytest.mark.sync
+    def test_events_are_coalesced_per_path(self):
+        self.feed["/d"] = [
+            _changes(),
+            _changes(
+                ("create", "/d/a"), ("modify", "/d/a"),
+                ("create", "/d/b"), ("delete", "/d/b"),
+                ("delete", "/d/c"), ("create", "/d/c"),
+            ),
+        ]
+
+        with self.fs.watch("/d", interval=0.01) as watch:
+            batch = watch.__next__()
+
+        self.assertEqual([(e.event_type, e.path) for e in batch], [("create", "/d/a"), ("modify", "/d/c")])
+
+    @pytest.mark.sync
+    def test_pending_buffer_is_bounded(self):
+        self.feed["/d"] = [_changes(), _changes(("modify", "/d/1"), ("modify", "/d/2"), ("modify", "/d/3"))]
+
+        with self.fs.watch("/d", interval=0.01, max_pending=2) as watch:
+            batch = watch.__next__()
+
+        self.assertEqual([e.path for e in batch], ["/d/2", "/d/3"])
+        self.assertEqual(watch.dropped, 1)
+
+    @pytest.mark.sync
+    def test_iteration_stops_when_session_expires(self):
+        self.fs.session._is_expired.return_value = True
+
+        batches = [batch for batch in self.fs.watch("/d", interval=0.01)]
+
+        self.assertEqual(batches, [])
+
+
+    @pytest.mark.sync
+    def test_paths_are_polled_through_common_ancestor(self):
+        a = self.fs.watch("/home/u/a", interval=0.01)
+        sub = self.fs.watch("/home/u/a/sub", interval=0.01)
+        b = self.fs.watch("/home/u/b", interval=0.01)
+        other = self.fs.watch("/tmp/x", interval=0.01)
+        for watch in (a, sub, b, other):
+            watch.start()
+        hub = self.fs._watch_hub
+        self.assertEqual(sorted(f.root for f in hub._feeds.values()), ["/home/u", "/tmp/x"])
+        self.fs._get_file_change.reset_mock()
+        self.feed["/home/u"] = [
+            _changes(("modify", "/home/u/a/sub/f"), ("create", "/home/u/b/g"), ("modify", "/home/u/c/h"))
+        ]
+
+        batch_a = a.__next__()
+
+        self.assertEqual([c.args[0] for c in self.fs._get_file_change.call_args_list], ["/home/u"])
+        self.assertEqual([e.path for e in batch_a], ["/home/u/a/sub/f"])
+        self.assertEqual([e.path for e in sub.__next__()], ["/home/u/a/sub/f"])
+        self.assertEqual([e.path for e in b.__next__()], ["/home/u/b/g"])
+        self.assertEqual(self.fs._get_file_change.call_count, 1)
+
+        b.close()
+        self.assertEqual(hub._feeds["/home"].root, "/home/u/a")
+        for watch in (a, sub, other):
+            watch.close()
+        self.assertEqual(hub._feeds, {})
+
+    @pytest.mark.sync
+    def test_joining_watch_does_not_see_older_changes(self):
+        first = self.fs.watch("/home/u/a", interval=0.01)
+        first.start()
+        self.feed["/home/u/a"] = [_changes(("modify", "/home/u/a/old"))]
+
+        second = self.fs.watch("/home/u/a/deeper", interval=0.01)
+        second.start()
+
+        self.assertEqual([e.path for e in first._take()], ["/home/u/a/old"])
+        self.assertEqual(second._take(), [])
+
+    @pytest.mark.sync
+    def test_poll_reads_feed_for_every_watch(self):
+        self.feed["/d"] = [
+            _changes(),
+            _changes(("modify", "/d/a")),
+            FileChangeResult(success=False, error_message="tool not found"),
+        ]
+
+        with self.fs.watch("/d", interval=60) as sampler, self.fs.watch("/d", interval=60) as other:
+            polled = sampler.poll()
+            failed = sampler.poll()
+
+        self.assertEqual([e.path for e in polled], ["/d/a"])
+        self.assertEqual([e.path for e in other._take()], ["/d/a"])
+        self.assertIsNone(failed)
+
+    @pytest.mark.sync
+    def test_watch_directory_thread_shares_the_feed(self):
+        self.feed["/d"] = [_changes(), _changes(("modify", "/d/a"))]
+        seen = []
+
+        with self.fs.watch("/d", interval=0.01) as watch:
+            monitor = self.fs.watch_directory("/d", seen.extend, interval=0.01)
+            monitor.start()
+            monitor.ready_event.wait(5)
+            batch = watch.__next__()
+            for _ in range(200):
+                if seen:
+                    break
+                time.sleep(0.01)
+            monitor.stop_event.set()
+            monitor.join(5)
+
+        self.assertEqual([e.path for e in batch], ["/d/a"])
+        self.assertEqual([e.path for e in seen], ["/d/a"])
+        self.assertFalse(monitor.is_alive())
+        self.assertEqual(self.fs._watch_hub._paths, {})
+
+
+class TestFileSystemWatchPush(unittest.TestCase):
+    def setUp(self):
+        self.ws = FakeWsClient()
+        self.fs = FileSystem(_session(push=True))
+        self.fs.session._get_ws_client = MagicMock(return_value=self.ws)
+        self.fs._get_file_change = MagicMock(return_value=_changes())
+
+    @pytest.mark.sync
+    def test_watches_share_one_subscription(self):
+        first = self.fs.watch("/d")
+        second = self.fs.watch("/d", debounce=0)
+        first.start()
+        second.start()
+
+        self.ws.call_stream.assert_called_once()
+        self.assertEqual(len(self.ws.callbacks), 1)
+        self.assertEqual(
+            self.ws.call_stream.call_args.kwargs["data"],
+            {"method": "subscribe_file_change", "params": {"path": "/d"}},
+        )
+
+        self.ws.push("/d", ("modify", "/d/a"), ("modify", "/d/a"))
+        self.ws.push("/other", ("modify", "/other/x"))
+        batch = second.__next__()
+        self.assertEqual([e.path for e in batch], ["/d/a"])
+        self.assertEqual([e.path for e in first.__next__()], ["/d/a"])
+
+        first.close()
+        self.ws.send_message.assert_not_called()
+        second.close()
+        self.assertEqual(
+            self.ws.send_message.call_args.kwargs["data"],
+            {"method": "unsubscribe_file_change", "params": {"path": "/d"}},
+        )
+        self.assertEqual(self.ws.released, 2)
+
+    @pytest.mark.sync
+    def test_falls_back_to_polling_when_subscribe_fails(self):
+        self.ws.call_stream.side_effect = RuntimeError("no push")
+        self.fs._get_file_change.side_effect = [_changes(), _changes(), _changes(("modify", "/d/a"))]
+
+        with self.fs.watch("/d", interval=0.01) as watch:
+            batch = watch.__next__()
+
+        self.assertFalse(self.fs._watch_hub._is_pushed("/d"))
+        self.assertEqual([e.path for e in batch], ["/d/a"])
+
+    @pytest.mark.sync
+    def test_resubscribes_after_reconnect(self):
+        with self.fs.watch("/d", debounce=0) as watch:
+            for listener in self.ws.state_listeners:
+                listener("OPEN", "reconnected")
+            self.fs._get_file_change.return_value = _changes(("modify", "/d/missed"))
+
+            batch = watch.__next__()
+
+        self.assertEqual(self.ws.call_stream.call_count, 2)
+        self.assertEqual([e.path for e in batch], ["/d/missed"])
@@ -287,7 +287,7 @@ class TestSyncFileSystemWatchDirectory(unittest.TestCase):
             callback_events.extend(events)
 
         # Mock _get_file_change to return some events
-        mock_events = [FileChangeEvent("create", "/tmp/test.txt", "file")]
+        mock_events = [FileChangeEvent("create", "/tmp/test_dir/test.txt", "file")]
         mock_result = FileChangeResult(success=True, events=mock_events)
 
         self.filesystem._get_file_change = MagicMock(return_value=mock_result)
@@ -308,17 +308,17 @@ class TestSyncFileSystemWatchDirectory(unittest.TestCase):
 
         # Start the thread
         thread.start()
-        # Use async sleep so the event loop can process run_coroutine_threadsafe calls
+        # The watch runs on this event loop; sleep and join without blocking it
         time.sleep(0.5)
 
         # Stop the thread
         stop_event.set()
-        thread.join(timeout=2.0)
+        thread.join(2.0)
 
         # Verify callback was called with events
         self.assertGreater(len(callback_events), 0)
         self.assertEqual(callback_events[0].event_type, "create")
-        self.assertEqual(callback_events[0].path, "/tmp/test.txt")
+        self.assertEqual(callback_events[0].path, "/tmp/test_dir/test.txt")
 
     @pytest.mark.sync
 
@@ -330,7 +330,7 @@ class TestSyncFileSystemWatchDirectory(unittest.TestCase):
             raise Exception("Callback error")
 
         # Mock _get_file_change to return some events
-        mock_events = [FileChangeEvent("create", "/tmp/test.txt", "file")]
+        mock_events = [FileChangeEvent("create", "/tmp/test_dir/test.txt", "file")]
         mock_result = FileChangeResult(success=True, events=mock_events)
 
         self.filesystem._get_file_change = MagicMock(return_value=mock_result)
@@ -346,12 +346,12 @@ class TestSyncFileSystemWatchDirectory(unittest.TestCase):
 
         # Start the thread
         thread.start()
-        # Use async sleep so the event loop can process run_coroutine_threadsafe calls
+        # The watch runs on this event loop; sleep and join without blocking it
         time.sleep(0.5)
 
         # Stop the thread - should not crash despite callback exception
         stop_event.set()
-        thread.join(timeout=2.0)
+        thread.join(2.0)
 
         # Thread should have completed without crashing
         self.assertFalse(thread.is_alive())
@@ -0,0 +1,165 @@
+"""
+Unit tests for the session link cache used by get_link, get_endpoint_url and get_adb_url.
+"""
+
+import time
+import unittest
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentbay import Session
+from agentbay._sync._internal.link_cache import LinkCache, _link_ttl_from_url
+
+
+class DummyAgentBay:
+    def __init__(self):
+        self.client = MagicMock()
+        self.api_key = "test_api_key"
+
+
+def _link_response(url, request_id="req-1"):
+    response = MagicMock()
+    response.to_map.return_value = {
+        "body": {"Data": {"Url": url}, "Success": True, "RequestId": request_id}
+    }
+    return response
+
+
+def _cdp_response(url, request_id="req-cdp"):
+    response = MagicMock()
+    response.body.success = True
+    response.body.request_id = request_id
+    response.body.data.url = url
+    return response
+
+
+class TestLinkTtlFromUrl(unittest.TestCase):
+    def test_no_query_returns_none(self):
+        self.assertIsNone(_link_ttl_from_url("ws://host:9222/devtools", 1000.0))
+
+    def test_expiry_in_seconds(self):
+        ttl = _link_ttl_from_url("wss://host/cdp?token=x&Expires=1300", 1000.0)
+        self.assertEqual(ttl, 300.0)
+
+    def test_expiry_in_milliseconds(self):
+        ttl = _link_ttl_from_url(
+            "https://host/path?expire_time=1700000060000", 1700000000.0
+        )
+        self.assertAlmostEqual(ttl, 60.0)
+
+    def test_ttl_uses_margin_and_default(self):
+        cache = LinkCache(default_ttl_s=30.0, expiry_margin_s=5.0)
+        now = time.time()
+        self.assertEqual(cache._ttl_for("ws://host/devtools"), 30.0)
+        ttl = cache._ttl_for(f"ws://host/devtools?expires={int(now) + 100}")
+        self.assertTrue(90.0 <= ttl <= 95.0)
+
+
+class TestSessionLinkCache(unittest.TestCase):
+    def setUp(self):
+        self.agent_bay = DummyAgentBay()
+        self.session = Session(self.agent_bay, "test_session_id")
+
+    @pytest.mark.sync
+    def test_get_link_is_cached_per_key(self):
+        self.agent_bay.client.get_link = MagicMock(
+            return_value=_link_response("https://example.com:30100")
+        )
+
+        first = self.session.get_link(port=30100)
+        second = self.session.get_link(port=30100)
+        self.session.get_link(port=30101)
+
+        self.assertEqual(first.data, "https://example.com:30100")
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.request_id, "req-1")
+        self.assertEqual(self.agent_bay.client.get_link.call_count, 2)
+
+    @pytest.mark.sync
+    def test_get_link_force_refresh_and_invalidate(self):
+        self.agent_bay.client.get_link = MagicMock(
+            return_value=_link_response("https://example.com")
+        )
+
+        self.session.get_link()
+        self.session.get_link(force_refresh=True)
+        self.session.invalidate_link_cache("link")
+        self.session.get_link()
+
+        self.assertEqual(self.agent_bay.client.get_link.call_count, 3)
+
+    @pytest.mark.sync
+    def test_expired_entry_is_refetched(self):
+        self.session._link_cache = LinkCache(default_ttl_s=0.0)
+        self.agent_bay.client.get_link = MagicMock(
+            return_value=_link_response("https://example.com")
+        )
+
+        self.session.get_link()
+        self.session.get_link()
+
+        self.assertEqual(self.agent_bay.client.get_link.call_count, 2)
+
+    @pytest.mark.sync
+    def test_concurrent_get_link_shares_one_call(self):
+        def _slow_get_link(request):
+            time.sleep(0.05)
+            return _link_response("https://example.com")
+
+        self.agent_bay.client.get_link = MagicMock(side_effect=_slow_get_link)
+
+        tasks = [self.session.get_link() for _ in range(5)]
+        results = [task for task in tasks]
+
+        self.assertTrue(all(r.data == "https://example.com" for r in results))
+        self.assertEqual(self.agent_bay.client.get_link.call_count, 1)
+
+    @pytest.mark.sync
+    def test_endpoint_url_cached_until_invalidated(self):
+        self.agent_bay.client.get_cdp_link = MagicMock(
+            return_value=_cdp_response("ws://cdp:9222")
+        )
+        self.session.browser._initialized = True
+        self.session.browser.endpoint_router_port = 9333
+
+        self.assertEqual(self.session.browser.get_endpoint_url(), "ws://cdp:9222")
+        self.assertEqual(self.session.browser.get_endpoint_url(), "ws://cdp:9222")
+        self.assertEqual(self.agent_bay.client.get_cdp_link.call_count, 1)
+
+        self.session.invalidate_link_cache("cdp")
+        self.session.browser.get_endpoint_url()
+        self.session.browser.get_endpoint_url(force_refresh=True)
+        self.assertEqual(self.agent_bay.client.get_cdp_link.call_count, 3)
+
+    @pytest.mark.sync
+    def test_adb_url_cached_per_public_key(self):
+        self.agent_bay.client.get_adb_link = MagicMock(
+            return_value=_cdp_response("adb connect 1.2.3.4:5555", "req-adb")
+        )
+
+        first = self.session.mobile.get_adb_url("key-a")
+        second = self.session.mobile.get_adb_url("key-a")
+        self.session.mobile.get_adb_url("key-b")
+
+        self.assertTrue(second.success)
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second.request_id, "req-adb")
+        self.assertEqual(self.agent_bay.client.get_adb_link.call_count, 2)
+
+    @pytest.mark.sync
+    def test_adb_failure_is_not_cached(self):
+        failed = MagicMock()
+        failed.body.success = False
+        failed.body.request_id = "req-err"
+        failed.body.message = "ImageTypeNotMatched"
+        failed.body.data = None
+        self.agent_bay.client.get_adb_link = MagicMock(return_value=failed)
+
+        first = self.session.mobile.get_adb_url("key-a")
+        second = self.session.mobile.get_adb_url("key-a")
+
+        self.assertFalse(first.success)
+        self.assertEqual(first.error_message, "ImageTypeNotMatched")
+        self.assertFalse(second.success)
+        self.assertEqual(self.agent_bay.client.get_adb_link.call_count, 2)
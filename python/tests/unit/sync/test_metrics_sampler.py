@@ -0,0 +1,138 @@
+import time
+"""
+Unit tests for the session metrics sampler.
+"""
+
+import unittest
+from unittest.mock import MagicMock
+
+import pytest
+
+from agentbay import MetricsSampler, SessionMetrics, SessionMetricsResult
+
+
+def _result(cpu=10.0, mem_used=100, success=True):
+    return SessionMetricsResult(
+        success=success,
+        metrics=SessionMetrics(cpu_used_pct=cpu, mem_used=mem_used, mem_total=1000) if success else None,
+        error_message="" if success else "tool failed",
+    )
+
+
+def _session(session_id, *results):
+    session = MagicMock()
+    session.session_id = session_id
+    session.get_metrics = MagicMock(side_effect=list(results) or None, return_value=_result())
+    return session
+
+
+class TestSyncMetricsSampler(unittest.TestCase):
+    @pytest.mark.sync
+    def test_samples_sessions_within_concurrency(self):
+        sampler = MetricsSampler(concurrency=2)
+        in_flight = 0
+        peak = 0
+
+        def _get_metrics():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            time.sleep(0.01)
+            in_flight -= 1
+            return _result()
+
+        for i in range(4):
+            session = _session(f"s-{i}")
+            session.get_metrics.side_effect = _get_metrics
+            sampler.add(session)
+
+        self.assertEqual(sampler.sample_once(), 4)
+        sampler.sample_once()
+
+        self.assertLessEqual(peak, 2)
+        self.assertEqual(len(sampler.history("s-0")), 2)
+
+    @pytest.mark.sync
+    def test_failed_samples_are_skipped(self):
+        sampler = MetricsSampler()
+        session = _session("s-1", _result(cpu=20.0), _result(success=False), RuntimeError("boom"))
+        sampler.add(session)
+
+        for _ in range(3):
+            sampler.sample_once()
+
+        self.assertEqual(len(sampler.history("s-1")), 1)
+        self.assertEqual(sampler.errors, 2)
+        self.assertEqual(sampler.summary("s-1").cpu_max, 20.0)
+
+    @pytest.mark.sync
+    def test_threshold_fires_on_crossing(self):
+        sampler = MetricsSampler()
+        callback = MagicMock()
+        sampler.on_threshold("mem_used_pct", 80, callback)
+        sampler.add(
+            _session(
+                "s-1",
+                _result(mem_used=500), _result(mem_used=900), _result(mem_used=950),
+                _result(mem_used=700), _result(mem_used=850),
+            )
+        )
+
+        for _ in range(5):
+            sampler.sample_once()
+
+        self.assertEqual(callback.call_count, 2)
+        session_id, metric, value, sample = callback.call_args_list[0][0]
+        self.assertEqual((session_id, metric, value), ("s-1", "mem_used_pct", 90.0))
+        self.assertEqual(sample["mem_used"], 900)
+        with self.assertRaises(ValueError):
+            sampler.on_threshold("gpu", 1, callback)
+
+    @pytest.mark.sync
+    def test_remove_stops_sampling(self):
+        sampler = MetricsSampler()
+        session = _session("s-1")
+        sampler.add(session)
+        sampler.sample_once()
+
+        self.assertTrue(sampler.remove("s-1", keep_history=True))
+        sampler.sample_once()
+
+        session.get_metrics.assert_called_once()
+        self.assertEqual(len(sampler.history("s-1")), 1)
+        sampler.remove("s-1")
+        self.assertIsNone(sampler.history("s-1"))
+
+    @pytest.mark.sync
+    def test_export_formats(self):
+        sampler = MetricsSampler()
+        sampler.add(_session("s-1", _result(cpu=12.5, mem_used=2048)))
+        sampler.add(_session("s-2"))
+        sampler.remove("s-2")
+        sampler.sample_once()
+
+        text = sampler.export()
+
+        self.assertIn("# TYPE agentbay_session_cpu_used_pct gauge", text)
+        self.assertIn('agentbay_session_cpu_used_pct{session_id="s-1"} 12.5', text)
+        self.assertIn('agentbay_session_mem_used_max{session_id="s-1"} 2048.0', text)
+        self.assertNotIn("s-2", text)
+        self.assertNotIn("# EOF", text)
+        self.assertTrue(sampler.export(openmetrics=True).endswith("# EOF\n"))
+
+    @pytest.mark.sync
+    def test_run_until_stopped(self):
+        sampler = MetricsSampler(interval=0.01)
+        session = _session("s-1")
+
+        def _get_metrics():
+            if session.get_metrics.call_count == 2:
+                sampler.stop()
+            return _result()
+
+        session.get_metrics.side_effect = _get_metrics
+        sampler.add(session)
+
+        sampler.run()
+
+        self.assertEqual(len(sampler.history("s-1")), 2)
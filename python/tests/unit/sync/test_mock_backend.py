@@ -0,0 +1,115 @@
+"""
+Unit tests for the offline mock backend (agentbay.testing), driven through the SDK.
+"""
+
+import time
+import unittest
+
+import pytest
+
+from agentbay import AgentBay, CreateSessionParams
+from agentbay.testing import MockAgentBayServer
+
+
+class TestSyncMockBackend(unittest.TestCase):
+    def setUp(self):
+        self.server = MockAgentBayServer(seed=7).start()
+        self.agent_bay = AgentBay(api_key="test-key", cfg=self.server.config())
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _create(self, **kwargs):
+        result = self.agent_bay.create(CreateSessionParams(**kwargs))
+        self.assertTrue(result.success, result.error_message)
+        return result.session
+
+    @pytest.mark.sync
+    def test_session_lifecycle(self):
+        session = self._create(labels={"team": "perf"})
+        self._create(labels={"team": "other"})
+
+        listed = self.agent_bay.list(labels={"team": "perf"})
+        self.assertEqual([s["sessionId"] for s in listed.session_ids], [session.session_id])
+        self.assertTrue((session.keep_alive()).success)
+        self.assertTrue((self.agent_bay.get(session.session_id)).success)
+
+        self.assertTrue((session.delete()).success)
+        self.assertNotIn(session.session_id, self.server.sessions)
+        self.assertEqual(self.server.calls["CreateMcpSession"], 2)
+
+    @pytest.mark.sync
+    def test_tools_over_link_url(self):
+        session = self._create()
+
+        command = session.command.execute_command("echo hello")
+        session.file_system.write_file("/tmp/a.txt", "content")
+        read = session.file_system.read_file("/tmp/a.txt")
+        metrics = session.get_metrics()
+
+        self.assertEqual(command.stdout, "hello\n")
+        self.assertEqual(read.content, "content")
+        self.assertTrue(metrics.success)
+        self.assertEqual(self.server.calls["shell"], 1)
+        self.assertGreaterEqual(self.server.calls["CallMcpTool(LinkUrl)"], 4)
+        self.assertNotIn("CallMcpTool", self.server.calls)
+
+    @pytest.mark.sync
+    def test_tools_over_openapi(self):
+        self.server.link_url_enabled = False
+        session = self._create()
+
+        command = session.command.execute_command("echo api")
+
+        self.assertEqual(command.stdout, "api\n")
+        self.assertEqual(self.server.calls["CallMcpTool"], 1)
+
+    @pytest.mark.sync
+    def test_fault_injection(self):
+        session = self._create()
+        self.server.set_fault("shell", error_rate=1.0, error_code="Throttling")
+        self.server.set_fault("RefreshSessionIdleTime", error_rate=1.0, http_status=200)
+        self.server.set_fault("write_file", payload_bytes=64)
+
+        command = session.command.execute_command("echo hi")
+        keep_alive = session.keep_alive()
+        write = session.file_system.write_file("/tmp/a", "x")
+
+        self.assertFalse(command.success)
+        self.assertIn("Throttling", command.error_message)
+        self.assertFalse(keep_alive.success)
+        self.assertTrue(write.success)
+
+        self.server.clear_faults()
+        self.server.set_fault("CreateMcpSession", latency=0.2)
+        started = time.monotonic()
+        self._create()
+        self.assertGreaterEqual(time.monotonic() - started, 0.2)
+
+    @pytest.mark.sync
+    def test_ws_calls_and_push(self):
+        session = self._create()
+        self.server.register_ws_handler("echo_server", lambda s, data: [{"seen": data}, {"ok": True}])
+        ws_client = session._get_ws_client()
+        events = []
+        pushed = []
+
+        handle = ws_client.call_stream(
+            target="echo_server",
+            data={"n": 1},
+            on_event=lambda invocation_id, data: events.append(data),
+            on_end=None,
+            on_error=None,
+        )
+        end = handle.wait_end_with_timeout(5)
+        ws_client.register_callback("notifier", pushed.append)
+        self.server.push(session.session_id, "notifier", {"k": "v"})
+        for _ in range(50):
+            if pushed:
+                break
+            time.sleep(0.01)
+        ws_client.close()
+
+        self.assertEqual(events, [{"phase": "event", "seen": {"n": 1}}])
+        self.assertEqual(end, {"phase": "end", "ok": True})
+        self.assertEqual(pushed[0]["data"], {"k": "v"})
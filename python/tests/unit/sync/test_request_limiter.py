@@ -0,0 +1,49 @@
+"""
+Unit tests for client-side request limiting, driven through the offline mock backend.
+"""
+
+import unittest
+
+import pytest
+
+from agentbay import AgentBay, RetryPolicy
+from agentbay.testing import MockAgentBayServer
+
+
+class TestSyncRequestLimiter(unittest.TestCase):
+    def setUp(self):
+        self.server = MockAgentBayServer(seed=5).start()
+        self.agent_bay = AgentBay(
+            api_key="test-key",
+            cfg=self.server.config(),
+            max_concurrency=8,
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _row(self, action):
+        return {row["action"]: row for row in self.agent_bay.request_limiter.snapshot()}[action]
+
+    @pytest.mark.sync
+    def test_throttling_shrinks_cap(self):
+        session = (self.agent_bay.create()).session
+        self.server.set_fault(
+            "RefreshSessionIdleTime", error_rate=1.0, error_code="Throttling", http_status=200
+        )
+
+        self.assertFalse((session.keep_alive()).success)
+
+        self.assertEqual(self._row("RefreshSessionIdleTime")["limit"], 4)
+        self.assertEqual(self._row("RefreshSessionIdleTime")["overloaded"], 1)
+        self.assertEqual(self._row("CreateMcpSession")["limit"], 8)
+
+    @pytest.mark.sync
+    def test_link_url_calls_are_limited(self):
+        session = (self.agent_bay.create()).session
+
+        session.command.execute_command("echo hi")
+
+        row = self._row("CallMcpTool(LinkUrl)")
+        self.assertEqual((row["calls"], row["in_flight"], row["overloaded"]), (1, 0, 0))
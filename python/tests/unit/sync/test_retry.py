@@ -0,0 +1,60 @@
+"""
+Unit tests for retries of idempotent calls, driven through the offline mock backend.
+"""
+
+import unittest
+
+import pytest
+
+from agentbay import AgentBay, RetryPolicy
+from agentbay.testing import MockAgentBayServer
+
+
+class TestSyncRetry(unittest.TestCase):
+    def setUp(self):
+        self.server = MockAgentBayServer(seed=11).start()
+        self.agent_bay = AgentBay(
+            api_key="test-key",
+            cfg=self.server.config(),
+            retry_policy=RetryPolicy(max_attempts=3, initial_backoff=0.001, max_backoff=0.002),
+        )
+
+    def tearDown(self):
+        self.server.stop()
+
+    @pytest.mark.sync
+    def test_idempotent_action_is_retried(self):
+        session = (self.agent_bay.create()).session
+        self.server.set_fault("GetSession", error_rate=1.0, http_status=503)
+        self.server.set_fault("CreateMcpSession", error_rate=1.0, http_status=503)
+
+        self.agent_bay.get(session.session_id)
+        self.agent_bay.create()
+
+        self.assertEqual(self.server.calls["GetSession"], 3)
+        self.assertEqual(self.server.calls["CreateMcpSession"], 2)
+
+    @pytest.mark.sync
+    def test_only_read_tools_are_retried_over_link_url(self):
+        session = (self.agent_bay.create()).session
+        session.file_system.write_file("/tmp/a.txt", "content")
+        self.server.set_fault("CallMcpTool(LinkUrl)", error_rate=1.0, http_status=502)
+
+        read = session.file_system.get_file_info("/tmp/a.txt")
+        command = session.command.execute_command("echo hi")
+
+        self.assertFalse(read.success)
+        self.assertFalse(command.success)
+        self.assertEqual(self.server.calls.get("get_file_info", 0), 0)
+        # 1 write + 3 get_file_info attempts + 1 shell attempt
+        self.assertEqual(self.server.calls["CallMcpTool(LinkUrl)"], 5)
+
+    @pytest.mark.sync
+    def test_transient_link_error_recovers(self):
+        session = (self.agent_bay.create()).session
+        session.file_system.write_file("/tmp/a.txt", "content")
+        self.server.set_fault("CallMcpTool(LinkUrl)", error_rate=0.5, http_status=503)
+
+        results = [session.file_system.read_file("/tmp/a.txt") for _ in range(5)]
+
+        self.assertTrue(all(r.success for r in results))
@@ -0,0 +1,72 @@
+"""
+Unit tests for filling session tool lists from the per-image cache, driven
+through the offline mock backend.
+"""
+
+import os
+import tempfile
+import unittest
+
+import pytest
+
+from agentbay import AgentBay, CreateSessionParams
+from agentbay.testing import MockAgentBayServer
+
+IMAGE = "linux_latest"
+
+
+class TestSyncToolListCache(unittest.TestCase):
+    def setUp(self):
+        # No ToolList in create/get responses, as for some backends.
+        self.server = MockAgentBayServer(seed=19, tool_list=False).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def _agent_bay(self, **kwargs):
+        return AgentBay(api_key="test-key", cfg=self.server.config(), **kwargs)
+
+    def _create(self, agent_bay):
+        return (agent_bay.create(CreateSessionParams(image_id=IMAGE))).session
+
+    @pytest.mark.sync
+    def test_known_tool_list_enables_link_url_route(self):
+        agent_bay = self._agent_bay()
+        first = self._create(agent_bay)
+        self.assertEqual(first.mcpTools, [])
+        first.command.execute_command("echo hi")
+        self.assertEqual(self.server.calls.get("CallMcpTool(LinkUrl)", 0), 0)
+
+        listed = first.list_mcp_tools()
+        second = self._create(agent_bay)
+        fetched = (agent_bay.get(first.session_id)).session
+        second.command.execute_command("echo hi")
+
+        self.assertEqual(second.mcpTools, listed.tools)
+        self.assertEqual(fetched.mcpTools, listed.tools)
+        self.assertEqual(self.server.calls["CallMcpTool(LinkUrl)"], 1)
+
+    @pytest.mark.sync
+    def test_list_mcp_tools_is_served_from_cache(self):
+        agent_bay = self._agent_bay()
+        session = self._create(agent_bay)
+
+        first = session.list_mcp_tools()
+        second = session.list_mcp_tools()
+        session.list_mcp_tools(force_refresh=True)
+
+        self.assertEqual(second.tools, first.tools)
+        self.assertEqual(second.request_id, first.request_id)
+        self.assertEqual(self.server.calls["ListMcpTools"], 2)
+
+    @pytest.mark.sync
+    def test_cache_file_is_shared_by_clients(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "tools.json")
+            session = self._create(self._agent_bay(tool_list_cache_path=path))
+            session.list_mcp_tools()
+
+            session = self._create(self._agent_bay(tool_list_cache_path=path))
+
+        self.assertNotEqual(session.mcpTools, [])
+        self.assertEqual(self.server.calls["ListMcpTools"], 1)